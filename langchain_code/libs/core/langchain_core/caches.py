@@ -17,16 +17,39 @@ A cache is useful for two reasons:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import weakref
+import zlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Sequence
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 from typing_extensions import override
 
+from langchain_core.load import dumpd, load
 from langchain_core.outputs import Generation
 from langchain_core.runnables import run_in_executor
 
+if TYPE_CHECKING:
+    import sqlite3
+    from pathlib import Path
+
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.vectorstores.utils import _VectorMatrix
+
+logger = logging.getLogger(__name__)
+
 RETURN_VAL_TYPE = Sequence[Generation]
+_CacheKey = tuple[str, str]
 
 
 class BaseCache(ABC):
@@ -152,10 +175,252 @@ class BaseCache(ABC):
         return await run_in_executor(None, self.clear, **kwargs)
 
 
+# Fixed per-generation overhead used when estimating the size of cached values.
+_GENERATION_OVERHEAD = 64
+
+
+class CacheStats(TypedDict):
+    """Counters describing the usage of an `InMemoryCache`."""
+
+    hits: int
+    """Number of lookups that returned a cached value."""
+    misses: int
+    """Number of lookups that did not find a (live) cached value."""
+    evictions: int
+    """Number of entries removed to respect `maxsize` or `max_bytes`."""
+    expirations: int
+    """Number of entries removed because their `ttl` elapsed."""
+    size: int
+    """Number of entries currently stored."""
+    bytes: int
+    """Approximate size in bytes of the entries currently stored.
+
+    Only tracked when the cache was created with `max_bytes`, `0` otherwise.
+    """
+
+
+class EvictionPolicy(ABC):
+    """Policy deciding which entry an `InMemoryCache` evicts when it is full.
+
+    The cache notifies the policy of every insertion, access and removal, and
+    asks it for a victim whenever an entry must be dropped. Implementations do
+    not need to be thread-safe: the cache serializes all calls.
+    """
+
+    @abstractmethod
+    def insert(self, key: _CacheKey) -> None:
+        """Record that `key` was added to the cache.
+
+        Only called for keys that are not tracked yet: overwriting an entry is
+        recorded with `access`.
+        """
+
+    @abstractmethod
+    def access(self, key: _CacheKey) -> None:
+        """Record that `key` was read from or overwritten in the cache."""
+
+    @abstractmethod
+    def remove(self, key: _CacheKey) -> None:
+        """Record that `key` was removed from the cache."""
+
+    @abstractmethod
+    def victim(self) -> _CacheKey:
+        """Return the key that should be evicted next.
+
+        Only called while at least one key is tracked.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+
+
+class FIFOEvictionPolicy(EvictionPolicy):
+    """Evict the entry that was inserted first, regardless of how it is used."""
+
+    def __init__(self) -> None:
+        """Initialize the policy."""
+        self._order: dict[_CacheKey, None] = {}
+
+    @override
+    def insert(self, key: _CacheKey) -> None:
+        self._order[key] = None
+
+    @override
+    def access(self, key: _CacheKey) -> None:
+        pass
+
+    @override
+    def remove(self, key: _CacheKey) -> None:
+        self._order.pop(key, None)
+
+    @override
+    def victim(self) -> _CacheKey:
+        return next(iter(self._order))
+
+    @override
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """Evict the entry that was least recently looked up or updated."""
+
+    def __init__(self) -> None:
+        """Initialize the policy."""
+        self._order: OrderedDict[_CacheKey, None] = OrderedDict()
+
+    @override
+    def insert(self, key: _CacheKey) -> None:
+        self._order[key] = None
+
+    @override
+    def access(self, key: _CacheKey) -> None:
+        self._order.move_to_end(key)
+
+    @override
+    def remove(self, key: _CacheKey) -> None:
+        self._order.pop(key, None)
+
+    @override
+    def victim(self) -> _CacheKey:
+        return next(iter(self._order))
+
+    @override
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LFUEvictionPolicy(EvictionPolicy):
+    """Evict the entry that was used the least often.
+
+    Ties are broken by recency: among the least frequently used entries, the one
+    used least recently is evicted first. All operations are `O(1)`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the policy."""
+        self._counts: dict[_CacheKey, int] = {}
+        self._buckets: dict[int, OrderedDict[_CacheKey, None]] = {}
+        self._min_count = 0
+
+    def _unlink(self, key: _CacheKey, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+
+    @override
+    def insert(self, key: _CacheKey) -> None:
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    @override
+    def access(self, key: _CacheKey) -> None:
+        count = self._counts[key]
+        self._unlink(key, count)
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    @override
+    def remove(self, key: _CacheKey) -> None:
+        count = self._counts.pop(key, None)
+        if count is None:
+            return
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = min(self._buckets, default=0)
+
+    @override
+    def victim(self) -> _CacheKey:
+        return next(iter(self._buckets[self._min_count]))
+
+    @override
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+_EVICTION_POLICIES: dict[str, type[EvictionPolicy]] = {
+    "fifo": FIFOEvictionPolicy,
+    "lru": LRUEvictionPolicy,
+    "lfu": LFUEvictionPolicy,
+}
+
+
+def _resolve_eviction_policy(
+    eviction_policy: Literal["fifo", "lru", "lfu"] | EvictionPolicy,
+) -> EvictionPolicy:
+    if isinstance(eviction_policy, EvictionPolicy):
+        return eviction_policy
+    if eviction_policy not in _EVICTION_POLICIES:
+        msg = (
+            f"Unknown eviction_policy {eviction_policy!r}. "
+            f"Expected one of {sorted(_EVICTION_POLICIES)}."
+        )
+        raise ValueError(msg)
+    return _EVICTION_POLICIES[eviction_policy]()
+
+
+def _approximate_size(key: _CacheKey, return_val: RETURN_VAL_TYPE) -> int:
+    """Estimate the memory held by a cache entry.
+
+    The estimate counts the characters of the key, of each generation's text and
+    of any extra payload (generation info, non-text message content, tool calls),
+    plus a fixed overhead per generation. It is meant for budgeting, not for exact
+    accounting.
+    """
+    size = len(key[0]) + len(key[1])
+    for generation in return_val:
+        size += _GENERATION_OVERHEAD + len(generation.text)
+        if generation.generation_info:
+            size += len(repr(generation.generation_info))
+        message = getattr(generation, "message", None)
+        if message is not None:
+            if not isinstance(message.content, str):
+                size += len(repr(message.content))
+            if tool_calls := getattr(message, "tool_calls", None):
+                size += len(repr(tool_calls))
+    return size
+
+
 class InMemoryCache(BaseCache):
-    """Cache that stores things in memory."""
+    """Cache that stores things in memory.
+
+    The cache can be bounded by a number of entries (`maxsize`), by an approximate
+    memory budget (`max_bytes`) and by a time to live (`ttl`). When a bound is
+    reached, entries are evicted according to `eviction_policy`.
+
+    Example:
+        ```python
+        from langchain_core.caches import InMemoryCache
+        from langchain_core.globals import set_llm_cache
+
+        cache = InMemoryCache(maxsize=1_000, eviction_policy="lru", ttl=3600)
+        set_llm_cache(cache)
 
-    def __init__(self, *, maxsize: int | None = None) -> None:
+        # ... run some chat model calls ...
+
+        cache.stats()
+        # -> {"hits": 42, "misses": 7, "evictions": 0, "expirations": 1, ...}
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int | None = None,
+        eviction_policy: Literal["fifo", "lru", "lfu"] | EvictionPolicy = "fifo",
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
         """Initialize with empty cache.
 
         Args:
@@ -163,16 +428,82 @@ class InMemoryCache(BaseCache):
 
                 If `None`, the cache has no maximum size.
 
-                If the cache exceeds the maximum size, the oldest items are removed.
+                If the cache exceeds the maximum size, items are removed according
+                to `eviction_policy`.
+            eviction_policy: Which entry to evict when the cache is full.
+
+                - `'fifo'`: the oldest inserted entry (default).
+                - `'lru'`: the least recently looked up or updated entry.
+                - `'lfu'`: the least frequently looked up or updated entry.
+
+                An `EvictionPolicy` instance can be passed for custom behavior.
+            ttl: Time to live of an entry, in seconds.
+
+                Entries older than `ttl` are treated as misses and dropped. If
+                `None`, entries never expire.
+            max_bytes: Approximate memory budget of the cache, in bytes.
+
+                The size of an entry is estimated from the length of its key and of
+                the text and payload of its generations. If `None`, the cache has no
+                memory budget.
 
         Raises:
-            ValueError: If `maxsize` is less than or equal to `0`.
+            ValueError: If `maxsize`, `ttl` or `max_bytes` is less than or equal to
+                `0`, or if `eviction_policy` is unknown.
         """
-        self._cache: dict[tuple[str, str], RETURN_VAL_TYPE] = {}
+        self._cache: dict[_CacheKey, RETURN_VAL_TYPE] = {}
         if maxsize is not None and maxsize <= 0:
             msg = "maxsize must be greater than 0"
             raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = "ttl must be greater than 0"
+            raise ValueError(msg)
+        if max_bytes is not None and max_bytes <= 0:
+            msg = "max_bytes must be greater than 0"
+            raise ValueError(msg)
         self._maxsize = maxsize
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._policy = _resolve_eviction_policy(eviction_policy)
+        # Expiry deadlines in insertion order; with a constant ttl this is also
+        # deadline order, so expired entries can be purged from the front.
+        self._expires_at: dict[_CacheKey, float] = {}
+        self._sizes: dict[_CacheKey, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, key: _CacheKey) -> None:
+        del self._cache[key]
+        self._policy.remove(key)
+        self._expires_at.pop(key, None)
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def _purge_expired(self, now: float) -> None:
+        expired = []
+        for key, deadline in self._expires_at.items():
+            if deadline > now:
+                break
+            expired.append(key)
+        for expired_key in expired:
+            self._remove(expired_key)
+        self._expirations += len(expired)
+
+    def _is_full(self, key: _CacheKey, incoming_size: int) -> bool:
+        """Whether an entry must be evicted before storing `incoming_size` bytes."""
+        if (
+            self._maxsize is not None
+            and key not in self._cache
+            and len(self._cache) >= self._maxsize
+        ):
+            return True
+        return (
+            self._max_bytes is not None
+            and self._bytes + incoming_size > self._max_bytes
+        )
 
     def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
         """Look up based on `prompt` and `llm_string`.
@@ -187,7 +518,19 @@ class InMemoryCache(BaseCache):
         Returns:
             On a cache miss, return `None`. On a cache hit, return the cached value.
         """
-        return self._cache.get((prompt, llm_string), None)
+        key = (prompt, llm_string)
+        with self._lock:
+            if key not in self._cache:
+                self._misses += 1
+                return None
+            if self._ttl is not None and self._expires_at[key] <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._policy.access(key)
+            self._hits += 1
+            return self._cache[key]
 
     def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
         """Update cache based on `prompt` and `llm_string`.
@@ -202,14 +545,64 @@ class InMemoryCache(BaseCache):
 
                 The value is a list of `Generation` (or subclasses).
         """
-        if self._maxsize is not None and len(self._cache) == self._maxsize:
-            del self._cache[next(iter(self._cache))]
-        self._cache[prompt, llm_string] = return_val
+        key = (prompt, llm_string)
+        size = 0
+        if self._max_bytes is not None:
+            size = _approximate_size(key, return_val)
+        with self._lock:
+            if self._ttl is not None:
+                self._purge_expired(time.monotonic())
+            if key in self._cache:
+                # Overwriting an entry counts as a use of it, so that e.g. a hot
+                # entry keeps its LFU count. Its size and deadline are reset below.
+                self._policy.access(key)
+                self._expires_at.pop(key, None)
+                self._bytes -= self._sizes.pop(key, 0)
+            if self._max_bytes is not None and size > self._max_bytes:
+                # The entry can never fit, don't evict everything else for it.
+                if key in self._cache:
+                    self._remove(key)
+                return
+            while self._cache and self._is_full(key, size):
+                self._remove(self._policy.victim())
+                self._evictions += 1
+            if key not in self._cache:
+                self._policy.insert(key)
+            self._cache[key] = return_val
+            if self._ttl is not None:
+                self._expires_at[key] = time.monotonic() + self._ttl
+            if self._max_bytes is not None:
+                self._sizes[key] = size
+                self._bytes += size
 
     @override
     def clear(self, **kwargs: Any) -> None:
         """Clear cache."""
-        self._cache = {}
+        with self._lock:
+            self._cache = {}
+            self._policy.clear()
+            self._expires_at.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return hit, miss and eviction counters along with the current size.
+
+        Counters are cumulative over the lifetime of the cache; they are not reset
+        by `clear`.
+
+        Returns:
+            A snapshot of the cache statistics.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._cache),
+                bytes=self._bytes,
+            )
 
     async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
         """Async look up based on `prompt` and `llm_string`.
@@ -246,3 +639,687 @@ class InMemoryCache(BaseCache):
     async def aclear(self, **kwargs: Any) -> None:
         """Async clear cache."""
         self.clear()
+
+
+# Encoding tags of the values stored by `SQLiteCache`.
+_TEXT_GENERATIONS = 1
+_SERIALIZED_GENERATIONS = 2
+_COMPRESSED = 0x80
+# Serialized payloads larger than this are zlib-compressed.
+_COMPRESSION_THRESHOLD = 512
+_TEXT_LENGTH = struct.Struct("<I")
+
+
+def _encode_generations(return_val: RETURN_VAL_TYPE) -> bytes:
+    """Encode a list of generations into a compact binary value.
+
+    Plain `Generation` objects without `generation_info` (the common case for
+    LLMs) are stored as length-prefixed UTF-8 texts. Anything else, such as
+    `ChatGeneration`, is stored as its JSON serialization, compressed when large.
+    """
+    if all(
+        type(generation) is Generation and not generation.generation_info
+        for generation in return_val
+    ):
+        parts = [bytes([_TEXT_GENERATIONS])]
+        for generation in return_val:
+            text = generation.text.encode("utf-8")
+            parts.extend((_TEXT_LENGTH.pack(len(text)), text))
+        return b"".join(parts)
+    payload = json.dumps(
+        [dumpd(generation) for generation in return_val], separators=(",", ":")
+    ).encode("utf-8")
+    if len(payload) > _COMPRESSION_THRESHOLD:
+        return bytes([_SERIALIZED_GENERATIONS | _COMPRESSED]) + zlib.compress(payload)
+    return bytes([_SERIALIZED_GENERATIONS]) + payload
+
+
+def _decode_generations(value: bytes) -> list[Generation]:
+    """Decode a value produced by `_encode_generations`."""
+    tag, payload = value[0], value[1:]
+    if tag == _TEXT_GENERATIONS:
+        generations = []
+        offset = 0
+        while offset < len(payload):
+            (length,) = _TEXT_LENGTH.unpack_from(payload, offset)
+            offset += _TEXT_LENGTH.size
+            text = payload[offset : offset + length].decode("utf-8")
+            generations.append(Generation(text=text))
+            offset += length
+        return generations
+    if tag & _COMPRESSED:
+        payload = zlib.decompress(payload)
+    return [load(generation) for generation in json.loads(payload)]
+
+
+def _cache_key(prompt: str, llm_string: str) -> bytes:
+    digest = hashlib.blake2b(llm_string.encode("utf-8"), digest_size=16)
+    digest.update(b"\x00")
+    digest.update(prompt.encode("utf-8"))
+    return digest.digest()
+
+
+def _connect(database_path: str, timeout: float) -> sqlite3.Connection:
+    import sqlite3  # noqa: PLC0415
+
+    conn = sqlite3.connect(
+        database_path, timeout=timeout, isolation_level=None, check_same_thread=False
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache "
+        "(key BLOB PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+    )
+    return conn
+
+
+def _write_batch(conn: sqlite3.Connection, rows: dict[bytes, bytes]) -> None:
+    # BEGIN IMMEDIATE takes the write lock up front so that concurrent writers
+    # wait for `timeout` instead of failing halfway through the transaction.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)",
+            rows.items(),
+        )
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _flush_at_exit(
+    database_path: str, timeout: float, pending: dict[bytes, bytes]
+) -> None:
+    if pending:
+        conn = _connect(database_path, timeout)
+        try:
+            _write_batch(conn, pending)
+        finally:
+            conn.close()
+        pending.clear()
+
+
+class SQLiteCache(BaseCache):
+    """Cache that persists generations in a local SQLite database.
+
+    The database uses write-ahead logging, so several processes on the same host can
+    share one cache file: lookups never block on writers, and writers wait for each
+    other for up to `timeout` seconds.
+
+    Updates are buffered and written in a single transaction once `batch_size`
+    entries are pending or `flush_interval` seconds have passed since the oldest
+    pending entry. Pending entries are visible to lookups on the same instance
+    right away, and to other processes once flushed. They are flushed on `close`,
+    when the cache is garbage collected and at interpreter exit. If a flush
+    triggered by an update fails, for instance because another process held the
+    database lock for longer than `timeout`, the error is logged and the entries
+    stay pending until the next flush.
+
+    Each instance holds two connections: one shared by lookups and one used by
+    flushes, so lookups never wait for a flush, and the lock guarding the write
+    buffer is never held during disk access. `alookup` answers from the write buffer
+    without leaving the event loop and otherwise reads on a thread dedicated to the
+    instance, so it never queues behind other work in the default executor.
+    `aupdate` only appends to the write buffer and offloads the flush to an executor
+    when one is due, so the event loop never waits on the database.
+
+    Example:
+        ```python
+        from langchain_core.caches import SQLiteCache
+        from langchain_core.globals import set_llm_cache
+
+        set_llm_cache(SQLiteCache(".langchain_cache.db"))
+        ```
+    """
+
+    def __init__(
+        self,
+        database_path: str | Path = ".langchain_cache.db",
+        *,
+        batch_size: int = 32,
+        flush_interval: float = 1.0,
+        timeout: float = 30.0,
+    ) -> None:
+        """Open or create the cache database.
+
+        Args:
+            database_path: Path of the SQLite database file.
+            batch_size: Number of pending updates that triggers a write.
+
+                Use `1` to write every update immediately.
+            flush_interval: Maximum time, in seconds, an update stays pending
+                before the next update triggers a write.
+            timeout: Time, in seconds, to wait for another process to release the
+                database lock before raising.
+
+        Raises:
+            ValueError: If `batch_size` is less than `1`.
+        """
+        if batch_size < 1:
+            msg = "batch_size must be greater than 0"
+            raise ValueError(msg)
+        self._database_path = str(database_path)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._timeout = timeout
+        # Guards the write buffers and the reader thread; never held while waiting
+        # on the database.
+        self._lock = threading.Lock()
+        # Serializes lookups on the read connection.
+        self._read_lock = threading.Lock()
+        # Serializes flushes so that batches are written in order, and guards the
+        # write connection.
+        self._write_lock = threading.Lock()
+        self._pending: dict[bytes, bytes] = {}
+        self._pending_since = 0.0
+        # The batch being written by `flush`, still visible to lookups.
+        self._flushing: dict[bytes, bytes] = {}
+        # Connections and reader thread, with the id of the process that opened
+        # them: they must not be used by a forked child.
+        self._reader: tuple[int, sqlite3.Connection] | None = None
+        self._writer: tuple[int, sqlite3.Connection] | None = None
+        self._executor: tuple[int, ThreadPoolExecutor] | None = None
+        # Create the database right away, so that errors surface here.
+        with self._write_lock:
+            self._write_connection()
+        self._finalizer = weakref.finalize(
+            self, _flush_at_exit, self._database_path, timeout, self._pending
+        )
+
+    def _open(
+        self, held: tuple[int, sqlite3.Connection] | None
+    ) -> tuple[int, sqlite3.Connection]:
+        pid = os.getpid()
+        if held is None or held[0] != pid:
+            return pid, _connect(self._database_path, self._timeout)
+        return held
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """Return the read connection, opening it if needed.
+
+        Must be called with `_read_lock` held.
+        """
+        self._reader = self._open(self._reader)
+        return self._reader[1]
+
+    def _write_connection(self) -> sqlite3.Connection:
+        """Return the write connection, opening it if needed.
+
+        Must be called with `_write_lock` held.
+        """
+        self._writer = self._open(self._writer)
+        return self._writer[1]
+
+    def _reader_thread(self) -> ThreadPoolExecutor:
+        """Return the executor running the async lookups, starting it if needed."""
+        pid = os.getpid()
+        with self._lock:
+            if self._executor is None or self._executor[0] != pid:
+                self._executor = (
+                    pid,
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix="SQLiteCache"),
+                )
+            return self._executor[1]
+
+    def _read(self, key: bytes) -> RETURN_VAL_TYPE | None:
+        value = self._buffered(key)
+        if value is None:
+            with self._read_lock:
+                row = (
+                    self._read_connection()
+                    .execute("SELECT value FROM llm_cache WHERE key = ?", (key,))
+                    .fetchone()
+                )
+            if row is None:
+                return None
+            value = row[0]
+        return _decode_generations(value)
+
+    def _buffered(self, key: bytes) -> bytes | None:
+        with self._lock:
+            value = self._pending.get(key)
+            return self._flushing.get(key) if value is None else value
+
+    def _flush_due(self) -> bool:
+        return len(self._pending) >= self._batch_size or (
+            time.monotonic() - self._pending_since >= self._flush_interval
+        )
+
+    def _buffer(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> bool:
+        """Add an update to the write buffer and return whether a flush is due."""
+        value = _encode_generations(return_val)
+        with self._lock:
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending[_cache_key(prompt, llm_string)] = value
+            return self._flush_due()
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Look up based on `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+
+        Returns:
+            On a cache miss, return `None`. On a cache hit, return the cached value.
+        """
+        return self._read(_cache_key(prompt, llm_string))
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Update cache based on `prompt` and `llm_string`.
+
+        The update is buffered and written with the next batch. Errors writing the
+        batch are logged rather than raised.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+            return_val: The value to be cached.
+
+                The value is a list of `Generation` (or subclasses).
+        """
+        if self._buffer(prompt, llm_string, return_val):
+            self._flush_or_log()
+
+    def _flush_or_log(self) -> None:
+        import sqlite3  # noqa: PLC0415
+
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            logger.warning("Failed to write to the LLM cache: %s", repr(e))
+
+    def flush(self) -> None:
+        """Write all pending updates to the database.
+
+        If the write fails, the updates stay pending.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._flushing = batch = dict(self._pending)
+                self._pending.clear()
+            try:
+                _write_batch(self._write_connection(), batch)
+            except BaseException:
+                with self._lock:
+                    # Updates buffered since the batch was taken are newer.
+                    self._pending.update(
+                        {k: v for k, v in batch.items() if k not in self._pending}
+                    )
+                    self._pending_since = time.monotonic()
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+    @override
+    def clear(self, **kwargs: Any) -> None:
+        """Clear cache, including pending updates."""
+        with self._write_lock:
+            with self._lock:
+                self._pending.clear()
+            self._write_connection().execute("DELETE FROM llm_cache")
+
+    def close(self) -> None:
+        """Flush pending updates and close the database connections."""
+        self.flush()
+        pid = os.getpid()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and executor[0] == pid:
+            executor[1].shutdown()
+        with self._read_lock:
+            reader, self._reader = self._reader, None
+        with self._write_lock:
+            writer, self._writer = self._writer, None
+        for held in (reader, writer):
+            if held is not None and held[0] == pid:
+                held[1].close()
+
+    async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Async look up based on `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+
+        Returns:
+            On a cache miss, return `None`. On a cache hit, return the cached value.
+        """
+        key = _cache_key(prompt, llm_string)
+        value = self._buffered(key)
+        if value is not None:
+            return _decode_generations(value)
+        return await asyncio.wrap_future(self._reader_thread().submit(self._read, key))
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        """Async update cache based on `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+            return_val: The value to be cached. The value is a list of `Generation`
+                (or subclasses).
+        """
+        if self._buffer(prompt, llm_string, return_val):
+            await run_in_executor(None, self._flush_or_log)
+
+    @override
+    async def aclear(self, **kwargs: Any) -> None:
+        """Async clear cache."""
+        await run_in_executor(None, self.clear)
+
+
+# Number of prompt embeddings computed by missed lookups that are kept for the
+# update that usually follows them.
+_RECENT_EMBEDDINGS_SIZE = 128
+
+
+def _prompt_text(prompt: str) -> str:
+    """Return the text of a prompt that is relevant to its meaning.
+
+    Chat models cache serialized lists of messages, whose JSON structure would
+    dominate the embedding. For those, only the type and content of each message
+    are kept.
+    """
+    if not prompt.startswith('[{"lc"'):
+        return prompt
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    lines = []
+    for message in messages:
+        kwargs = message.get("kwargs", {}) if isinstance(message, dict) else {}
+        content = kwargs.get("content")
+        if isinstance(content, list):
+            content = "\n".join(
+                block if isinstance(block, str) else str(block.get("text", ""))
+                for block in content
+                if isinstance(block, (str, dict))
+            )
+        if isinstance(content, str):
+            lines.append(f"{kwargs.get('type', '')}: {content}")
+    return "\n".join(lines) or prompt
+
+
+class SemanticCache(BaseCache):
+    """Cache that returns generations cached for semantically similar prompts.
+
+    Prompts are embedded with an `Embeddings` model. A lookup returns the
+    generations cached for the most similar prompt with the same `llm_string`, if
+    their cosine similarity is at least `score_threshold`. Exact matches are
+    answered without calling the embedding model. For chat models, only the type
+    and content of the messages are embedded, not their serialization.
+
+    The embeddings of each `llm_string` are kept in a contiguous `float32` matrix,
+    so a lookup is a single matrix-vector product. The number of cached entries is
+    bounded by `maxsize`, with entries evicted according to `eviction_policy`.
+
+    !!! warning
+
+        A semantic cache can return an answer to a different question. Pick a
+        threshold that is high enough for your embedding model and use case.
+
+    Example:
+        ```python
+        from langchain_core.caches import SemanticCache
+        from langchain_core.globals import set_llm_cache
+
+        set_llm_cache(SemanticCache(embeddings, score_threshold=0.95))
+        ```
+    """
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        *,
+        score_threshold: float = 0.95,
+        maxsize: int | None = 1_000,
+        eviction_policy: Literal["fifo", "lru", "lfu"] | EvictionPolicy = "lru",
+    ) -> None:
+        """Initialize with empty cache.
+
+        Args:
+            embedding: The embedding model used to embed prompts.
+            score_threshold: Minimum cosine similarity, between `-1` and `1`, for a
+                cached prompt to be considered a match.
+            maxsize: The maximum number of items to store in the cache.
+
+                If `None`, the cache has no maximum size.
+            eviction_policy: Which entry to evict when the cache is full.
+
+                See `InMemoryCache` for the available policies.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If `score_threshold` is not between `-1` and `1`, if
+                `maxsize` is less than or equal to `0`, or if `eviction_policy` is
+                unknown.
+        """
+        from langchain_core.vectorstores.utils import _HAS_NUMPY  # noqa: PLC0415
+
+        if not _HAS_NUMPY:
+            msg = (
+                "SemanticCache requires numpy to be installed. "
+                "Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
+        if not -1 <= score_threshold <= 1:
+            msg = "score_threshold must be between -1 and 1"
+            raise ValueError(msg)
+        if maxsize is not None and maxsize <= 0:
+            msg = "maxsize must be greater than 0"
+            raise ValueError(msg)
+        self.embedding = embedding
+        self.score_threshold = score_threshold
+        self._maxsize = maxsize
+        self._policy = _resolve_eviction_policy(eviction_policy)
+        self._cache: dict[_CacheKey, RETURN_VAL_TYPE] = {}
+        self._matrices: dict[str, _VectorMatrix] = {}
+        self._recent_embeddings: OrderedDict[str, list[float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _exact_match(self, key: _CacheKey) -> tuple[RETURN_VAL_TYPE | None, bool]:
+        """Return the entry stored under `key` and whether a search is needed."""
+        with self._lock:
+            if key in self._cache:
+                self._policy.access(key)
+                self._hits += 1
+                return self._cache[key], False
+            if key[1] not in self._matrices:
+                self._misses += 1
+                return None, False
+            return None, True
+
+    def _search(
+        self, prompt: str, llm_string: str, embedding: list[float]
+    ) -> RETURN_VAL_TYPE | None:
+        with self._lock:
+            matrix = self._matrices.get(llm_string)
+            if matrix is not None:
+                scores = matrix.cosine_similarity([embedding])[0]
+                best = int(scores.argmax())
+                if scores[best] >= self.score_threshold:
+                    key = (matrix.ids[best], llm_string)
+                    self._policy.access(key)
+                    self._hits += 1
+                    return self._cache[key]
+            self._misses += 1
+            # The caller will most likely update the cache with this prompt next.
+            self._recent_embeddings[prompt] = embedding
+            self._recent_embeddings.move_to_end(prompt)
+            if len(self._recent_embeddings) > _RECENT_EMBEDDINGS_SIZE:
+                self._recent_embeddings.popitem(last=False)
+            return None
+
+    def _pop_recent_embedding(self, prompt: str) -> list[float] | None:
+        with self._lock:
+            return self._recent_embeddings.pop(prompt, None)
+
+    def _remove(self, key: _CacheKey) -> None:
+        del self._cache[key]
+        self._policy.remove(key)
+        matrix = self._matrices[key[1]]
+        matrix.remove(key[0])
+        if not len(matrix):
+            del self._matrices[key[1]]
+
+    def _store(
+        self,
+        prompt: str,
+        llm_string: str,
+        embedding: list[float],
+        return_val: RETURN_VAL_TYPE,
+    ) -> None:
+        from langchain_core.vectorstores.utils import _VectorMatrix  # noqa: PLC0415
+
+        key = (prompt, llm_string)
+        with self._lock:
+            if key in self._cache:
+                self._policy.access(key)
+            else:
+                while (
+                    self._cache
+                    and self._maxsize is not None
+                    and len(self._cache) >= self._maxsize
+                ):
+                    self._remove(self._policy.victim())
+                    self._evictions += 1
+                self._policy.insert(key)
+            matrix = self._matrices.get(llm_string)
+            if matrix is None:
+                matrix = self._matrices[llm_string] = _VectorMatrix(len(embedding))
+            matrix.upsert(prompt, embedding)
+            self._cache[key] = return_val
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Look up based on `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+
+        Returns:
+            On a cache miss, return `None`. On a cache hit, return the cached value
+                of the most similar prompt.
+        """
+        cached, needs_search = self._exact_match((prompt, llm_string))
+        if not needs_search:
+            return cached
+        embedding = self.embedding.embed_query(_prompt_text(prompt))
+        return self._search(prompt, llm_string, embedding)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Update cache based on `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+            return_val: The value to be cached.
+
+                The value is a list of `Generation` (or subclasses).
+        """
+        embedding = self._pop_recent_embedding(prompt)
+        if embedding is None:
+            embedding = self.embedding.embed_query(_prompt_text(prompt))
+        self._store(prompt, llm_string, embedding, return_val)
+
+    @override
+    def clear(self, **kwargs: Any) -> None:
+        """Clear cache."""
+        with self._lock:
+            self._cache = {}
+            self._matrices = {}
+            self._recent_embeddings.clear()
+            self._policy.clear()
+
+    def stats(self) -> CacheStats:
+        """Return hit, miss and eviction counters along with the current size.
+
+        Returns:
+            A snapshot of the cache statistics.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=0,
+                size=len(self._cache),
+                bytes=0,
+            )
+
+    async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Async look up based on `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+
+        Returns:
+            On a cache miss, return `None`. On a cache hit, return the cached value
+                of the most similar prompt.
+        """
+        cached, needs_search = self._exact_match((prompt, llm_string))
+        if not needs_search:
+            return cached
+        embedding = await self.embedding.aembed_query(_prompt_text(prompt))
+        return self._search(prompt, llm_string, embedding)
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        """Async update cache based on `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+
+                In the case of a chat model, the prompt is a non-trivial
+                serialization of the prompt into the language model.
+            llm_string: A string representation of the LLM configuration.
+            return_val: The value to be cached. The value is a list of `Generation`
+                (or subclasses).
+        """
+        embedding = self._pop_recent_embedding(prompt)
+        if embedding is None:
+            embedding = await self.embedding.aembed_query(_prompt_text(prompt))
+        self._store(prompt, llm_string, embedding, return_val)
+
+    @override
+    async def aclear(self, **kwargs: Any) -> None:
+        """Async clear cache."""
+        self.clear()
@@ -17,8 +17,10 @@ from langsmith.run_helpers import get_tracing_context
 from typing_extensions import Self, override
 
 from langchain_core.callbacks.base import (
+    AsyncCallbackHandler,
     BaseCallbackHandler,
     BaseCallbackManager,
+    CallbackManagerMixin,
     Callbacks,
     ChainManagerMixin,
     LLMManagerMixin,
@@ -253,6 +255,36 @@ def shielded(func: Func) -> Func:
     return cast("Func", wrapped)
 
 
+# The do-nothing implementations that handlers inherit for every event they don't
+# override, resolved once at import. `on_chat_model_start` is excluded: its default
+# raises `NotImplementedError` to fall back to `on_llm_start`.
+_NOOP_CALLBACKS = frozenset(
+    method
+    for mixin in (
+        RetrieverManagerMixin,
+        LLMManagerMixin,
+        ChainManagerMixin,
+        ToolManagerMixin,
+        CallbackManagerMixin,
+        RunManagerMixin,
+        AsyncCallbackHandler,
+    )
+    for name, method in vars(mixin).items()
+    if name.startswith("on_") and name != "on_chat_model_start"
+)
+
+
+def _skips_event(handler: BaseCallbackHandler, event_name: str) -> bool:
+    """Whether `handler` only inherits the no-op implementation of `event_name`.
+
+    Such handlers are not dispatched to at all, which avoids creating (and, for
+    async handlers, scheduling) a call that does nothing for every streamed token.
+    """
+    return getattr(
+        type(handler), event_name, None
+    ) in _NOOP_CALLBACKS and event_name not in getattr(handler, "__dict__", ())
+
+
 def handle_event(
     handlers: list[BaseCallbackHandler],
     event_name: str,
@@ -276,6 +308,8 @@ def handle_event(
     try:
         message_strings: list[str] | None = None
         for handler in handlers:
+            if _skips_event(handler, event_name):
+                continue
             try:
                 if ignore_condition_name is None or not getattr(
                     handler, ignore_condition_name
@@ -435,10 +469,18 @@ async def ahandle_event(
         **kwargs: The keyword arguments to pass to the event handler.
 
     """
-    for handler in [h for h in handlers if h.run_inline]:
-        await _ahandle_event_for_handler(
-            handler, event_name, ignore_condition_name, *args, **kwargs
-        )
+    concurrent = False
+    for handler in handlers:
+        if _skips_event(handler, event_name):
+            continue
+        if handler.run_inline:
+            await _ahandle_event_for_handler(
+                handler, event_name, ignore_condition_name, *args, **kwargs
+            )
+        else:
+            concurrent = True
+    if not concurrent:
+        return
     await asyncio.gather(
         *(
             _ahandle_event_for_handler(
@@ -449,7 +491,7 @@ async def ahandle_event(
                 **kwargs,
             )
             for handler in handlers
-            if not handler.run_inline
+            if not handler.run_inline and not _skips_event(handler, event_name)
         )
     )
 
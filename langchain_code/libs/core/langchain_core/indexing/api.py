@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import json
+import os
 import uuid
 import warnings
-from itertools import islice
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import ExitStack
+from itertools import chain, islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -20,6 +26,7 @@ from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 from langchain_core.exceptions import LangChainException
 from langchain_core.indexing.base import DocumentIndex, RecordManager
+from langchain_core.runnables.config import get_executor_for_config
 from langchain_core.vectorstores import VectorStore
 
 if TYPE_CHECKING:
@@ -27,15 +34,25 @@ if TYPE_CHECKING:
         AsyncIterable,
         AsyncIterator,
         Callable,
+        Container,
+        Coroutine,
         Iterable,
         Iterator,
         Sequence,
     )
+    from concurrent.futures import Executor
+
+    from typing_extensions import Self
 
 # Magic UUID to use as a namespace for hashing.
 # Used to try and generate a unique UUID for each document
 # from hashing the document content and metadata.
 NAMESPACE_UUID = uuid.UUID(int=1984)
+_NAMESPACE_BYTES = NAMESPACE_UUID.bytes
+
+# Encodes metadata exactly like `json.dumps(metadata, sort_keys=True)` without
+# building a new encoder for every document.
+_METADATA_ENCODER = json.JSONEncoder(sort_keys=True)
 
 
 T = TypeVar("T")
@@ -148,14 +165,29 @@ class IndexingException(LangChainException):
     """Raised when an indexing operation fails."""
 
 
+def _uuid5(name: str) -> str:
+    """Return `str(uuid.uuid5(NAMESPACE_UUID, name))` without the UUID objects."""
+    digest = bytearray(
+        hashlib.sha1(
+            _NAMESPACE_BYTES + name.encode("utf-8"), usedforsecurity=False
+        ).digest()[:16]
+    )
+    # Set the version (5) and RFC 4122 variant bits.
+    digest[6] = (digest[6] & 0x0F) | 0x50
+    digest[8] = (digest[8] & 0x3F) | 0x80
+    hex_ = digest.hex()
+    return f"{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}"
+
+
 def _calculate_hash(
     text: str, algorithm: Literal["sha1", "sha256", "sha512", "blake2b"]
 ) -> str:
     """Return a hexadecimal digest of *text* using *algorithm*."""
     if algorithm == "sha1":
         # Calculate the SHA-1 hash and return it as a UUID.
-        digest = hashlib.sha1(text.encode("utf-8"), usedforsecurity=False).hexdigest()
-        return str(uuid.uuid5(NAMESPACE_UUID, digest))
+        return _uuid5(
+            hashlib.sha1(text.encode("utf-8"), usedforsecurity=False).hexdigest()
+        )
     if algorithm == "blake2b":
         return hashlib.blake2b(text.encode("utf-8")).hexdigest()
     if algorithm == "sha256":
@@ -197,31 +229,101 @@ def _get_document_with_hash(
     Returns:
         Document with a unique identifier based on the hash of the content and metadata.
     """
-    metadata: dict[str, Any] = dict(document.metadata or {})
+    return Document(
+        # Assign a unique identifier based on the hash.
+        id=_hash_documents([document], key_encoder=key_encoder)[0],
+        page_content=document.page_content,
+        metadata=document.metadata,
+    )
 
+
+def _hash_documents(
+    documents: Sequence[Document],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+) -> list[str]:
+    """Calculate the hash of each document, as `_get_document_with_hash` does.
+
+    Metadata that repeats across the documents is only hashed once.
+
+    Raises:
+        ValueError: If the metadata cannot be serialized using json.
+    """
     if callable(key_encoder):
         # If key_encoder is a callable, we use it to generate the hash.
-        hash_ = key_encoder(document)
-    else:
+        return [key_encoder(document) for document in documents]
+
+    hashes = []
+    metadata_hashes: dict[str, str] = {}
+    for document in documents:
         # The hashes are calculated separate for the content and the metadata.
         content_hash = _calculate_hash(document.page_content, algorithm=key_encoder)
         try:
-            serialized_meta = json.dumps(metadata, sort_keys=True)
+            serialized_meta = _METADATA_ENCODER.encode(document.metadata or {})
         except Exception as e:
             msg = (
                 f"Failed to hash metadata: {e}. "
                 f"Please use a dict that can be serialized using json."
             )
             raise ValueError(msg) from e
-        metadata_hash = _calculate_hash(serialized_meta, algorithm=key_encoder)
-        hash_ = _calculate_hash(content_hash + metadata_hash, algorithm=key_encoder)
+        metadata_hash = metadata_hashes.get(serialized_meta)
+        if metadata_hash is None:
+            metadata_hash = _calculate_hash(serialized_meta, algorithm=key_encoder)
+            metadata_hashes[serialized_meta] = metadata_hash
+        hashes.append(
+            _calculate_hash(content_hash + metadata_hash, algorithm=key_encoder)
+        )
+    return hashes
 
-    return Document(
-        # Assign a unique identifier based on the hash.
-        id=hash_,
-        page_content=document.page_content,
-        metadata=document.metadata,
+
+_MIN_PARALLEL_HASH_BATCH = 16
+"""Smallest batch that is split across the hashing executor."""
+
+
+def _hash_batch(
+    documents: list[Document],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    executor: Executor | None,
+) -> list[str]:
+    """Hash a batch of documents, in parallel chunks if an executor is given."""
+    if executor is None or len(documents) < _MIN_PARALLEL_HASH_BATCH:
+        return _hash_documents(documents, key_encoder=key_encoder)
+    hashes = executor.map(
+        functools.partial(_hash_documents, key_encoder=key_encoder),
+        _split_for_hashing(documents),
     )
+    return list(chain.from_iterable(hashes))
+
+
+async def _ahash_batch(
+    documents: list[Document],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    executor: Executor | None,
+) -> list[str]:
+    """Async hash a batch of documents, in parallel chunks if an executor is given."""
+    if executor is None:
+        return _hash_documents(documents, key_encoder=key_encoder)
+    hashes = await asyncio.gather(
+        *(
+            asyncio.wrap_future(
+                executor.submit(_hash_documents, chunk, key_encoder=key_encoder)
+            )
+            for chunk in _split_for_hashing(documents)
+        )
+    )
+    return list(chain.from_iterable(hashes))
+
+
+def _split_for_hashing(documents: list[Document]) -> list[list[Document]]:
+    """Split documents into one chunk per CPU, keeping their order."""
+    n_chunks = min(os.cpu_count() or 1, len(documents)) or 1
+    size = -(-len(documents) // n_chunks)
+    return [documents[i : i + size] for i in range(0, len(documents), size)]
 
 
 # This internal abstraction was imported by the langchain package internally, so
@@ -271,6 +373,273 @@ def _delete(
         raise TypeError(msg)
 
 
+_BatchCounts = tuple[int, int, int]
+"""Number of added, updated and skipped documents of an indexed batch."""
+
+
+def _prepare_batch(
+    doc_batch: list[Document],
+    hashes: list[str],
+    *,
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+) -> tuple[list[Document], Sequence[str | None], int]:
+    """Deduplicate a batch of hashed documents and assign their source IDs.
+
+    Returns:
+        The hashed documents, their source IDs and the number of documents
+        dropped as duplicates within the batch.
+
+    Raises:
+        ValueError: If a source ID is missing while `cleanup` requires one.
+    """
+    hashed_docs = list(
+        _deduplicate_in_order(
+            [
+                # Assign a unique identifier based on the hash.
+                Document(id=hash_, page_content=doc.page_content, metadata=doc.metadata)
+                for doc, hash_ in zip(doc_batch, hashes, strict=True)
+            ]
+        )
+    )
+
+    source_ids: Sequence[str | None] = [
+        source_id_assigner(hashed_doc) for hashed_doc in hashed_docs
+    ]
+
+    if cleanup in {"incremental", "scoped_full"}:
+        # Source IDs are required.
+        for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
+            if source_id is None:
+                msg = (
+                    f"Source IDs are required when cleanup mode is "
+                    f"incremental or scoped_full. "
+                    f"Document that starts with "
+                    f"content: {hashed_doc.page_content[:100]} "
+                    f"was not assigned as source id."
+                )
+                raise ValueError(msg)
+
+    return hashed_docs, source_ids, len(doc_batch) - len(hashed_docs)
+
+
+def _prepare_batches(
+    doc_batches: Iterable[list[Document]],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    hash_executor: Executor | None,
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+) -> Iterator[tuple[list[Document], Sequence[str | None], int]]:
+    """Lazily hash each batch of documents and apply `_prepare_batch` to it."""
+    for doc_batch in doc_batches:
+        yield _prepare_batch(
+            doc_batch,
+            _hash_batch(doc_batch, key_encoder=key_encoder, executor=hash_executor),
+            source_id_assigner=source_id_assigner,
+            cleanup=cleanup,
+        )
+
+
+def _merge_exists(
+    uids: Sequence[str], looked_up: Sequence[str], exists: Sequence[bool]
+) -> list[bool]:
+    """Align record manager lookups with a batch, counting the rest as existing."""
+    found = dict(zip(looked_up, exists, strict=False))
+    return [found.get(uid, True) for uid in uids]
+
+
+def _split_batch(
+    hashed_docs: Sequence[Document],
+    exists_batch: Sequence[bool],
+    *,
+    force_update: bool,
+) -> tuple[list[str], list[Document], list[str], int]:
+    """Split a batch into documents to write and documents to only refresh.
+
+    Returns:
+        The IDs and documents to write, the IDs to refresh and the number of
+        documents to write that already exist.
+    """
+    uids = []
+    docs_to_index = []
+    uids_to_refresh = []
+    seen_docs: set[str] = set()
+    for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
+        hashed_id = cast("str", hashed_doc.id)
+        if doc_exists:
+            if force_update:
+                seen_docs.add(hashed_id)
+            else:
+                uids_to_refresh.append(hashed_id)
+                continue
+        uids.append(hashed_id)
+        docs_to_index.append(hashed_doc)
+    return uids, docs_to_index, uids_to_refresh, len(seen_docs)
+
+
+def _index_batch(
+    hashed_docs: list[Document],
+    source_ids: Sequence[str | None],
+    claimed_ids: Container[str] = frozenset(),
+    *,
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    index_start_dt: float,
+    force_update: bool,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> _BatchCounts:
+    """Write a batch of hashed documents and record them in the record manager.
+
+    Args:
+        hashed_docs: Deduplicated documents with their hash as ID.
+        source_ids: Source ID of each document.
+        claimed_ids: IDs an earlier batch of the same run is still writing.
+            They count as existing without asking the record manager.
+        record_manager: Record manager keeping track of the documents.
+        destination: Vector store or document index to write to.
+        index_start_dt: Time at which the indexing run started.
+        force_update: Whether to rewrite documents that already exist.
+        batch_size: Batch size passed on to `add_documents`.
+        upsert_kwargs: Extra keyword arguments for the write.
+
+    Returns:
+        The number of added, updated and skipped documents.
+    """
+    all_uids = [cast("str", doc.id) for doc in hashed_docs]
+    looked_up = [uid for uid in all_uids if uid not in claimed_ids]
+    exists_batch = _merge_exists(
+        all_uids, looked_up, record_manager.exists(looked_up) if looked_up else []
+    )
+
+    # Filter out documents that already exist in the record store.
+    uids, docs_to_index, uids_to_refresh, num_seen = _split_batch(
+        hashed_docs, exists_batch, force_update=force_update
+    )
+    num_added = num_updated = num_skipped = 0
+
+    # Update refresh timestamp
+    if uids_to_refresh:
+        record_manager.update(uids_to_refresh, time_at_least=index_start_dt)
+        num_skipped = len(uids_to_refresh)
+
+    # Be pessimistic and assume that all vector store write will fail.
+    # First write to vector store
+    if docs_to_index:
+        if isinstance(destination, VectorStore):
+            destination.add_documents(
+                docs_to_index,
+                ids=uids,
+                batch_size=batch_size,
+                **(upsert_kwargs or {}),
+            )
+        elif isinstance(destination, DocumentIndex):
+            destination.upsert(
+                docs_to_index,
+                **(upsert_kwargs or {}),
+            )
+
+        num_added = len(docs_to_index) - num_seen
+        num_updated = num_seen
+
+    # And only then update the record store.
+    # Update ALL records, even if they already exist since we want to refresh
+    # their timestamp.
+    record_manager.update(
+        all_uids,
+        group_ids=source_ids,
+        time_at_least=index_start_dt,
+    )
+    return num_added, num_updated, num_skipped
+
+
+class _InFlightBatches:
+    """Bookkeeping shared by the pipelined indexing modes.
+
+    Later batches are hashed and submitted while earlier ones are still looking
+    up and writing their documents. A document ID held by a batch that is still
+    in flight is claimed: later batches count it as existing, which is what they
+    would have found had the batches run one after another.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        self._max_concurrency = max_concurrency
+        self._claimed: Counter[str] = Counter()
+        self.num_added = 0
+        self.num_updated = 0
+        self.num_skipped = 0
+
+    def _claim(self, uids: list[str]) -> frozenset[str]:
+        claimed = frozenset(uid for uid in uids if uid in self._claimed)
+        self._claimed.update(uids)
+        return claimed
+
+    def _release(self, uids: list[str], counts: _BatchCounts) -> None:
+        for uid in uids:
+            self._claimed[uid] -= 1
+            if not self._claimed[uid]:
+                del self._claimed[uid]
+        num_added, num_updated, num_skipped = counts
+        self.num_added += num_added
+        self.num_updated += num_updated
+        self.num_skipped += num_skipped
+
+
+class _BatchPipeline(_InFlightBatches):
+    """Index batches on an executor with at most `max_concurrency` in flight."""
+
+    def __init__(
+        self,
+        index_batch: Callable[
+            [list[Document], Sequence[str | None], Container[str]], _BatchCounts
+        ],
+        max_concurrency: int,
+    ) -> None:
+        super().__init__(max_concurrency)
+        self._index_batch = index_batch
+        self._in_flight: dict[Future[_BatchCounts], list[str]] = {}
+        self._exit_stack = ExitStack()
+
+    def __enter__(self) -> Self:
+        self._executor = self._exit_stack.enter_context(
+            get_executor_for_config({"max_concurrency": self._max_concurrency})
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        with self._exit_stack:
+            if exc_type is not None:
+                for future in self._in_flight:
+                    future.cancel()
+                wait(self._in_flight)
+                return
+            self._collect(wait(self._in_flight).done)
+
+    def submit(
+        self, hashed_docs: list[Document], source_ids: Sequence[str | None]
+    ) -> None:
+        """Submit the next batch, blocking while too many batches are in flight."""
+        if len(self._in_flight) >= self._max_concurrency:
+            done, _ = wait(self._in_flight, return_when=FIRST_COMPLETED)
+            self._collect(done)
+        uids = [cast("str", doc.id) for doc in hashed_docs]
+        future = self._executor.submit(
+            self._index_batch, hashed_docs, source_ids, self._claim(uids)
+        )
+        self._in_flight[future] = uids
+
+    def _collect(self, done: Iterable[Future[_BatchCounts]]) -> None:
+        for future in done:
+            self._release(self._in_flight.pop(future), future.result())
+
+
 # PUBLIC API
 
 
@@ -300,6 +669,8 @@ def index(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
+    hash_executor: Executor | None = None,
 ) -> IndexingResult:
     """Index data from the loader into the vector store.
 
@@ -382,6 +753,27 @@ def index(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: Maximum number of batches to index concurrently.
+
+            When set, the next batches are hashed while the record manager
+            lookups and vector store writes of up to `max_concurrency` batches
+            run concurrently; reading from the loader pauses while that many
+            batches are in flight. The returned counts are the same as when
+            indexing one batch at a time, which is what `None` does.
+
+            The record manager and the vector store are then called from several
+            threads at once, so both must be thread safe.
+
+            Not supported with `incremental` cleanup, which deletes stale
+            documents between batches.
+        hash_executor: Executor to hash the documents of each batch on, split into
+            one chunk per CPU. Document IDs are the same as without it.
+
+            A `ProcessPoolExecutor` parallelizes all of the hashing. A
+            `ThreadPoolExecutor` helps with long documents, as `hashlib` releases
+            the GIL while hashing large inputs. A custom `key_encoder` must be
+            picklable to be used with a process pool. The executor is not shut
+            down.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -393,6 +785,8 @@ def index(
         ValueError: If `VectorStore` does not have
             "delete" and "add_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
+        ValueError: If `max_concurrency` is smaller than 1 or is set together with
+            `incremental` cleanup.
         TypeError: If `vectorstore` is not a `VectorStore` or a DocumentIndex.
         AssertionError: If `source_id` is None when cleanup mode is incremental.
             (should be unreachable code).
@@ -415,6 +809,14 @@ def index(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None:
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1. Got {max_concurrency}."
+            raise ValueError(msg)
+        if cleanup == "incremental":
+            msg = "max_concurrency is not supported with incremental cleanup."
+            raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -461,118 +863,74 @@ def index(
     num_deleted = 0
     scoped_full_cleanup_source_ids: set[str] = set()
 
-    for doc_batch in _batch(batch_size, doc_iterator):
-        # Track original batch size before deduplication
-        original_batch_size = len(doc_batch)
+    batches = _prepare_batches(
+        _batch(batch_size, doc_iterator),
+        key_encoder=key_encoder,
+        hash_executor=hash_executor,
+        source_id_assigner=source_id_assigner,
+        cleanup=cleanup,
+    )
+    index_batch = functools.partial(
+        _index_batch,
+        record_manager=record_manager,
+        destination=destination,
+        index_start_dt=index_start_dt,
+        force_update=force_update,
+        batch_size=batch_size,
+        upsert_kwargs=upsert_kwargs,
+    )
 
-        hashed_docs = list(
-            _deduplicate_in_order(
-                [
-                    _get_document_with_hash(doc, key_encoder=key_encoder)
-                    for doc in doc_batch
-                ]
-            )
-        )
-        # Count documents removed by within-batch deduplication
-        num_skipped += original_batch_size - len(hashed_docs)
-
-        source_ids: Sequence[str | None] = [
-            source_id_assigner(hashed_doc) for hashed_doc in hashed_docs
-        ]
-
-        if cleanup in {"incremental", "scoped_full"}:
-            # Source IDs are required.
-            for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
-                if source_id is None:
-                    msg = (
-                        f"Source IDs are required when cleanup mode is "
-                        f"incremental or scoped_full. "
-                        f"Document that starts with "
-                        f"content: {hashed_doc.page_content[:100]} "
-                        f"was not assigned as source id."
-                    )
-                    raise ValueError(msg)
+    if max_concurrency is not None:
+        with _BatchPipeline(index_batch, max_concurrency) as pipeline:
+            for hashed_docs, source_ids, num_duplicates in batches:
+                num_skipped += num_duplicates
                 if cleanup == "scoped_full":
-                    scoped_full_cleanup_source_ids.add(source_id)
-            # Source IDs cannot be None after for loop above.
-            source_ids = cast("Sequence[str]", source_ids)
-
-        exists_batch = record_manager.exists(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs])
-        )
-
-        # Filter out documents that already exist in the record store.
-        uids = []
-        docs_to_index = []
-        uids_to_refresh = []
-        seen_docs: set[str] = set()
-        for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
-            hashed_id = cast("str", hashed_doc.id)
-            if doc_exists:
-                if force_update:
-                    seen_docs.add(hashed_id)
-                else:
-                    uids_to_refresh.append(hashed_id)
-                    continue
-            uids.append(hashed_id)
-            docs_to_index.append(hashed_doc)
-
-        # Update refresh timestamp
-        if uids_to_refresh:
-            record_manager.update(uids_to_refresh, time_at_least=index_start_dt)
-            num_skipped += len(uids_to_refresh)
-
-        # Be pessimistic and assume that all vector store write will fail.
-        # First write to vector store
-        if docs_to_index:
-            if isinstance(destination, VectorStore):
-                destination.add_documents(
-                    docs_to_index,
-                    ids=uids,
-                    batch_size=batch_size,
-                    **(upsert_kwargs or {}),
-                )
-            elif isinstance(destination, DocumentIndex):
-                destination.upsert(
-                    docs_to_index,
-                    **(upsert_kwargs or {}),
-                )
-
-            num_added += len(docs_to_index) - len(seen_docs)
-            num_updated += len(seen_docs)
-
-        # And only then update the record store.
-        # Update ALL records, even if they already exist since we want to refresh
-        # their timestamp.
-        record_manager.update(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs]),
-            group_ids=source_ids,
-            time_at_least=index_start_dt,
-        )
-
-        # If source IDs are provided, we can do the deletion incrementally!
-        if cleanup == "incremental":
-            # Get the uids of the documents that were not returned by the loader.
-            # mypy isn't good enough to determine that source IDs cannot be None
-            # here due to a check that's happening above, so we check again.
-            for source_id in source_ids:
-                if source_id is None:
-                    msg = (
-                        "source_id cannot be None at this point. "
-                        "Reached unreachable code."
+                    scoped_full_cleanup_source_ids.update(
+                        cast("Sequence[str]", source_ids)
                     )
-                    raise AssertionError(msg)
-
-            source_ids_ = cast("Sequence[str]", source_ids)
-
-            while uids_to_delete := record_manager.list_keys(
-                group_ids=source_ids_, before=index_start_dt, limit=cleanup_batch_size
-            ):
-                # Then delete from vector store.
-                _delete(destination, uids_to_delete)
-                # First delete from record store.
-                record_manager.delete_keys(uids_to_delete)
-                num_deleted += len(uids_to_delete)
+                pipeline.submit(hashed_docs, source_ids)
+        num_added += pipeline.num_added
+        num_updated += pipeline.num_updated
+        num_skipped += pipeline.num_skipped
+    else:
+        for hashed_docs, source_ids, num_duplicates in batches:
+            # Count documents removed by within-batch deduplication
+            num_skipped += num_duplicates
+            if cleanup == "scoped_full":
+                scoped_full_cleanup_source_ids.update(cast("Sequence[str]", source_ids))
+
+            batch_added, batch_updated, batch_skipped = index_batch(
+                hashed_docs, source_ids
+            )
+            num_added += batch_added
+            num_updated += batch_updated
+            num_skipped += batch_skipped
+
+            # If source IDs are provided, we can do the deletion incrementally!
+            if cleanup == "incremental":
+                # Get the uids of the documents that were not returned by the loader.
+                # mypy isn't good enough to determine that source IDs cannot be None
+                # here due to a check that's happening above, so we check again.
+                for source_id in source_ids:
+                    if source_id is None:
+                        msg = (
+                            "source_id cannot be None at this point. "
+                            "Reached unreachable code."
+                        )
+                        raise AssertionError(msg)
+
+                source_ids_ = cast("Sequence[str]", source_ids)
+
+                while uids_to_delete := record_manager.list_keys(
+                    group_ids=source_ids_,
+                    before=index_start_dt,
+                    limit=cleanup_batch_size,
+                ):
+                    # Then delete from vector store.
+                    _delete(destination, uids_to_delete)
+                    # First delete from record store.
+                    record_manager.delete_keys(uids_to_delete)
+                    num_deleted += len(uids_to_delete)
 
     if cleanup == "full" or (
         cleanup == "scoped_full" and scoped_full_cleanup_source_ids
@@ -626,6 +984,147 @@ async def _adelete(
         raise TypeError(msg)
 
 
+async def _aprepare_batches(
+    doc_batches: AsyncIterable[list[Document]],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    hash_executor: Executor | None,
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+) -> AsyncIterator[tuple[list[Document], Sequence[str | None], int]]:
+    """Lazily hash each batch of documents and apply `_prepare_batch` to it."""
+    async for doc_batch in doc_batches:
+        yield _prepare_batch(
+            doc_batch,
+            await _ahash_batch(
+                doc_batch, key_encoder=key_encoder, executor=hash_executor
+            ),
+            source_id_assigner=source_id_assigner,
+            cleanup=cleanup,
+        )
+
+
+async def _aindex_batch(
+    hashed_docs: list[Document],
+    source_ids: Sequence[str | None],
+    claimed_ids: Container[str] = frozenset(),
+    *,
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    index_start_dt: float,
+    force_update: bool,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> _BatchCounts:
+    """Async write a batch of hashed documents and record them.
+
+    See `_index_batch` for the arguments.
+
+    Returns:
+        The number of added, updated and skipped documents.
+    """
+    all_uids = [cast("str", doc.id) for doc in hashed_docs]
+    looked_up = [uid for uid in all_uids if uid not in claimed_ids]
+    exists_batch = _merge_exists(
+        all_uids,
+        looked_up,
+        await record_manager.aexists(looked_up) if looked_up else [],
+    )
+
+    # Filter out documents that already exist in the record store.
+    uids, docs_to_index, uids_to_refresh, num_seen = _split_batch(
+        hashed_docs, exists_batch, force_update=force_update
+    )
+    num_added = num_updated = num_skipped = 0
+
+    if uids_to_refresh:
+        # Must be updated to refresh timestamp.
+        await record_manager.aupdate(uids_to_refresh, time_at_least=index_start_dt)
+        num_skipped = len(uids_to_refresh)
+
+    # Be pessimistic and assume that all vector store write will fail.
+    # First write to vector store
+    if docs_to_index:
+        if isinstance(destination, VectorStore):
+            await destination.aadd_documents(
+                docs_to_index,
+                ids=uids,
+                batch_size=batch_size,
+                **(upsert_kwargs or {}),
+            )
+        elif isinstance(destination, DocumentIndex):
+            await destination.aupsert(
+                docs_to_index,
+                **(upsert_kwargs or {}),
+            )
+        num_added = len(docs_to_index) - num_seen
+        num_updated = num_seen
+
+    # And only then update the record store.
+    # Update ALL records, even if they already exist since we want to refresh
+    # their timestamp.
+    await record_manager.aupdate(
+        all_uids,
+        group_ids=source_ids,
+        time_at_least=index_start_dt,
+    )
+    return num_added, num_updated, num_skipped
+
+
+class _AsyncBatchPipeline(_InFlightBatches):
+    """Index batches as tasks with at most `max_concurrency` in flight."""
+
+    def __init__(
+        self,
+        index_batch: Callable[
+            [list[Document], Sequence[str | None], Container[str]],
+            Coroutine[Any, Any, _BatchCounts],
+        ],
+        max_concurrency: int,
+    ) -> None:
+        super().__init__(max_concurrency)
+        self._index_batch = index_batch
+        self._in_flight: dict[asyncio.Task[_BatchCounts], list[str]] = {}
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        if exc_type is not None:
+            for task in self._in_flight:
+                task.cancel()
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+            return
+        if self._in_flight:
+            done, _ = await asyncio.wait(self._in_flight)
+            self._collect(done)
+
+    async def submit(
+        self, hashed_docs: list[Document], source_ids: Sequence[str | None]
+    ) -> None:
+        """Submit the next batch, waiting while too many batches are in flight."""
+        if len(self._in_flight) >= self._max_concurrency:
+            done, _ = await asyncio.wait(
+                self._in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            self._collect(done)
+        uids = [cast("str", doc.id) for doc in hashed_docs]
+        task = asyncio.create_task(
+            self._index_batch(hashed_docs, source_ids, self._claim(uids))
+        )
+        self._in_flight[task] = uids
+
+    def _collect(self, done: Iterable[asyncio.Task[_BatchCounts]]) -> None:
+        for task in done:
+            self._release(self._in_flight.pop(task), task.result())
+
+
 async def aindex(
     docs_source: BaseLoader | Iterable[Document] | AsyncIterator[Document],
     record_manager: RecordManager,
@@ -639,6 +1138,8 @@ async def aindex(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
+    hash_executor: Executor | None = None,
 ) -> IndexingResult:
     """Async index data from the loader into the vector store.
 
@@ -721,6 +1222,29 @@ async def aindex(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: Maximum number of batches to index concurrently.
+
+            When set, the next batches are hashed while the record manager
+            lookups and vector store writes of up to `max_concurrency` batches
+            run concurrently; reading from the loader pauses while that many
+            batches are in flight. The returned counts are the same as when
+            indexing one batch at a time, which is what `None` does.
+
+            The record manager and the vector store are then called from
+            concurrent tasks, so both must support concurrent calls. Async
+            methods that fall back to the sync ones run them on several threads at
+            once.
+
+            Not supported with `incremental` cleanup, which deletes stale
+            documents between batches.
+        hash_executor: Executor to hash the documents of each batch on, split into
+            one chunk per CPU. Document IDs are the same as without it.
+
+            A `ProcessPoolExecutor` parallelizes all of the hashing. A
+            `ThreadPoolExecutor` helps with long documents, as `hashlib` releases
+            the GIL while hashing large inputs. A custom `key_encoder` must be
+            picklable to be used with a process pool. The executor is not shut
+            down.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -732,6 +1256,8 @@ async def aindex(
         ValueError: If `VectorStore` does not have
             "adelete" and "aadd_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
+        ValueError: If `max_concurrency` is smaller than 1 or is set together with
+            `incremental` cleanup.
         TypeError: If `vector_store` is not a `VectorStore` or DocumentIndex.
         AssertionError: If `source_id_key` is None when cleanup mode is
             incremental or `scoped_full` (should be unreachable).
@@ -754,6 +1280,14 @@ async def aindex(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None:
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1. Got {max_concurrency}."
+            raise ValueError(msg)
+        if cleanup == "incremental":
+            msg = "max_concurrency is not supported with incremental cleanup."
+            raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -811,119 +1345,75 @@ async def aindex(
     num_deleted = 0
     scoped_full_cleanup_source_ids: set[str] = set()
 
-    async for doc_batch in _abatch(batch_size, async_doc_iterator):
-        # Track original batch size before deduplication
-        original_batch_size = len(doc_batch)
+    batches = _aprepare_batches(
+        _abatch(batch_size, async_doc_iterator),
+        key_encoder=key_encoder,
+        hash_executor=hash_executor,
+        source_id_assigner=source_id_assigner,
+        cleanup=cleanup,
+    )
+    index_batch = functools.partial(
+        _aindex_batch,
+        record_manager=record_manager,
+        destination=destination,
+        index_start_dt=index_start_dt,
+        force_update=force_update,
+        batch_size=batch_size,
+        upsert_kwargs=upsert_kwargs,
+    )
 
-        hashed_docs = list(
-            _deduplicate_in_order(
-                [
-                    _get_document_with_hash(doc, key_encoder=key_encoder)
-                    for doc in doc_batch
-                ]
-            )
-        )
-        # Count documents removed by within-batch deduplication
-        num_skipped += original_batch_size - len(hashed_docs)
-
-        source_ids: Sequence[str | None] = [
-            source_id_assigner(doc) for doc in hashed_docs
-        ]
-
-        if cleanup in {"incremental", "scoped_full"}:
-            # If the cleanup mode is incremental, source IDs are required.
-            for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
-                if source_id is None:
-                    msg = (
-                        f"Source IDs are required when cleanup mode is "
-                        f"incremental or scoped_full. "
-                        f"Document that starts with "
-                        f"content: {hashed_doc.page_content[:100]} "
-                        f"was not assigned as source id."
-                    )
-                    raise ValueError(msg)
+    if max_concurrency is not None:
+        async with _AsyncBatchPipeline(index_batch, max_concurrency) as pipeline:
+            async for hashed_docs, source_ids, num_duplicates in batches:
+                num_skipped += num_duplicates
                 if cleanup == "scoped_full":
-                    scoped_full_cleanup_source_ids.add(source_id)
-            # Source IDs cannot be None after for loop above.
-            source_ids = cast("Sequence[str]", source_ids)
-
-        exists_batch = await record_manager.aexists(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs])
-        )
-
-        # Filter out documents that already exist in the record store.
-        uids: list[str] = []
-        docs_to_index: list[Document] = []
-        uids_to_refresh = []
-        seen_docs: set[str] = set()
-        for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
-            hashed_id = cast("str", hashed_doc.id)
-            if doc_exists:
-                if force_update:
-                    seen_docs.add(hashed_id)
-                else:
-                    uids_to_refresh.append(hashed_id)
-                    continue
-            uids.append(hashed_id)
-            docs_to_index.append(hashed_doc)
-
-        if uids_to_refresh:
-            # Must be updated to refresh timestamp.
-            await record_manager.aupdate(uids_to_refresh, time_at_least=index_start_dt)
-            num_skipped += len(uids_to_refresh)
-
-        # Be pessimistic and assume that all vector store write will fail.
-        # First write to vector store
-        if docs_to_index:
-            if isinstance(destination, VectorStore):
-                await destination.aadd_documents(
-                    docs_to_index,
-                    ids=uids,
-                    batch_size=batch_size,
-                    **(upsert_kwargs or {}),
-                )
-            elif isinstance(destination, DocumentIndex):
-                await destination.aupsert(
-                    docs_to_index,
-                    **(upsert_kwargs or {}),
-                )
-            num_added += len(docs_to_index) - len(seen_docs)
-            num_updated += len(seen_docs)
-
-        # And only then update the record store.
-        # Update ALL records, even if they already exist since we want to refresh
-        # their timestamp.
-        await record_manager.aupdate(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs]),
-            group_ids=source_ids,
-            time_at_least=index_start_dt,
-        )
-
-        # If source IDs are provided, we can do the deletion incrementally!
-
-        if cleanup == "incremental":
-            # Get the uids of the documents that were not returned by the loader.
-
-            # mypy isn't good enough to determine that source IDs cannot be None
-            # here due to a check that's happening above, so we check again.
-            for source_id in source_ids:
-                if source_id is None:
-                    msg = (
-                        "source_id cannot be None at this point. "
-                        "Reached unreachable code."
+                    scoped_full_cleanup_source_ids.update(
+                        cast("Sequence[str]", source_ids)
                     )
-                    raise AssertionError(msg)
-
-            source_ids_ = cast("Sequence[str]", source_ids)
-
-            while uids_to_delete := await record_manager.alist_keys(
-                group_ids=source_ids_, before=index_start_dt, limit=cleanup_batch_size
-            ):
-                # Then delete from vector store.
-                await _adelete(destination, uids_to_delete)
-                # First delete from record store.
-                await record_manager.adelete_keys(uids_to_delete)
-                num_deleted += len(uids_to_delete)
+                await pipeline.submit(hashed_docs, source_ids)
+        num_added += pipeline.num_added
+        num_updated += pipeline.num_updated
+        num_skipped += pipeline.num_skipped
+    else:
+        async for hashed_docs, source_ids, num_duplicates in batches:
+            # Count documents removed by within-batch deduplication
+            num_skipped += num_duplicates
+            if cleanup == "scoped_full":
+                scoped_full_cleanup_source_ids.update(cast("Sequence[str]", source_ids))
+
+            batch_added, batch_updated, batch_skipped = await index_batch(
+                hashed_docs, source_ids
+            )
+            num_added += batch_added
+            num_updated += batch_updated
+            num_skipped += batch_skipped
+
+            # If source IDs are provided, we can do the deletion incrementally!
+            if cleanup == "incremental":
+                # Get the uids of the documents that were not returned by the loader.
+
+                # mypy isn't good enough to determine that source IDs cannot be None
+                # here due to a check that's happening above, so we check again.
+                for source_id in source_ids:
+                    if source_id is None:
+                        msg = (
+                            "source_id cannot be None at this point. "
+                            "Reached unreachable code."
+                        )
+                        raise AssertionError(msg)
+
+                source_ids_ = cast("Sequence[str]", source_ids)
+
+                while uids_to_delete := await record_manager.alist_keys(
+                    group_ids=source_ids_,
+                    before=index_start_dt,
+                    limit=cleanup_batch_size,
+                ):
+                    # Then delete from vector store.
+                    await _adelete(destination, uids_to_delete)
+                    # First delete from record store.
+                    await record_manager.adelete_keys(uids_to_delete)
+                    num_deleted += len(uids_to_delete)
 
     if cleanup == "full" or (
         cleanup == "scoped_full" and scoped_full_cleanup_source_ids
@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 import abc
+import bisect
+import heapq
+import json
+import threading
 import time
 from abc import ABC, abstractmethod
+from itertools import count, islice, repeat
+from operator import itemgetter
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from typing_extensions import override
@@ -14,7 +21,7 @@ from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import run_in_executor
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from langchain_core.documents import Document
 
@@ -237,8 +244,86 @@ class _Record(TypedDict):
     updated_at: float
 
 
+_IndexEntry = tuple[float, int, str, _Record]
+"""Update time, update sequence number, key and record of an indexed record."""
+
+_SNAPSHOT_VERSION = 1
+
+
+class _TimeIndex:
+    """Record keys sorted by update time.
+
+    An entry is live while its record is still the one stored under its key.
+    Entries of records that were updated again or deleted are skipped, dropped
+    once they reach the front, and compacted away when they outnumber the live
+    ones.
+    """
+
+    __slots__ = ("_entries", "_head", "_stale")
+
+    def __init__(self) -> None:
+        self._entries: list[_IndexEntry] = []
+        self._head = 0
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) - self._head - self._stale
+
+    def add(self, entry: _IndexEntry) -> None:
+        # Records are almost always updated with the latest time.
+        if not self._entries or entry >= self._entries[-1]:
+            self._entries.append(entry)
+        else:
+            bisect.insort(self._entries, entry, lo=self._head)
+
+    def discard(self, records: dict[str, _Record]) -> None:
+        """Account for an entry that is no longer live."""
+        self._stale += 1
+        if self._head + self._stale > len(self):
+            self._entries = [
+                entry
+                for entry in islice(self._entries, self._head, None)
+                if records.get(entry[2]) is entry[3]
+            ]
+            self._head = 0
+            self._stale = 0
+
+    def range(
+        self,
+        records: dict[str, _Record],
+        *,
+        before: float | None = None,
+        after: float | None = None,
+    ) -> Iterator[_IndexEntry]:
+        """Iterate over live entries updated after `after` and before `before`."""
+        entries = self._entries
+        lo = self._head
+        if after:
+            lo = bisect.bisect_right(entries, after, lo=lo, key=itemgetter(0))
+        hi = (
+            bisect.bisect_left(entries, before, lo=lo, key=itemgetter(0))
+            if before
+            else len(entries)
+        )
+        if lo == self._head:
+            while lo < hi and records.get(entries[lo][2]) is not entries[lo][3]:
+                lo += 1
+            self._stale -= lo - self._head
+            self._head = lo
+        return (
+            entry
+            for entry in islice(entries, lo, hi)
+            if records.get(entry[2]) is entry[3]
+        )
+
+
 class InMemoryRecordManager(RecordManager):
-    """An in-memory record manager for testing purposes."""
+    """An in-memory record manager for testing purposes.
+
+    Records are indexed by update time and by group ID, so `list_keys` only
+    visits the records it returns, oldest first. `dump` and `load` save the
+    records to a file and restore them, e.g. between local indexing runs.
+    """
 
     def __init__(self, namespace: str) -> None:
         """Initialize the in-memory record manager.
@@ -251,6 +336,10 @@ class InMemoryRecordManager(RecordManager):
         # of {'group_id': group_id, 'updated_at': timestamp}
         self.records: dict[str, _Record] = {}
         self.namespace = namespace
+        self._index = _TimeIndex()
+        self._groups: dict[str, _TimeIndex] = {}
+        self._sequence = count()
+        self._lock = threading.Lock()
 
     def create_schema(self) -> None:
         """In-memory schema creation is simply ensuring the structure is initialized."""
@@ -296,12 +385,16 @@ class InMemoryRecordManager(RecordManager):
         if group_ids and len(keys) != len(group_ids):
             msg = "Length of keys must match length of group_ids"
             raise ValueError(msg)
-        for index, key in enumerate(keys):
-            group_id = group_ids[index] if group_ids else None
-            if time_at_least and time_at_least > self.get_time():
-                msg = "time_at_least must be in the past"
-                raise ValueError(msg)
-            self.records[key] = {"group_id": group_id, "updated_at": self.get_time()}
+        if not keys:
+            return
+        now = self.get_time()
+        if time_at_least and time_at_least > now:
+            msg = "time_at_least must be in the past"
+            raise ValueError(msg)
+        with self._lock:
+            for key, group_id in zip(keys, group_ids or repeat(None), strict=False):
+                self._remove(key)
+                self._insert(key, group_id, now)
 
     async def aupdate(
         self,
@@ -370,20 +463,23 @@ class InMemoryRecordManager(RecordManager):
 
 
         Returns:
-            A list of keys for the matching records.
+            A list of keys for the matching records, least recently updated first.
         """
-        result = []
-        for key, data in self.records.items():
-            if before and data["updated_at"] >= before:
-                continue
-            if after and data["updated_at"] <= after:
-                continue
-            if group_ids and data["group_id"] not in group_ids:
-                continue
-            result.append(key)
-        if limit:
-            return result[:limit]
-        return result
+        with self._lock:
+            if group_ids:
+                indexes = [
+                    self._groups[group_id]
+                    for group_id in dict.fromkeys(group_ids)
+                    if group_id in self._groups
+                ]
+            else:
+                indexes = [self._index]
+            ranges = [
+                index.range(self.records, before=before, after=after)
+                for index in indexes
+            ]
+            entries = ranges[0] if len(ranges) == 1 else heapq.merge(*ranges)
+            return [entry[2] for entry in islice(entries, limit or None)]
 
     async def alist_keys(
         self,
@@ -406,7 +502,7 @@ class InMemoryRecordManager(RecordManager):
 
 
         Returns:
-            A list of keys for the matching records.
+            A list of keys for the matching records, least recently updated first.
         """
         return self.list_keys(
             before=before, after=after, group_ids=group_ids, limit=limit
@@ -418,9 +514,9 @@ class InMemoryRecordManager(RecordManager):
         Args:
             keys: A list of keys to delete.
         """
-        for key in keys:
-            if key in self.records:
-                del self.records[key]
+        with self._lock:
+            for key in keys:
+                self._remove(key)
 
     async def adelete_keys(self, keys: Sequence[str]) -> None:
         """Async delete specified records from the database.
@@ -430,6 +526,92 @@ class InMemoryRecordManager(RecordManager):
         """
         self.delete_keys(keys)
 
+    def dump(self, path: str | Path) -> None:
+        """Save the records to a snapshot file.
+
+        The snapshot is a JSON file holding the namespace, the group IDs and the
+        records in update order. It is written next to `path` and then moved
+        into place, so an interrupted dump leaves an existing snapshot intact.
+
+        Args:
+            path: The path to write the snapshot to.
+        """
+        with self._lock:
+            entries = list(self._index.range(self.records))
+        groups: dict[str, int] = {}
+        snapshot = {
+            "version": _SNAPSHOT_VERSION,
+            "namespace": self.namespace,
+            "keys": [key for _, _, key, _ in entries],
+            "updated_at": [updated_at for updated_at, _, _, _ in entries],
+            "group_ids": [
+                -1
+                if record["group_id"] is None
+                else groups.setdefault(record["group_id"], len(groups))
+                for _, _, _, record in entries
+            ],
+            "groups": list(groups),
+        }
+        path_ = Path(path)
+        path_.parent.mkdir(exist_ok=True, parents=True)
+        tmp_path = path_.with_name(f"{path_.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        tmp_path.replace(path_)
+
+    @classmethod
+    def load(cls, path: str | Path) -> InMemoryRecordManager:
+        """Restore a record manager from a snapshot file written by `dump`.
+
+        Args:
+            path: The path to read the snapshot from.
+
+        Returns:
+            A record manager with the namespace and records of the snapshot.
+
+        Raises:
+            ValueError: If the file is not a supported snapshot.
+        """
+        with Path(path).open(encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != _SNAPSHOT_VERSION:
+            msg = f"Unsupported InMemoryRecordManager snapshot version in {path}."
+            raise ValueError(msg)
+        manager = cls(snapshot["namespace"])
+        groups = snapshot["groups"]
+        for key, updated_at, group_index in zip(
+            snapshot["keys"],
+            snapshot["updated_at"],
+            snapshot["group_ids"],
+            strict=True,
+        ):
+            manager._insert(
+                key, None if group_index < 0 else groups[group_index], updated_at
+            )
+        return manager
+
+    def _insert(self, key: str, group_id: str | None, updated_at: float) -> None:
+        record: _Record = {"group_id": group_id, "updated_at": updated_at}
+        self.records[key] = record
+        entry = (updated_at, next(self._sequence), key, record)
+        self._index.add(entry)
+        if group_id is not None:
+            if group_id not in self._groups:
+                self._groups[group_id] = _TimeIndex()
+            self._groups[group_id].add(entry)
+
+    def _remove(self, key: str) -> None:
+        record = self.records.pop(key, None)
+        if record is None:
+            return
+        self._index.discard(self.records)
+        group_id = record["group_id"]
+        if group_id is not None:
+            group = self._groups[group_id]
+            group.discard(self.records)
+            if not group:
+                del self._groups[group_id]
+
 
 class UpsertResponse(TypedDict):
     """A generic response for upsert operations.
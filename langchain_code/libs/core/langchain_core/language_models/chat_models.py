@@ -528,8 +528,11 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
 
             chunks: list[ChatGenerationChunk] = []
 
-            if self.rate_limiter:
-                self.rate_limiter.acquire(blocking=True)
+            rate_limit_reservation = (
+                self.rate_limiter.acquire_request(messages)
+                if self.rate_limiter
+                else None
+            )
 
             try:
                 input_messages = _normalize_messages(messages)
@@ -579,6 +582,10 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                     )
                     yield msg_chunk
             except BaseException as e:
+                # Release first, so that neither a failing callback nor a closed
+                # generator keeps the reservation.
+                if self.rate_limiter:
+                    self.rate_limiter.release_request(rate_limit_reservation, None)
                 generations_with_error_metadata = _generate_response_from_error(e)
                 chat_generation_chunk = merge_chat_generation_chunks(chunks)
                 if chat_generation_chunk:
@@ -595,6 +602,10 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 raise
 
             generation = merge_chat_generation_chunks(chunks)
+            if self.rate_limiter:
+                self.rate_limiter.release_request(
+                    rate_limit_reservation, generation.message if generation else None
+                )
             if generation is None:
                 err = ValueError("No generation chunks were returned")
                 run_manager.on_llm_error(err, response=LLMResult(generations=[]))
@@ -654,8 +665,11 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             batch_size=1,
         )
 
-        if self.rate_limiter:
-            await self.rate_limiter.aacquire(blocking=True)
+        rate_limit_reservation = (
+            await self.rate_limiter.aacquire_request(messages)
+            if self.rate_limiter
+            else None
+        )
 
         chunks: list[ChatGenerationChunk] = []
 
@@ -710,6 +724,10 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 )
                 yield msg_chunk
         except BaseException as e:
+            # Release first, so that neither a failing callback nor a closed
+            # generator keeps the reservation.
+            if self.rate_limiter:
+                await self.rate_limiter.arelease_request(rate_limit_reservation, None)
             generations_with_error_metadata = _generate_response_from_error(e)
             chat_generation_chunk = merge_chat_generation_chunks(chunks)
             if chat_generation_chunk:
@@ -723,6 +741,10 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             raise
 
         generation = merge_chat_generation_chunks(chunks)
+        if self.rate_limiter:
+            await self.rate_limiter.arelease_request(
+                rate_limit_reservation, generation.message if generation else None
+            )
         if not generation:
             err = ValueError("No generation chunks were returned")
             await run_manager.on_llm_error(err, response=LLMResult(generations=[]))
@@ -1170,71 +1192,83 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
         # Apply the rate limiter after checking the cache, since
         # we usually don't want to rate limit cache lookups, but
         # we do want to rate limit API requests.
-        if self.rate_limiter:
-            self.rate_limiter.acquire(blocking=True)
-
-        # If stream is not explicitly set, check if implicitly requested by
-        # astream_events() or astream_log(). Bail out if _stream not implemented
-        if self._should_stream(
-            async_api=False,
-            run_manager=run_manager,
-            **kwargs,
-        ):
-            chunks: list[ChatGenerationChunk] = []
-            run_id: str | None = (
-                f"{LC_ID_PREFIX}-{run_manager.run_id}" if run_manager else None
-            )
-            yielded = False
-            index = -1
-            index_type = ""
-            for chunk in self._stream(messages, stop=stop, **kwargs):
-                chunk.message.response_metadata = _gen_info_and_msg_metadata(chunk)
-                if self.output_version == "v1":
-                    # Overwrite .content with .content_blocks
-                    chunk.message = _update_message_content_to_blocks(
-                        chunk.message, "v1"
-                    )
-                    for block in cast(
-                        "list[types.ContentBlock]", chunk.message.content
-                    ):
-                        if block["type"] != index_type:
-                            index_type = block["type"]
-                            index += 1
-                        if "index" not in block:
-                            block["index"] = index
-                if run_manager:
-                    if chunk.message.id is None:
-                        chunk.message.id = run_id
-                    run_manager.on_llm_new_token(
-                        cast("str", chunk.message.content), chunk=chunk
-                    )
-                chunks.append(chunk)
-                yielded = True
+        rate_limit_reservation = (
+            self.rate_limiter.acquire_request(messages) if self.rate_limiter else None
+        )
 
-            # Yield a final empty chunk with chunk_position="last" if not yet yielded
-            if (
-                yielded
-                and isinstance(chunk.message, AIMessageChunk)
-                and not chunk.message.chunk_position
+        try:
+            # If stream is not explicitly set, check if implicitly requested by
+            # astream_events() or astream_log(). Bail out if _stream not implemented
+            if self._should_stream(
+                async_api=False,
+                run_manager=run_manager,
+                **kwargs,
             ):
-                empty_content: str | list = (
-                    "" if isinstance(chunk.message.content, str) else []
+                chunks: list[ChatGenerationChunk] = []
+                run_id: str | None = (
+                    f"{LC_ID_PREFIX}-{run_manager.run_id}" if run_manager else None
                 )
-                chunk = ChatGenerationChunk(
-                    message=AIMessageChunk(
-                        content=empty_content, chunk_position="last", id=run_id
+                yielded = False
+                index = -1
+                index_type = ""
+                for chunk in self._stream(messages, stop=stop, **kwargs):
+                    chunk.message.response_metadata = _gen_info_and_msg_metadata(chunk)
+                    if self.output_version == "v1":
+                        # Overwrite .content with .content_blocks
+                        chunk.message = _update_message_content_to_blocks(
+                            chunk.message, "v1"
+                        )
+                        for block in cast(
+                            "list[types.ContentBlock]", chunk.message.content
+                        ):
+                            if block["type"] != index_type:
+                                index_type = block["type"]
+                                index += 1
+                            if "index" not in block:
+                                block["index"] = index
+                    if run_manager:
+                        if chunk.message.id is None:
+                            chunk.message.id = run_id
+                        run_manager.on_llm_new_token(
+                            cast("str", chunk.message.content), chunk=chunk
+                        )
+                    chunks.append(chunk)
+                    yielded = True
+
+                # Yield a final empty chunk with chunk_position="last" if not yet
+                # yielded
+                if (
+                    yielded
+                    and isinstance(chunk.message, AIMessageChunk)
+                    and not chunk.message.chunk_position
+                ):
+                    empty_content: str | list = (
+                        "" if isinstance(chunk.message.content, str) else []
+                    )
+                    chunk = ChatGenerationChunk(
+                        message=AIMessageChunk(
+                            content=empty_content, chunk_position="last", id=run_id
+                        )
                     )
+                    if run_manager:
+                        run_manager.on_llm_new_token("", chunk=chunk)
+                    chunks.append(chunk)
+                result = generate_from_stream(iter(chunks))
+            elif inspect.signature(self._generate).parameters.get("run_manager"):
+                result = self._generate(
+                    messages, stop=stop, run_manager=run_manager, **kwargs
                 )
-                if run_manager:
-                    run_manager.on_llm_new_token("", chunk=chunk)
-                chunks.append(chunk)
-            result = generate_from_stream(iter(chunks))
-        elif inspect.signature(self._generate).parameters.get("run_manager"):
-            result = self._generate(
-                messages, stop=stop, run_manager=run_manager, **kwargs
+            else:
+                result = self._generate(messages, stop=stop, **kwargs)
+        except BaseException:
+            if self.rate_limiter:
+                self.rate_limiter.release_request(rate_limit_reservation, None)
+            raise
+        if self.rate_limiter:
+            self.rate_limiter.release_request(
+                rate_limit_reservation,
+                result.generations[0].message if result.generations else None,
             )
-        else:
-            result = self._generate(messages, stop=stop, **kwargs)
 
         if self.output_version == "v1":
             # Overwrite .content with .content_blocks
@@ -1296,71 +1330,85 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
         # Apply the rate limiter after checking the cache, since
         # we usually don't want to rate limit cache lookups, but
         # we do want to rate limit API requests.
-        if self.rate_limiter:
-            await self.rate_limiter.aacquire(blocking=True)
-
-        # If stream is not explicitly set, check if implicitly requested by
-        # astream_events() or astream_log(). Bail out if _astream not implemented
-        if self._should_stream(
-            async_api=True,
-            run_manager=run_manager,
-            **kwargs,
-        ):
-            chunks: list[ChatGenerationChunk] = []
-            run_id: str | None = (
-                f"{LC_ID_PREFIX}-{run_manager.run_id}" if run_manager else None
-            )
-            yielded = False
-            index = -1
-            index_type = ""
-            async for chunk in self._astream(messages, stop=stop, **kwargs):
-                chunk.message.response_metadata = _gen_info_and_msg_metadata(chunk)
-                if self.output_version == "v1":
-                    # Overwrite .content with .content_blocks
-                    chunk.message = _update_message_content_to_blocks(
-                        chunk.message, "v1"
-                    )
-                    for block in cast(
-                        "list[types.ContentBlock]", chunk.message.content
-                    ):
-                        if block["type"] != index_type:
-                            index_type = block["type"]
-                            index += 1
-                        if "index" not in block:
-                            block["index"] = index
-                if run_manager:
-                    if chunk.message.id is None:
-                        chunk.message.id = run_id
-                    await run_manager.on_llm_new_token(
-                        cast("str", chunk.message.content), chunk=chunk
-                    )
-                chunks.append(chunk)
-                yielded = True
+        rate_limit_reservation = (
+            await self.rate_limiter.aacquire_request(messages)
+            if self.rate_limiter
+            else None
+        )
 
-            # Yield a final empty chunk with chunk_position="last" if not yet yielded
-            if (
-                yielded
-                and isinstance(chunk.message, AIMessageChunk)
-                and not chunk.message.chunk_position
+        try:
+            # If stream is not explicitly set, check if implicitly requested by
+            # astream_events() or astream_log(). Bail out if _astream not implemented
+            if self._should_stream(
+                async_api=True,
+                run_manager=run_manager,
+                **kwargs,
             ):
-                empty_content: str | list = (
-                    "" if isinstance(chunk.message.content, str) else []
+                chunks: list[ChatGenerationChunk] = []
+                run_id: str | None = (
+                    f"{LC_ID_PREFIX}-{run_manager.run_id}" if run_manager else None
                 )
-                chunk = ChatGenerationChunk(
-                    message=AIMessageChunk(
-                        content=empty_content, chunk_position="last", id=run_id
+                yielded = False
+                index = -1
+                index_type = ""
+                async for chunk in self._astream(messages, stop=stop, **kwargs):
+                    chunk.message.response_metadata = _gen_info_and_msg_metadata(chunk)
+                    if self.output_version == "v1":
+                        # Overwrite .content with .content_blocks
+                        chunk.message = _update_message_content_to_blocks(
+                            chunk.message, "v1"
+                        )
+                        for block in cast(
+                            "list[types.ContentBlock]", chunk.message.content
+                        ):
+                            if block["type"] != index_type:
+                                index_type = block["type"]
+                                index += 1
+                            if "index" not in block:
+                                block["index"] = index
+                    if run_manager:
+                        if chunk.message.id is None:
+                            chunk.message.id = run_id
+                        await run_manager.on_llm_new_token(
+                            cast("str", chunk.message.content), chunk=chunk
+                        )
+                    chunks.append(chunk)
+                    yielded = True
+
+                # Yield a final empty chunk with chunk_position="last" if not yet
+                # yielded
+                if (
+                    yielded
+                    and isinstance(chunk.message, AIMessageChunk)
+                    and not chunk.message.chunk_position
+                ):
+                    empty_content: str | list = (
+                        "" if isinstance(chunk.message.content, str) else []
+                    )
+                    chunk = ChatGenerationChunk(
+                        message=AIMessageChunk(
+                            content=empty_content, chunk_position="last", id=run_id
+                        )
                     )
+                    if run_manager:
+                        await run_manager.on_llm_new_token("", chunk=chunk)
+                    chunks.append(chunk)
+                result = generate_from_stream(iter(chunks))
+            elif inspect.signature(self._agenerate).parameters.get("run_manager"):
+                result = await self._agenerate(
+                    messages, stop=stop, run_manager=run_manager, **kwargs
                 )
-                if run_manager:
-                    await run_manager.on_llm_new_token("", chunk=chunk)
-                chunks.append(chunk)
-            result = generate_from_stream(iter(chunks))
-        elif inspect.signature(self._agenerate).parameters.get("run_manager"):
-            result = await self._agenerate(
-                messages, stop=stop, run_manager=run_manager, **kwargs
+            else:
+                result = await self._agenerate(messages, stop=stop, **kwargs)
+        except BaseException:
+            if self.rate_limiter:
+                await self.rate_limiter.arelease_request(rate_limit_reservation, None)
+            raise
+        if self.rate_limiter:
+            await self.rate_limiter.arelease_request(
+                rate_limit_reservation,
+                result.generations[0].message if result.generations else None,
             )
-        else:
-            result = await self._agenerate(messages, stop=stop, **kwargs)
 
         if self.output_version == "v1":
             # Overwrite .content with .content_blocks
@@ -4,7 +4,7 @@ import itertools
 import json
 import logging
 import operator
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Any, Literal, cast, overload
 
 from pydantic import Field, model_validator
@@ -694,6 +694,93 @@ def add_ai_message_chunks(
     )
 
 
+class AIMessageChunkAccumulator:
+    """Mutable accumulator for streamed `AIMessageChunk`s.
+
+    Folding a stream with `chunk = chunk + next_chunk` re-merges the whole message
+    on every step, including re-parsing the tool call arguments streamed so far,
+    which is quadratic in the length of the response. The accumulator instead
+    appends chunks in amortized constant time and merges them with a single call
+    to `add_ai_message_chunks` when the result is requested.
+
+    Example:
+        ```python
+        from langchain_core.messages.ai import AIMessageChunkAccumulator
+
+        accumulator = AIMessageChunkAccumulator()
+        for chunk in model.stream("Hello"):
+            accumulator.append(chunk)
+        message = accumulator.to_message()
+        ```
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: Iterable[AIMessageChunk] = ()) -> None:
+        """Create an accumulator.
+
+        Args:
+            chunks: Chunks to start the accumulator with.
+        """
+        self._chunks: list[AIMessageChunk] = list(chunks)
+
+    def __bool__(self) -> bool:
+        """Return whether any chunk has been added."""
+        return bool(self._chunks)
+
+    def append(self, chunk: AIMessageChunk) -> None:
+        """Add a chunk to the end of the message.
+
+        Args:
+            chunk: The chunk to add.
+        """
+        self._chunks.append(chunk)
+
+    def extend(self, chunks: Iterable[AIMessageChunk]) -> None:
+        """Add several chunks to the end of the message.
+
+        Args:
+            chunks: The chunks to add, in stream order.
+        """
+        self._chunks.extend(chunks)
+
+    def to_chunk(self) -> AIMessageChunk | None:
+        """Merge the chunks added so far.
+
+        The merged chunk replaces the buffered ones, so calling this again after
+        appending more chunks only merges the new chunks into it.
+
+        Returns:
+            The merged chunk, equal to adding the chunks together with `+`, or
+            `None` if no chunk has been added.
+        """
+        if not self._chunks:
+            return None
+        if len(self._chunks) > 1:
+            first, *others = self._chunks
+            self._chunks = [first + others]
+        return self._chunks[0]
+
+    def to_message(self) -> AIMessage:
+        """Merge the chunks added so far into a final `AIMessage`.
+
+        Returns:
+            The merged message.
+
+        Raises:
+            ValueError: If no chunk has been added.
+        """
+        from langchain_core.messages.utils import (  # noqa: PLC0415
+            message_chunk_to_message,
+        )
+
+        chunk = self.to_chunk()
+        if chunk is None:
+            msg = "No chunks have been added to the accumulator."
+            raise ValueError(msg)
+        return cast("AIMessage", message_chunk_to_message(chunk))
+
+
 def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageMetadata:
     """Recursively add two UsageMetadata objects.
 
@@ -347,8 +347,13 @@ def merge_content(
     """
     merged: str | list[str | dict]
     merged = "" if first_content is None else first_content
+    # Consecutive list contents are merged with a single `merge_lists` call
+    pending_lists: list[list[str | dict]] = []
 
     for content in contents:
+        if pending_lists and not isinstance(content, list):
+            merged = merge_lists(cast("list", merged), *pending_lists)  # type: ignore[assignment]
+            pending_lists = []
         # If current is a string
         if isinstance(merged, str):
             # If the next chunk is also a string, then merge them naively
@@ -359,7 +364,7 @@ def merge_content(
                 merged = [merged, *content]
         elif isinstance(content, list):
             # If both are lists
-            merged = merge_lists(cast("list", merged), content)  # type: ignore[assignment]
+            pending_lists.append(content)
         # If the first content is a list, and the second content is a string
         # If the last element of the first content is a string
         # Add the second content to the last element
@@ -371,6 +376,8 @@ def merge_content(
         # Otherwise, add the second content as a new element of the list
         elif merged:
             merged.append(content)
+    if pending_lists:
+        merged = merge_lists(cast("list", merged), *pending_lists)  # type: ignore[assignment]
     return merged
 
 
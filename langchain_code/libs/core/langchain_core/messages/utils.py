@@ -14,8 +14,10 @@ import inspect
 import json
 import logging
 import math
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Sequence
 from functools import partial, wraps
+from itertools import accumulate
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -1409,15 +1411,21 @@ def trim_messages(
         # Type narrowing: at this point token_counter is not a str
         actual_token_counter = token_counter  # type: ignore[assignment]
 
+    message_token_counter: Callable[[BaseMessage], int] | None = None
     if hasattr(actual_token_counter, "get_num_tokens_from_messages"):
         list_token_counter = actual_token_counter.get_num_tokens_from_messages
     elif callable(actual_token_counter):
         if (
-            next(
-                iter(inspect.signature(actual_token_counter).parameters.values())
-            ).annotation
-            is BaseMessage
+            actual_token_counter is count_tokens_approximately
+            or actual_token_counter is _approximate_token_counter
         ):
+            # Approximate counts add up per message with the default settings.
+            message_token_counter = _count_message_tokens_approximately
+            list_token_counter = actual_token_counter
+        elif _is_message_token_counter(actual_token_counter):
+            message_token_counter = cast(
+                "Callable[[BaseMessage], int]", actual_token_counter
+            )
 
             def list_token_counter(messages: Sequence[BaseMessage]) -> int:
                 return sum(actual_token_counter(msg) for msg in messages)  # type: ignore[arg-type, misc]
@@ -1447,6 +1455,7 @@ def trim_messages(
             text_splitter=text_splitter_fn,
             partial_strategy="first" if allow_partial else None,
             end_on=end_on,
+            message_token_counter=message_token_counter,
         )
     if strategy == "last":
         return _last_max_tokens(
@@ -1458,6 +1467,7 @@ def trim_messages(
             start_on=start_on,
             end_on=end_on,
             text_splitter=text_splitter_fn,
+            message_token_counter=message_token_counter,
         )
     msg = f"Unrecognized {strategy=}. Supported strategies are 'last' and 'first'."
     raise ValueError(msg)
@@ -1912,13 +1922,40 @@ def _first_max_tokens(
     text_splitter: Callable[[str], list[str]],
     partial_strategy: Literal["first", "last"] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    message_token_counter: Callable[[BaseMessage], int] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if not messages:
         return messages
 
+    count_prefix: Callable[[int], int]
+    count_one: Callable[[BaseMessage], int]
+    if message_token_counter is None:
+        original = messages
+
+        def count_prefix(n: int) -> int:
+            return token_counter(original[:n])
+
+        def count_one(message: BaseMessage) -> int:
+            return token_counter([message])
+
+        def count_with(n: int, message: BaseMessage) -> int:
+            return token_counter([*original[:n], message])
+
+    else:
+        # Counts add up per message: count each message once and look up
+        # prefix counts in the cumulative sums.
+        prefix_counts = list(
+            accumulate(map(message_token_counter, messages), initial=0)
+        )
+        count_prefix = prefix_counts.__getitem__
+        count_one = message_token_counter
+
+        def count_with(n: int, message: BaseMessage) -> int:
+            return prefix_counts[n] + count_one(message)
+
     # Check if all messages already fit within token limit
-    if token_counter(messages) <= max_tokens:
+    if count_prefix(len(messages)) <= max_tokens:
         # When all messages fit, only apply end_on filtering if needed
         if end_on:
             for _ in range(len(messages)):
@@ -1935,7 +1972,7 @@ def _first_max_tokens(
         if left >= right:
             break
         mid = (left + right + 1) // 2
-        if token_counter(messages[:mid]) <= max_tokens:
+        if count_prefix(mid) <= max_tokens:
             left = mid
             idx = mid
         else:
@@ -1955,7 +1992,7 @@ def _first_max_tokens(
                 excluded.content = list(reversed(excluded.content))
             for _ in range(1, num_block):
                 excluded.content = excluded.content[:-1]
-                if token_counter([*messages[:idx], excluded]) <= max_tokens:
+                if count_with(idx, excluded) <= max_tokens:
                     messages = [*messages[:idx], excluded]
                     idx += 1
                     included_partial = True
@@ -1985,7 +2022,7 @@ def _first_max_tokens(
                     excluded = excluded.model_copy(deep=True)
 
                 split_texts = text_splitter(text)
-                base_message_count = token_counter(messages[:idx])
+                base_message_count = count_prefix(idx)
                 if partial_strategy == "last":
                     split_texts = list(reversed(split_texts))
 
@@ -1997,7 +2034,7 @@ def _first_max_tokens(
                         break
                     mid = (left + right + 1) // 2
                     excluded.content = "".join(split_texts[:mid])
-                    if base_message_count + token_counter([excluded]) <= max_tokens:
+                    if base_message_count + count_one(excluded) <= max_tokens:
                         left = mid
                     else:
                         right = mid - 1
@@ -2030,6 +2067,7 @@ def _last_max_tokens(
     include_system: bool = False,
     start_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    message_token_counter: Callable[[BaseMessage], int] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if len(messages) == 0:
@@ -2055,7 +2093,11 @@ def _last_max_tokens(
     # Calculate remaining tokens after accounting for system message if present
     remaining_tokens = max_tokens
     if system_message:
-        system_tokens = token_counter([system_message])
+        system_tokens = (
+            token_counter([system_message])
+            if message_token_counter is None
+            else message_token_counter(system_message)
+        )
         remaining_tokens = max(0, max_tokens - system_tokens)
 
     reversed_result = _first_max_tokens(
@@ -2065,6 +2107,7 @@ def _last_max_tokens(
         text_splitter=text_splitter,
         partial_strategy="last" if allow_partial else None,
         end_on=start_on,
+        message_token_counter=message_token_counter,
     )
 
     # Re-reverse the messages and add back the system message if needed
@@ -2294,3 +2337,66 @@ def _approximate_token_counter(messages: Sequence[BaseMessage]) -> int:
 _TOKEN_COUNTER_SHORTCUTS = {
     "approximate": _approximate_token_counter,
 }
+
+
+def _count_message_tokens_approximately(message: BaseMessage) -> int:
+    """Per-message form of `count_tokens_approximately`."""
+    return count_tokens_approximately([message])
+
+
+def _is_message_token_counter(token_counter: Callable[..., int]) -> bool:
+    """Whether a token counter takes a single `BaseMessage` instead of a list."""
+    try:
+        parameters = inspect.signature(token_counter).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    first = next(iter(parameters), None)
+    # Postponed annotations are left as strings.
+    return first is not None and first.annotation in {BaseMessage, "BaseMessage"}
+
+
+def cache_token_counts(
+    token_counter: Callable[[BaseMessage], int], *, maxsize: int | None = 1_024
+) -> Callable[[BaseMessage], int]:
+    """Memoize a per-message token counter by message ID.
+
+    A chat history mostly repeats from one turn to the next. Wrapping the token
+    counter passed to `trim_messages` lets those messages skip counting:
+
+    ```python
+    token_counter = cache_token_counts(count_message_tokens)
+
+    for turn in conversation:
+        trim_messages(history, max_tokens=4_000, token_counter=token_counter)
+    ```
+
+    A cached count is reused for a message with the same ID as long as it is
+    the same object or compares equal to the message it was computed for.
+    Messages without an ID are always counted. Messages must not be mutated in
+    place after they were counted.
+
+    Args:
+        token_counter: Function returning the number of tokens of one message.
+        maxsize: Maximum number of cached counts. The least recently used counts
+            are dropped first. `None` keeps every count.
+
+    Returns:
+        A per-message token counter, recognized as such by `trim_messages`.
+    """
+    cache: OrderedDict[str, tuple[BaseMessage, int]] = OrderedDict()
+
+    def count(message: BaseMessage) -> int:
+        if message.id is None:
+            return token_counter(message)
+        cached = cache.get(message.id)
+        if cached is not None and (cached[0] is message or cached[0] == message):
+            cache.move_to_end(message.id)
+            return cached[1]
+        num_tokens = token_counter(message)
+        cache[message.id] = (message, num_tokens)
+        cache.move_to_end(message.id)
+        if maxsize is not None and len(cache) > maxsize:
+            cache.popitem(last=False)
+        return num_tokens
+
+    return count
@@ -16,7 +16,9 @@ from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers.format_instructions import JSON_FORMAT_INSTRUCTIONS
 from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
 from langchain_core.outputs import Generation
+from langchain_core.runnables.config import run_in_executor
 from langchain_core.utils.json import (
+    _PartialJsonStream,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -35,7 +37,9 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
     use function calling.
 
     When used in streaming mode, it will yield partial JSON objects containing all the
-    keys that have been returned so far.
+    keys that have been returned so far. Each chunk of text is only scanned once, but
+    every partial object is parsed from all the text received so far, so the time
+    spent streaming still grows quadratically with the length of the output.
 
     In streaming, if `diff` is set to `True`, yields `JSONPatch` operations describing
     the difference between the previous and the current object.
@@ -90,6 +94,30 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
                 msg = f"Invalid json output: {text}"
                 raise OutputParserException(msg, llm_output=text) from e
 
+    @override
+    def _parse_stream_result(
+        self, result: list[Generation], state: dict[str, Any]
+    ) -> Any:
+        if type(self).parse_result is not JsonOutputParser.parse_result:
+            # A subclass may post-process the parsed object.
+            return super()._parse_stream_result(result, state)
+        # Keep the partial JSON parser of the stream, so that each chunk is only
+        # scanned once. Parsing the snapshot, and looking for a markdown code block
+        # in it, remain linear in the text received so far.
+        parser = state.setdefault("json", _PartialJsonStream())
+        try:
+            return parse_json_markdown(result[0].text.strip(), parser=parser)
+        except JSONDecodeError:
+            return None
+
+    @override
+    async def _aparse_stream_result(
+        self, result: list[Generation], state: dict[str, Any]
+    ) -> Any:
+        if type(self).aparse_result is not JsonOutputParser.aparse_result:
+            return await super()._aparse_stream_result(result, state)
+        return await run_in_executor(None, self._parse_stream_result, result, state)
+
     def parse(self, text: str) -> Any:
         """Parse the output of an LLM call to a JSON object.
 
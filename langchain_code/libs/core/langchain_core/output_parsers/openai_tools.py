@@ -3,10 +3,12 @@
 import copy
 import json
 import logging
+from collections.abc import Callable
 from json import JSONDecodeError
 from typing import Annotated, Any
 
 from pydantic import SkipValidation, ValidationError
+from typing_extensions import override
 
 from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import AIMessage, InvalidToolCall
@@ -14,7 +16,8 @@ from langchain_core.messages.tool import invalid_tool_call
 from langchain_core.messages.tool import tool_call as create_tool_call
 from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
 from langchain_core.outputs import ChatGeneration, Generation
-from langchain_core.utils.json import parse_partial_json
+from langchain_core.runnables.config import run_in_executor
+from langchain_core.utils.json import _PartialJsonStream, parse_partial_json
 from langchain_core.utils.pydantic import (
     TypeBaseModel,
     is_pydantic_v1_subclass,
@@ -45,6 +48,19 @@ def parse_tool_call(
     Raises:
         OutputParserException: If the tool call is not valid JSON.
     """
+    return _parse_tool_call(
+        raw_tool_call, partial=partial, strict=strict, return_id=return_id
+    )
+
+
+def _parse_tool_call(
+    raw_tool_call: dict[str, Any],
+    *,
+    partial: bool,
+    strict: bool,
+    return_id: bool,
+    parse_partial: Callable[[str], Any] | None = None,
+) -> dict[str, Any] | None:
     if "function" not in raw_tool_call:
         return None
 
@@ -52,7 +68,10 @@ def parse_tool_call(
 
     if partial:
         try:
-            function_args = parse_partial_json(arguments, strict=strict)
+            if parse_partial is None:
+                function_args = parse_partial_json(arguments, strict=strict)
+            else:
+                function_args = parse_partial(arguments)
         except (JSONDecodeError, TypeError):  # None args raise TypeError
             return None
     # Handle None or empty string arguments for parameter-less tools
@@ -181,6 +200,37 @@ class JsonOutputToolsParser(BaseCumulativeTransformOutputParser[Any]):
         Raises:
             OutputParserException: If the output is not valid JSON.
         """
+        return self._parse_tool_calls(result, partial=partial)
+
+    @override
+    def _parse_stream_result(
+        self, result: list[Generation], state: dict[str, Any]
+    ) -> Any:
+        if type(self).parse_result is not JsonOutputToolsParser.parse_result:
+            # A subclass may post-process the parsed tool calls.
+            return super()._parse_stream_result(result, state)
+        # Keep a partial JSON parser per tool call for the whole stream, so that
+        # each chunk of arguments is only scanned once. Parsing the arguments is
+        # still linear in their length at every chunk.
+        return self._parse_tool_calls(
+            result, partial=True, json_streams=state.setdefault("json", [])
+        )
+
+    @override
+    async def _aparse_stream_result(
+        self, result: list[Generation], state: dict[str, Any]
+    ) -> Any:
+        if type(self).aparse_result is not JsonOutputToolsParser.aparse_result:
+            return await super()._aparse_stream_result(result, state)
+        return await run_in_executor(None, self._parse_stream_result, result, state)
+
+    def _parse_tool_calls(
+        self,
+        result: list[Generation],
+        *,
+        partial: bool,
+        json_streams: list[_PartialJsonStream] | None = None,
+    ) -> Any:
         generation = result[0]
         if not isinstance(generation, ChatGeneration):
             msg = "This output parser can only be used with a chat generation."
@@ -196,12 +246,31 @@ class JsonOutputToolsParser(BaseCumulativeTransformOutputParser[Any]):
                 raw_tool_calls = copy.deepcopy(message.additional_kwargs["tool_calls"])
             except KeyError:
                 return []
-            tool_calls = parse_tool_calls(
-                raw_tool_calls,
-                partial=partial,
-                strict=self.strict,
-                return_id=self.return_id,
-            )
+            if json_streams is None:
+                tool_calls = parse_tool_calls(
+                    raw_tool_calls,
+                    partial=partial,
+                    strict=self.strict,
+                    return_id=self.return_id,
+                )
+            else:
+                json_streams.extend(
+                    _PartialJsonStream(strict=self.strict)
+                    for _ in range(len(raw_tool_calls) - len(json_streams))
+                )
+                tool_calls = []
+                for raw_tool_call, parse_partial in zip(
+                    raw_tool_calls, json_streams, strict=False
+                ):
+                    parsed = _parse_tool_call(
+                        raw_tool_call,
+                        partial=partial,
+                        strict=self.strict,
+                        return_id=self.return_id,
+                        parse_partial=parse_partial,
+                    )
+                    if parsed:
+                        tool_calls.append(parsed)
         # for backwards compatibility
         for tc in tool_calls:
             tc["type"] = tc.pop("name")
@@ -122,9 +122,48 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
         """
         raise NotImplementedError
 
+    def _parse_stream_result(
+        self,
+        result: list[Generation],
+        state: dict[str, Any],  # noqa: ARG002
+    ) -> T | None:
+        """Parse the output accumulated so far while streaming.
+
+        Called after every chunk with the same `state` dict, which lives as long as
+        the stream, so that subclasses can resume parsing where the previous chunk
+        left off instead of starting over. Each call still receives and returns the
+        whole output so far, so streaming remains quadratic in the length of the
+        output.
+
+        Args:
+            result: The output accumulated so far.
+            state: Parsing state of the stream, empty for the first chunk.
+
+        Returns:
+            The partially parsed output.
+        """
+        return self.parse_result(result, partial=True)
+
+    async def _aparse_stream_result(
+        self,
+        result: list[Generation],
+        state: dict[str, Any],  # noqa: ARG002
+    ) -> T | None:
+        """Async version of `_parse_stream_result`.
+
+        Args:
+            result: The output accumulated so far.
+            state: Parsing state of the stream, empty for the first chunk.
+
+        Returns:
+            The partially parsed output.
+        """
+        return await self.aparse_result(result, partial=True)
+
     @override
     def _transform(self, input: Iterator[str | BaseMessage]) -> Iterator[Any]:
         prev_parsed = None
+        state: dict[str, Any] = {}
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
         for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
@@ -139,7 +178,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
 
             acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
 
-            parsed = self.parse_result([acc_gen], partial=True)
+            parsed = self._parse_stream_result([acc_gen], state)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield self._diff(prev_parsed, parsed)
@@ -152,6 +191,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
         self, input: AsyncIterator[str | BaseMessage]
     ) -> AsyncIterator[T]:
         prev_parsed = None
+        state: dict[str, Any] = {}
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
         async for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
@@ -166,7 +206,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
 
             acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
 
-            parsed = await self.aparse_result([acc_gen], partial=True)
+            parsed = await self._aparse_stream_result([acc_gen], state)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield await run_in_executor(None, self._diff, prev_parsed, parsed)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
-from string import Formatter
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from pydantic import BaseModel, create_model
@@ -13,14 +13,18 @@ from typing_extensions import override
 from langchain_core.prompt_values import PromptValue, StringPromptValue
 from langchain_core.prompts.base import BasePromptTemplate
 from langchain_core.utils import get_colored_text, mustache
-from langchain_core.utils.formatting import formatter
+from langchain_core.utils.formatting import (
+    _FORMAT_CACHE_SIZE,
+    _parse_format_string,
+    formatter,
+)
 from langchain_core.utils.interactive_env import is_interactive_env
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
 try:
-    from jinja2 import meta
+    from jinja2 import Template, meta
     from jinja2.sandbox import SandboxedEnvironment
 
     _HAS_JINJA2 = True
@@ -67,7 +71,19 @@ def jinja2_formatter(template: str, /, **kwargs: Any) -> str:
     # Use a restricted sandbox that blocks ALL attribute/method access
     # Only simple variable lookups like {{variable}} are allowed
     # Attribute access like {{variable.attr}} or {{variable.method()}} is blocked
-    return SandboxedEnvironment().from_string(template).render(**kwargs)
+    return _compile_jinja2_template(template).render(**kwargs)
+
+
+@lru_cache(maxsize=1)
+def _get_jinja2_environment() -> SandboxedEnvironment:
+    return SandboxedEnvironment()
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _compile_jinja2_template(template: str) -> Template:
+    # Compiled templates are immutable and safe to render concurrently, so each
+    # template source is only compiled once.
+    return _get_jinja2_environment().from_string(template)
 
 
 def validate_jinja2(template: str, input_variables: list[str]) -> None:
@@ -80,7 +96,7 @@ def validate_jinja2(template: str, input_variables: list[str]) -> None:
         input_variables: The input variables.
     """
     input_variables_set = set(input_variables)
-    valid_variables = _get_jinja2_variables_from_template(template)
+    valid_variables = set(_get_jinja2_variables_from_template(template))
     missing_variables = valid_variables - input_variables_set
     extra_variables = input_variables_set - valid_variables
 
@@ -95,16 +111,16 @@ def validate_jinja2(template: str, input_variables: list[str]) -> None:
         warnings.warn(warning_message.strip(), stacklevel=7)
 
 
-def _get_jinja2_variables_from_template(template: str) -> set[str]:
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _get_jinja2_variables_from_template(template: str) -> frozenset[str]:
     if not _HAS_JINJA2:
         msg = (
             "jinja2 not installed, which is needed to use the jinja2_formatter. "
             "Please install it with `pip install jinja2`."
         )
         raise ImportError(msg)
-    env = SandboxedEnvironment()
-    ast = env.parse(template)
-    return meta.find_undeclared_variables(ast)
+    ast = _get_jinja2_environment().parse(template)
+    return frozenset(meta.find_undeclared_variables(ast))
 
 
 def mustache_formatter(template: str, /, **kwargs: Any) -> str:
@@ -266,12 +282,13 @@ def get_template_variables(template: str, template_format: str) -> list[str]:
     Raises:
         ValueError: If the template format is not supported.
     """
+    input_variables: set[str] | frozenset[str]
     if template_format == "jinja2":
         # Get the variables for the template
         input_variables = _get_jinja2_variables_from_template(template)
     elif template_format == "f-string":
         input_variables = {
-            v for _, v, _, _ in Formatter().parse(template) if v is not None
+            v for _, v, _, _ in _parse_format_string(template) if v is not None
         }
     elif template_format == "mustache":
         input_variables = mustache_template_vars(template)
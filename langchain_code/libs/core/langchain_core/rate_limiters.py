@@ -4,8 +4,20 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import contextlib
 import threading
 import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, cast
+
+from typing_extensions import override
+
+from langchain_core.messages.utils import count_tokens_approximately
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langchain_core.messages import BaseMessage
 
 
 class BaseRateLimiter(abc.ABC):
@@ -63,6 +75,105 @@ class BaseRateLimiter(abc.ABC):
             `True` if the tokens were successfully acquired, `False` otherwise.
         """
 
+    def acquire_request(
+        self,
+        messages: list[BaseMessage],  # noqa: ARG002
+    ) -> Any:
+        """Acquire what is needed to send a request to a chat model.
+
+        Called by `BaseChatModel` before each request to the model provider. The
+        default implementation blocks until `acquire` succeeds.
+
+        Args:
+            messages: The input messages of the request.
+
+        Returns:
+            A value passed back to `release_request` once the request is done.
+        """
+        self.acquire(blocking=True)
+
+    async def aacquire_request(
+        self,
+        messages: list[BaseMessage],  # noqa: ARG002
+    ) -> Any:
+        """Acquire what is needed to send a request to a chat model. Async version.
+
+        Called by `BaseChatModel` before each request to the model provider. The
+        default implementation waits until `aacquire` succeeds.
+
+        Args:
+            messages: The input messages of the request.
+
+        Returns:
+            A value passed back to `arelease_request` once the request is done.
+        """
+        await self.aacquire(blocking=True)
+
+    def release_request(  # noqa: B027
+        self, reservation: Any, output: BaseMessage | None
+    ) -> None:
+        """Release what was acquired for a chat model request.
+
+        Called by `BaseChatModel` once the request is done, including when it
+        failed. The default implementation does nothing.
+
+        Args:
+            reservation: The value returned by `acquire_request`.
+            output: The message generated by the model, or `None` if the request
+                failed.
+        """
+
+    async def arelease_request(
+        self, reservation: Any, output: BaseMessage | None
+    ) -> None:
+        """Release what was acquired for a chat model request. Async version.
+
+        Called by `BaseChatModel` once the request is done, including when it
+        failed. The default implementation calls `release_request`.
+
+        Args:
+            reservation: The value returned by `aacquire_request`.
+            output: The message generated by the model, or `None` if the request
+                failed.
+        """
+        self.release_request(reservation, output)
+
+
+class _Waiter:
+    """A caller waiting in the queue of an `InMemoryRateLimiter`."""
+
+    __slots__ = ("event", "future", "granted", "loop", "tokens")
+
+    def __init__(
+        self,
+        tokens: float,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self.tokens = tokens
+        self.loop = loop
+        # Whether a resource was handed over to the waiter before it was woken up.
+        self.granted = False
+        self.event: threading.Event | None = None
+        self.future: asyncio.Future[None] | None = None
+        if loop is None:
+            self.event = threading.Event()
+        else:
+            self.future = loop.create_future()
+
+    def wake(self) -> None:
+        """Signal the waiter that it is now first in line."""
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None and self.future is not None:
+            # If the event loop of the waiter is closed, there is nothing to wake.
+            with contextlib.suppress(RuntimeError):
+                self.loop.call_soon_threadsafe(_set_future_done, self.future)
+
+
+def _set_future_done(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
 
 class InMemoryRateLimiter(BaseRateLimiter):
     """An in memory rate limiter based on a token bucket algorithm.
@@ -70,26 +181,29 @@ class InMemoryRateLimiter(BaseRateLimiter):
     This is an in memory rate limiter, so it cannot rate limit across
     different processes.
 
-    The rate limiter only allows time-based rate limiting and does not
-    take into account any information about the input or the output, so it
-    cannot be used to rate limit based on the size of the request.
-
-    It is thread safe and can be used in either a sync or async context.
+    It is thread safe and can be used in either a sync or async context. A single
+    instance can be shared between threads and event loops: all callers wait in a
+    single first-in, first-out queue. The exception is a blocking `acquire` on a
+    thread that runs an event loop, which polls for tokens outside the queue so as
+    not to wait on `aacquire` callers that the blocked loop cannot resume.
 
     The in memory rate limiter is based on a token bucket. The bucket is filled
-    with tokens at a given rate. Each request consumes a token. If there are
-    not enough tokens in the bucket, the request is blocked until there are
-    enough tokens.
-
-    These tokens have nothing to do with LLM tokens. They are just
+    with tokens at a given rate. Each request consumes a token by default, or a
+    custom number of tokens passed to `acquire`/`aacquire`. If there are not
+    enough tokens in the bucket, the request is blocked until there are enough
+    tokens. The first caller in line sleeps for exactly the time it takes to
+    refill the bucket, while the others wait to be woken up in turn, so there is
+    no polling.
+
+    These tokens have nothing to do with LLM tokens by default. They are just
     a way to keep track of how many requests can be made at a given time.
 
     Current limitations:
 
     - The rate limiter is not designed to work across different processes. It is
         an in-memory rate limiter, but it is thread safe.
-    - The rate limiter only supports time-based rate limiting. It does not take
-        into account the size of the request or any other factors.
+    - The rate limiter only supports time-based rate limiting. Chat models
+        consume a single token per request.
 
     Example:
         ```python
@@ -99,7 +213,6 @@ class InMemoryRateLimiter(BaseRateLimiter):
 
         rate_limiter = InMemoryRateLimiter(
             requests_per_second=0.1,  # <-- Can only make a request once every 10 seconds!!
-            check_every_n_seconds=0.1,  # Wake up every 100 ms to check whether allowed to make a request,
             max_bucket_size=10,  # Controls the maximum burst size.
         )
 
@@ -139,9 +252,10 @@ class InMemoryRateLimiter(BaseRateLimiter):
         Args:
             requests_per_second: The number of tokens to add per second to the bucket.
                 The tokens represent "credit" that can be used to make requests.
-            check_every_n_seconds: Check whether the tokens are available
-                every this many seconds. Can be a float to represent
-                fractions of a second.
+            check_every_n_seconds: Unused, kept for backwards compatibility.
+
+                The time to wait for tokens is computed exactly instead of being
+                checked periodically.
             max_bucket_size: The maximum number of tokens that can be in the bucket.
                 Must be at least `1`. Used to prevent bursts of requests.
         """
@@ -154,48 +268,107 @@ class InMemoryRateLimiter(BaseRateLimiter):
         self.max_bucket_size = max_bucket_size
 
         # A lock to ensure that tokens can only be consumed by one thread
-        # at a given time.
+        # at a given time. It also guards the queue of waiters.
         self._consume_lock = threading.Lock()
 
+        # Callers waiting for tokens, in arrival order. Only the first one
+        # consumes tokens; it wakes up the next one when it is done.
+        self._waiters: deque[_Waiter] = deque()
+
         # The last time we tried to consume tokens.
         self.last: float | None = None
 
         self.check_every_n_seconds = check_every_n_seconds
 
-    def _consume(self) -> bool:
-        """Try to consume a token.
+    def _consume(self, tokens: float = 1) -> float:
+        """Try to consume tokens.
+
+        Must be called while holding `_consume_lock`.
+
+        Args:
+            tokens: The number of tokens to consume.
 
         Returns:
-            True means that the tokens were consumed, and the caller can proceed to
-            make the request. A False means that the tokens were not consumed, and
-            the caller should try again later.
+            `0` if the tokens were consumed, and the caller can proceed to make the
+            request. Otherwise, the number of seconds after which enough tokens
+            will be available.
         """
-        with self._consume_lock:
-            now = time.monotonic()
+        now = time.monotonic()
 
-            # initialize on first call to avoid a burst
-            if self.last is None:
-                self.last = now
+        # initialize on first call to avoid a burst
+        if self.last is None:
+            self.last = now
 
-            elapsed = now - self.last
+        elapsed = now - self.last
 
-            if elapsed * self.requests_per_second >= 1:
-                self.available_tokens += elapsed * self.requests_per_second
-                self.last = now
+        if elapsed * self.requests_per_second >= 1:
+            self.available_tokens += elapsed * self.requests_per_second
+            self.last = now
 
-            # Make sure that we don't exceed the bucket size.
-            # This is used to prevent bursts of requests.
-            self.available_tokens = min(self.available_tokens, self.max_bucket_size)
+        # Make sure that we don't exceed the bucket size.
+        # This is used to prevent bursts of requests.
+        self.available_tokens = min(self.available_tokens, self.max_bucket_size)
 
-            # As long as we have at least one token, we can proceed.
-            if self.available_tokens >= 1:
-                self.available_tokens -= 1
-                return True
+        # As long as we have enough tokens, we can proceed.
+        if self.available_tokens >= tokens:
+            self.available_tokens -= tokens
+            return 0.0
 
-            return False
+        # The bucket is refilled once at least one token has accrued.
+        missing = max(tokens - self.available_tokens, 1)
+        return missing / self.requests_per_second - (now - self.last)
 
-    def acquire(self, *, blocking: bool = True) -> bool:
-        """Attempt to acquire a token from the rate limiter.
+    def _check_tokens(self, tokens: float) -> None:
+        if not 0 < tokens <= self.max_bucket_size:
+            msg = (
+                f"tokens must be greater than 0 and at most max_bucket_size "
+                f"({self.max_bucket_size}), got {tokens}."
+            )
+            raise ValueError(msg)
+
+    def _try_acquire(self, tokens: float) -> bool:
+        """Consume tokens right away if nobody is waiting and enough are available."""
+        with self._consume_lock:
+            return not self._waiters and self._consume(tokens) == 0
+
+    def _consume_now(self, tokens: float) -> float:
+        """Consume tokens regardless of the queue, see `_consume`."""
+        with self._consume_lock:
+            return self._consume(tokens)
+
+    def _poll(self, waiter: _Waiter) -> float | None:
+        """Let a waiter consume tokens if it is first in line.
+
+        Returns:
+            `0` if the tokens were consumed, the number of seconds to sleep before
+            trying again if the waiter is first in line, or `None` if it is not.
+        """
+        with self._consume_lock:
+            if self._waiters[0] is not waiter:
+                return None
+            wait = self._consume(waiter.tokens)
+            if wait == 0:
+                self._waiters.popleft()
+                if self._waiters:
+                    self._waiters[0].wake()
+            return wait
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Remove a waiter that gave up, e.g. because it was cancelled."""
+        with self._consume_lock:
+            if not self._waiters or waiter not in self._waiters:
+                return
+            was_first = self._waiters[0] is waiter
+            self._waiters.remove(waiter)
+            if was_first and self._waiters:
+                self._waiters[0].wake()
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        with self._consume_lock:
+            self._waiters.append(waiter)
+
+    def acquire(self, *, blocking: bool = True, tokens: float = 1) -> bool:
+        """Attempt to acquire tokens from the rate limiter.
 
         This method blocks until the required tokens are available if `blocking`
         is set to `True`.
@@ -207,20 +380,52 @@ class InMemoryRateLimiter(BaseRateLimiter):
             blocking: If `True`, the method will block until the tokens are available.
                 If `False`, the method will return immediately with the result of
                 the attempt.
+            tokens: The number of tokens to acquire.
+
+                Must be greater than `0` and at most `max_bucket_size`.
 
         Returns:
             `True` if the tokens were successfully acquired, `False` otherwise.
+
+        Raises:
+            ValueError: If `tokens` is out of range.
         """
+        self._check_tokens(tokens)
+        if self._try_acquire(tokens):
+            return True
         if not blocking:
-            return self._consume()
-
-        while not self._consume():
-            time.sleep(self.check_every_n_seconds)
+            return False
 
+        try:
+            # Raises RuntimeError if there is no current event loop.
+            asyncio.get_running_loop()
+            loop_running = True
+        except RuntimeError:
+            loop_running = False
+        if loop_running:
+            # Waiting in the queue would block the event loop of this thread, and
+            # with it any `aacquire` caller of that loop ahead in line: poll
+            # outside the queue instead.
+            while (delay := self._consume_now(tokens)) != 0:
+                time.sleep(delay)
+            return True
+
+        waiter = _Waiter(tokens)
+        self._enqueue(waiter)
+        try:
+            while (wait := self._poll(waiter)) != 0:
+                if wait is None:
+                    # Woken up once the waiter is first in line.
+                    cast("threading.Event", waiter.event).wait()
+                else:
+                    time.sleep(wait)
+        except BaseException:
+            self._abandon(waiter)
+            raise
         return True
 
-    async def aacquire(self, *, blocking: bool = True) -> bool:
-        """Attempt to acquire a token from the rate limiter. Async version.
+    async def aacquire(self, *, blocking: bool = True, tokens: float = 1) -> bool:
+        """Attempt to acquire tokens from the rate limiter. Async version.
 
         This method blocks until the required tokens are available if `blocking`
         is set to `True`.
@@ -232,25 +437,258 @@ class InMemoryRateLimiter(BaseRateLimiter):
             blocking: If `True`, the method will block until the tokens are available.
                 If `False`, the method will return immediately with the result of
                 the attempt.
+            tokens: The number of tokens to acquire.
+
+                Must be greater than `0` and at most `max_bucket_size`.
 
         Returns:
             `True` if the tokens were successfully acquired, `False` otherwise.
+
+        Raises:
+            ValueError: If `tokens` is out of range.
         """
+        self._check_tokens(tokens)
+        if self._try_acquire(tokens):
+            return True
         if not blocking:
-            return self._consume()
-
-        while not self._consume():  # noqa: ASYNC110
-            # This code ignores the ASYNC110 warning which is a false positive in this
-            # case.
-            # There is no external actor that can mark that the Event is done
-            # since the tokens are managed by the rate limiter itself.
-            # It needs to wake up to re-fill the tokens.
-            # https://docs.astral.sh/ruff/rules/async-busy-wait/
-            await asyncio.sleep(self.check_every_n_seconds)
+            return False
+
+        waiter = _Waiter(tokens, asyncio.get_running_loop())
+        self._enqueue(waiter)
+        try:
+            while (wait := self._poll(waiter)) != 0:
+                if wait is None:
+                    # Woken up once the waiter is first in line.
+                    await cast("asyncio.Future[None]", waiter.future)
+                else:
+                    await asyncio.sleep(wait)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return True
+
+
+class InMemoryTokenRateLimiter(InMemoryRateLimiter):
+    """An in memory rate limiter for the number of LLM tokens used per minute.
+
+    Before each chat model request, the limiter charges an estimate of the input
+    tokens, computed with `token_counter`. Once the request is done, the estimate
+    is reconciled with the `total_tokens` reported in the `usage_metadata` of the
+    output message: tokens used beyond the estimate are charged as well, which may
+    put the bucket in debt and delay the next requests, while unused tokens are
+    refunded.
+
+    Unlike `InMemoryRateLimiter`, the bucket starts full, matching provider limits
+    that allow a full minute of tokens right away.
+
+    Example:
+        ```python
+        from langchain_core.rate_limiters import InMemoryTokenRateLimiter
+
+        rate_limiter = InMemoryTokenRateLimiter(tokens_per_minute=30_000)
+
+        from langchain_anthropic import ChatAnthropic
+
+        model = ChatAnthropic(
+            model_name="claude-sonnet-4-5-20250929", rate_limiter=rate_limiter
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        tokens_per_minute: float,
+        max_bucket_size: float | None = None,
+        token_counter: Callable[[list[BaseMessage]], int] = (
+            count_tokens_approximately
+        ),
+    ) -> None:
+        """A rate limiter based on a bucket of LLM tokens.
+
+        Args:
+            tokens_per_minute: The number of tokens to add to the bucket per minute.
+            max_bucket_size: The maximum number of tokens that can be in the bucket.
+
+                Defaults to `tokens_per_minute`. A request estimated to use more
+                tokens is charged the bucket size upfront and the rest once it is
+                done.
+            token_counter: Function estimating the number of input tokens of a
+                list of messages.
+        """
+        super().__init__(
+            requests_per_second=tokens_per_minute / 60,
+            max_bucket_size=(
+                tokens_per_minute if max_bucket_size is None else max_bucket_size
+            ),
+        )
+        self.tokens_per_minute = tokens_per_minute
+        self.token_counter = token_counter
+        self.available_tokens = float(self.max_bucket_size)
+
+    def _estimate(self, messages: list[BaseMessage]) -> float:
+        return float(min(max(self.token_counter(messages), 1), self.max_bucket_size))
+
+    def _reconcile(self, reservation: Any, output: BaseMessage | None) -> None:
+        usage = getattr(output, "usage_metadata", None)
+        if reservation is None or not usage:
+            return
+        with self._consume_lock:
+            self.available_tokens = min(
+                self.available_tokens - (usage["total_tokens"] - reservation),
+                self.max_bucket_size,
+            )
+
+    @override
+    def acquire_request(self, messages: list[BaseMessage]) -> float:
+        tokens = self._estimate(messages)
+        self.acquire(blocking=True, tokens=tokens)
+        return tokens
+
+    @override
+    async def aacquire_request(self, messages: list[BaseMessage]) -> float:
+        tokens = self._estimate(messages)
+        await self.aacquire(blocking=True, tokens=tokens)
+        return tokens
+
+    @override
+    def release_request(self, reservation: Any, output: BaseMessage | None) -> None:
+        self._reconcile(reservation, output)
+
+
+class InMemoryConcurrencyLimiter(BaseRateLimiter):
+    """An in memory limiter for the number of requests in flight at the same time.
+
+    `acquire` takes one of `max_concurrency` slots and `release` gives it back.
+    When used as the `rate_limiter` of a chat model, a slot is held for the
+    duration of each request to the model provider.
+
+    Callers waiting for a slot are served in first-in, first-out order. A single
+    instance can be shared between threads and event loops.
+
+    Example:
+        ```python
+        from langchain_core.rate_limiters import InMemoryConcurrencyLimiter
+
+        rate_limiter = InMemoryConcurrencyLimiter(max_concurrency=8)
+
+        from langchain_anthropic import ChatAnthropic
+
+        model = ChatAnthropic(
+            model_name="claude-sonnet-4-5-20250929", rate_limiter=rate_limiter
+        )
+        ```
+    """
+
+    def __init__(self, *, max_concurrency: int) -> None:
+        """A limiter for the number of requests in flight.
+
+        Args:
+            max_concurrency: The maximum number of slots that can be held at once.
+
+        Raises:
+            ValueError: If `max_concurrency` is less than `1`.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be greater than 0"
+            raise ValueError(msg)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+
+    def _acquire_or_enqueue(self, waiter: _Waiter | None) -> bool:
+        """Take a slot if one is free, otherwise queue the waiter if any."""
+        with self._lock:
+            if not self._waiters and self.in_flight < self.max_concurrency:
+                self.in_flight += 1
+                return True
+            if waiter is not None:
+                self._waiters.append(waiter)
+            return False
+
+    def _release_locked(self) -> None:
+        if self._waiters:
+            # Hand the slot over to the next waiter.
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            waiter.wake()
+        else:
+            self.in_flight -= 1
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter.granted:
+                self._release_locked()
+            else:
+                self._waiters.remove(waiter)
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Attempt to acquire a slot.
+
+        Args:
+            blocking: If `True`, the method will block until a slot is available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if a slot was acquired, `False` otherwise.
+        """
+        waiter = _Waiter(1) if blocking else None
+        if self._acquire_or_enqueue(waiter):
+            return True
+        if waiter is None:
+            return False
+        try:
+            cast("threading.Event", waiter.event).wait()
+        except BaseException:
+            self._abandon(waiter)
+            raise
         return True
 
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Attempt to acquire a slot. Async version.
+
+        Args:
+            blocking: If `True`, the method will wait until a slot is available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if a slot was acquired, `False` otherwise.
+        """
+        waiter = _Waiter(1, asyncio.get_running_loop()) if blocking else None
+        if self._acquire_or_enqueue(waiter):
+            return True
+        if waiter is None:
+            return False
+        try:
+            await cast("asyncio.Future[None]", waiter.future)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return True
+
+    def release(self) -> None:
+        """Release a slot acquired with `acquire` or `aacquire`.
+
+        Raises:
+            ValueError: If no slot is held.
+        """
+        with self._lock:
+            if self.in_flight == 0:
+                msg = "release() called without a matching acquire()"
+                raise ValueError(msg)
+            self._release_locked()
+
+    @override
+    def release_request(self, reservation: Any, output: BaseMessage | None) -> None:
+        self.release()
+
 
 __all__ = [
     "BaseRateLimiter",
+    "InMemoryConcurrencyLimiter",
     "InMemoryRateLimiter",
+    "InMemoryTokenRateLimiter",
 ]
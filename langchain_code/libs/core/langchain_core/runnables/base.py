@@ -68,6 +68,7 @@ from langchain_core.runnables.utils import (
     ConfigurableFieldSpec,
     Input,
     Output,
+    _ChunkAccumulator,
     accepts_config,
     accepts_run_manager,
     coro_with_context,
@@ -1538,7 +1539,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
+        final = _ChunkAccumulator()
         got_first_val = False
 
         for ichunk in input:
@@ -1549,17 +1550,11 @@ class Runnable(ABC, Generic[Input, Output]):
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            final.add(ichunk)
+            got_first_val = True
 
         if got_first_val:
-            yield from self.stream(final, config, **kwargs)
+            yield from self.stream(final.value, config, **kwargs)
 
     async def atransform(
         self,
@@ -1583,7 +1578,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
+        final = _ChunkAccumulator()
         got_first_val = False
 
         async for ichunk in input:
@@ -1594,17 +1589,11 @@ class Runnable(ABC, Generic[Input, Output]):
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            final.add(ichunk)
+            got_first_val = True
 
         if got_first_val:
-            async for output in self.astream(final, config, **kwargs):
+            async for output in self.astream(final.value, config, **kwargs):
                 yield output
 
     def bind(self, **kwargs: Any) -> Runnable[Input, Output]:
@@ -2285,10 +2274,9 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = tee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = next(input_for_tracing, None)
-        final_input_supported = True
-        final_output: Output | None = None
-        final_output_supported = True
+        final_input = _ChunkAccumulator(stop_on_error=True)
+        final_input.add(next(input_for_tracing, None))
+        final_output = _ChunkAccumulator(stop_on_error=True)
 
         config = ensure_config(config)
         callback_manager = get_callback_manager_for_config(config)
@@ -2325,36 +2313,16 @@ class Runnable(ABC, Generic[Input, Output]):
                     while True:
                         chunk: Output = context.run(next, iterator)
                         yield chunk
-                        if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk  # type: ignore[operator]
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
-                        else:
-                            final_output = chunk
+                        final_output.add(chunk)
                 except (StopIteration, GeneratorExit):
                     pass
                 for ichunk in input_for_tracing:
-                    if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
-                    else:
-                        final_input = ichunk
+                    final_input.add(ichunk)
         except BaseException as e:
-            run_manager.on_chain_error(e, inputs=final_input)
+            run_manager.on_chain_error(e, inputs=final_input.value)
             raise
         else:
-            run_manager.on_chain_end(final_output, inputs=final_input)
+            run_manager.on_chain_end(final_output.value, inputs=final_input.value)
 
     async def _atransform_stream_with_config(
         self,
@@ -2386,10 +2354,9 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = atee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = await anext(input_for_tracing, None)
-        final_input_supported = True
-        final_output: Output | None = None
-        final_output_supported = True
+        final_input = _ChunkAccumulator(stop_on_error=True)
+        final_input.add(await anext(input_for_tracing, None))
+        final_output = _ChunkAccumulator(stop_on_error=True)
 
         config = ensure_config(config)
         callback_manager = get_async_callback_manager_for_config(config)
@@ -2429,36 +2396,16 @@ class Runnable(ABC, Generic[Input, Output]):
                     while True:
                         chunk = await coro_with_context(anext(iterator), context)
                         yield chunk
-                        if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
-                        else:
-                            final_output = chunk
+                        final_output.add(chunk)
                 except StopAsyncIteration:
                     pass
                 async for ichunk in input_for_tracing:
-                    if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
-                    else:
-                        final_input = ichunk
+                    final_input.add(ichunk)
         except BaseException as e:
-            await run_manager.on_chain_error(e, inputs=final_input)
+            await run_manager.on_chain_error(e, inputs=final_input.value)
             raise
         else:
-            await run_manager.on_chain_end(final_output, inputs=final_input)
+            await run_manager.on_chain_end(final_output.value, inputs=final_input.value)
         finally:
             if iterator_ is not None and hasattr(iterator_, "aclose"):
                 await iterator_.aclose()
@@ -5053,20 +5000,17 @@ class RunnableLambda(Runnable[Input, Output]):
         **kwargs: Any,
     ) -> Iterator[Output]:
         final: Input
+        gathered = _ChunkAccumulator()
         got_first_val = False
         for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            gathered.add(ichunk)
+            got_first_val = True
+        if got_first_val:
+            final = gathered.value
 
         if inspect.isgeneratorfunction(self.func):
             output: Output | None = None
@@ -5145,20 +5089,17 @@ class RunnableLambda(Runnable[Input, Output]):
         **kwargs: Any,
     ) -> AsyncIterator[Output]:
         final: Input
+        gathered = _ChunkAccumulator()
         got_first_val = False
         async for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            gathered.add(ichunk)
+            got_first_val = True
+        if got_first_val:
+            final = gathered.value
 
         if hasattr(self, "afunc"):
             afunc = self.afunc
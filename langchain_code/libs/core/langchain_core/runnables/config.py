@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import threading
 
 # Cannot move uuid to TYPE_CHECKING as RunnableConfig is used in Pydantic models
 import uuid  # noqa: TC003
 import warnings
+from collections import deque
 from collections.abc import Awaitable, Callable, Generator, Iterable, Iterator, Sequence
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from contextlib import contextmanager
 from contextvars import Context, ContextVar, Token, copy_context
 from functools import partial
@@ -576,12 +580,302 @@ class ContextThreadPoolExecutor(ThreadPoolExecutor):
         )
 
 
+class ExecutorPoolStats(TypedDict):
+    """Point-in-time statistics of an `ExecutorPool`."""
+
+    max_workers: int
+    """Maximum number of worker threads of the pool."""
+
+    workers: int
+    """Number of worker threads started so far."""
+
+    active: int
+    """Number of tasks currently running on a worker thread."""
+
+    queued: int
+    """Number of tasks waiting for a free worker thread."""
+
+    throttled: int
+    """Number of tasks held back by the `max_concurrency` of their caller."""
+
+    submitted: int
+    """Total number of tasks submitted to the pool."""
+
+    completed: int
+    """Total number of tasks that finished running on the pool."""
+
+
+# Set inside tasks running on a shared pool. Nested `get_executor_for_config` calls
+# made from those tasks get a dedicated executor, since blocking a shared worker on
+# work queued behind it on the same bounded pool could deadlock.
+_in_shared_executor: ContextVar[bool] = ContextVar("in_shared_executor", default=False)
+
+
+class ExecutorPool:
+    """Process-wide thread pool shared by `Runnable` batch and parallel calls.
+
+    Instead of starting and tearing down a thread pool on every `batch`,
+    `batch_as_completed` or `RunnableParallel.invoke` call, `get_executor_for_config`
+    hands out lightweight views over a single, lazily started pool of worker
+    threads. Each view copies the caller's context to the worker thread and caps
+    the number of its tasks running at once to the `max_concurrency` of the config.
+
+    Use `set_executor_pool` to replace the default pool, e.g. to resize it, or to
+    disable sharing altogether.
+
+    Example:
+        ```python
+        from langchain_core.runnables.config import ExecutorPool, set_executor_pool
+
+        set_executor_pool(ExecutorPool(max_workers=64))
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        thread_name_prefix: str = "langchain-executor",
+    ) -> None:
+        """Create an executor pool.
+
+        Args:
+            max_workers: The maximum number of worker threads. Defaults to the
+                `ThreadPoolExecutor` default of `min(32, os.cpu_count() + 4)`.
+            thread_name_prefix: The prefix of the worker thread names.
+
+        Raises:
+            ValueError: If `max_workers` is not positive.
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers <= 0:
+            msg = f"max_workers must be greater than 0, got {max_workers}"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._queued = 0
+        self._active = 0
+        self._throttled = 0
+        self._submitted = 0
+        self._completed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix,
+                )
+            return self._executor
+
+    def _submit(self, fn: Callable[[], None]) -> None:
+        executor = self._get_executor()
+        with self._lock:
+            self._queued += 1
+            self._submitted += 1
+        executor.submit(self._run, fn)
+
+    def _run(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            fn()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def _throttle(self, delta: int) -> None:
+        with self._lock:
+            self._throttled += delta
+
+    @contextmanager
+    def executor(
+        self, max_concurrency: int | None = None
+    ) -> Generator[Executor, None, None]:
+        """Get an executor backed by this pool.
+
+        On exit, waits for all tasks submitted through the executor to finish.
+
+        Args:
+            max_concurrency: The maximum number of tasks of this executor to run
+                at once. If larger than `max_workers`, or when called from a task
+                already running on this pool, a dedicated
+                `ContextThreadPoolExecutor` is used instead.
+
+        Yields:
+            The executor.
+        """
+        if _in_shared_executor.get() or (
+            max_concurrency is not None and not 0 < max_concurrency <= self.max_workers
+        ):
+            with ContextThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                yield executor
+            return
+        with _PooledExecutor(self, max_concurrency) as executor:
+            yield executor
+
+    def stats(self) -> ExecutorPoolStats:
+        """Get the current statistics of the pool.
+
+        Returns:
+            The statistics of the pool.
+        """
+        with self._lock:
+            executor = self._executor
+            return ExecutorPoolStats(
+                max_workers=self.max_workers,
+                workers=len(executor._threads) if executor is not None else 0,  # noqa: SLF001
+                active=self._active,
+                queued=self._queued,
+                throttled=self._throttled,
+                submitted=self._submitted,
+                completed=self._completed,
+            )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the worker threads of the pool.
+
+        The pool starts new worker threads if it is used again afterwards.
+
+        Args:
+            wait: Whether to wait for running and queued tasks to finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _after_fork(self) -> None:
+        # Worker threads don't survive a fork, start over in the child process.
+        self._lock = threading.Lock()
+        self._executor = None
+        self._queued = self._active = self._throttled = 0
+
+
+class _PooledExecutor(Executor):
+    """View over an `ExecutorPool` limiting how many of its tasks run at once."""
+
+    def __init__(self, pool: ExecutorPool, max_concurrency: int | None) -> None:
+        self._pool = pool
+        self._max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._pending: deque[tuple[Future[Any], Callable[[], Any]]] = deque()
+        self._running = 0
+        self._futures: set[Future[Any]] = set()
+        self._shutdown = False
+
+    def submit(  # type: ignore[override]
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        future: Future[T] = Future()
+        call = partial(
+            copy_context().run, _run_in_shared_executor, partial(func, *args, **kwargs)
+        )
+        with self._lock:
+            if self._shutdown:
+                msg = "cannot schedule new futures after shutdown"
+                raise RuntimeError(msg)
+            self._futures.add(future)
+            future.add_done_callback(self._discard)
+            if (
+                self._max_concurrency is not None
+                and self._running >= self._max_concurrency
+            ):
+                self._pending.append((future, call))
+                self._pool._throttle(1)  # noqa: SLF001
+                return future
+            self._running += 1
+        self._pool._submit(partial(self._drain, future, call))  # noqa: SLF001
+        return future
+
+    def _drain(self, future: Future[Any], call: Callable[[], Any]) -> None:
+        # Run the task, then keep this worker busy with tasks held back by
+        # max_concurrency instead of handing them back to the pool queue.
+        while True:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = call()
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                if not self._pending:
+                    self._running -= 1
+                    return
+                future, call = self._pending.popleft()
+            self._pool._throttle(-1)  # noqa: SLF001
+
+    def _discard(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001,FBT002
+        with self._lock:
+            self._shutdown = True
+            pending = list(self._pending) if cancel_futures else []
+            futures = list(self._futures)
+        for future, _ in pending:
+            future.cancel()
+        if wait:
+            wait_futures(futures)
+
+
+def _run_in_shared_executor(func: Callable[[], T]) -> T:
+    _in_shared_executor.set(True)
+    return func()
+
+
+# DO NOT USE THIS VALUE DIRECTLY!
+# Use it only via `get_executor_pool()` and `set_executor_pool()` below.
+_executor_pool: ExecutorPool | None = ExecutorPool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=lambda: _executor_pool._after_fork() if _executor_pool else None  # noqa: SLF001
+    )
+
+
+def set_executor_pool(pool: ExecutorPool | None) -> None:
+    """Set the executor pool shared by `Runnable` batch and parallel calls.
+
+    The previous pool is not shut down; its worker threads finish their current
+    tasks and exit when the pool is garbage collected.
+
+    Args:
+        pool: The new executor pool. If `None`, every call creates and tears down
+            its own `ContextThreadPoolExecutor`.
+    """
+    global _executor_pool  # noqa: PLW0603
+    _executor_pool = pool
+
+
+def get_executor_pool() -> ExecutorPool | None:
+    """Get the executor pool shared by `Runnable` batch and parallel calls.
+
+    Returns:
+        The executor pool, or `None` if every call uses its own executor.
+    """
+    return _executor_pool
+
+
 @contextmanager
 def get_executor_for_config(
     config: RunnableConfig | None,
 ) -> Generator[Executor, None, None]:
     """Get an executor for a config.
 
+    The executor is backed by the shared pool set with `set_executor_pool` and
+    runs at most `max_concurrency` tasks of the caller at once.
+
     Args:
         config: The config.
 
@@ -589,9 +883,14 @@ def get_executor_for_config(
         The executor.
     """
     config = config or {}
-    with ContextThreadPoolExecutor(
-        max_workers=config.get("max_concurrency")
-    ) as executor:
+    pool = _executor_pool
+    if pool is None:
+        with ContextThreadPoolExecutor(
+            max_workers=config.get("max_concurrency")
+        ) as executor:
+            yield executor
+        return
+    with pool.executor(config.get("max_concurrency")) as executor:
         yield executor
 
 
@@ -32,6 +32,7 @@ from langchain_core.runnables.config import (
 from langchain_core.runnables.utils import (
     AddableDict,
     ConfigurableFieldSpec,
+    _ChunkAccumulator,
 )
 from langchain_core.utils.aiter import atee
 from langchain_core.utils.iter import safetee
@@ -260,24 +261,17 @@ class RunnablePassthrough(RunnableSerializable[Other, Other]):
             for chunk in self._transform_stream_with_config(input, identity, config):
                 yield chunk
         else:
-            final: Other
+            final = _ChunkAccumulator()
             got_first_chunk = False
 
             for chunk in self._transform_stream_with_config(input, identity, config):
                 yield chunk
-
-                if not got_first_chunk:
-                    final = chunk
-                    got_first_chunk = True
-                else:
-                    try:
-                        final = final + chunk  # type: ignore[operator]
-                    except TypeError:
-                        final = chunk
+                final.add(chunk)
+                got_first_chunk = True
 
             if got_first_chunk:
                 call_func_with_variable_args(
-                    self.func, final, ensure_config(config), **kwargs
+                    self.func, final.value, ensure_config(config), **kwargs
                 )
 
     @override
@@ -293,6 +287,7 @@ class RunnablePassthrough(RunnableSerializable[Other, Other]):
             ):
                 yield chunk
         else:
+            final = _ChunkAccumulator()
             got_first_chunk = False
 
             async for chunk in self._atransform_stream_with_config(
@@ -305,23 +300,19 @@ class RunnablePassthrough(RunnableSerializable[Other, Other]):
                 # chunk.
                 # If the input is not addable, then we'll assume that we can
                 # only operate on the last chunk.
-                if not got_first_chunk:
-                    final = chunk
-                    got_first_chunk = True
-                else:
-                    try:
-                        final = final + chunk  # type: ignore[operator]
-                    except TypeError:
-                        final = chunk
+                final.add(chunk)
+                got_first_chunk = True
 
             if got_first_chunk:
                 config = ensure_config(config)
                 if self.afunc is not None:
                     await acall_func_with_variable_args(
-                        self.afunc, final, config, **kwargs
+                        self.afunc, final.value, config, **kwargs
                     )
                 elif self.func is not None:
-                    call_func_with_variable_args(self.func, final, config, **kwargs)
+                    call_func_with_variable_args(
+                        self.func, final.value, config, **kwargs
+                    )
 
     @override
     def stream(
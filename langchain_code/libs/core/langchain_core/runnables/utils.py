@@ -25,6 +25,8 @@ from typing import (
 
 from typing_extensions import override
 
+from langchain_core.messages.ai import AIMessageChunk, AIMessageChunkAccumulator
+
 # Re-export create-model for backwards compatibility
 from langchain_core.utils.pydantic import create_model  # noqa: F401
 
@@ -553,6 +555,65 @@ async def aadd(addables: AsyncIterable[Addable]) -> Addable | None:
     return final
 
 
+class _ChunkAccumulator:
+    """Fold streamed chunks together with `+`.
+
+    Consecutive `AIMessageChunk`s are buffered and merged in one pass when the
+    value is read, rather than re-merging the whole message on every chunk.
+
+    When two chunks cannot be added, the value restarts from the newer chunk. With
+    `stop_on_error`, folding stops at that point and the value is the latest chunk.
+    A `None` value is replaced by the next chunk.
+    """
+
+    __slots__ = ("_pending", "_stop_on_error", "_supported", "_value")
+
+    def __init__(self, *, stop_on_error: bool = False) -> None:
+        self._value: Any = None
+        self._pending: list[AIMessageChunk] = []
+        self._stop_on_error = stop_on_error
+        self._supported = True
+
+    @property
+    def value(self) -> Any:
+        """The chunks added so far, folded together."""
+        self._flush()
+        return self._value
+
+    def add(self, chunk: Any) -> None:
+        """Add a chunk to the end of the stream."""
+        if self._pending and isinstance(chunk, AIMessageChunk):
+            self._pending.append(chunk)
+            return
+        self._flush()
+        self._fold(chunk)
+        if self._supported and isinstance(self._value, AIMessageChunk):
+            self._pending = [self._value]
+
+    def _fold(self, chunk: Any) -> None:
+        if not self._supported or self._value is None:
+            self._value = chunk
+            return
+        try:
+            self._value = self._value + chunk
+        except TypeError:
+            self._value = chunk
+            if self._stop_on_error:
+                self._supported = False
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        if len(pending) <= 1:
+            return
+        try:
+            self._value = AIMessageChunkAccumulator(pending).to_chunk()
+        except TypeError:
+            # Replay one chunk at a time to find where the stream stops adding up
+            self._value = pending[0]
+            for chunk in pending[1:]:
+                self._fold(chunk)
+
+
 class ConfigurableField(NamedTuple):
     """Field that can be configured by the user."""
 
@@ -0,0 +1,324 @@
+"""Tracers that persist runs in batches from a background thread."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from typing_extensions import override
+
+from langchain_core.tracers._compat import run_construct
+from langchain_core.tracers.base import AsyncBaseTracer, BaseTracer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langchain_core.tracers.schemas import Run
+
+logger = logging.getLogger(__name__)
+
+DropPolicy = Literal["oldest", "newest"]
+_EventKind = Literal["start", "end"]
+
+# Fields that are not copied into an event: the nested run tree and the client.
+_EXCLUDED_RUN_FIELDS = ("child_runs", "parent_run", "ls_client")
+
+
+class RunEvent(NamedTuple):
+    """A run as it was when it started or ended."""
+
+    kind: _EventKind
+    """Whether the run started or ended."""
+    run: Run
+    """A copy of the run, without its child runs."""
+
+
+class _RunEventBuffer:
+    """Bounded buffer of run events drained in batches by a daemon thread.
+
+    Recording an event only takes a shallow snapshot of the run's fields and appends
+    it to a `deque`, whose appends and pops are atomic, so the threads emitting
+    callbacks never wait on a lock. Building the `Run` copies, deep-copying inputs and
+    outputs, and persisting them happen on the worker thread.
+    """
+
+    def __init__(
+        self,
+        persist: Callable[[list[RunEvent]], None],
+        *,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        drop_policy: DropPolicy,
+    ) -> None:
+        if max_size < 1 or batch_size < 1:
+            msg = "max_buffer_size and batch_size must be positive."
+            raise ValueError(msg)
+        if drop_policy not in {"oldest", "newest"}:
+            msg = f"drop_policy must be 'oldest' or 'newest', got {drop_policy!r}."
+            raise ValueError(msg)
+        self._persist = weakref.WeakMethod(persist)
+        self._events: deque[tuple[_EventKind, dict[str, Any]]] = deque(maxlen=max_size)
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._drop_newest = drop_policy == "newest"
+        self._drain_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self.dropped = 0
+
+    def record(self, kind: _EventKind, run: Run) -> None:
+        if len(self._events) >= self._max_size:
+            self.dropped += 1
+            if self._drop_newest:
+                return
+        fields = run.__dict__.copy()
+        for name in _EXCLUDED_RUN_FIELDS:
+            fields.pop(name, None)
+        # These are updated in place while the run is in progress; their contents
+        # are copied on the worker.
+        for name in ("inputs", "outputs", "extra"):
+            if isinstance(value := fields.get(name), dict):
+                fields[name] = value.copy()
+        fields["events"] = list(run.events or ())
+        fields["tags"] = list(run.tags or ())
+        self._events.append((kind, fields))
+        if self._worker is None and not self._closed:
+            self._start_worker()
+        if len(self._events) >= self._batch_size:
+            self._wakeup.set()
+
+    def _start_worker(self) -> None:
+        with self._start_lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=_run_worker,
+                args=(weakref.ref(self), self._wakeup, self._flush_interval),
+                name="langchain-batched-tracer",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def drain(self) -> None:
+        """Persist every buffered event, one batch at a time."""
+        with self._drain_lock:
+            while self._events:
+                batch: list[RunEvent] = []
+                while self._events and len(batch) < self._batch_size:
+                    kind, fields = self._events.popleft()
+                    batch.append(_build_event(kind, fields))
+                persist = self._persist()
+                if persist is None:
+                    self._events.clear()
+                    return
+                try:
+                    persist(batch)
+                except Exception as e:
+                    logger.warning(
+                        "Error persisting a batch of %d runs: %s", len(batch), repr(e)
+                    )
+
+    def close(self, timeout: float | None) -> None:
+        self._closed = True
+        self._wakeup.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout)
+        self.drain()
+
+
+def _build_event(kind: _EventKind, fields: dict[str, Any]) -> RunEvent:
+    for name in ("inputs", "outputs"):
+        if fields.get(name):
+            try:
+                fields[name] = copy.deepcopy(fields[name])
+            except Exception:
+                logger.debug("Could not copy run %s; keeping a reference.", name)
+    return RunEvent(kind, run_construct(**fields, child_runs=[]))
+
+
+def _run_worker(
+    buffer_ref: weakref.ref[_RunEventBuffer],
+    wakeup: threading.Event,
+    flush_interval: float,
+) -> None:
+    # Only a weak reference is held between batches so that a tracer that is no
+    # longer used can be garbage collected, which also stops this thread.
+    while True:
+        wakeup.wait(flush_interval)
+        wakeup.clear()
+        buffer = buffer_ref()
+        if buffer is None:
+            return
+        buffer.drain()
+        if buffer._closed:  # noqa: SLF001
+            return
+        del buffer
+
+
+class _BatchedTracerMixin:
+    _buffer: _RunEventBuffer
+
+    def _init_buffer(
+        self,
+        *,
+        max_buffer_size: int,
+        batch_size: int,
+        flush_interval: float,
+        drop_policy: DropPolicy,
+    ) -> None:
+        self._buffer = _RunEventBuffer(
+            self._persist_batch,
+            max_size=max_buffer_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            drop_policy=drop_policy,
+        )
+
+    @abstractmethod
+    def _persist_batch(self, events: list[RunEvent]) -> None:
+        """Persist a batch of run events.
+
+        Called on a background thread, in the order the events were recorded.
+
+        Args:
+            events: The run events to persist.
+        """
+
+    @property
+    def dropped_events(self) -> int:
+        """The number of events dropped because the buffer was full."""
+        return self._buffer.dropped
+
+    def flush(self) -> None:
+        """Persist all buffered events on the calling thread."""
+        self._buffer.drain()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop the background thread and persist all buffered events.
+
+        Args:
+            timeout: How long to wait for the background thread to finish its
+                current batch.
+        """
+        self._buffer.close(timeout)
+
+
+class BatchedTracer(_BatchedTracerMixin, BaseTracer, ABC):
+    """Tracer that persists runs in batches from a background thread.
+
+    Instead of doing the work of persisting each run on the thread that emits the
+    callback, every run start and end is recorded as a compact event in a bounded
+    buffer. A daemon thread turns the events into `RunEvent` objects and passes them
+    to `_persist_batch` in batches, either when `batch_size` events are waiting or
+    every `flush_interval` seconds.
+
+    When the buffer holds `max_buffer_size` events, new events either replace the
+    oldest ones or are discarded, according to `drop_policy`; `dropped_events` counts
+    them. Call `flush` or `close` to persist whatever is still buffered.
+
+    Example:
+        ```python
+        class PrintingTracer(BatchedTracer):
+            def _persist_batch(self, events: list[RunEvent]) -> None:
+                for event in events:
+                    print(event.kind, event.run.name)
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_buffer_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        drop_policy: DropPolicy = "oldest",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            max_buffer_size: The maximum number of events held in memory.
+            batch_size: The maximum number of events passed to `_persist_batch`.
+            flush_interval: How often, in seconds, buffered events are persisted.
+            drop_policy: Which events are dropped once the buffer is full:
+                `'oldest'` replaces the oldest buffered events, `'newest'` discards
+                the incoming ones.
+            **kwargs: Additional keyword arguments passed to `BaseTracer`.
+        """
+        super().__init__(**kwargs)
+        self._init_buffer(
+            max_buffer_size=max_buffer_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            drop_policy=drop_policy,
+        )
+
+    @override
+    def _persist_run(self, run: Run) -> None:
+        # Root runs are recorded on end like every other run.
+        pass
+
+    @override
+    def _on_run_create(self, run: Run) -> None:
+        self._buffer.record("start", run)
+
+    @override
+    def _on_run_update(self, run: Run) -> None:
+        self._buffer.record("end", run)
+
+
+class AsyncBatchedTracer(_BatchedTracerMixin, AsyncBaseTracer, ABC):
+    """Async tracer that persists runs in batches from a background thread.
+
+    The async counterpart of `BatchedTracer`: recording an event never awaits, and
+    `_persist_batch` is called on the background thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_buffer_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        drop_policy: DropPolicy = "oldest",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            max_buffer_size: The maximum number of events held in memory.
+            batch_size: The maximum number of events passed to `_persist_batch`.
+            flush_interval: How often, in seconds, buffered events are persisted.
+            drop_policy: Which events are dropped once the buffer is full:
+                `'oldest'` replaces the oldest buffered events, `'newest'` discards
+                the incoming ones.
+            **kwargs: Additional keyword arguments passed to `AsyncBaseTracer`.
+        """
+        super().__init__(**kwargs)
+        self._init_buffer(
+            max_buffer_size=max_buffer_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            drop_policy=drop_policy,
+        )
+
+    @override
+    async def _persist_run(self, run: Run) -> None:
+        pass
+
+    @override
+    async def _on_run_create(self, run: Run) -> None:
+        self._buffer.record("start", run)
+
+    @override
+    async def _on_run_update(self, run: Run) -> None:
+        self._buffer.record("end", run)
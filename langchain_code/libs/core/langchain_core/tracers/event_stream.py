@@ -136,6 +136,21 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             exclude_types=exclude_types,
             exclude_tags=exclude_tags,
         )
+        # A run's name, type and tags are all the filter looks at, and they are
+        # known when the run starts. Runs whose events would all be filtered out
+        # are recorded here so that no event is built for them in the first place.
+        self._filters_runs = any(
+            option is not None
+            for option in (
+                include_names,
+                include_types,
+                include_tags,
+                exclude_names,
+                exclude_types,
+                exclude_tags,
+            )
+        )
+        self._excluded_runs: set[UUID] = set()
 
         try:
             loop = asyncio.get_event_loop()
@@ -205,7 +220,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             # run has finished, don't issue any stream events
             yield cast("T", first)
             return
-        if tap is sentinel:
+        if tap is sentinel and run_id not in self._excluded_runs:
             # if we are the first to tap, issue stream events
             event: StandardStreamEvent = {
                 "event": f"on_{run_info['run_type']}_stream",
@@ -255,7 +270,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             # run has finished, don't issue any stream events
             yield cast("T", first)
             return
-        if tap is sentinel:
+        if tap is sentinel and run_id not in self._excluded_runs:
             # if we are the first to tap, issue stream events
             event: StandardStreamEvent = {
                 "event": f"on_{run_info['run_type']}_stream",
@@ -292,8 +307,12 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_: str,
         run_type: str,
         **kwargs: Any,
-    ) -> None:
-        """Update the run info."""
+    ) -> bool:
+        """Update the run info.
+
+        Returns:
+            Whether the events of the run pass the filter.
+        """
         info: RunInfo = {
             "tags": tags or [],
             "metadata": metadata or {},
@@ -301,6 +320,16 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             "run_type": run_type,
             "parent_run_id": parent_run_id,
         }
+        self.run_map[run_id] = info
+        self.parent_map[run_id] = parent_run_id
+
+        if self._filters_runs and not self.root_event_filter.include_event(
+            cast("StreamEvent", info), run_type
+        ):
+            # Still tracked so that its children know their parents, but nothing
+            # else about the run is needed.
+            self._excluded_runs.add(run_id)
+            return False
 
         if "inputs" in kwargs:
             # Handle inputs in a special case to allow inputs to be an
@@ -311,9 +340,15 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         if "tool_call_id" in kwargs:
             # Store tool_call_id in run info for linking errors to tool calls
             info["tool_call_id"] = kwargs["tool_call_id"]
+        return True
 
-        self.run_map[run_id] = info
-        self.parent_map[run_id] = parent_run_id
+    def _pop_run_info(self, run_id: UUID) -> RunInfo | None:
+        """Remove a run that ended, returning its info if its events pass the filter."""
+        run_info = self.run_map.pop(run_id)
+        if run_id in self._excluded_runs:
+            self._excluded_runs.remove(run_id)
+            return None
+        return run_info
 
     @override
     async def on_chat_model_start(
@@ -332,7 +367,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "chat_model"
 
-        self._write_run_start_info(
+        if not self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -340,7 +375,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             name_=name_,
             run_type=run_type,
             inputs={"messages": messages},
-        )
+        ):
+            return
 
         self._send(
             {
@@ -374,7 +410,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "llm"
 
-        self._write_run_start_info(
+        if not self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -382,7 +418,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             name_=name_,
             run_type=run_type,
             inputs={"prompts": prompts},
-        )
+        ):
+            return
 
         self._send(
             {
@@ -450,7 +487,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         if run_info is None:
             msg = f"Run ID {run_id} not found in run map."
             raise AssertionError(msg)
-        if self.is_tapped.get(run_id):
+        if self.is_tapped.get(run_id) or run_id in self._excluded_runs:
             return
         if run_info["run_type"] == "chat_model":
             event = "on_chat_model_stream"
@@ -496,7 +533,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         Raises:
             ValueError: If the run type is not `'llm'` or `'chat_model'`.
         """
-        run_info = self.run_map.pop(run_id)
+        run_info = self._pop_run_info(run_id)
+        if run_info is None:
+            return
         inputs_ = run_info.get("inputs")
 
         generations: list[list[GenerationChunk]] | list[list[ChatGenerationChunk]]
@@ -571,7 +610,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             data["input"] = inputs
             kwargs["inputs"] = inputs
 
-        self._write_run_start_info(
+        if not self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -579,7 +618,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             name_=name_,
             run_type=run_type_,
             **kwargs,
-        )
+        ):
+            return
 
         self._send(
             {
@@ -604,7 +644,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         **kwargs: Any,
     ) -> None:
         """End a trace for a chain run."""
-        run_info = self.run_map.pop(run_id)
+        run_info = self._pop_run_info(run_id)
+        if run_info is None:
+            return
         run_type = run_info["run_type"]
 
         event = f"on_{run_type}_end"
@@ -668,7 +710,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         """Start a trace for a tool run."""
         name_ = _assign_name(name, serialized)
 
-        self._write_run_start_info(
+        if not self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -677,7 +719,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             run_type="tool",
             inputs=inputs,
             tool_call_id=kwargs.get("tool_call_id"),
-        )
+        ):
+            return
 
         self._send(
             {
@@ -707,6 +750,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         """Run when tool errors."""
         # Extract tool_call_id from kwargs if passed directly, or from run_info
         # (which was stored during on_tool_start) as a fallback
+        if run_id in self._excluded_runs:
+            self._pop_run_info(run_id)
+            return
         tool_call_id = kwargs.get("tool_call_id")
         run_info, inputs = self._get_tool_run_info_with_inputs(run_id)
         if tool_call_id is None:
@@ -730,6 +776,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
     @override
     async def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
         """End a trace for a tool run."""
+        if run_id in self._excluded_runs:
+            self._pop_run_info(run_id)
+            return
         run_info, inputs = self._get_tool_run_info_with_inputs(run_id)
 
         self._send(
@@ -765,7 +814,7 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         name_ = _assign_name(name, serialized)
         run_type = "retriever"
 
-        self._write_run_start_info(
+        if not self._write_run_start_info(
             run_id,
             tags=tags,
             metadata=metadata,
@@ -773,7 +822,8 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
             name_=name_,
             run_type=run_type,
             inputs={"query": query},
-        )
+        ):
+            return
 
         self._send(
             {
@@ -797,7 +847,9 @@ class _AstreamEventsCallbackHandler(AsyncCallbackHandler, _StreamingCallbackHand
         self, documents: Sequence[Document], *, run_id: UUID, **kwargs: Any
     ) -> None:
         """Run when `Retriever` ends running."""
-        run_info = self.run_map.pop(run_id)
+        run_info = self._pop_run_info(run_id)
+        if run_info is None:
+            return
 
         self._send(
             {
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
+# String keys whose merge depends on the value accumulated so far
+_STR_MERGE_SPECIAL_KEYS = frozenset({"index", "id", "output_version", "model_provider"})
+
 
 def merge_dicts(left: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]:
     r"""Merge dictionaries.
@@ -28,6 +31,11 @@ def merge_dicts(left: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]
         `merged = {"function_call": {"arguments": "{\n"}}`.
     """
     merged = left.copy()
+    # String, dict and list values merged into the same key are collected and merged
+    # once at the end, so merging many dicts stays linear in the total size of the
+    # values. This is equivalent to merging them one at a time, since the merges
+    # fold from the left and none of the checks below depend on the merged value.
+    deferred: dict[str, list[Any]] = {}
     for right in others:
         for right_k, right_v in right.items():
             if right_k not in merged or (
@@ -61,11 +69,12 @@ def merge_dicts(left: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]
                     and merged[right_k] == right_v
                 ):
                     continue
-                merged[right_k] += right_v
-            elif isinstance(merged[right_k], dict):
-                merged[right_k] = merge_dicts(merged[right_k], right_v)
-            elif isinstance(merged[right_k], list):
-                merged[right_k] = merge_lists(merged[right_k], right_v)
+                if right_k in _STR_MERGE_SPECIAL_KEYS:
+                    merged[right_k] += right_v
+                else:
+                    deferred.setdefault(right_k, []).append(right_v)
+            elif isinstance(merged[right_k], (dict, list)):
+                deferred.setdefault(right_k, []).append(right_v)
             elif merged[right_k] == right_v:
                 continue
             elif isinstance(merged[right_k], int):
@@ -76,6 +85,13 @@ def merge_dicts(left: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]
                     f"value has unsupported type {type(merged[right_k])}."
                 )
                 raise TypeError(msg)
+    for key, values in deferred.items():
+        if isinstance(merged[key], str):
+            merged[key] = "".join((merged[key], *values))
+        elif isinstance(merged[key], dict):
+            merged[key] = merge_dicts(merged[key], *values)
+        else:
+            merged[key] = merge_lists(merged[key], *values)
     return merged
 
 
@@ -90,6 +106,9 @@ def merge_lists(left: list | None, *others: list | None) -> list | None:
         The merged list.
     """
     merged = left.copy() if left is not None else None
+    # Elements merged into the same position are collected and merged with a single
+    # `merge_dicts` call at the end, which is equivalent since it folds from the left
+    pending: dict[int, list[dict[str, Any]]] = {}
     for other in others:
         if other is None:
             continue
@@ -144,11 +163,14 @@ def merge_lists(left: list | None, *others: list | None) -> list | None:
                                 if "type" in e
                                 else e
                             )
-                        merged[to_merge[0]] = merge_dicts(merged[to_merge[0]], new_e)
+                        pending.setdefault(to_merge[0], []).append(new_e)
                     else:
                         merged.append(e)
                 else:
                     merged.append(e)
+    if merged is not None:
+        for position, new_es in pending.items():
+            merged[position] = merge_dicts(merged[position], *new_es)
     return merged
 
 
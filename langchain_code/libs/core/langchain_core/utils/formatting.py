@@ -1,9 +1,47 @@
 """Utilities for formatting strings."""
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
 from string import Formatter
 from typing import Any
 
+_FORMAT_CACHE_SIZE = 1_024
+
+_ParsedField = tuple[str, str | None, str | None, str | None]
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _parse_format_string(format_string: str) -> tuple[_ParsedField, ...]:
+    """Parse a format string once and remember its fields."""
+    return tuple(Formatter().parse(format_string))
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _compile_format_string(
+    format_string: str,
+) -> tuple[tuple[str, str | None], ...] | None:
+    """Reduce a format string to `(literal, name)` pairs for plain `{name}` fields.
+
+    Returns `None` when any field uses positional or automatic numbering, attribute
+    access, indexing, a conversion, or a format spec; those templates are rendered
+    by the generic `string.Formatter` machinery instead.
+    """
+    compiled: list[tuple[str, str | None]] = []
+    for literal_text, field_name, format_spec, conversion in _parse_format_string(
+        format_string
+    ):
+        if field_name is not None and (
+            not field_name
+            or field_name.isdigit()
+            or "." in field_name
+            or "[" in field_name
+            or format_spec
+            or conversion is not None
+        ):
+            return None
+        compiled.append((literal_text, field_name))
+    return tuple(compiled)
+
 
 class StrictFormatter(Formatter):
     """A string formatter that enforces keyword-only argument substitution.
@@ -45,7 +83,35 @@ class StrictFormatter(Formatter):
                 "everything should be passed as keyword arguments."
             )
             raise ValueError(msg)
-        return super().vformat(format_string, args, kwargs)
+        compiled = _compile_format_string(format_string)
+        if compiled is None:
+            return super().vformat(format_string, args, kwargs)
+        result = []
+        used_args: set[int | str] = set()
+        for literal_text, field_name in compiled:
+            if literal_text:
+                result.append(literal_text)
+            if field_name is not None:
+                obj = self.get_value(field_name, args, kwargs)
+                used_args.add(field_name)
+                result.append(self.format_field(obj, ""))
+        self.check_unused_args(used_args, args, kwargs)
+        return "".join(result)
+
+    def parse(self, format_string: str) -> Iterable[_ParsedField]:
+        """Parse a format string into its literal text and replacement fields.
+
+        Parsed templates are cached, so formatting the same template repeatedly
+        only pays the parsing cost once.
+
+        Args:
+            format_string: The format string to parse.
+
+        Returns:
+            `(literal_text, field_name, format_spec, conversion)` tuples, as
+            returned by `string.Formatter.parse`.
+        """
+        return _parse_format_string(format_string)
 
     def validate_input_variables(
         self, format_string: str, input_variables: list[str]
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import collections
+import copy
 import inspect
 import logging
 import types
 import typing
 import uuid
+import weakref
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -311,6 +313,45 @@ def _convert_any_typed_dicts_to_pydantic(
     return type_
 
 
+# Converted tools, keyed by tool id. An entry is removed when its tool is garbage
+# collected and recomputed when a field the schema is derived from changes.
+_TOOL_FUNCTION_CACHE: dict[int, tuple[tuple[Any, ...], FunctionDescription]] = {}
+
+
+def _cached_tool_to_openai_function(tool: BaseTool) -> FunctionDescription:
+    """Memoized `_format_tool_to_openai_function`.
+
+    Generating the JSON schema of a tool dominates the cost of binding tools to a
+    model, which agents do on every step with the same tools. Tools that override
+    `tool_call_schema` are not memoized since it may depend on other state.
+
+    Args:
+        tool: The tool to format.
+
+    Returns:
+        A copy of the function description, which callers may modify.
+    """
+    if (
+        type(tool).tool_call_schema
+        is not langchain_core.tools.base.BaseTool.tool_call_schema
+    ):
+        return _format_tool_to_openai_function(tool)
+    signature = (type(tool), tool.name, tool.description, tool.args_schema)
+    cached = _TOOL_FUNCTION_CACHE.get(id(tool))
+    if cached is None or cached[0] != signature:
+        function = _format_tool_to_openai_function(tool)
+        if cached is None:
+            weakref.finalize(tool, _TOOL_FUNCTION_CACHE.pop, id(tool), None)
+        if isinstance(tool.args_schema, dict):
+            # Compare against a snapshot, so that a schema edited in place is
+            # converted again.
+            signature = (*signature[:3], copy.deepcopy(tool.args_schema))
+        _TOOL_FUNCTION_CACHE[id(tool)] = (signature, function)
+    else:
+        function = cached[1]
+    return copy.deepcopy(function)
+
+
 def _format_tool_to_openai_function(tool: BaseTool) -> FunctionDescription:
     """Format tool into the OpenAI function API.
 
@@ -429,7 +470,7 @@ def convert_to_openai_function(
             "dict", _convert_typed_dict_to_openai_function(cast("type", function))
         )
     elif isinstance(function, langchain_core.tools.base.BaseTool):
-        oai_function = cast("dict", _format_tool_to_openai_function(function))
+        oai_function = cast("dict", _cached_tool_to_openai_function(function))
     elif callable(function):
         oai_function = cast(
             "dict", _convert_python_function_to_openai_function(function)
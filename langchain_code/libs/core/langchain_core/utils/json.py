@@ -55,8 +55,8 @@ def _custom_parser(multiline_string: str | bytes | bytearray) -> str:
 # MIT License
 
 
-def parse_partial_json(s: str, *, strict: bool = False) -> Any:
-    """Parse a JSON string that may be missing closing braces.
+def _parse_partial_json(s: str, *, strict: bool = False) -> Any:
+    """Parse a JSON string that may be missing closing braces, from scratch.
 
     Args:
         s: The JSON string to parse.
@@ -136,6 +136,367 @@ def parse_partial_json(s: str, *, strict: bool = False) -> Any:
     return json.loads(s, strict=strict)
 
 
+_WHITESPACE_RUN = re.compile(r"[ \t\n\r]*")
+_STRING_RUN = re.compile(r'[^"\\\x00-\x1f]*')
+_NUMBER_RUN = re.compile(r"[-+.0-9eE]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?")
+_SIMPLE_ESCAPES = frozenset('"\\/bfnrt')
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_LITERALS = {"t": "true", "f": "false", "n": "null"}
+
+# Scanner states between tokens. Only a snapshot taken in one of the
+# `_COMPLETE_STATES` can keep everything scanned so far.
+_VALUE = 0  # A value must follow (document start, after `:` or an array `,`).
+_VALUE_OR_CLOSE = 1  # Right after `[`.
+_KEY_OR_CLOSE = 2  # Right after `{`.
+_KEY = 3  # After an object `,`.
+_COLON = 4  # After an object key.
+_NEXT = 5  # After a complete value.
+_COMPLETE_STATES = frozenset({_VALUE_OR_CLOSE, _KEY_OR_CLOSE, _NEXT})
+
+# Tokens that can be split across calls to `feed`.
+_NO_TOKEN = 0
+_STRING = 1
+_NUMBER_TOKEN = 2
+_LITERAL = 3
+
+
+class PartialJsonParser:
+    """Incrementally parse a JSON document that is received in pieces.
+
+    Every piece passed to `feed` is scanned exactly once, so `parse` does not have
+    to rescan the text for the closing brackets that `parse_partial_json` adds.
+    `parse` still hands the whole text fed so far to `json.loads` and builds a new
+    value, so each snapshot costs time proportional to the size of the document,
+    and taking one after each chunk of a stream remains quadratic in the length of
+    the stream overall. Only the constant factor is smaller.
+
+    `parse` returns the same result as `parse_partial_json` called on all the text
+    fed so far, including for malformed input, which is delegated to it.
+
+    Example:
+        ```python
+        parser = PartialJsonParser()
+        parser.feed('{"name": "Al')
+        parser.parse()  # {'name': 'Al'}
+        parser.feed('ice", "tags": [1, 2')
+        parser.parse()  # {'name': 'Alice', 'tags': [1, 2]}
+        ```
+    """
+
+    __slots__ = (
+        "_closers",
+        "_escape",
+        "_is_key",
+        "_length",
+        "_literal",
+        "_malformed",
+        "_member_ends",
+        "_parts",
+        "_raw",
+        "_state",
+        "_token",
+        "_token_start",
+        "_token_text",
+        "strict",
+    )
+
+    def __init__(self, *, strict: bool = False) -> None:
+        """Create an empty parser.
+
+        Args:
+            strict: Whether to use strict parsing.
+        """
+        self.strict = strict
+        self._raw: list[str] = []
+        # The text fed so far with raw newlines inside strings escaped, which is
+        # what `parse_partial_json` hands to `json.loads`.
+        self._parts: list[str] = []
+        self._length = 0
+        self._closers: list[str] = []
+        # For each open container, the offset just past its last complete member.
+        self._member_ends: list[int] = []
+        self._state = _VALUE
+        self._token = _NO_TOKEN
+        self._token_start = 0
+        self._token_text = ""
+        self._literal = ""
+        self._is_key = False
+        # 0 outside an escape, -1 after a backslash, else the `\\u` digits left.
+        self._escape = 0
+        self._malformed = False
+
+    @property
+    def text(self) -> str:
+        """All the text fed so far."""
+        return "".join(self._raw)
+
+    def feed(self, text: str) -> None:
+        """Scan the next piece of the document.
+
+        Args:
+            text: The text that follows everything fed so far.
+        """
+        if not text:
+            return
+        self._raw.append(text)
+        if self._malformed:
+            return
+        newlines: list[int] = []
+        if not self._scan(text, newlines):
+            # Not on the happy path any more: leave it to `parse_partial_json`.
+            self._malformed = True
+            self._parts.clear()
+            return
+        if newlines:
+            pieces = []
+            start = 0
+            for index in newlines:
+                pieces.append(text[start:index])
+                pieces.append("\\n")
+                start = index + 1
+            pieces.append(text[start:])
+            text = "".join(pieces)
+        self._parts.append(text)
+        self._length += len(text)
+
+    def parse(self) -> Any:
+        """Parse everything fed so far, closing whatever is still open.
+
+        Returns:
+            The parsed JSON value. Each call returns newly built objects.
+
+        Raises:
+            json.JSONDecodeError: If nothing parseable has been fed yet.
+        """
+        if self._malformed:
+            return _parse_partial_json(self.text, strict=self.strict)
+        prefix = self._valid_prefix()
+        if prefix is None:
+            return _parse_partial_json(self.text, strict=self.strict)
+        try:
+            return json.loads(
+                prefix + "".join(reversed(self._closers)), strict=self.strict
+            )
+        except ValueError:
+            return _parse_partial_json(self.text, strict=self.strict)
+
+    def _valid_prefix(self) -> str | None:
+        """Return the longest prefix `parse_partial_json` would manage to close."""
+        text = "".join(self._parts)
+        if len(self._parts) > 1:
+            self._parts[:] = [text]
+        token = self._token
+        if token == _STRING and not self._is_key:
+            if self._escape == 0:
+                return text + '"'
+            if self._escape < 0:
+                # Drop the dangling backslash.
+                return text[:-1] + '"'
+        elif token == _NUMBER_TOKEN:
+            match = _NUMBER.match(self._token_text)
+            if match is not None:
+                return text[: self._token_start + match.end()]
+        elif token == _NO_TOKEN and self._state in _COMPLETE_STATES:
+            return text
+        # Drop the incomplete member of the innermost container.
+        return text[: self._member_ends[-1]] if self._member_ends else None
+
+    def _end_value(self, end: int) -> None:
+        self._state = _NEXT
+        if self._member_ends:
+            self._member_ends[-1] = end
+
+    def _scan(self, text: str, newlines: list[int]) -> bool:
+        """Advance the scanner over `text`, recording raw newlines inside strings.
+
+        Returns:
+            `False` as soon as `text` is not a valid continuation of the document.
+        """
+        closers = self._closers
+        member_ends = self._member_ends
+        base = self._length
+        size = len(text)
+        i = 0
+        while i < size:
+            token = self._token
+            if token == _STRING:
+                if self._escape == 0:
+                    i = _STRING_RUN.match(text, i).end()  # type: ignore[union-attr]
+                    if i == size:
+                        break
+                    char = text[i]
+                    if char == '"':
+                        self._token = _NO_TOKEN
+                        if self._is_key:
+                            self._state = _COLON
+                        else:
+                            self._end_value(base + i + 1 + len(newlines))
+                    elif char == "\\":
+                        self._escape = -1
+                    elif char == "\n":
+                        newlines.append(i)
+                    elif self.strict:
+                        return False
+                elif self._escape < 0:
+                    char = text[i]
+                    if char == "u":
+                        self._escape = 4
+                    elif char in _SIMPLE_ESCAPES:
+                        self._escape = 0
+                    else:
+                        return False
+                elif text[i] in _HEX_DIGITS:
+                    self._escape -= 1
+                else:
+                    return False
+                i += 1
+                continue
+            if token == _NUMBER_TOKEN:
+                end = _NUMBER_RUN.match(text, i).end()  # type: ignore[union-attr]
+                self._token_text += text[i:end]
+                i = end
+                if i == size:
+                    break
+                if _NUMBER.fullmatch(self._token_text) is None:
+                    return False
+                self._token = _NO_TOKEN
+                self._end_value(base + i + len(newlines))
+                continue
+            if token == _LITERAL:
+                literal = self._literal
+                done = len(self._token_text)
+                end = min(size, i + len(literal) - done)
+                piece = text[i:end]
+                if not literal.startswith(piece, done):
+                    return False
+                self._token_text += piece
+                i = end
+                if len(self._token_text) == len(literal):
+                    self._token = _NO_TOKEN
+                    self._end_value(base + i + len(newlines))
+                continue
+
+            char = text[i]
+            if char in " \t\n\r":
+                i = _WHITESPACE_RUN.match(text, i).end()  # type: ignore[union-attr]
+                continue
+            state = self._state
+            position = base + i + len(newlines)
+            if state == _NEXT:
+                if not closers:
+                    # Extra data after the document.
+                    return False
+                if char == ",":
+                    self._state = _KEY if closers[-1] == "}" else _VALUE
+                elif char == closers[-1]:
+                    closers.pop()
+                    member_ends.pop()
+                    self._end_value(position + 1)
+                else:
+                    return False
+            elif state in {_KEY, _KEY_OR_CLOSE}:
+                if char == '"':
+                    self._token = _STRING
+                    self._is_key = True
+                elif char == "}" and state == _KEY_OR_CLOSE:
+                    closers.pop()
+                    member_ends.pop()
+                    self._end_value(position + 1)
+                else:
+                    return False
+            elif state == _COLON:
+                if char != ":":
+                    return False
+                self._state = _VALUE
+            elif char == "]" and state == _VALUE_OR_CLOSE:
+                closers.pop()
+                member_ends.pop()
+                self._end_value(position + 1)
+            elif char == "{":
+                closers.append("}")
+                member_ends.append(position + 1)
+                self._state = _KEY_OR_CLOSE
+            elif char == "[":
+                closers.append("]")
+                member_ends.append(position + 1)
+                self._state = _VALUE_OR_CLOSE
+            elif char == '"':
+                self._token = _STRING
+                self._is_key = False
+            elif char in "-0123456789":
+                self._token = _NUMBER_TOKEN
+                self._token_start = position
+                self._token_text = ""
+                # The number branch consumes it.
+                continue
+            elif char in _LITERALS:
+                self._token = _LITERAL
+                self._literal = _LITERALS[char]
+                self._token_text = ""
+                continue
+            else:
+                return False
+            i += 1
+        return True
+
+
+def parse_partial_json(s: str, *, strict: bool = False) -> Any:
+    """Parse a JSON string that may be missing closing braces.
+
+    To parse a string that grows chunk by chunk, feed the chunks to a
+    `PartialJsonParser` instead, which only scans each chunk once. Parsing each
+    snapshot still costs time proportional to its length either way.
+
+    Args:
+        s: The JSON string to parse.
+        strict: Whether to use strict parsing.
+
+    Returns:
+        The parsed JSON object as a Python dictionary.
+    """
+    return _parse_partial_json(s, strict=strict)
+
+
+class _PartialJsonStream:
+    """Parse successive snapshots of a JSON string that grows while streaming.
+
+    Returns what `parse_partial_json` would for each snapshot, but when a snapshot
+    extends the last one parsed, only the new suffix is scanned. Comparing with the
+    last snapshot and parsing the new one are still linear in its length, so a
+    stream remains quadratic overall. Create one per stream.
+    """
+
+    __slots__ = ("_parser", "_text", "strict")
+
+    def __init__(self, *, strict: bool = False) -> None:
+        self.strict = strict
+        self._parser: PartialJsonParser | None = None
+        self._text = ""
+
+    def __call__(self, s: str) -> Any:
+        if not isinstance(s, str):
+            return _parse_partial_json(s, strict=self.strict)
+        parser = self._parser
+        if parser is not None and s.startswith(self._text):
+            self._parser = None
+            parser.feed(s[len(self._text) :])
+        else:
+            # Attempt to parse the string as-is.
+            try:
+                return json.loads(s, strict=self.strict)
+            except json.JSONDecodeError:
+                pass
+            parser = PartialJsonParser(strict=self.strict)
+            parser.feed(s)
+        # A malformed snapshot, such as `parse_json_markdown` trying the text
+        # around a fenced block, does not replace the last parser on track.
+        if not parser._malformed:  # noqa: SLF001
+            self._parser = parser
+            self._text = s
+        return parser.parse()
+
+
 _json_markdown_re = re.compile(r"```(json)?(.*)", re.DOTALL)
 
 
@@ -2,21 +2,44 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import math
+import operator
+import os
+import re
+import tempfile
+import threading
 import uuid
 from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
+    Literal,
+    cast,
 )
 
-from typing_extensions import override
+from typing_extensions import Self, override
 
 from langchain_core.documents import Document
 from langchain_core.load import dumpd, load
+from langchain_core.structured_query import (
+    Comparator,
+    Comparison,
+    FilterDirective,
+    Operation,
+    Operator,
+    StructuredQuery,
+    Visitor,
+)
 from langchain_core.vectorstores import VectorStore
-from langchain_core.vectorstores.utils import _cosine_similarity as cosine_similarity
-from langchain_core.vectorstores.utils import maximal_marginal_relevance
+from langchain_core.vectorstores.utils import (
+    _IVFIndex,
+    _top_k_indices,
+    _VectorMatrix,
+    maximal_marginal_relevance,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator, Sequence
@@ -31,6 +54,415 @@ except ImportError:
     _HAS_NUMPY = False
 
 
+_MASK_CACHE_SIZE = 128
+
+# Files of a binary dump. The data files of each dump are named after a generation
+# id recorded in the manifest, so that replacing the manifest switches to the new
+# files all at once.
+_BINARY_FORMAT_VERSION = 1
+_MANIFEST_FILE = "manifest.json"
+_IDS_FILE = "ids.{}.json"
+_VECTORS_FILE = "vectors.{}.npy"
+_DOCUMENTS_FILE = "documents.{}.jsonl"
+
+_MISSING = object()
+
+
+def _replace_file(
+    path: Path, write: Callable[[IO[Any]], object], *, binary: bool = False
+) -> None:
+    """Write a file in the directory of `path`, then move it over `path`.
+
+    Readers of the previous file, such as a memory map, keep seeing its contents.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        f = os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding="utf-8")
+        with f:
+            write(f)
+        Path(tmp).replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            Path(tmp).unlink()
+        raise
+
+
+def _read_binary_dump(
+    path: Path, manifest: dict[str, Any], *, mmap: bool
+) -> tuple[list[str], np.ndarray, dict[str, dict[str, Any]]]:
+    """Read the ids, vectors and entries of the binary dump described by `manifest`."""
+    generation = manifest["generation"]
+    ids = json.loads((path / _IDS_FILE.format(generation)).read_text(encoding="utf-8"))
+    vectors = np.load(
+        path / _VECTORS_FILE.format(generation), mmap_mode="r" if mmap else None
+    )
+    if vectors.shape != (len(ids), manifest["dim"]):
+        msg = (
+            f"Expected {len(ids)} vectors of dimension {manifest['dim']} in "
+            f"{path}, got an array of shape {vectors.shape}."
+        )
+        raise ValueError(msg)
+    store: dict[str, dict[str, Any]] = {}
+    with (path / _DOCUMENTS_FILE.format(generation)).open("r", encoding="utf-8") as f:
+        for id_, line, vector in zip(ids, f, vectors, strict=True):
+            record = json.loads(line)
+            # Only records holding serialized LangChain objects need reviving
+            if '"lc"' in line:
+                record = load(record, allowed_objects=[Document])
+            store[id_] = {
+                "id": id_,
+                "vector": vector,
+                "text": record["text"],
+                "metadata": record["metadata"],
+            }
+    return ids, vectors, store
+
+
+class _IndexedStore(dict[str, dict[str, Any]]):
+    """Entries of an `InMemoryVectorStore`, mirrored into a `_VectorMatrix`.
+
+    The matrix is built on the first search and then kept up to date as entries
+    are set or removed. Operations that are awkward to mirror row by row drop the
+    matrix so that it is rebuilt on the next search. Mutating an entry in place
+    (e.g. `store["id"]["vector"] = ...`) is not tracked.
+
+    Metadata columns and compiled filter masks are aligned with the rows of the
+    matrix, and dropped whenever the store changes.
+
+    Changes to the entries and the matrix are made under a lock, so that entries
+    can be added from several threads at once, e.g. by `index` with
+    `max_concurrency`.
+    """
+
+    ivf: _IVFIndex | None = None
+    _matrix: _VectorMatrix | None = None
+    _columns: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] | None = None
+    _masks: dict[str, np.ndarray] | None = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lock = threading.RLock()
+
+    def _invalidate(self) -> None:
+        self._columns = None
+        self._masks = None
+
+    def column(self, attribute: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get a metadata attribute as columns aligned with the rows of the matrix.
+
+        Args:
+            attribute: The metadata attribute.
+
+        Returns:
+            The values as an object array, a boolean array telling whether each
+                entry has the attribute, and the values as a float array with NaN
+                where the value is not a number.
+        """
+        with self._lock:
+            if self._columns is None:
+                self._columns = {}
+            if (column := self._columns.get(attribute)) is None:
+                matrix = self.matrix()
+                ids = matrix.ids if matrix is not None else []
+                values = np.empty(len(ids), dtype=object)
+                values[:] = [
+                    self[id_]["metadata"].get(attribute, _MISSING) for id_ in ids
+                ]
+                present = np.fromiter(
+                    (value is not _MISSING for value in values),
+                    dtype=bool,
+                    count=len(ids),
+                )
+                numbers = np.fromiter(
+                    (
+                        value if _is_number(value) else math.nan
+                        for value in values.tolist()
+                    ),
+                    dtype=np.float64,
+                    count=len(ids),
+                )
+                column = self._columns[attribute] = (values, present, numbers)
+            return column
+
+    def filter_mask(self, directive: FilterDirective) -> np.ndarray:
+        """Get the rows of the matrix matching a filter.
+
+        Masks are cached per filter expression until the store changes.
+
+        Args:
+            directive: The filter.
+
+        Returns:
+            A boolean array aligned with the rows of the matrix.
+        """
+        key = repr(directive)
+        with self._lock:
+            if self._masks is None:
+                self._masks = {}
+            if (mask := self._masks.get(key)) is None:
+                mask = directive.accept(_MetadataMaskVisitor(self))
+                if len(self._masks) >= _MASK_CACHE_SIZE:
+                    del self._masks[next(iter(self._masks))]
+                self._masks[key] = mask
+            return mask
+
+    def matrix(self) -> _VectorMatrix | None:
+        """Get the matrix of stored vectors, building it if needed.
+
+        Returns:
+            The matrix, or `None` if the store is empty.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if not _HAS_NUMPY:
+            msg = (
+                "InMemoryVectorStore search requires numpy to be installed. "
+                "Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
+        with self._lock:
+            if self._matrix is None and self:
+                self._matrix = _VectorMatrix.from_vectors(
+                    list(self.keys()), [entry["vector"] for entry in self.values()]
+                )
+                if self.ivf is not None:
+                    self.ivf.reset()
+                    self._matrix.ivf = self.ivf
+            return self._matrix
+
+    def train_ivf(self, matrix: _VectorMatrix) -> None:
+        """Train the IVF index of the matrix if it is due.
+
+        Training is serialized with changes to the entries, while searches keep
+        using the previous centroids until it is done.
+
+        Args:
+            matrix: The matrix returned by `matrix`.
+        """
+        if matrix.ivf is not None:
+            with self._lock:
+                matrix.ivf.maybe_train(matrix)
+
+    def set_matrix(self, matrix: _VectorMatrix) -> None:
+        """Use a prebuilt matrix of the stored vectors.
+
+        Args:
+            matrix: The matrix, holding the vectors of every entry.
+        """
+        with self._lock:
+            self._invalidate()
+            self._matrix = matrix
+            if self.ivf is not None:
+                self.ivf.reset()
+                matrix.ivf = self.ivf
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self._invalidate()
+            if self._matrix is not None:
+                try:
+                    self._matrix.upsert(key, value["vector"])
+                except (KeyError, TypeError, ValueError):
+                    self._matrix = None
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            super().__delitem__(key)
+            self._invalidate()
+            if self._matrix is not None:
+                self._matrix.remove(key)
+
+    def pop(self, key: str, *args: Any) -> Any:
+        """Remove an entry and return it.
+
+        Args:
+            key: The id of the entry.
+            *args: The default to return if the entry does not exist.
+
+        Returns:
+            The removed entry, or the default.
+        """
+        with self._lock:
+            value = super().pop(key, *args)
+            self._invalidate()
+            if self._matrix is not None:
+                self._matrix.remove(key)
+            return value
+
+    def popitem(self) -> tuple[str, dict[str, Any]]:
+        """Remove the last inserted entry and return it with its id.
+
+        Returns:
+            The id and the entry.
+        """
+        with self._lock:
+            key, value = super().popitem()
+            self._invalidate()
+            if self._matrix is not None:
+                self._matrix.remove(key)
+            return key, value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            super().clear()
+            self._invalidate()
+            self._matrix = None
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Add or overwrite entries."""
+        with self._lock:
+            super().update(*args, **kwargs)
+            self._invalidate()
+            self._matrix = None
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Get an entry, inserting the default first if it does not exist.
+
+        Args:
+            key: The id of the entry.
+            default: The entry to insert if it does not exist.
+
+        Returns:
+            The entry.
+        """
+        with self._lock:
+            if key not in self:
+                self[key] = default
+            return self[key]
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (dict(self),), {"ivf": self.ivf})
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _like(value: Any, pattern: str) -> bool:
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern
+    )
+    return isinstance(value, str) and re.fullmatch(regex, value, re.DOTALL) is not None
+
+
+def _contains(value: Any, item: Any) -> bool:
+    if isinstance(value, str):
+        return isinstance(item, str) and item in value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return item in value
+    return False
+
+
+def _compare(op: Callable[[Any, Any], Any], value: Any, other: Any) -> bool:
+    if value is _MISSING:
+        return False
+    try:
+        return bool(op(value, other))
+    except TypeError:
+        return False
+
+
+def _is_in(value: Any, collection: Any) -> bool:
+    try:
+        return value in collection
+    except TypeError:
+        return False
+
+
+_RANGE_OPERATORS: dict[Comparator, Callable[[Any, Any], Any]] = {
+    Comparator.GT: operator.gt,
+    Comparator.GTE: operator.ge,
+    Comparator.LT: operator.lt,
+    Comparator.LTE: operator.le,
+}
+
+
+class _MetadataMaskVisitor(Visitor):
+    """Compiles a filter into a boolean mask over the rows of an `_IndexedStore`.
+
+    Comparisons only match entries whose metadata has the compared attribute.
+    Numeric comparisons run on a float column; other values are compared with
+    the regular Python operators.
+    """
+
+    def __init__(self, store: _IndexedStore) -> None:
+        self.store = store
+
+    def visit_operation(self, operation: Operation) -> np.ndarray:
+        masks = [argument.accept(self) for argument in operation.arguments]
+        if not masks:
+            msg = f"Operation {operation.operator} requires at least one argument."
+            raise ValueError(msg)
+        if operation.operator == Operator.AND:
+            return cast("np.ndarray", np.logical_and.reduce(masks))
+        any_match = cast("np.ndarray", np.logical_or.reduce(masks))
+        if operation.operator == Operator.NOT:
+            return ~any_match
+        return any_match
+
+    def visit_comparison(self, comparison: Comparison) -> np.ndarray:
+        values, present, numbers = self.store.column(comparison.attribute)
+        comparator, value = comparison.comparator, comparison.value
+        matches: np.ndarray
+        if comparator in {Comparator.EQ, Comparator.NE}:
+            if _is_number(value):
+                matches = numbers == value
+            elif isinstance(value, str):
+                matches = (values == value).astype(bool)
+            else:
+                matches = np.array([v == value for v in values.tolist()], dtype=bool)
+            if comparator == Comparator.NE:
+                matches = ~matches
+        elif comparator in _RANGE_OPERATORS:
+            op = _RANGE_OPERATORS[comparator]
+            if _is_number(value):
+                with np.errstate(invalid="ignore"):
+                    matches = op(numbers, value)
+            else:
+                matches = np.array(
+                    [_compare(op, v, value) for v in values.tolist()], dtype=bool
+                )
+        elif comparator in {Comparator.IN, Comparator.NIN}:
+            collection = set(value) if all(map(_is_hashable, value)) else list(value)
+            matches = np.array(
+                [_is_in(v, collection) for v in values.tolist()], dtype=bool
+            )
+            if comparator == Comparator.NIN:
+                matches = ~matches
+        elif comparator == Comparator.CONTAIN:
+            matches = np.array(
+                [_contains(v, value) for v in values.tolist()], dtype=bool
+            )
+        elif comparator == Comparator.LIKE:
+            matches = np.array([_like(v, value) for v in values.tolist()], dtype=bool)
+        else:
+            msg = f"Unsupported comparator {comparator}."
+            raise ValueError(msg)
+        return cast("np.ndarray", present & matches)
+
+    def visit_structured_query(self, structured_query: StructuredQuery) -> np.ndarray:
+        if structured_query.filter is None:
+            matrix = self.store.matrix()
+            return np.ones(len(matrix) if matrix is not None else 0, dtype=bool)
+        return cast("np.ndarray", structured_query.filter.accept(self))
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class InMemoryVectorStore(VectorStore):
     """In-memory vector store implementation.
 
@@ -112,6 +544,18 @@ class InMemoryVectorStore(VectorStore):
         * thud [{'bar': 'baz'}]
         ```
 
+    Search with a metadata filter:
+        ```python
+        from langchain_core.structured_query import Comparator, Comparison
+
+        results = vector_store.similarity_search(
+            query="thud", k=1, filter=Comparison(Comparator.EQ, "bar", "baz")
+        )
+        ```
+
+        Unlike filter functions, `FilterDirective` filters are evaluated on columns
+        of metadata values and cached until the store changes.
+
     Search with score:
         ```python
         results = vector_store.similarity_search_with_score(query="qux", k=1)
@@ -158,17 +602,65 @@ class InMemoryVectorStore(VectorStore):
         ```
     """
 
-    def __init__(self, embedding: Embeddings) -> None:
+    def __init__(
+        self,
+        embedding: Embeddings,
+        *,
+        index: Literal["flat", "ivf"] = "flat",
+        n_lists: int | None = None,
+        n_probe: int = 8,
+    ) -> None:
         """Initialize with the given embedding function.
 
         Args:
             embedding: embedding function to use.
+            index: How to search the stored vectors.
+
+                - `'flat'`: compare the query to every stored vector (exact).
+                - `'ivf'`: cluster the stored vectors into `n_lists` lists and
+                    only compare the query to the vectors of the `n_probe` closest
+                    lists (approximate). Search stays exact until there are enough
+                    vectors to train the clusters.
+            n_lists: The number of IVF lists. Defaults to `sqrt(n)` for `n` stored
+                vectors. More lists make each probe cheaper but less
+                likely to contain the true nearest neighbors.
+            n_probe: The number of IVF lists to search by default. Higher values
+                increase recall and latency.
+
+        Raises:
+            ValueError: If `index` is not a supported index type.
         """
+        if index not in {"flat", "ivf"}:
+            msg = f"index must be 'flat' or 'ivf', got {index!r}"
+            raise ValueError(msg)
+        self._ivf_params = (n_lists, n_probe) if index == "ivf" else None
+        if self._ivf_params is not None:
+            # Validate the parameters early
+            _IVFIndex(*self._ivf_params)
         # TODO: would be nice to change to
         # dict[str, Document] at some point (will be a breaking change)
-        self.store: dict[str, dict[str, Any]] = {}
+        self.store = {}
         self.embedding = embedding
 
+    @property
+    def store(self) -> dict[str, dict[str, Any]]:
+        """The stored entries, keyed by id.
+
+        Entries have the keys `'id'`, `'vector'`, `'text'` and `'metadata'`.
+
+        Assigning a plain `dict` copies its entries into a new mapping that keeps
+        the search index up to date, so later changes to the assigned `dict` do not
+        affect the vector store. Modify `store` itself instead.
+        """
+        return self._store
+
+    @store.setter
+    def store(self, value: dict[str, dict[str, Any]]) -> None:
+        store = value if isinstance(value, _IndexedStore) else _IndexedStore(value)
+        if self._ivf_params is not None and store.ivf is None:
+            store.ivf = _IVFIndex(*self._ivf_params)
+        self._store = store
+
     @property
     @override
     def embeddings(self) -> Embeddings:
@@ -288,54 +780,106 @@ class InMemoryVectorStore(VectorStore):
         """
         return self.get_by_ids(ids)
 
-    def _similarity_search_with_score_by_vector(
+    def _similarity_search_with_score_by_vectors(
         self,
-        embedding: list[float],
+        embeddings: Sequence[list[float]],
         k: int = 4,
-        filter: Callable[[Document], bool] | None = None,  # noqa: A002
-    ) -> list[tuple[Document, float, list[float]]]:
-        # Get all docs with fixed order in list
-        docs = list(self.store.values())
-
-        if filter is not None:
-            docs = [
-                doc
-                for doc in docs
-                if filter(
-                    Document(
-                        id=doc["id"], page_content=doc["text"], metadata=doc["metadata"]
+        filter: Callable[[Document], bool] | FilterDirective | None = None,  # noqa: A002
+        n_probe: int | None = None,
+    ) -> list[list[tuple[Document, float, list[float]]]]:
+        matrix = self._store.matrix()
+        if matrix is None or not embeddings:
+            return [[] for _ in embeddings]
+
+        mask: np.ndarray | None = None
+        if isinstance(filter, FilterDirective):
+            mask = self._store.filter_mask(filter)
+        elif filter is not None:
+            mask = np.fromiter(
+                (
+                    filter(
+                        Document(
+                            id=doc["id"],
+                            page_content=doc["text"],
+                            metadata=doc["metadata"],
+                        )
+                    )
+                    for doc in map(self._store.__getitem__, matrix.ids)
+                ),
+                dtype=bool,
+                count=len(matrix),
+            )
+        if mask is not None:
+            if not mask.any():
+                return [[] for _ in embeddings]
+            k = min(k, int(mask.sum()))
+
+        hits: list[tuple[np.ndarray, np.ndarray]] = []
+        self._store.train_ivf(matrix)
+        if matrix.ivf is not None and matrix.ivf.centroids is not None:
+            for embedding in embeddings:
+                rows = matrix.ivf.candidate_rows(matrix, embedding, n_probe)
+                if rows is not None and mask is not None:
+                    rows = rows[mask[rows]]
+                if rows is not None and len(rows) < k:
+                    # Not enough candidates in the probed lists, search exactly.
+                    rows = None
+                if rows is None:
+                    rows = np.flatnonzero(mask) if mask is not None else None
+                scores = matrix.cosine_similarity([embedding], rows)[0]
+                top_k_idx = _top_k_indices(scores, k)
+                hits.append(
+                    (
+                        rows[top_k_idx] if rows is not None else top_k_idx,
+                        scores[top_k_idx],
                     )
                 )
-            ]
-
-        if not docs:
-            return []
-
-        similarity = cosine_similarity([embedding], [doc["vector"] for doc in docs])[0]
-
-        # Get the indices ordered by similarity score
-        top_k_idx = similarity.argsort()[::-1][:k]
+        else:
+            similarity = matrix.cosine_similarity(embeddings)
+            if mask is not None:
+                similarity[:, ~mask] = -np.inf
+            hits.extend(
+                (top_k_idx, scores[top_k_idx])
+                for scores, top_k_idx in zip(
+                    similarity, _top_k_indices(similarity, k), strict=True
+                )
+            )
 
         return [
-            (
-                Document(
-                    id=doc_dict["id"],
-                    page_content=doc_dict["text"],
-                    metadata=doc_dict["metadata"],
-                ),
-                float(similarity[idx].item()),
-                doc_dict["vector"],
-            )
-            for idx in top_k_idx
-            # Assign using walrus operator to avoid multiple lookups
-            if (doc_dict := docs[idx])
+            [
+                (
+                    Document(
+                        id=doc_dict["id"],
+                        page_content=doc_dict["text"],
+                        metadata=doc_dict["metadata"],
+                    ),
+                    float(score),
+                    doc_dict["vector"],
+                )
+                for idx, score in zip(positions.tolist(), scores.tolist(), strict=True)
+                # Assign using walrus operator to avoid multiple lookups
+                if (doc_dict := self._store[matrix.ids[idx]])
+            ]
+            for positions, scores in hits
         ]
 
+    def _similarity_search_with_score_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        filter: Callable[[Document], bool] | FilterDirective | None = None,  # noqa: A002
+        n_probe: int | None = None,
+    ) -> list[tuple[Document, float, list[float]]]:
+        return self._similarity_search_with_score_by_vectors(
+            [embedding], k=k, filter=filter, n_probe=n_probe
+        )[0]
+
     def similarity_search_with_score_by_vector(
         self,
         embedding: list[float],
         k: int = 4,
-        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        filter: Callable[[Document], bool] | FilterDirective | None = None,  # noqa: A002
+        n_probe: int | None = None,
         **_kwargs: Any,
     ) -> list[tuple[Document, float]]:
         """Search for the most similar documents to the given embedding.
@@ -343,7 +887,10 @@ class InMemoryVectorStore(VectorStore):
         Args:
             embedding: The embedding to search for.
             k: The number of documents to return.
-            filter: A function to filter the documents.
+            filter: A function to filter the documents, or a `FilterDirective`
+                over their metadata.
+            n_probe: The number of IVF lists to search, when the store was created
+                with `index="ivf"`. Defaults to the `n_probe` of the store.
 
         Returns:
             A list of tuples of `Document` objects and their similarity scores.
@@ -351,7 +898,39 @@ class InMemoryVectorStore(VectorStore):
         return [
             (doc, similarity)
             for doc, similarity, _ in self._similarity_search_with_score_by_vector(
-                embedding=embedding, k=k, filter=filter
+                embedding=embedding, k=k, filter=filter, n_probe=n_probe
+            )
+        ]
+
+    def similarity_search_with_score_by_vectors(
+        self,
+        embeddings: Sequence[list[float]],
+        k: int = 4,
+        filter: Callable[[Document], bool] | FilterDirective | None = None,  # noqa: A002
+        n_probe: int | None = None,
+        **_kwargs: Any,
+    ) -> list[list[tuple[Document, float]]]:
+        """Search for the most similar documents to each of the given embeddings.
+
+        All embeddings are scored against the stored vectors in a single matrix
+        product, which is faster than searching for them one by one.
+
+        Args:
+            embeddings: The embeddings to search for.
+            k: The number of documents to return per embedding.
+            filter: A function to filter the documents, or a `FilterDirective`
+                over their metadata.
+            n_probe: The number of IVF lists to search, when the store was created
+                with `index="ivf"`. Defaults to the `n_probe` of the store.
+
+        Returns:
+            For each embedding, a list of tuples of `Document` objects and their
+                similarity scores.
+        """
+        return [
+            [(doc, similarity) for doc, similarity, _ in hits]
+            for hits in self._similarity_search_with_score_by_vectors(
+                embeddings, k=k, filter=filter, n_probe=n_probe
             )
         ]
 
@@ -423,13 +1002,15 @@ class InMemoryVectorStore(VectorStore):
         fetch_k: int = 20,
         lambda_mult: float = 0.5,
         *,
-        filter: Callable[[Document], bool] | None = None,
+        filter: Callable[[Document], bool] | FilterDirective | None = None,
+        n_probe: int | None = None,
         **kwargs: Any,
     ) -> list[Document]:
         prefetch_hits = self._similarity_search_with_score_by_vector(
             embedding=embedding,
             k=fetch_k,
             filter=filter,
+            n_probe=n_probe,
         )
 
         if not _HAS_NUMPY:
@@ -515,32 +1096,143 @@ class InMemoryVectorStore(VectorStore):
 
     @classmethod
     def load(
-        cls, path: str, embedding: Embeddings, **kwargs: Any
+        cls, path: str, embedding: Embeddings, *, mmap: bool = True, **kwargs: Any
     ) -> InMemoryVectorStore:
         """Load a vector store from a file.
 
+        Both the JSON file and the binary directory written by `dump` can be
+        loaded; the format is detected from the path.
+
         Args:
             path: The path to load the vector store from.
             embedding: The embedding to use.
+            mmap: Whether to memory-map the vectors of a binary dump instead of
+                reading them into memory. The vectors are copied the first time
+                the store is modified.
+
+                The vectors of entries loaded from a binary dump are read-only
+                `numpy` arrays rather than lists of floats, whether or not they are
+                memory-mapped.
             **kwargs: Additional arguments to pass to the constructor.
 
         Returns:
             A `VectorStore` object.
         """
         path_: Path = Path(path)
+        vectorstore = cls(embedding=embedding, **kwargs)
+        if path_.is_dir():
+            vectorstore._load_binary(path_, mmap=mmap)
+            return vectorstore
         with path_.open("r", encoding="utf-8") as f:
             store = load(json.load(f), allowed_objects=[Document])
-        vectorstore = cls(embedding=embedding, **kwargs)
         vectorstore.store = store
         return vectorstore
 
-    def dump(self, path: str) -> None:
+    def _load_binary(self, path: Path, *, mmap: bool) -> None:
+        if not _HAS_NUMPY:
+            msg = (
+                "Loading a binary InMemoryVectorStore dump requires numpy to be "
+                "installed. Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
+        while True:
+            manifest = json.loads((path / _MANIFEST_FILE).read_text(encoding="utf-8"))
+            if manifest.get("version") != _BINARY_FORMAT_VERSION:
+                msg = f"Unsupported InMemoryVectorStore dump version in {path}."
+                raise ValueError(msg)
+            try:
+                ids, vectors, store = _read_binary_dump(path, manifest, mmap=mmap)
+            except FileNotFoundError:
+                # A concurrent dump removed the files after writing a new manifest.
+                current = json.loads(
+                    (path / _MANIFEST_FILE).read_text(encoding="utf-8")
+                )
+                if current.get("generation") == manifest["generation"]:
+                    raise
+                continue
+            break
+        self.store = store
+        if ids:
+            self._store.set_matrix(_VectorMatrix.from_vectors(ids, vectors))
+
+    def dump(self, path: str, *, binary: bool = False) -> None:
         """Dump the vector store to a file.
 
         Args:
             path: The path to dump the vector store to.
+            binary: Whether to write a binary dump instead of a JSON file.
+
+                A binary dump is a directory holding the vectors as a `float32`
+                `.npy` array, the ids in the same order as a JSON list, and the
+                texts and metadata as JSON lines. It is much smaller and faster to
+                load than JSON, and its vectors can be memory-mapped by `load`.
+                Dumping over an existing binary dump replaces all of its files at
+                once, when its manifest is written.
         """
         path_: Path = Path(path)
+        if binary:
+            self._dump_binary(path_)
+            return
         path_.parent.mkdir(exist_ok=True, parents=True)
+        store = {
+            id_: (
+                {**entry, "vector": entry["vector"].tolist()}
+                if _HAS_NUMPY and isinstance(entry["vector"], np.ndarray)
+                else entry
+            )
+            for id_, entry in self.store.items()
+        }
         with path_.open("w", encoding="utf-8") as f:
-            json.dump(dumpd(self.store), f, indent=2)
+            json.dump(dumpd(store), f, indent=2)
+
+    def _dump_binary(self, path: Path) -> None:
+        matrix = self._store.matrix()
+        path.mkdir(exist_ok=True, parents=True)
+        ids = matrix.ids if matrix is not None else []
+        vectors = matrix.vectors if matrix is not None else np.empty((0, 0), np.float32)
+
+        def write_documents(f: IO[str]) -> None:
+            for id_ in ids:
+                entry = self.store[id_]
+                record = {"text": entry["text"], "metadata": entry["metadata"]}
+                try:
+                    line = json.dumps(record)
+                except TypeError:
+                    line = json.dumps(dumpd(record))
+                else:
+                    if '"lc"' in line:
+                        line = json.dumps(dumpd(record))
+                f.write(line)
+                f.write("\n")
+
+        # The data files are written under new names and only then referenced by
+        # the manifest, so that a crash or a concurrent `load` never mixes files of
+        # two dumps. The files of the previous dump are removed afterwards; their
+        # vectors may still be memory-mapped, which keeps their contents readable.
+        generation = uuid.uuid4().hex
+        _replace_file(
+            path / _VECTORS_FILE.format(generation),
+            lambda f: np.save(f, vectors, allow_pickle=False),
+            binary=True,
+        )
+        _replace_file(path / _DOCUMENTS_FILE.format(generation), write_documents)
+        _replace_file(
+            path / _IDS_FILE.format(generation), lambda f: f.write(json.dumps(ids))
+        )
+        manifest = {
+            "version": _BINARY_FORMAT_VERSION,
+            "generation": generation,
+            "count": len(ids),
+            "dim": vectors.shape[1],
+        }
+        _replace_file(path / _MANIFEST_FILE, lambda f: f.write(json.dumps(manifest)))
+        current = {
+            name.format(generation)
+            for name in (_IDS_FILE, _VECTORS_FILE, _DOCUMENTS_FILE)
+        }
+        for name in (_IDS_FILE, _VECTORS_FILE, _DOCUMENTS_FILE):
+            for old in path.glob(name.format("*")):
+                if old.name not in current:
+                    # Files that are still mapped can't be removed on Windows.
+                    with contextlib.suppress(OSError):
+                        old.unlink()
@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import logging
+import math
 import warnings
 from typing import TYPE_CHECKING, cast
 
@@ -27,6 +28,8 @@ except ImportError:
     _HAS_SIMSIMD = False
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     Matrix = list[list[float]] | list[np.ndarray] | np.ndarray
 
 logger = logging.getLogger(__name__)
@@ -155,3 +158,407 @@ def maximal_marginal_relevance(
         idxs.append(idx_to_add)
         selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
     return idxs
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the `k` largest scores along the last axis, in descending order.
+
+    Uses a partial selection (`argpartition`) so only the selected `k` scores are
+    sorted.
+
+    Args:
+        scores: An array of shape `(n,)` or `(q, n)`.
+        k: The number of indices to select.
+
+    Returns:
+        An array of shape `(min(k, n),)` or `(q, min(k, n))`.
+    """
+    n = scores.shape[-1]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty((*scores.shape[:-1], 0), dtype=np.intp)
+    if k < n:
+        top = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        top = np.broadcast_to(np.arange(n), scores.shape).copy()
+    order = np.argsort(
+        -np.take_along_axis(scores, top, axis=-1), axis=-1, kind="stable"
+    )
+    return np.take_along_axis(top, order, axis=-1)
+
+
+class _VectorMatrix:
+    """Contiguous `float32` matrix of vectors keyed by id, with precomputed norms.
+
+    Rows are stored in a buffer that grows geometrically, so appending is amortized
+    `O(d)`. Removing a row moves the last row into its slot.
+    """
+
+    def __init__(self, dim: int, capacity: int = 0) -> None:
+        """Create an empty matrix.
+
+        Args:
+            dim: The dimension of the vectors.
+            capacity: The initial number of rows to allocate.
+        """
+        self.dim = dim
+        self.ids: list[str] = []
+        self.positions: dict[str, int] = {}
+        self.ivf: _IVFIndex | None = None
+        self._vectors = np.empty((capacity, dim), dtype=np.float32)
+        self._norms = np.empty(capacity, dtype=np.float32)
+
+    @classmethod
+    def from_vectors(
+        cls, ids: Sequence[str], vectors: Sequence[Sequence[float]] | np.ndarray
+    ) -> _VectorMatrix:
+        """Build a matrix from ids and vectors.
+
+        Args:
+            ids: The ids of the vectors.
+            vectors: The vectors, all of the same dimension.
+
+        Returns:
+            The matrix.
+        """
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.ndim != 2:  # noqa: PLR2004
+            array = array.reshape(len(ids), -1)
+        matrix = cls(array.shape[1])
+        matrix.ids = list(ids)
+        matrix.positions = {id_: i for i, id_ in enumerate(matrix.ids)}
+        # A read-only array (e.g. memory-mapped) is kept as is until written to
+        matrix._vectors = (
+            array if array.flags.c_contiguous else np.ascontiguousarray(array)
+        )
+        matrix._norms = np.linalg.norm(array, axis=1).astype(np.float32)
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """View of the stored vectors, of shape `(n, dim)`."""
+        return self._vectors[: len(self.ids)]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """View of the norms of the stored vectors, of shape `(n,)`."""
+        return self._norms[: len(self.ids)]
+
+    def upsert(self, id_: str, vector: Sequence[float]) -> None:
+        """Insert or overwrite the vector stored under an id.
+
+        Args:
+            id_: The id of the vector.
+            vector: The vector.
+
+        Raises:
+            ValueError: If the vector does not have the dimension of the matrix.
+        """
+        row = np.asarray(vector, dtype=np.float32)
+        if row.shape != (self.dim,):
+            msg = f"Expected a vector of dimension {self.dim}, got shape {row.shape}."
+            raise ValueError(msg)
+        if not self._vectors.flags.writeable:
+            self._grow(self._vectors.shape[0])
+        position = self.positions.get(id_)
+        if position is None:
+            position = len(self.ids)
+            if position == self._vectors.shape[0]:
+                self._grow(max(8, 2 * position))
+            self.ids.append(id_)
+            self.positions[id_] = position
+        self._vectors[position] = row
+        self._norms[position] = np.linalg.norm(row)
+        if self.ivf is not None:
+            self.ivf.assign_row(self, position)
+
+    def remove(self, id_: str) -> None:
+        """Remove the vector stored under an id, if any.
+
+        Args:
+            id_: The id of the vector.
+        """
+        position = self.positions.pop(id_, None)
+        if position is None:
+            return
+        last = len(self.ids) - 1
+        last_id = self.ids.pop()
+        if position != last and not self._vectors.flags.writeable:
+            self._grow(self._vectors.shape[0])
+        if position != last:
+            self.ids[position] = last_id
+            self.positions[last_id] = position
+            self._vectors[position] = self._vectors[last]
+            self._norms[position] = self._norms[last]
+            if self.ivf is not None:
+                self.ivf.move_row(last, position)
+
+    def _grow(self, capacity: int) -> None:
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        norms = np.empty(capacity, dtype=np.float32)
+        n = len(self.ids)
+        vectors[:n] = self._vectors[:n]
+        norms[:n] = self._norms[:n]
+        self._vectors = vectors
+        self._norms = norms
+
+    def cosine_similarity(
+        self,
+        queries: Sequence[Sequence[float]] | np.ndarray,
+        rows: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Cosine similarity between query vectors and the stored vectors.
+
+        Zero vectors have a similarity of `0` to every other vector.
+
+        Args:
+            queries: A matrix of shape `(q, dim)`.
+            rows: The positions of the stored vectors to compare to. Defaults to
+                all of them.
+
+        Returns:
+            A matrix of shape `(q, n)`, or `(q, len(rows))` if rows are given.
+
+        Raises:
+            ValueError: If the queries do not have the dimension of the matrix, or
+                if they are made of NaN values only.
+        """
+        x = np.asarray(queries, dtype=np.float32)
+        if x.ndim != 2 or x.shape[1] != self.dim:  # noqa: PLR2004
+            msg = (
+                f"Number of columns in X and Y must be the same. X has shape {x.shape} "
+                f"and Y has shape {self.vectors.shape}."
+            )
+            raise ValueError(msg)
+        vectors, norms = self.vectors, self.norms
+        if rows is not None:
+            vectors, norms = vectors[rows], norms[rows]
+        x_norm = np.linalg.norm(x, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity = (x @ vectors.T) / np.outer(x_norm, norms)
+        invalid = ~np.isfinite(similarity)
+        if invalid.any():
+            if np.isnan(x).all():
+                msg = "NaN values found, please remove the NaN values and try again"
+                raise ValueError(msg)
+            similarity[invalid] = 0.0
+        # float32 rounding can push the similarity of parallel vectors past 1.
+        np.clip(similarity, -1.0, 1.0, out=similarity)
+        return cast("np.ndarray", similarity)
+
+
+# Lists with fewer training points than this give poor centroids.
+_IVF_MIN_POINTS_PER_LIST = 39
+# Cap on the number of rows k-means is trained on.
+_IVF_MAX_POINTS_PER_LIST = 64
+_IVF_ASSIGN_CHUNK_SIZE = 65536
+
+
+def _normalize(vectors: np.ndarray, norms: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = vectors / norms[:, None]
+    normalized[~np.isfinite(normalized)] = 0.0
+    return cast("np.ndarray", normalized)
+
+
+def _kmeans_plus_plus(
+    points: np.ndarray, n_clusters: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Pick initial centroids among unit vectors with k-means++ seeding."""
+    centroids = np.empty((n_clusters, points.shape[1]), dtype=points.dtype)
+    centroids[0] = points[rng.integers(len(points))]
+    distances = 1.0 - points @ centroids[0]
+    for i in range(1, n_clusters):
+        weights = np.maximum(distances, 0.0).astype(np.float64) ** 2
+        total = weights.sum()
+        index = (
+            rng.choice(len(points), p=weights / total)
+            if total > 0
+            else rng.integers(len(points))
+        )
+        centroids[i] = points[index]
+        np.minimum(distances, 1.0 - points @ centroids[i], out=distances)
+    return centroids
+
+
+def _nearest_lists(
+    centroids: np.ndarray, vectors: np.ndarray, norms: np.ndarray
+) -> np.ndarray:
+    """Return the index of the closest centroid to each vector."""
+    return cast(
+        "np.ndarray", np.argmax(_normalize(vectors, norms) @ centroids.T, axis=1)
+    )
+
+
+class _IVFIndex:
+    """Inverted-file (IVF-flat) approximate index over a `_VectorMatrix`.
+
+    Stored vectors are clustered with spherical k-means into `n_lists` lists. A
+    query is only compared to the vectors of the `n_probe` lists whose centroids
+    are the most similar to it, trading recall for speed.
+
+    Until the matrix holds enough vectors to train the centroids, and whenever
+    `n_probe` covers every list, search is exact. Vectors added after training are
+    assigned to their closest list, and the centroids are retrained once the
+    matrix has doubled in size since the last training.
+    """
+
+    def __init__(
+        self,
+        n_lists: int | None = None,
+        n_probe: int = 8,
+        *,
+        n_iter: int = 10,
+        seed: int = 0,
+    ) -> None:
+        """Create an untrained index.
+
+        Args:
+            n_lists: The number of lists. Defaults to `sqrt(n)` for a matrix of `n`
+                vectors, computed when the index is trained.
+            n_probe: The default number of lists to search.
+            n_iter: The number of k-means iterations.
+            seed: The seed of the k-means initialization and sampling.
+
+        Raises:
+            ValueError: If `n_lists` or `n_probe` is not positive.
+        """
+        if n_lists is not None and n_lists <= 0:
+            msg = f"n_lists must be greater than 0, got {n_lists}"
+            raise ValueError(msg)
+        if n_probe <= 0:
+            msg = f"n_probe must be greater than 0, got {n_probe}"
+            raise ValueError(msg)
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.seed = seed
+        # The centroids and the list of each row of the matrix, replaced together
+        # so that a concurrent search never sees one without the other.
+        self._lists: tuple[np.ndarray, np.ndarray] | None = None
+        self._trained_size = 0
+
+    @property
+    def centroids(self) -> np.ndarray | None:
+        """The centroids of the lists, or `None` if the index is not trained."""
+        return self._lists[0] if self._lists is not None else None
+
+    def reset(self) -> None:
+        """Forget the centroids, e.g. after the matrix was rebuilt."""
+        self._lists = None
+        self._trained_size = 0
+
+    def _target_lists(self, size: int) -> int:
+        if self.n_lists is not None:
+            return self.n_lists
+        return max(1, int(math.sqrt(size)))
+
+    def maybe_train(self, matrix: _VectorMatrix) -> None:
+        """Train the centroids if there are enough new vectors since last time.
+
+        Must not run concurrently with changes to the matrix. Searches may run
+        concurrently: they keep using the previous centroids until training is done.
+
+        Args:
+            matrix: The matrix the index belongs to.
+        """
+        size = len(matrix)
+        if self.centroids is not None and size < 2 * self._trained_size:
+            return
+        n_lists = self._target_lists(size)
+        if n_lists < 2 or size < _IVF_MIN_POINTS_PER_LIST * n_lists:  # noqa: PLR2004
+            return
+        rng = np.random.default_rng(self.seed)
+        vectors, norms = matrix.vectors, matrix.norms
+        sample = min(size, _IVF_MAX_POINTS_PER_LIST * n_lists)
+        rows = rng.choice(size, sample, replace=False) if sample < size else None
+        points = _normalize(
+            vectors[rows] if rows is not None else vectors,
+            norms[rows] if rows is not None else norms,
+        )
+        centroids = _kmeans_plus_plus(points, n_lists, rng)
+        for _ in range(self.n_iter):
+            assignments = np.argmax(points @ centroids.T, axis=1)
+            order = np.argsort(assignments, kind="stable")
+            counts = np.bincount(assignments, minlength=n_lists)
+            starts = np.cumsum(counts) - counts
+            sums = np.zeros_like(centroids)
+            filled = counts > 0
+            sums[filled] = np.add.reduceat(points[order], starts[filled], axis=0)
+            # Restart empty lists from random points
+            empty = np.flatnonzero(counts == 0)
+            sums[empty] = points[rng.choice(len(points), len(empty), replace=False)]
+            centroids = _normalize(sums, np.linalg.norm(sums, axis=1))
+        centroids = centroids.astype(np.float32)
+        # Zeros rather than `np.empty`: rows set after training are only assigned
+        # once written, and a concurrent search must not read garbage list numbers.
+        assignments = np.zeros(matrix._vectors.shape[0], dtype=np.int32)  # noqa: SLF001
+        for start in range(0, size, _IVF_ASSIGN_CHUNK_SIZE):
+            stop = min(start + _IVF_ASSIGN_CHUNK_SIZE, size)
+            assignments[start:stop] = _nearest_lists(
+                centroids, vectors[start:stop], norms[start:stop]
+            )
+        self._lists = (centroids, assignments)
+        self._trained_size = size
+
+    def assign_row(self, matrix: _VectorMatrix, position: int) -> None:
+        """Assign a newly set row of the matrix to its closest list.
+
+        Args:
+            matrix: The matrix the index belongs to.
+            position: The position of the row.
+        """
+        if self._lists is None:
+            return
+        centroids, assignments = self._lists
+        if position >= len(assignments):
+            grown = np.zeros(matrix._vectors.shape[0], dtype=np.int32)  # noqa: SLF001
+            grown[: len(assignments)] = assignments
+            assignments = grown
+            self._lists = (centroids, assignments)
+        assignments[position] = _nearest_lists(
+            centroids,
+            matrix._vectors[position : position + 1],  # noqa: SLF001
+            matrix._norms[position : position + 1],  # noqa: SLF001
+        )[0]
+
+    def move_row(self, source: int, destination: int) -> None:
+        """Mirror a row moved by `_VectorMatrix.remove`.
+
+        Args:
+            source: The previous position of the row.
+            destination: The new position of the row.
+        """
+        if self._lists is not None:
+            assignments = self._lists[1]
+            assignments[destination] = assignments[source]
+
+    def candidate_rows(
+        self,
+        matrix: _VectorMatrix,
+        query: Sequence[float] | np.ndarray,
+        n_probe: int | None = None,
+    ) -> np.ndarray | None:
+        """Get the rows of the lists closest to a query.
+
+        Args:
+            matrix: The matrix the index belongs to.
+            query: The query vector, of shape `(dim,)`.
+            n_probe: The number of lists to search. Defaults to `self.n_probe`.
+
+        Returns:
+            The positions of the candidate rows, or `None` if all rows should be
+                searched.
+        """
+        n_probe = n_probe or self.n_probe
+        lists = self._lists
+        if lists is None or n_probe >= len(lists[0]):
+            return None
+        centroids, assignments = lists
+        scores = np.asarray(query, dtype=np.float32) @ centroids.T
+        probed = np.zeros(len(centroids), dtype=bool)
+        probed[_top_k_indices(scores, n_probe)] = True
+        return np.flatnonzero(probed[assignments[: len(matrix)]])
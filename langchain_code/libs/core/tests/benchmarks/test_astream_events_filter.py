@@ -0,0 +1,41 @@
+import asyncio
+from itertools import cycle
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+
+N_TOKENS = 200
+N_STEPS = 20
+
+
+def _chain() -> Runnable[Any, Any]:
+    model = GenericFakeChatModel(
+        messages=cycle([AIMessage(content=" ".join(["token"] * N_TOKENS))])
+    )
+    chain: Runnable[Any, Any] = model
+    for i in range(N_STEPS):
+        chain = chain | RunnableLambda(lambda x: x, name=f"step_{i}")
+    return chain
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "filters", [{}, {"include_types": ["chat_model"]}, {"include_names": ["step_0"]}]
+)
+def test_astream_events_filtered(
+    benchmark: BenchmarkFixture, filters: dict[str, Any]
+) -> None:
+    chain = _chain()
+
+    async def consume() -> None:
+        async for _ in chain.astream_events("hello", version="v2", **filters):
+            pass
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def stream() -> None:
+        asyncio.run(consume())
@@ -0,0 +1,61 @@
+import copy
+import time
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
+
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tracers._compat import run_copy
+from langchain_core.tracers.base import BaseTracer
+from langchain_core.tracers.batched import BatchedTracer, RunEvent
+from langchain_core.tracers.schemas import Run
+
+N_INVOKES = 100
+INPUT = {"question": "why?", "history": [{"role": "user", "content": "hi"}] * 50}
+# Simulated cost of one call to a tracing backend.
+EXPORT_LATENCY = 0.000_1
+
+
+class ExportingTracer(BaseTracer):
+    """Copies and exports every run on the calling thread."""
+
+    def _persist_run(self, run: Run) -> None:
+        pass
+
+    def _on_run_create(self, run: Run) -> None:
+        run_copy(run, update={"inputs": copy.deepcopy(run.inputs)})
+        time.sleep(EXPORT_LATENCY)
+
+    def _on_run_update(self, run: Run) -> None:
+        run_copy(run, update={"outputs": copy.deepcopy(run.outputs)})
+        time.sleep(EXPORT_LATENCY)
+
+
+class ExportingBatchedTracer(BatchedTracer):
+    @override
+    def _persist_batch(self, events: list[RunEvent]) -> None:
+        time.sleep(EXPORT_LATENCY)
+
+
+def _chain() -> RunnableLambda[Any, Any]:
+    step: RunnableLambda[Any, Any] = RunnableLambda(lambda x: x, name="step")
+    return RunnableLambda(step.invoke, name="chain")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("tracer_cls", [ExportingTracer, ExportingBatchedTracer])
+def test_traced_invoke(
+    benchmark: BenchmarkFixture, tracer_cls: type[BaseTracer]
+) -> None:
+    chain = _chain()
+    tracer = tracer_cls()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def invoke() -> None:
+        for _ in range(N_INVOKES):
+            chain.invoke(INPUT, {"callbacks": [tracer]})
+
+    if isinstance(tracer, BatchedTracer):
+        tracer.close()
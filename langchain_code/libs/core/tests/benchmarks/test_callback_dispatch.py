@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
+
+from langchain_core.callbacks import AsyncCallbackHandler, BaseCallbackHandler
+from langchain_core.callbacks.manager import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.runnables import RunnableLambda
+
+N_TOKENS = 1_000
+N_INVOKES = 200
+
+
+class TokenCounter(BaseCallbackHandler):
+    run_inline = True
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    @override
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.count += 1
+
+
+class AsyncEndOnly(AsyncCallbackHandler):
+    @override
+    async def on_llm_end(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def _handlers() -> list[BaseCallbackHandler]:
+    return [BaseCallbackHandler(), AsyncEndOnly(), TokenCounter()]
+
+
+@pytest.mark.benchmark
+def test_stream_token_dispatch(benchmark: BenchmarkFixture) -> None:
+    run_manager = CallbackManagerForLLMRun(
+        run_id=uuid4(), handlers=_handlers(), inheritable_handlers=[]
+    )
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def dispatch() -> None:
+        for _ in range(N_TOKENS):
+            run_manager.on_llm_new_token("token")
+
+
+@pytest.mark.benchmark
+def test_async_stream_token_dispatch(benchmark: BenchmarkFixture) -> None:
+    run_manager = AsyncCallbackManagerForLLMRun(
+        run_id=uuid4(), handlers=_handlers(), inheritable_handlers=[]
+    )
+
+    async def dispatch_tokens() -> None:
+        for _ in range(N_TOKENS):
+            await run_manager.on_llm_new_token("token")
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def dispatch() -> None:
+        asyncio.run(dispatch_tokens())
+
+
+@pytest.mark.benchmark
+def test_invoke_callback_overhead(benchmark: BenchmarkFixture) -> None:
+    runnable = RunnableLambda(lambda x: x)
+    config = {"callbacks": _handlers()}
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def invoke() -> None:
+        for i in range(N_INVOKES):
+            runnable.invoke(i, config)  # type: ignore[arg-type]
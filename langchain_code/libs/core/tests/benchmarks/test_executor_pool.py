@@ -0,0 +1,45 @@
+from collections.abc import Iterator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.runnables import RunnableLambda, RunnableParallel
+from langchain_core.runnables.config import (
+    ExecutorPool,
+    get_executor_pool,
+    set_executor_pool,
+)
+
+
+@pytest.fixture(params=["per_call", "shared"])
+def executor_pool(request: pytest.FixtureRequest) -> Iterator[None]:
+    previous = get_executor_pool()
+    pool = ExecutorPool() if request.param == "shared" else None
+    set_executor_pool(pool)
+    yield
+    set_executor_pool(previous)
+    if pool is not None:
+        pool.shutdown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("executor_pool")
+def test_batch(benchmark: BenchmarkFixture) -> None:
+    runnable = RunnableLambda(lambda x: x + 1)
+    inputs = list(range(8))
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def batch() -> None:
+        for _ in range(50):
+            runnable.batch(inputs, {"max_concurrency": 4})
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("executor_pool")
+def test_parallel_invoke(benchmark: BenchmarkFixture) -> None:
+    runnable = RunnableParallel(a=lambda x: x + 1, b=lambda x: x * 2, c=lambda x: x - 1)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def parallel_invoke() -> None:
+        for i in range(50):
+            runnable.invoke(i)
@@ -0,0 +1,70 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.embeddings.fake import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+np = pytest.importorskip("numpy")
+
+N_VECTORS = 50_000
+DIM = 64
+K = 10
+
+
+@pytest.fixture(scope="module")
+def dataset() -> tuple[list[list[float]], list[list[float]]]:
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(200, DIM))
+    vectors = centers[rng.integers(0, 200, N_VECTORS)] + 0.6 * rng.normal(
+        size=(N_VECTORS, DIM)
+    )
+    queries = centers[rng.integers(0, 200, 100)] + 0.6 * rng.normal(size=(100, DIM))
+    return vectors.tolist(), queries.tolist()
+
+
+def _build_store(vectors: list[list[float]], **kwargs: object) -> InMemoryVectorStore:
+    store = InMemoryVectorStore(DeterministicFakeEmbedding(size=DIM), **kwargs)  # type: ignore[arg-type]
+    store.store = {
+        str(i): {"id": str(i), "vector": vector, "text": "", "metadata": {}}
+        for i, vector in enumerate(vectors)
+    }
+    # Build the vector matrix and train the index outside of the timed section
+    store.similarity_search_by_vector(vectors[0], k=K)
+    return store
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n_probe", [None, 1, 4, 16])
+def test_similarity_search_recall_vs_qps(
+    benchmark: BenchmarkFixture,
+    dataset: tuple[list[list[float]], list[list[float]]],
+    n_probe: int | None,
+) -> None:
+    vectors, queries = dataset
+    exact = _build_store(vectors)
+    store = exact if n_probe is None else _build_store(vectors, index="ivf")
+
+    def search() -> list[list[str | None]]:
+        return [
+            [
+                doc.id
+                for doc in store.similarity_search_by_vector(q, k=K, n_probe=n_probe)
+            ]
+            for q in queries
+        ]
+
+    results = benchmark(search)
+
+    truth = [
+        {doc.id for doc in exact.similarity_search_by_vector(q, k=K)} for q in queries
+    ]
+    recall = float(
+        np.mean(
+            [
+                len(truth_ids & set(ids)) / K
+                for truth_ids, ids in zip(truth, results, strict=True)
+            ]
+        )
+    )
+    benchmark.extra_info["recall@10"] = recall
+    benchmark.extra_info["queries"] = len(queries)
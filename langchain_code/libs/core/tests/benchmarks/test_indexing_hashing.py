@@ -0,0 +1,92 @@
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.indexing import InMemoryRecordManager, index
+from langchain_core.indexing.api import _get_document_with_hash, _hash_batch
+from langchain_core.vectorstores import InMemoryVectorStore
+
+N_DOCUMENTS = 10_000
+BATCH_SIZE = 1_000
+
+
+@pytest.fixture(scope="module")
+def documents() -> list[Document]:
+    return [
+        Document(
+            page_content=f"chunk {i} " + "lorem ipsum dolor sit amet " * 40,
+            metadata={"source": f"file{i // 20}.pdf", "page": i % 20},
+        )
+        for i in range(N_DOCUMENTS)
+    ]
+
+
+@pytest.fixture(params=["serial", "threads", "processes"])
+def hash_executor(request: pytest.FixtureRequest) -> Iterator[Executor | None]:
+    if request.param == "serial":
+        yield None
+        return
+    executor_cls = (
+        ThreadPoolExecutor if request.param == "threads" else ProcessPoolExecutor
+    )
+    with executor_cls(max_workers=4) as executor:
+        yield executor
+
+
+@pytest.mark.benchmark
+@pytest.mark.filterwarnings("ignore:Using SHA-1")
+@pytest.mark.parametrize("key_encoder", ["sha1", "blake2b"])
+def test_hash_documents_one_by_one(
+    benchmark: BenchmarkFixture,
+    documents: list[Document],
+    key_encoder: Literal["sha1", "blake2b"],
+) -> None:
+    @benchmark  # type: ignore[untyped-decorator]
+    def hash_documents() -> None:
+        for document in documents:
+            _get_document_with_hash(document, key_encoder=key_encoder)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("key_encoder", ["sha1", "blake2b"])
+def test_hash_documents_batched(
+    benchmark: BenchmarkFixture,
+    documents: list[Document],
+    key_encoder: Literal["sha1", "blake2b"],
+    hash_executor: Executor | None,
+) -> None:
+    @benchmark  # type: ignore[untyped-decorator]
+    def hash_documents() -> None:
+        for start in range(0, len(documents), BATCH_SIZE):
+            _hash_batch(
+                documents[start : start + BATCH_SIZE],
+                key_encoder=key_encoder,
+                executor=hash_executor,
+            )
+
+
+@pytest.mark.benchmark
+def test_noop_reindex(
+    benchmark: BenchmarkFixture,
+    documents: list[Document],
+    hash_executor: Executor | None,
+) -> None:
+    record_manager = InMemoryRecordManager(namespace="benchmark")
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+    index(documents, record_manager, vector_store, key_encoder="blake2b")
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def reindex() -> None:
+        index(
+            documents,
+            record_manager,
+            vector_store,
+            batch_size=BATCH_SIZE,
+            key_encoder="blake2b",
+            hash_executor=hash_executor,
+        )
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.output_parsers.openai_tools import JsonOutputToolsParser
+
+DOCUMENT = json.dumps(
+    {
+        "items": [
+            {"id": i, "name": f"item {i}", "tags": ["a", "b"], "score": i / 7}
+            for i in range(100)
+        ]
+    }
+)
+CHUNKS = [DOCUMENT[i : i + 8] for i in range(0, len(DOCUMENT), 8)]
+
+
+@pytest.mark.benchmark
+def test_json_output_parser_stream(benchmark: BenchmarkFixture) -> None:
+    parser = JsonOutputParser()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def stream() -> None:
+        for _ in parser.transform(iter(CHUNKS)):
+            pass
+
+
+@pytest.mark.benchmark
+def test_json_output_tools_parser_stream(benchmark: BenchmarkFixture) -> None:
+    parser = JsonOutputToolsParser()
+    messages = [
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                tool_call_chunk(
+                    name="extract" if i == 0 else None,
+                    args=chunk,
+                    id="call_1" if i == 0 else None,
+                    index=0,
+                )
+            ],
+        )
+        for i, chunk in enumerate(CHUNKS)
+    ]
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def stream() -> None:
+        for _ in parser.transform(iter(messages)):
+            pass
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages.ai import AIMessageChunkAccumulator
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
+
+N_CHUNKS = 10_000
+
+
+def _text_stream() -> list[AIMessageChunk]:
+    return [AIMessageChunk(content=f"token{i} ") for i in range(N_CHUNKS)]
+
+
+def _tool_call_stream() -> list[AIMessageChunk]:
+    args = json.dumps({"query": "lorem ipsum " * N_CHUNKS})
+    step = len(args) // N_CHUNKS + 1
+    return [
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                tool_call_chunk(
+                    name="search" if i == 0 else None,
+                    args=args[i : i + step],
+                    id="call_1" if i == 0 else None,
+                    index=0,
+                )
+            ],
+        )
+        for i in range(0, len(args), step)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("stream", ["text", "tool_calls"])
+def test_accumulate_stream(benchmark: BenchmarkFixture, stream: str) -> None:
+    chunks = _text_stream() if stream == "text" else _tool_call_stream()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def accumulate() -> None:
+        accumulator = AIMessageChunkAccumulator()
+        for chunk in chunks:
+            accumulator.append(chunk)
+        accumulator.to_message()
+
+
+@pytest.mark.benchmark
+def test_passthrough_transform_stream(benchmark: BenchmarkFixture) -> None:
+    chunks = _tool_call_stream()
+    chain = RunnablePassthrough() | RunnableLambda(lambda message: message)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def transform() -> None:
+        for _ in chain.transform(iter(chunks)):
+            pass
@@ -0,0 +1,46 @@
+from typing import Literal
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+
+N_RENDERS = 1_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("template_format", ["f-string", "jinja2"])
+def test_prompt_template_invoke(
+    benchmark: BenchmarkFixture, template_format: Literal["f-string", "jinja2"]
+) -> None:
+    pytest.importorskip("jinja2")
+    template = (
+        "You are {role}. Answer the question about {topic}: {question}"
+        if template_format == "f-string"
+        else "You are {{ role }}. Answer the question about {{ topic }}: {{ question }}"
+    )
+    prompt = PromptTemplate.from_template(template, template_format=template_format)
+    inputs = {"role": "a helpful assistant", "topic": "tea", "question": "why?"}
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def render() -> None:
+        for _ in range(N_RENDERS):
+            prompt.invoke(inputs)
+
+
+@pytest.mark.benchmark
+def test_chat_prompt_template_format_messages(benchmark: BenchmarkFixture) -> None:
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", "You are {role}."),
+            ("human", "Tell me about {topic}."),
+            ("ai", "Sure, {topic} is interesting."),
+            ("human", "{question}"),
+        ]
+    )
+    inputs = {"role": "a helpful assistant", "topic": "tea", "question": "why?"}
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def render() -> None:
+        for _ in range(N_RENDERS):
+            prompt.format_messages(**inputs)
@@ -1,6 +1,11 @@
 import pytest
 
-from langchain_core.caches import RETURN_VAL_TYPE, InMemoryCache
+from langchain_core.caches import (
+    RETURN_VAL_TYPE,
+    EvictionPolicy,
+    InMemoryCache,
+    LFUEvictionPolicy,
+)
 from langchain_core.outputs import Generation
 
 
@@ -69,6 +74,193 @@ def test_update_with_maxsize() -> None:
     assert cache.lookup(prompt3, llm_string3) == generations3
 
 
+def test_update_existing_key_does_not_evict() -> None:
+    cache = InMemoryCache(maxsize=2)
+    for item_id in (1, 2):
+        cache.update(*cache_item(item_id))
+    prompt, llm_string, _ = cache_item(1)
+    cache.update(prompt, llm_string, [Generation(text="new")])
+    assert len(cache._cache) == 2
+    assert cache.lookup(prompt, llm_string) == [Generation(text="new")]
+
+
+def test_lru_eviction() -> None:
+    cache = InMemoryCache(maxsize=2, eviction_policy="lru")
+    cache.update(*cache_item(1))
+    cache.update(*cache_item(2))
+    # Touching item 1 makes item 2 the least recently used one.
+    assert cache.lookup(*cache_item(1)[:2]) is not None
+    cache.update(*cache_item(3))
+    assert cache.lookup(*cache_item(1)[:2]) is not None
+    assert cache.lookup(*cache_item(2)[:2]) is None
+    assert cache.lookup(*cache_item(3)[:2]) is not None
+
+
+def test_lfu_eviction() -> None:
+    cache = InMemoryCache(maxsize=2, eviction_policy="lfu")
+    cache.update(*cache_item(1))
+    cache.update(*cache_item(2))
+    for _ in range(3):
+        cache.lookup(*cache_item(1)[:2])
+    cache.lookup(*cache_item(2)[:2])
+    cache.update(*cache_item(3))
+    assert cache.lookup(*cache_item(2)[:2]) is None
+    cache.update(*cache_item(4))
+    # Item 3 has been used once, item 1 four times.
+    assert cache.lookup(*cache_item(3)[:2]) is None
+    assert cache.lookup(*cache_item(1)[:2]) is not None
+
+
+def test_lfu_overwrite_keeps_frequency() -> None:
+    cache = InMemoryCache(maxsize=2, eviction_policy="lfu")
+    cache.update(*cache_item(1))
+    for _ in range(3):
+        cache.lookup(*cache_item(1)[:2])
+    prompt, llm_string, _ = cache_item(1)
+    cache.update(prompt, llm_string, [Generation(text="new")])
+    cache.update(*cache_item(2))
+    cache.update(*cache_item(3))
+    assert cache.lookup(prompt, llm_string) == [Generation(text="new")]
+    assert cache.lookup(*cache_item(2)[:2]) is None
+
+
+def test_fifo_overwrite_keeps_position() -> None:
+    cache = InMemoryCache(maxsize=2)
+    cache.update(*cache_item(1))
+    cache.update(*cache_item(2))
+    prompt, llm_string, _ = cache_item(1)
+    cache.update(prompt, llm_string, [Generation(text="new")])
+    cache.update(*cache_item(3))
+    assert cache.lookup(prompt, llm_string) is None
+    assert cache.lookup(*cache_item(2)[:2]) is not None
+
+
+def test_lfu_policy_ties_evict_least_recent() -> None:
+    policy = LFUEvictionPolicy()
+    policy.insert(("a", ""))
+    policy.insert(("b", ""))
+    assert policy.victim() == ("a", "")
+    policy.access(("a", ""))
+    assert policy.victim() == ("b", "")
+    policy.remove(("b", ""))
+    assert policy.victim() == ("a", "")
+
+
+def test_custom_eviction_policy() -> None:
+    class EvictNewest(EvictionPolicy):
+        def __init__(self) -> None:
+            self.keys: list[tuple[str, str]] = []
+
+        def insert(self, key: tuple[str, str]) -> None:
+            self.keys.append(key)
+
+        def access(self, key: tuple[str, str]) -> None:
+            pass
+
+        def remove(self, key: tuple[str, str]) -> None:
+            self.keys.remove(key)
+
+        def victim(self) -> tuple[str, str]:
+            return self.keys[-1]
+
+        def clear(self) -> None:
+            self.keys.clear()
+
+    cache = InMemoryCache(maxsize=2, eviction_policy=EvictNewest())
+    for item_id in (1, 2, 3):
+        cache.update(*cache_item(item_id))
+    assert cache.lookup(*cache_item(1)[:2]) is not None
+    assert cache.lookup(*cache_item(2)[:2]) is None
+    assert cache.lookup(*cache_item(3)[:2]) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="ttl must be greater than 0"):
+        InMemoryCache(ttl=0)
+    with pytest.raises(ValueError, match="max_bytes must be greater than 0"):
+        InMemoryCache(max_bytes=0)
+    with pytest.raises(ValueError, match="Unknown eviction_policy"):
+        InMemoryCache(eviction_policy="random")  # type: ignore[arg-type]
+
+
+def test_ttl_expiration(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("langchain_core.caches.time.monotonic", lambda: now)
+    cache = InMemoryCache(ttl=10)
+    cache.update(*cache_item(1))
+    now += 5
+    cache.update(*cache_item(2))
+    assert cache.lookup(*cache_item(1)[:2]) is not None
+
+    now += 6
+    assert cache.lookup(*cache_item(1)[:2]) is None
+    assert cache.lookup(*cache_item(2)[:2]) is not None
+
+    # Expired entries are purged on update even if never looked up again.
+    now += 10
+    cache.update(*cache_item(3))
+    assert cache._cache.keys() == {cache_item(3)[:2]}
+    assert cache.stats()["expirations"] == 2
+
+
+def test_ttl_overwrite_resets_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("langchain_core.caches.time.monotonic", lambda: now)
+    cache = InMemoryCache(ttl=10)
+    cache.update(*cache_item(1))
+    cache.update(*cache_item(2))
+    now += 5
+    cache.update(*cache_item(1))
+    now += 6
+    assert cache.lookup(*cache_item(1)[:2]) is not None
+    assert cache.lookup(*cache_item(2)[:2]) is None
+
+
+def test_max_bytes() -> None:
+    big = [Generation(text="x" * 1_000)]
+    cache = InMemoryCache(max_bytes=2_500, eviction_policy="lru")
+    cache.update("p1", "llm", big)
+    cache.update("p2", "llm", big)
+    cache.lookup("p1", "llm")
+    cache.update("p3", "llm", big)
+    assert cache.lookup("p2", "llm") is None
+    assert cache.lookup("p1", "llm") is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert 2_000 < stats["bytes"] <= 2_500
+
+    # Overwriting an entry replaces its size.
+    cache.update("p1", "llm", [Generation(text="x")])
+    assert cache.stats()["bytes"] < 1_500
+    cache.update("p1", "llm", big)
+    assert 2_000 < cache.stats()["bytes"] <= 2_500
+    assert cache.stats()["evictions"] == 1
+
+    # A single entry larger than the budget is not kept.
+    cache.update("p4", "llm", [Generation(text="x" * 10_000)])
+    assert cache.lookup("p4", "llm") is None
+
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+
+
+def test_stats(cache: InMemoryCache) -> None:
+    prompt, llm_string, generations = cache_item(1)
+    assert cache.lookup(prompt, llm_string) is None
+    cache.update(prompt, llm_string, generations)
+    assert cache.lookup(prompt, llm_string) == generations
+    assert cache.lookup(prompt, llm_string) == generations
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "size": 1,
+        "bytes": 0,
+    }
+
+
 def test_clear(cache: InMemoryCache) -> None:
     """Test the clear method of InMemoryCache."""
     prompt, llm_string, generations = cache_item(1)
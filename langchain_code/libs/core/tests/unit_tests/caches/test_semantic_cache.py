@@ -0,0 +1,111 @@
+import string
+
+import pytest
+from typing_extensions import override
+
+from langchain_core.caches import SemanticCache
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.outputs import Generation
+
+
+class LetterEmbeddings(Embeddings):
+    """Embed a text as the counts of its lowercase letters."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    @override
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        text = text.lower()
+        return [float(text.count(letter)) for letter in string.ascii_lowercase]
+
+
+@pytest.fixture
+def embeddings() -> LetterEmbeddings:
+    return LetterEmbeddings()
+
+
+def test_similar_prompt_hits(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings, score_threshold=0.95)
+    generations = [Generation(text="Paris")]
+    cache.update("What is the capital of France?", "llm", generations)
+    assert cache.lookup("what is the capital of france", "llm") == generations
+    assert cache.lookup("Tell me a joke about penguins", "llm") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_scoped_by_llm_string(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings)
+    cache.update("What is the capital of France?", "llm-a", [Generation(text="a")])
+    assert cache.lookup("What is the capital of France?", "llm-b") is None
+    # No entries for this llm_string, so the prompt is not even embedded.
+    assert embeddings.calls == 1
+
+
+def test_exact_match_skips_embedding(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings)
+    cache.update("prompt", "llm", [Generation(text="a")])
+    assert cache.lookup("prompt", "llm") == [Generation(text="a")]
+    assert embeddings.calls == 1
+
+
+def test_update_reuses_lookup_embedding(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings)
+    cache.update("first prompt", "llm", [Generation(text="a")])
+    assert cache.lookup("zzz", "llm") is None
+    cache.update("zzz", "llm", [Generation(text="b")])
+    assert embeddings.calls == 2
+    assert cache.lookup("zzz", "llm") == [Generation(text="b")]
+
+
+def test_maxsize_evicts_least_recently_used(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings, maxsize=2, score_threshold=0.99)
+    cache.update("aaaa", "llm", [Generation(text="a")])
+    cache.update("bbbb", "llm", [Generation(text="b")])
+    assert cache.lookup("aaaa", "llm") is not None
+    cache.update("cccc", "llm", [Generation(text="c")])
+    assert cache.lookup("bb", "llm") is None
+    assert cache.lookup("aa", "llm") == [Generation(text="a")]
+    assert cache.lookup("cc", "llm") == [Generation(text="c")]
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_clear(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings)
+    cache.update("prompt", "llm", [Generation(text="a")])
+    cache.clear()
+    assert cache.lookup("prompt", "llm") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_invalid_settings(embeddings: LetterEmbeddings) -> None:
+    with pytest.raises(ValueError, match="score_threshold must be between -1 and 1"):
+        SemanticCache(embeddings, score_threshold=1.5)
+    with pytest.raises(ValueError, match="maxsize must be greater than 0"):
+        SemanticCache(embeddings, maxsize=0)
+
+
+async def test_async_methods(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings)
+    await cache.aupdate("What is the capital of France?", "llm", [Generation(text="P")])
+    assert await cache.alookup("what is the capital of france", "llm") == [
+        Generation(text="P")
+    ]
+    await cache.aclear()
+    assert await cache.alookup("What is the capital of France?", "llm") is None
+
+
+def test_with_chat_model(embeddings: LetterEmbeddings) -> None:
+    cache = SemanticCache(embeddings, score_threshold=0.95)
+    model = FakeListChatModel(responses=["Paris", "Berlin"], cache=cache)
+    assert model.invoke("What is the capital of France?").content == "Paris"
+    assert model.invoke("what is the capital of France").content == "Paris"
+    assert model.invoke("Name a big German city, please!").content == "Berlin"
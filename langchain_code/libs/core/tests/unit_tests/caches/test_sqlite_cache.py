@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import multiprocessing
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from langchain_core import caches as caches_module
+from langchain_core.caches import SQLiteCache
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache.db"
+
+
+def test_roundtrip_generations(cache_path: Path) -> None:
+    cache = SQLiteCache(cache_path, batch_size=1)
+    generations = [Generation(text="héllo"), Generation(text="")]
+    cache.update("prompt", "llm", generations)
+    assert cache.lookup("prompt", "llm") == generations
+    assert cache.lookup("prompt", "other-llm") is None
+    assert cache.lookup("other-prompt", "llm") is None
+
+
+def test_roundtrip_chat_generations(cache_path: Path) -> None:
+    cache = SQLiteCache(cache_path, batch_size=1)
+    generations = [
+        ChatGeneration(
+            message=AIMessage(
+                content="x" * 2_000,
+                tool_calls=[{"name": "search", "args": {"q": "a"}, "id": "1"}],
+                usage_metadata={
+                    "input_tokens": 1,
+                    "output_tokens": 2,
+                    "total_tokens": 3,
+                },
+            ),
+            generation_info={"finish_reason": "stop"},
+        ),
+        Generation(text="plain", generation_info={"logprobs": None}),
+    ]
+    cache.update("prompt", "llm", generations)
+    assert cache.lookup("prompt", "llm") == generations
+
+
+def test_batched_writes(cache_path: Path) -> None:
+    cache = SQLiteCache(cache_path, batch_size=3, flush_interval=3600)
+    other = SQLiteCache(cache_path)
+    cache.update("p1", "llm", [Generation(text="1")])
+    cache.update("p2", "llm", [Generation(text="2")])
+    # Pending updates are visible to the writer but not yet persisted.
+    assert cache.lookup("p1", "llm") == [Generation(text="1")]
+    assert other.lookup("p1", "llm") is None
+
+    cache.update("p3", "llm", [Generation(text="3")])
+    assert other.lookup("p1", "llm") == [Generation(text="1")]
+    assert other.lookup("p3", "llm") == [Generation(text="3")]
+
+    cache.update("p4", "llm", [Generation(text="4")])
+    cache.close()
+    assert other.lookup("p4", "llm") == [Generation(text="4")]
+
+
+def test_flush_interval(cache_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("langchain_core.caches.time.monotonic", lambda: now)
+    cache = SQLiteCache(cache_path, batch_size=100, flush_interval=1)
+    other = SQLiteCache(cache_path)
+    cache.update("p1", "llm", [Generation(text="1")])
+    assert other.lookup("p1", "llm") is None
+    now += 2
+    cache.update("p2", "llm", [Generation(text="2")])
+    assert other.lookup("p1", "llm") == [Generation(text="1")]
+
+
+def test_persistence_across_instances(cache_path: Path) -> None:
+    cache = SQLiteCache(cache_path, batch_size=10)
+    cache.update("prompt", "llm", [Generation(text="cached")])
+    del cache
+    assert SQLiteCache(cache_path).lookup("prompt", "llm") == [
+        Generation(text="cached")
+    ]
+
+
+def test_clear(cache_path: Path) -> None:
+    cache = SQLiteCache(cache_path, batch_size=2)
+    cache.update("p1", "llm", [Generation(text="1")])
+    cache.update("p2", "llm", [Generation(text="2")])
+    cache.update("p3", "llm", [Generation(text="3")])
+    cache.clear()
+    for prompt in ("p1", "p2", "p3"):
+        assert cache.lookup(prompt, "llm") is None
+
+
+def test_invalid_batch_size(cache_path: Path) -> None:
+    with pytest.raises(ValueError, match="batch_size must be greater than 0"):
+        SQLiteCache(cache_path, batch_size=0)
+
+
+def _hold_write_lock(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("BEGIN IMMEDIATE")
+    return conn
+
+
+def test_failed_flush_is_logged_and_retried(
+    cache_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    cache = SQLiteCache(cache_path, batch_size=1, timeout=0.01)
+    other = SQLiteCache(cache_path)
+    blocker = _hold_write_lock(cache_path)
+
+    with caplog.at_level(logging.WARNING, logger="langchain_core.caches"):
+        cache.update("p1", "llm", [Generation(text="1")])
+    assert "Failed to write to the LLM cache" in caplog.text
+    assert cache.lookup("p1", "llm") == [Generation(text="1")]
+
+    blocker.execute("ROLLBACK")
+    blocker.close()
+    cache.update("p2", "llm", [Generation(text="2")])
+    assert other.lookup("p1", "llm") == [Generation(text="1")]
+    assert other.lookup("p2", "llm") == [Generation(text="2")]
+
+
+def test_lookup_does_not_wait_for_flush(cache_path: Path) -> None:
+    cache = SQLiteCache(cache_path, batch_size=100, timeout=10)
+    cache.update("p1", "llm", [Generation(text="1")])
+    blocker = _hold_write_lock(cache_path)
+    flusher = threading.Thread(target=cache.flush)
+    flusher.start()
+    try:
+        # The batch being flushed and the database are both readable while the
+        # flush waits for the write lock.
+        while not cache._flushing:
+            flusher.join(0.001)
+        assert cache.lookup("p1", "llm") == [Generation(text="1")]
+        assert cache.lookup("p2", "llm") is None
+        cache.update("p2", "llm", [Generation(text="2")])
+        assert cache.lookup("p2", "llm") == [Generation(text="2")]
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
+        flusher.join()
+    assert SQLiteCache(cache_path).lookup("p1", "llm") == [Generation(text="1")]
+
+
+def test_threads_share_connections(
+    cache_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    opened: list[sqlite3.Connection] = []
+    connect = caches_module._connect
+
+    def counting_connect(database_path: str, timeout: float) -> sqlite3.Connection:
+        conn = connect(database_path, timeout)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr("langchain_core.caches._connect", counting_connect)
+    cache = SQLiteCache(cache_path, batch_size=1)
+
+    def use(i: int) -> None:
+        cache.update(f"p{i}", "llm", [Generation(text=str(i))])
+        assert cache.lookup(f"p{i}", "llm") == [Generation(text=str(i))]
+        assert cache.lookup("missing", "llm") is None
+
+    for i in range(50):
+        thread = threading.Thread(target=use, args=(i,))
+        thread.start()
+        thread.join()
+    # One connection for lookups and one for flushes, whatever the thread count.
+    assert len(opened) == 2
+    cache.close()
+
+
+def _write_entries(path: str, worker: int) -> None:
+    cache = SQLiteCache(path, batch_size=5)
+    for i in range(20):
+        cache.update(f"{worker}-{i}", "llm", [Generation(text=str(i))])
+    cache.close()
+
+
+def test_shared_between_processes(cache_path: Path) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=_write_entries, args=(str(cache_path), worker))
+        for worker in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    cache = SQLiteCache(cache_path)
+    for worker in range(3):
+        for i in range(20):
+            assert cache.lookup(f"{worker}-{i}", "llm") == [Generation(text=str(i))]
+
+
+@pytest.fixture
+def caches(cache_path: Path) -> tuple[SQLiteCache, SQLiteCache]:
+    # Opening the database is blocking, so do it outside of the event loop.
+    return SQLiteCache(cache_path, batch_size=2), SQLiteCache(cache_path)
+
+
+async def test_async_methods(caches: tuple[SQLiteCache, SQLiteCache]) -> None:
+    cache, other = caches
+    await cache.aupdate("p1", "llm", [Generation(text="1")])
+    assert await cache.alookup("p1", "llm") == [Generation(text="1")]
+    await cache.aupdate("p2", "llm", [Generation(text="2")])
+    assert await other.alookup("p2", "llm") == [Generation(text="2")]
+    await cache.aclear()
+    assert await cache.alookup("p1", "llm") is None
+
+
+async def test_alookup_does_not_use_default_executor(
+    caches: tuple[SQLiteCache, SQLiteCache],
+) -> None:
+    cache, other = caches
+    await cache.aupdate("p1", "llm", [Generation(text="1")])
+    await cache.aupdate("p2", "llm", [Generation(text="2")])
+    loop = asyncio.get_running_loop()
+    default_executor = ThreadPoolExecutor(max_workers=1)
+    loop.set_default_executor(default_executor)
+    release = threading.Event()
+    busy = loop.run_in_executor(None, release.wait)
+    try:
+        # The default executor is busy, but database reads don't queue behind it.
+        assert await asyncio.wait_for(other.alookup("p1", "llm"), 5) == [
+            Generation(text="1")
+        ]
+        assert await asyncio.wait_for(other.alookup("p3", "llm"), 5) is None
+    finally:
+        release.set()
+        await busy
+        default_executor.shutdown()
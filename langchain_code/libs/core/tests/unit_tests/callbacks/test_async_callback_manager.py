@@ -8,15 +8,18 @@ via snapshot testing (e.g., see unit tests for runnables).
 import contextvars
 from contextlib import asynccontextmanager
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
+import pytest
 from typing_extensions import override
 
 from langchain_core.callbacks import (
     AsyncCallbackHandler,
     AsyncCallbackManager,
     BaseCallbackHandler,
+    manager,
 )
+from langchain_core.callbacks.manager import AsyncCallbackManagerForLLMRun
 
 
 async def test_inline_handlers_share_parent_context() -> None:
@@ -210,3 +213,42 @@ async def test_shielded_callback_context_preservation() -> None:
         f"but got {handler.context_values}. "
         f"This indicates the shielded decorator is not preserving context variables."
     )
+
+
+class _TokenCounter(BaseCallbackHandler):
+    def __init__(self) -> None:
+        self.tokens: list[str] = []
+
+    @override
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.tokens.append(token)
+
+
+class _AsyncEndOnly(AsyncCallbackHandler):
+    @override
+    async def on_llm_end(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+async def test_handlers_without_event_are_not_dispatched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dispatched: list[str] = []
+    original = manager._ahandle_event_for_handler
+
+    async def record(handler: BaseCallbackHandler, *args: Any, **kwargs: Any) -> None:
+        dispatched.append(type(handler).__name__)
+        await original(handler, *args, **kwargs)
+
+    monkeypatch.setattr(manager, "_ahandle_event_for_handler", record)
+    counter = _TokenCounter()
+    run_manager = AsyncCallbackManagerForLLMRun(
+        run_id=uuid4(),
+        handlers=[_AsyncEndOnly(), BaseCallbackHandler(), counter],
+        inheritable_handlers=[],
+    )
+
+    await run_manager.on_llm_new_token("a")
+
+    assert dispatched == ["_TokenCounter"]
+    assert counter.tokens == ["a"]
@@ -1,4 +1,16 @@
-from langchain_core.callbacks.base import BaseCallbackHandler, BaseCallbackManager
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from typing_extensions import override
+
+from langchain_core.callbacks import manager
+from langchain_core.callbacks.base import (
+    AsyncCallbackHandler,
+    BaseCallbackHandler,
+    BaseCallbackManager,
+)
+from langchain_core.callbacks.manager import CallbackManagerForLLMRun
 
 
 def test_remove_handler() -> None:
@@ -36,3 +48,45 @@ def test_merge_preserves_handler_distinction() -> None:
 
     assert set(merged.handlers) == {h1, h2}
     assert set(merged.inheritable_handlers) == {ih1, ih2}
+
+
+class _TokenCounter(BaseCallbackHandler):
+    def __init__(self) -> None:
+        self.tokens: list[str] = []
+
+    @override
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.tokens.append(token)
+
+
+class _AsyncEndOnly(AsyncCallbackHandler):
+    @override
+    async def on_llm_end(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def test_handlers_without_event_are_not_dispatched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*_: Any) -> None:
+        msg = "no coroutine should be scheduled"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(manager, "_run_coros", fail)
+    counter = _TokenCounter()
+    patched = BaseCallbackHandler()
+    patched_tokens: list[str] = []
+    patched.on_llm_new_token = (  # type: ignore[method-assign]
+        lambda token, **_: patched_tokens.append(token)
+    )
+    run_manager = CallbackManagerForLLMRun(
+        run_id=uuid4(),
+        handlers=[_AsyncEndOnly(), BaseCallbackHandler(), counter, patched],
+        inheritable_handlers=[],
+    )
+
+    run_manager.on_llm_new_token("a")
+    run_manager.on_llm_new_token("b")
+
+    assert counter.tokens == ["a", "b"]
+    assert patched_tokens == ["a", "b"]
@@ -1,7 +1,17 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
+import pytest
+
 from langchain_core.documents import Document
-from langchain_core.indexing.api import _get_document_with_hash
+from langchain_core.indexing.api import (
+    NAMESPACE_UUID,
+    _get_document_with_hash,
+    _hash_batch,
+    _hash_documents,
+    _uuid5,
+)
 
 
 def test_hashed_document_hashing() -> None:
@@ -63,3 +73,70 @@ def test_hashing_custom_key_encoder() -> None:
     hashed_document = _get_document_with_hash(document, key_encoder=custom_key_encoder)
     assert hashed_document.id == "quack-like a duck"
     assert isinstance(hashed_document.id, str)
+
+
+@pytest.mark.parametrize(
+    ("key_encoder", "expected"),
+    [
+        (
+            "sha1",
+            [
+                "73f0758b-25c8-5312-ae71-bff11889762e",
+                "4b5da1ab-9b94-52cb-ad2a-2963b1e3ba82",
+                "c487bb6b-a8f5-540c-a5af-b6be9c57cb43",
+            ],
+        ),
+        (
+            "sha256",
+            [
+                "3a819a1aca7a1b6e12759ca32fcc45445186eb1659a01f81e4e6c7e1bfff541f",
+                "3c476971a15bdffb103dbcb30d96c413871a1d7686ce7a4050d3426649ce0199",
+                "f955f08228f188bbc9d004c6c774cc3a799a7004dbfb4705174281fc08e37e6f",
+            ],
+        ),
+    ],
+)
+def test_hashes_are_stable(
+    key_encoder: Literal["sha1", "sha256"], expected: list[str]
+) -> None:
+    """Document hashes do not change, so existing indexes stay valid."""
+    documents = [
+        Document(
+            page_content="Lorem ipsum dolor sit amet", metadata={"key": "value", "n": 1}
+        ),
+        Document(page_content="ünïcode ✓"),
+        Document(
+            page_content="", metadata={"nested": {"b": [1, 2.5, None], "a": True}}
+        ),
+    ]
+    assert _hash_documents(documents, key_encoder=key_encoder) == expected
+    assert [
+        _get_document_with_hash(document, key_encoder=key_encoder).id
+        for document in documents
+    ] == expected
+
+
+def test_uuid5_matches_uuid_module() -> None:
+    for name in ["", "abc", "ünïcode", "f" * 40]:
+        assert _uuid5(name) == str(uuid.uuid5(NAMESPACE_UUID, name))
+
+
+@pytest.mark.parametrize("key_encoder", ["sha1", "blake2b"])
+def test_hash_batch_with_executor(key_encoder: Literal["sha1", "blake2b"]) -> None:
+    """Hashing on an executor returns the same hashes in the same order."""
+    documents = [
+        Document(page_content=f"document {i}", metadata={"source": str(i % 3)})
+        for i in range(100)
+    ]
+    expected = _hash_documents(documents, key_encoder=key_encoder)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert (
+            _hash_batch(documents, key_encoder=key_encoder, executor=executor)
+            == expected
+        )
+
+
+def test_hash_documents_rejects_unserializable_metadata() -> None:
+    document = Document(page_content="text", metadata={"key": object()})
+    with pytest.raises(ValueError, match="Failed to hash metadata"):
+        _hash_documents([document], key_encoder="sha256")
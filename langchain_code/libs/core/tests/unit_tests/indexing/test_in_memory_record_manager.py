@@ -1,4 +1,7 @@
+import json
+import random
 from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -277,3 +280,88 @@ async def test_adelete_keys(amanager: InMemoryRecordManager) -> None:
     # Check if the deleted keys are no longer in the database
     remaining_keys = await amanager.alist_keys()
     assert remaining_keys == ["key3"]
+
+
+def test_list_keys_orders_by_update_time(manager: InMemoryRecordManager) -> None:
+    """Keys are listed least recently updated first."""
+    for day, key in [(3, "key1"), (1, "key2"), (2, "key3")]:
+        with patch.object(
+            manager,
+            "get_time",
+            return_value=datetime(2021, 1, day, tzinfo=timezone.utc).timestamp(),
+        ):
+            manager.update([key], group_ids=["group1"])
+
+    assert manager.list_keys() == ["key2", "key3", "key1"]
+    assert manager.list_keys(group_ids=["group1"], limit=2) == ["key2", "key3"]
+
+    with patch.object(
+        manager,
+        "get_time",
+        return_value=datetime(2021, 1, 4, tzinfo=timezone.utc).timestamp(),
+    ):
+        manager.update(["key2"], group_ids=["group2"])
+
+    assert manager.list_keys() == ["key3", "key1", "key2"]
+    assert manager.list_keys(group_ids=["group1"]) == ["key3", "key1"]
+    assert manager.list_keys(group_ids=["group2", "group1"]) == [
+        "key3",
+        "key1",
+        "key2",
+    ]
+
+
+def test_list_keys_matches_scan(manager: InMemoryRecordManager) -> None:
+    """The indexes agree with a scan over the records after many changes."""
+    rng = random.Random(0)
+    keys = [f"key{i}" for i in range(200)]
+    for step in range(2_000):
+        key = rng.choice(keys)
+        if rng.random() < 0.3:
+            manager.delete_keys([key])
+            continue
+        with patch.object(manager, "get_time", return_value=float(step // 7)):
+            manager.update([key], group_ids=[rng.choice(["a", "b", "c", None])])
+
+        if step % 100 == 0:
+            before = float(rng.randrange(1, 300))
+            after = before / 2
+            group_ids = rng.sample(["a", "b", "c"], k=2)
+            expected = sorted(
+                (record["updated_at"], key)
+                for key, record in manager.records.items()
+                if after < record["updated_at"] < before
+                and record["group_id"] in group_ids
+            )
+            listed = manager.list_keys(before=before, after=after, group_ids=group_ids)
+            assert sorted(listed) == sorted(key for _, key in expected)
+            assert [manager.records[key]["updated_at"] for key in listed] == [
+                updated_at for updated_at, _ in expected
+            ]
+
+    assert sorted(manager.list_keys()) == sorted(manager.records)
+
+
+def test_dump_and_load(manager: InMemoryRecordManager, tmp_path: Path) -> None:
+    """A snapshot restores the namespace, records and indexes."""
+    with patch.object(manager, "get_time", return_value=1.0):
+        manager.update(["key1", "key2", "key3"], group_ids=["a", None, "b"])
+    with patch.object(manager, "get_time", return_value=2.0):
+        manager.update(["key1"], group_ids=["b"])
+
+    path = tmp_path / "records" / "snapshot.json"
+    manager.dump(path)
+    loaded = InMemoryRecordManager.load(path)
+
+    assert loaded.namespace == "kittens"
+    assert loaded.records == manager.records
+    assert loaded.list_keys() == ["key2", "key3", "key1"]
+    assert loaded.list_keys(group_ids=["b"], before=2.0) == ["key3"]
+
+
+def test_load_rejects_unknown_snapshot(tmp_path: Path) -> None:
+    """Files that are not snapshots of a known version are rejected."""
+    path = tmp_path / "snapshot.json"
+    path.write_text(json.dumps({"version": 99}), encoding="utf-8")
+    with pytest.raises(ValueError, match="snapshot version"):
+        InMemoryRecordManager.load(path)
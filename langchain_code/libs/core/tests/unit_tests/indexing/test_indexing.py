@@ -1,13 +1,19 @@
+import asyncio
+import threading
+import time
 from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import (
     Any,
+    Literal,
 )
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
 from pytest_mock import MockerFixture
+from typing_extensions import override
 
 from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
@@ -15,6 +21,7 @@ from langchain_core.embeddings import DeterministicFakeEmbedding
 from langchain_core.indexing import InMemoryRecordManager, aindex, index
 from langchain_core.indexing.api import (
     IndexingException,
+    IndexingResult,
     _abatch,
     _get_document_with_hash,
 )
@@ -2940,3 +2947,293 @@ async def test_aindex_with_upsert_kwargs(
         # Check other arguments
         assert kwargs["batch_size"] == 100
         assert kwargs["vector_field"] == "embedding"
+
+
+def _pipelining_docs(run: int) -> list[Document]:
+    """Documents repeated within and across batches of 30, partly changed per run."""
+    return [
+        Document(
+            page_content=f"chunk {i % 23} of run {run if i % 23 < 8 else 0}",
+            metadata={"source": str(i % 23 % 5)},
+        )
+        for i in range(200)
+    ]
+
+
+class _ConcurrencyTrackingVectorStore(InMemoryVectorStore):
+    """Vector store recording how many writes overlap."""
+
+    def __init__(self) -> None:
+        super().__init__(DeterministicFakeEmbedding(size=5))
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def _enter(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def _exit(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+    @override
+    def add_documents(
+        self, documents: list[Document], ids: list[str] | None = None, **kwargs: Any
+    ) -> list[str]:
+        self._enter()
+        try:
+            time.sleep(0.02)
+            with self.lock:
+                return super().add_documents(documents, ids=ids, **kwargs)
+        finally:
+            self._exit()
+
+    @override
+    async def aadd_documents(
+        self, documents: list[Document], ids: list[str] | None = None, **kwargs: Any
+    ) -> list[str]:
+        self._enter()
+        try:
+            await asyncio.sleep(0.02)
+            return await super().aadd_documents(documents, ids=ids, **kwargs)
+        finally:
+            self._exit()
+
+
+@pytest.mark.parametrize("cleanup", [None, "full", "scoped_full"])
+@pytest.mark.parametrize("force_update", [False, True])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_index_pipelined_matches_serial(
+    cleanup: Literal["full", "scoped_full"] | None,
+    *,
+    force_update: bool,
+    max_concurrency: int,
+) -> None:
+    """Pipelined indexing reports the same counts and ends in the same state."""
+
+    def run_twice(
+        concurrency: int | None,
+    ) -> tuple[list[IndexingResult], set[str], list[str]]:
+        record_manager = InMemoryRecordManager(namespace="pipelined")
+        record_manager.create_schema()
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        results = []
+        for run in range(2):
+            with patch.object(
+                record_manager,
+                "get_time",
+                return_value=datetime(
+                    2021, 1, run + 1, tzinfo=timezone.utc
+                ).timestamp(),
+            ):
+                results.append(
+                    index(
+                        _pipelining_docs(run),
+                        record_manager,
+                        vector_store,
+                        batch_size=30,
+                        cleanup=cleanup,
+                        source_id_key="source",
+                        force_update=force_update,
+                        key_encoder="sha256",
+                        max_concurrency=concurrency,
+                    )
+                )
+        return results, set(vector_store.store), sorted(record_manager.list_keys())
+
+    serial = run_twice(None)
+    assert serial[0][0]["num_skipped"] > 0
+    assert run_twice(max_concurrency) == serial
+
+
+@pytest.mark.parametrize("cleanup", [None, "full", "scoped_full"])
+@pytest.mark.parametrize("force_update", [False, True])
+async def test_aindex_pipelined_matches_serial(
+    cleanup: Literal["full", "scoped_full"] | None,
+    *,
+    force_update: bool,
+) -> None:
+    """Pipelined async indexing reports the same counts and ends in the same state."""
+
+    async def run_twice(
+        concurrency: int | None,
+    ) -> tuple[list[IndexingResult], set[str], list[str]]:
+        record_manager = InMemoryRecordManager(namespace="pipelined")
+        await record_manager.acreate_schema()
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        results = []
+        for run in range(2):
+            with patch.object(
+                record_manager,
+                "aget_time",
+                return_value=datetime(
+                    2021, 1, run + 1, tzinfo=timezone.utc
+                ).timestamp(),
+            ):
+                results.append(
+                    await aindex(
+                        _pipelining_docs(run),
+                        record_manager,
+                        vector_store,
+                        batch_size=30,
+                        cleanup=cleanup,
+                        source_id_key="source",
+                        force_update=force_update,
+                        key_encoder="sha256",
+                        max_concurrency=concurrency,
+                    )
+                )
+        return (
+            results,
+            set(vector_store.store),
+            sorted(await record_manager.alist_keys()),
+        )
+
+    assert await run_twice(4) == await run_twice(None)
+
+
+def test_index_pipelined_bounds_in_flight_batches(
+    record_manager: InMemoryRecordManager,
+) -> None:
+    """No more than max_concurrency batches are written at once."""
+    vector_store = _ConcurrencyTrackingVectorStore()
+    docs = [Document(page_content=f"doc {i}") for i in range(100)]
+
+    result = index(
+        docs,
+        record_manager,
+        vector_store,
+        batch_size=10,
+        key_encoder="sha256",
+        max_concurrency=3,
+    )
+
+    assert result["num_added"] == 100
+    assert 1 < vector_store.max_active <= 3
+
+
+async def test_aindex_pipelined_bounds_in_flight_batches(
+    arecord_manager: InMemoryRecordManager,
+) -> None:
+    """No more than max_concurrency batches are written at once."""
+    vector_store = _ConcurrencyTrackingVectorStore()
+    docs = [Document(page_content=f"doc {i}") for i in range(100)]
+
+    result = await aindex(
+        docs,
+        arecord_manager,
+        vector_store,
+        batch_size=10,
+        key_encoder="sha256",
+        max_concurrency=3,
+    )
+
+    assert result["num_added"] == 100
+    assert 1 < vector_store.max_active <= 3
+
+
+def test_index_pipelined_propagates_errors(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    """A failing batch aborts the run with its error."""
+    docs = [Document(page_content=f"doc {i}") for i in range(100)]
+    original = vector_store.add_documents
+
+    def add_documents(documents: list[Document], **kwargs: Any) -> list[str]:
+        if any(doc.page_content == "doc 42" for doc in documents):
+            msg = "write failed"
+            raise RuntimeError(msg)
+        return original(documents, **kwargs)
+
+    with (
+        patch.object(vector_store, "add_documents", side_effect=add_documents),
+        pytest.raises(RuntimeError, match="write failed"),
+    ):
+        index(
+            docs,
+            record_manager,
+            vector_store,
+            batch_size=10,
+            key_encoder="sha256",
+            max_concurrency=2,
+        )
+
+
+def test_index_max_concurrency_validation(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    """Invalid max_concurrency settings are rejected before indexing."""
+    docs = [Document(page_content="doc", metadata={"source": "1"})]
+    with pytest.raises(ValueError, match="at least 1"):
+        index(
+            docs, record_manager, vector_store, key_encoder="sha256", max_concurrency=0
+        )
+    with pytest.raises(ValueError, match="incremental cleanup"):
+        index(
+            docs,
+            record_manager,
+            vector_store,
+            cleanup="incremental",
+            source_id_key="source",
+            key_encoder="sha256",
+            max_concurrency=2,
+        )
+    assert vector_store.store == {}
+
+
+def test_index_with_hash_executor(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    """Hashing on an executor indexes the same documents under the same IDs."""
+    docs = _pipelining_docs(0)
+    expected_ids = {
+        _get_document_with_hash(doc, key_encoder="sha256").id for doc in docs
+    }
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = index(
+            docs,
+            record_manager,
+            vector_store,
+            batch_size=30,
+            key_encoder="sha256",
+            hash_executor=executor,
+        )
+
+    assert result == {
+        "num_added": 23,
+        "num_deleted": 0,
+        "num_skipped": 177,
+        "num_updated": 0,
+    }
+    assert set(vector_store.store) == expected_ids
+
+
+async def test_aindex_with_hash_executor(
+    arecord_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    """Hashing on an executor indexes the same documents under the same IDs."""
+    docs = _pipelining_docs(0)
+    expected_ids = {
+        _get_document_with_hash(doc, key_encoder="sha256").id for doc in docs
+    }
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = await aindex(
+            docs,
+            arecord_manager,
+            vector_store,
+            batch_size=30,
+            key_encoder="sha256",
+            hash_executor=executor,
+        )
+
+    assert result == {
+        "num_added": 23,
+        "num_deleted": 0,
+        "num_skipped": 177,
+        "num_updated": 0,
+    }
+    assert set(vector_store.store) == expected_ids
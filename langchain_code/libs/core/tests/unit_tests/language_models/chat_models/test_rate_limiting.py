@@ -1,12 +1,24 @@
 import time
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 from blockbuster import BlockBuster
+from freezegun import freeze_time
+from typing_extensions import override
 
 from langchain_core.caches import InMemoryCache
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import GenericFakeChatModel
 from langchain_core.load import dumps
-from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.rate_limiters import (
+    InMemoryConcurrencyLimiter,
+    InMemoryRateLimiter,
+    InMemoryTokenRateLimiter,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Generator
 
 
 @pytest.fixture(autouse=True)
@@ -29,15 +41,14 @@ def test_rate_limit_invoke() -> None:
     tic = time.time()
     model.invoke("foo")
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    # with 0 tokens.
-    assert 0.10 < toc - tic < 0.15
+    # The token bucket is empty, so the call waits for exactly one refill
+    # (0.05 seconds at 20 requests per second).
+    assert 0.04 < toc - tic < 0.15
 
     tic = time.time()
     model.invoke("foo")
     toc = time.time()
-    # Second time we check the model, we should have 1 extra token
-    # since the sleep time is 0.1 seconds
+    # The second call waits for at most one more refill.
     assert 0.00 < toc - tic < 0.10
 
 
@@ -55,24 +66,24 @@ async def test_rate_limit_ainvoke() -> None:
     tic = time.time()
     await model.ainvoke("foo")
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    # with 0 tokens.
-    assert 0.1 < toc - tic < 0.2
+    # The token bucket is empty, so the call waits for exactly one refill
+    # (0.05 seconds at 20 requests per second).
+    assert 0.04 < toc - tic < 0.15
 
-    tic = time.time()
+    tic = start = time.time()
     await model.ainvoke("foo")
     toc = time.time()
-    # The second time we call the model, we should have 1 extra token
-    # to proceed immediately.
+    # The second call waits for at most one more refill.
     assert toc - tic < 0.1
 
     # The third time we call the model, we need to wait again for a token
     tic = time.time()
     await model.ainvoke("foo")
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    # with 0 tokens.
-    assert 0.1 < toc - tic < 0.2
+    # The call waits for the rest of the refill since the previous call.
+    assert toc - tic < 0.15
+    # Together, the second and third calls wait for two refills.
+    assert toc - start > 0.09
 
 
 def test_rate_limit_batch() -> None:
@@ -125,23 +136,24 @@ def test_rate_limit_stream() -> None:
     response = list(model.stream("foo"))
     assert [msg.content for msg in response] == ["hello", " ", "world"]
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    assert 0.1 < toc - tic < 0.2
+    # The token bucket is empty, so the call waits for exactly one refill
+    assert 0.04 < toc - tic < 0.15
 
-    # Second time around we should have 1 token left
-    tic = time.time()
+    # Second time around we wait for at most one more refill
+    tic = start = time.time()
     response = list(model.stream("foo"))
     assert [msg.content for msg in response] == ["hello", " ", "world"]
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    assert toc - tic < 0.1  # Slightly smaller than check every n seconds
+    assert toc - tic < 0.1
 
-    # Third time around we should have 0 tokens left
+    # Third time around the bucket is empty again
     tic = time.time()
     response = list(model.stream("foo"))
     assert [msg.content for msg in response] == ["hello", " ", "world"]
     toc = time.time()
-    assert 0.1 < toc - tic < 0.2
+    assert toc - tic < 0.15
+    # Together, the second and third calls wait for two refills
+    assert toc - start > 0.09
 
 
 async def test_rate_limit_astream() -> None:
@@ -160,23 +172,24 @@ async def test_rate_limit_astream() -> None:
     response = [msg async for msg in model.astream("foo")]
     assert [msg.content for msg in response] == ["hello", " ", "world"]
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    assert 0.1 < toc - tic < 0.2
+    # The token bucket is empty, so the call waits for exactly one refill
+    assert 0.04 < toc - tic < 0.15
 
-    # Second time around we should have 1 token left
-    tic = time.time()
+    # Second time around we wait for at most one more refill
+    tic = start = time.time()
     response = [msg async for msg in model.astream("foo")]
     assert [msg.content for msg in response] == ["hello", " ", "world"]
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    assert toc - tic < 0.1  # Slightly smaller than check every n seconds
+    assert toc - tic < 0.1
 
-    # Third time around we should have 0 tokens left
+    # Third time around the bucket is empty again
     tic = time.time()
     response = [msg async for msg in model.astream("foo")]
     assert [msg.content for msg in response] == ["hello", " ", "world"]
     toc = time.time()
-    assert 0.1 < toc - tic < 0.2
+    assert toc - tic < 0.15
+    # Together, the second and third calls wait for two refills
+    assert toc - start > 0.09
 
 
 def test_rate_limit_skips_cache() -> None:
@@ -196,17 +209,16 @@ def test_rate_limit_skips_cache() -> None:
     tic = time.time()
     model.invoke("foo")
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    # with 0 tokens.
-    assert 0.1 < toc - tic < 0.2
+    # The token bucket is empty, so the call waits for exactly one refill
+    # (0.05 seconds at 20 requests per second).
+    assert 0.04 < toc - tic < 0.15
 
     for _ in range(2):
         # Cache hits
         tic = time.time()
         model.invoke("foo")
         toc = time.time()
-        # Should be larger than check every n seconds since the token bucket starts
-        # with 0 tokens.
+        # Cache hits do not wait for the rate limiter.
         assert toc - tic < 0.05
 
     # Test verifies that there's only a single key
@@ -256,15 +268,151 @@ async def test_rate_limit_skips_cache_async(output_version: str) -> None:
     tic = time.time()
     await model.ainvoke("foo")
     toc = time.time()
-    # Should be larger than check every n seconds since the token bucket starts
-    # with 0 tokens.
-    assert 0.1 < toc - tic < 0.2
+    # The token bucket is empty, so the call waits for exactly one refill
+    # (0.05 seconds at 20 requests per second).
+    assert 0.04 < toc - tic < 0.15
 
     for _ in range(2):
         # Cache hits
         tic = time.time()
         await model.ainvoke("foo")
         toc = time.time()
-        # Should be larger than check every n seconds since the token bucket starts
-        # with 0 tokens.
+        # Cache hits do not wait for the rate limiter.
         assert toc - tic < 0.05
+
+
+def _ai_message(text: str, total_tokens: int) -> AIMessage:
+    return AIMessage(
+        content=text,
+        usage_metadata={
+            "input_tokens": total_tokens - 1,
+            "output_tokens": 1,
+            "total_tokens": total_tokens,
+        },
+    )
+
+
+def _count_messages(messages: list[BaseMessage]) -> int:
+    return 10 * len(messages)
+
+
+def test_token_rate_limiter_reconciles_usage() -> None:
+    rate_limiter = InMemoryTokenRateLimiter(
+        tokens_per_minute=6_000, token_counter=_count_messages
+    )
+    model = GenericFakeChatModel(
+        messages=iter([_ai_message("hello", 100), _ai_message("world", 5)]),
+        rate_limiter=rate_limiter,
+    )
+    with freeze_time("2023-01-01 00:00:00"):
+        model.invoke("foo")
+        assert rate_limiter.available_tokens == 5_900
+        # The fake model does not stream usage metadata, so the estimate is kept.
+        list(model.stream("foo"))
+        assert rate_limiter.available_tokens == 5_890
+
+
+async def test_token_rate_limiter_reconciles_usage_async() -> None:
+    rate_limiter = InMemoryTokenRateLimiter(
+        tokens_per_minute=6_000, token_counter=_count_messages
+    )
+    model = GenericFakeChatModel(
+        messages=iter([_ai_message("hello", 100), _ai_message("world", 5)]),
+        rate_limiter=rate_limiter,
+    )
+    with freeze_time("2023-01-01 00:00:00"):
+        await model.ainvoke("foo")
+        assert rate_limiter.available_tokens == 5_900
+        _ = [chunk async for chunk in model.astream("foo")]
+        assert rate_limiter.available_tokens == 5_890
+
+
+def test_concurrency_limiter_releases_slots() -> None:
+    rate_limiter = InMemoryConcurrencyLimiter(max_concurrency=1)
+    model = GenericFakeChatModel(
+        messages=iter(["hello", "world"]), rate_limiter=rate_limiter
+    )
+    model.invoke("foo")
+    assert rate_limiter.in_flight == 0
+    list(model.stream("foo"))
+    assert rate_limiter.in_flight == 0
+
+    # The slot is released when the model fails as well.
+    with pytest.raises(StopIteration):
+        model.invoke("foo")
+    assert rate_limiter.in_flight == 0
+
+
+class _RaisingHandler(BaseCallbackHandler):
+    raise_error = True
+
+    @override
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        msg = "handler failed"
+        raise RuntimeError(msg)
+
+
+def test_concurrency_limiter_releases_slots_when_streaming_stops() -> None:
+    rate_limiter = InMemoryConcurrencyLimiter(max_concurrency=1)
+    model = GenericFakeChatModel(
+        messages=iter(["hello world", "hello world"]), rate_limiter=rate_limiter
+    )
+
+    # The consumer stops early.
+    stream = cast("Generator[AIMessageChunk, None, None]", model.stream("foo"))
+    next(stream)
+    assert rate_limiter.in_flight == 1
+    stream.close()
+    assert rate_limiter.in_flight == 0
+
+    # The model fails and so does an error callback.
+    stream = cast(
+        "Generator[AIMessageChunk, None, None]",
+        model.stream("foo", config={"callbacks": [_RaisingHandler()]}),
+    )
+    next(stream)
+    with pytest.raises(RuntimeError, match="handler failed"):
+        stream.throw(ValueError("model failed"))
+    assert rate_limiter.in_flight == 0
+
+
+async def test_concurrency_limiter_releases_slots_when_astreaming_stops() -> None:
+    rate_limiter = InMemoryConcurrencyLimiter(max_concurrency=1)
+    model = GenericFakeChatModel(
+        messages=iter(["hello world", "hello world"]), rate_limiter=rate_limiter
+    )
+
+    stream = cast("AsyncGenerator[AIMessageChunk, None]", model.astream("foo"))
+    await anext(stream)
+    assert rate_limiter.in_flight == 1
+    await stream.aclose()
+    assert rate_limiter.in_flight == 0
+
+    stream = cast(
+        "AsyncGenerator[AIMessageChunk, None]",
+        model.astream("foo", config={"callbacks": [_RaisingHandler()]}),
+    )
+    await anext(stream)
+    with pytest.raises(RuntimeError, match="handler failed"):
+        await stream.athrow(ValueError("model failed"))
+    assert rate_limiter.in_flight == 0
+
+
+async def test_concurrency_limiter_caps_abatch() -> None:
+    rate_limiter = InMemoryConcurrencyLimiter(max_concurrency=2)
+    model = GenericFakeChatModel(
+        messages=iter(["a", "b", "c", "d", "e"]), rate_limiter=rate_limiter
+    )
+    peak = 0
+    original = rate_limiter.aacquire
+
+    async def tracking_aacquire(*, blocking: bool = True) -> bool:
+        nonlocal peak
+        acquired = await original(blocking=blocking)
+        peak = max(peak, rate_limiter.in_flight)
+        return acquired
+
+    rate_limiter.aacquire = tracking_aacquire  # type: ignore[method-assign]
+    await model.abatch(["foo"] * 5)
+    assert peak == 2
+    assert rate_limiter.in_flight == 0
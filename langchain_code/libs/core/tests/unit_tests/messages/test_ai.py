@@ -1,9 +1,12 @@
 from typing import cast
 
+import pytest
+
 from langchain_core.load import dumpd, load
 from langchain_core.messages import AIMessage, AIMessageChunk
 from langchain_core.messages import content as types
 from langchain_core.messages.ai import (
+    AIMessageChunkAccumulator,
     InputTokenDetails,
     OutputTokenDetails,
     UsageMetadata,
@@ -502,3 +505,80 @@ def test_content_blocks_reasoning_extraction() -> None:
     content_blocks = message.content_blocks
     assert len(content_blocks) == 1
     assert content_blocks[0]["type"] == "text"
+
+
+def _streamed_chunks() -> list[AIMessageChunk]:
+    args = '{"query": "weather in paris", "units": "metric"}'
+    chunks = [
+        AIMessageChunk(content="Let me ", id="lc_run-1"),
+        AIMessageChunk(content="check.", id="lc_run-1"),
+    ]
+    chunks.extend(
+        AIMessageChunk(
+            content="",
+            id="lc_run-1" if i else "provider-id",
+            tool_call_chunks=[
+                create_tool_call_chunk(
+                    name="search" if i == 0 else None,
+                    args=args[i : i + 5],
+                    id="call_1" if i == 0 else None,
+                    index=0,
+                )
+            ],
+            additional_kwargs={"trace": [i]},
+        )
+        for i in range(0, len(args), 5)
+    )
+    chunks.append(
+        AIMessageChunk(
+            content="",
+            usage_metadata={"input_tokens": 3, "output_tokens": 7, "total_tokens": 10},
+            response_metadata={"finish_reason": "tool_calls"},
+            chunk_position="last",
+        )
+    )
+    return chunks
+
+
+def test_accumulator_matches_pairwise_addition() -> None:
+    chunks = _streamed_chunks()
+    expected = chunks[0]
+    for chunk in chunks[1:]:
+        expected += chunk
+
+    accumulator = AIMessageChunkAccumulator()
+    for chunk in chunks:
+        accumulator.append(chunk)
+
+    assert accumulator.to_chunk() == expected
+    assert accumulator.to_chunk() is accumulator.to_chunk()
+    message = accumulator.to_message()
+    assert type(message) is AIMessage
+    assert message.id == "provider-id"
+    assert message.tool_calls == [
+        create_tool_call(
+            name="search",
+            args={"query": "weather in paris", "units": "metric"},
+            id="call_1",
+        )
+    ]
+
+
+def test_accumulator_merges_incrementally() -> None:
+    chunks = _streamed_chunks()
+    accumulator = AIMessageChunkAccumulator(chunks[:3])
+    partial = accumulator.to_chunk()
+    assert partial == chunks[0] + chunks[1:3]
+    accumulator.extend(chunks[3:])
+    assert accumulator.to_chunk() == chunks[0] + chunks[1:]
+
+
+def test_accumulator_empty() -> None:
+    accumulator = AIMessageChunkAccumulator()
+    assert not accumulator
+    assert accumulator.to_chunk() is None
+    with pytest.raises(ValueError, match="No chunks"):
+        accumulator.to_message()
+    accumulator.append(AIMessageChunk(content="hi"))
+    assert accumulator
+    assert accumulator.to_message() == AIMessage(content="hi")
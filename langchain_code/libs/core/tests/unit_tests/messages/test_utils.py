@@ -1,8 +1,9 @@
 import base64
 import json
+import random
 import re
 from collections.abc import Callable, Sequence
-from typing import Any, TypedDict
+from typing import Any, Literal, TypedDict
 
 import pytest
 from typing_extensions import NotRequired, override
@@ -20,6 +21,7 @@ from langchain_core.messages import (
 )
 from langchain_core.messages.utils import (
     MessageLikeRepresentation,
+    cache_token_counts,
     convert_to_messages,
     convert_to_openai_messages,
     count_tokens_approximately,
@@ -752,6 +754,156 @@ def test_trim_messages_token_counter_shortcut_with_options() -> None:
     assert messages == messages_copy
 
 
+def _random_history(rng: random.Random, n: int) -> list[BaseMessage]:
+    messages: list[BaseMessage] = [SystemMessage("system " * rng.randint(1, 5))]
+    for i in range(n):
+        text = "\n".join("word " * rng.randint(1, 6) for _ in range(rng.randint(1, 4)))
+        if i % 3 == 2:
+            messages.append(
+                AIMessage(
+                    [{"type": "text", "text": text}, {"type": "text", "text": "tail"}],
+                    id=f"m{i}",
+                )
+            )
+        elif i % 2:
+            messages.append(AIMessage(text, id=f"m{i}"))
+        else:
+            messages.append(HumanMessage(text, id=f"m{i}"))
+    return messages
+
+
+@pytest.mark.parametrize("strategy", ["first", "last"])
+@pytest.mark.parametrize("allow_partial", [False, True])
+def test_trim_messages_per_message_counter_matches_list_counter(
+    strategy: Literal["first", "last"], *, allow_partial: bool
+) -> None:
+    """Prefix sums over per-message counts trim exactly like a list counter."""
+
+    def count_message(message: BaseMessage) -> int:
+        return count_tokens_approximately([message])
+
+    def count_messages(messages: list[BaseMessage]) -> int:
+        return sum(count_message(message) for message in messages)
+
+    rng = random.Random(0)
+    for _ in range(50):
+        messages = _random_history(rng, rng.randint(0, 30))
+        kwargs: dict[str, Any] = {
+            "max_tokens": rng.randint(0, 200),
+            "strategy": strategy,
+            "allow_partial": allow_partial,
+            "end_on": rng.choice([None, "human", "ai"]),
+        }
+        if strategy == "last":
+            kwargs["include_system"] = rng.random() < 0.5
+            kwargs["start_on"] = rng.choice([None, "human"])
+        expected = trim_messages(messages, token_counter=count_messages, **kwargs)
+        assert trim_messages(messages, token_counter=count_message, **kwargs) == (
+            expected
+        )
+        assert (
+            trim_messages(messages, token_counter="approximate", **kwargs) == expected
+        )
+        assert (
+            trim_messages(messages, token_counter=count_tokens_approximately, **kwargs)
+            == expected
+        )
+
+
+@pytest.mark.parametrize("strategy", ["first", "last"])
+def test_trim_messages_counts_each_message_once(
+    strategy: Literal["first", "last"],
+) -> None:
+    counted: list[BaseMessage] = []
+
+    def count_message(message: BaseMessage) -> int:
+        counted.append(message)
+        return count_tokens_approximately([message])
+
+    messages = _random_history(random.Random(1), 200)
+    kwargs: dict[str, Any] = (
+        {"include_system": True} if strategy == "last" else {"end_on": "human"}
+    )
+    trim_messages(
+        messages,
+        max_tokens=500,
+        token_counter=count_message,
+        strategy=strategy,
+        **kwargs,
+    )
+
+    assert len(counted) == len(messages)
+
+
+def test_trim_messages_detects_postponed_message_annotation() -> None:
+    """Per-message counters with string annotations are summed per message."""
+
+    def count_message(message: "BaseMessage") -> int:
+        return len(message.text)
+
+    messages = [HumanMessage("a" * 10), AIMessage("b" * 10), HumanMessage("c" * 10)]
+    assert (
+        trim_messages(messages, max_tokens=25, token_counter=count_message)
+        == (messages[1:])
+    )
+
+
+def test_cache_token_counts() -> None:
+    counted: list[str] = []
+
+    def count_message(message: BaseMessage) -> int:
+        counted.append(message.text)
+        return len(message.text)
+
+    token_counter = cache_token_counts(count_message, maxsize=2)
+    first = HumanMessage("hello", id="1")
+
+    assert token_counter(first) == 5
+    assert token_counter(first) == 5
+    # An equal copy reuses the count, a changed message with the same ID does not.
+    assert token_counter(HumanMessage("hello", id="1")) == 5
+    assert token_counter(HumanMessage("hello there", id="1")) == 11
+    assert counted == ["hello", "hello there"]
+
+    # Messages without an ID are always counted.
+    token_counter(HumanMessage("no id"))
+    token_counter(HumanMessage("no id"))
+    assert counted[-2:] == ["no id", "no id"]
+
+    # The least recently used count is dropped.
+    token_counter(HumanMessage("two", id="2"))
+    token_counter(HumanMessage("three", id="3"))
+    token_counter(HumanMessage("hello there", id="1"))
+    assert counted[-3:] == ["two", "three", "hello there"]
+
+
+def test_trim_messages_with_cached_token_counts() -> None:
+    """Unchanged history is not counted again on the next turn."""
+    counted: list[BaseMessage] = []
+
+    def count_message(message: BaseMessage) -> int:
+        counted.append(message)
+        return count_tokens_approximately([message])
+
+    token_counter = cache_token_counts(count_message)
+    history = _random_history(random.Random(2), 50)
+    expected = trim_messages(history, max_tokens=300, token_counter=count_message)
+    counted.clear()
+
+    assert (
+        trim_messages(history, max_tokens=300, token_counter=token_counter) == expected
+    )
+    counted.clear()
+    history.append(HumanMessage("one more question", id="new"))
+    trim_messages(history, max_tokens=300, token_counter=token_counter)
+
+    # Only the new message and the system message, which has no ID, are counted.
+    assert sorted(message.text for message in counted) == [
+        "one more question",
+        history[0].text,
+    ]
+
+
 class FakeTokenCountingModel(FakeChatModel):
     @override
     def get_num_tokens_from_messages(
@@ -11,6 +11,9 @@ from langchain_core.output_parsers.json import (
 )
 from langchain_core.utils.function_calling import convert_to_openai_function
 from langchain_core.utils.json import (
+    PartialJsonParser,
+    _parse_partial_json,
+    _PartialJsonStream,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -264,6 +267,69 @@ def test_parse_partial_json(json_strings: tuple[str, str]) -> None:
     assert parsed == json.loads(expected)
 
 
+PARTIAL_JSON_DOCUMENTS = [
+    '{"foo": "bar", "n": -12.5e+3, "ok": [true, false, null], "nested": {"a": []}}',
+    '[1, "two", {"three": [3.0, "\\u00e9\\"x\\\\"]}, -0, {}]',
+    '  {\n  "text": "line one\nline two",\n  "emoji": "\\ud83d\\ude00"\n}  ',
+    '"just a string"',
+    "42",
+    '{"foo": 1}} trailing',
+    '{"foo": tru, "bar": 1}',
+    '{"foo": NaN}',
+    "  ",
+]
+
+
+def _outcome(parse: Any) -> tuple[str, Any]:
+    try:
+        return ("ok", parse())
+    except json.JSONDecodeError as e:
+        return ("error", str(e))
+
+
+@pytest.mark.parametrize("document", PARTIAL_JSON_DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 3])
+@pytest.mark.parametrize("strict", [False, True])
+def test_partial_json_parser_matches_parse_partial_json(
+    document: str, chunk_size: int, *, strict: bool
+) -> None:
+    parser = PartialJsonParser(strict=strict)
+    stream = _PartialJsonStream(strict=strict)
+    for end in range(chunk_size, len(document) + chunk_size, chunk_size):
+        parser.feed(document[end - chunk_size : end])
+        prefix = document[:end]
+        expected = _outcome(lambda: _parse_partial_json(prefix, strict=strict))  # noqa: B023
+        assert _outcome(parser.parse) == expected, prefix
+        assert _outcome(lambda: stream(prefix)) == expected, prefix  # noqa: B023
+        assert _outcome(lambda: parse_partial_json(prefix, strict=strict)) == (  # noqa: B023
+            expected
+        ), prefix
+
+
+def test_partial_json_parser_returns_new_objects() -> None:
+    parser = PartialJsonParser()
+    parser.feed('{"foo": [1, 2')
+    first = parser.parse()
+    first["foo"].append(3)
+    assert parser.parse() == {"foo": [1, 2]}
+
+    stream = _PartialJsonStream()
+    streamed = stream('{"bar": {"baz": "q')
+    streamed["bar"]["baz"] = "changed"
+    assert stream('{"bar": {"baz": "qu') == {"bar": {"baz": "qu"}}
+
+
+def test_partial_json_stream_restarts_on_other_text() -> None:
+    stream = _PartialJsonStream()
+    assert stream('{"a": [1') == {"a": [1]}
+    # Malformed text in between does not lose the progress made so far.
+    with pytest.raises(json.JSONDecodeError):
+        stream('json\n{"a": [1, 2')
+    assert stream('{"a": [1, 2') == {"a": [1, 2]}
+    assert stream('{"b": "x') == {"b": "x"}
+    assert stream('{"b": "xy"}') == {"b": "xy"}
+
+
 STREAMED_TOKENS = """
 {
 
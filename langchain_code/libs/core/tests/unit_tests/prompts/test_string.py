@@ -1,7 +1,12 @@
 import pytest
 from packaging import version
 
-from langchain_core.prompts.string import mustache_schema
+from langchain_core.prompts.string import (
+    _compile_jinja2_template,
+    get_template_variables,
+    jinja2_formatter,
+    mustache_schema,
+)
 from langchain_core.utils.pydantic import PYDANTIC_VERSION
 
 PYDANTIC_VERSION_AT_LEAST_29 = version.parse("2.9") <= PYDANTIC_VERSION
@@ -30,3 +35,37 @@ def test_mustache_schema_parent_child() -> None:
     }
     actual = mustache_schema(template).model_json_schema()
     assert expected == actual
+
+
+def test_jinja2_templates_are_compiled_once() -> None:
+    pytest.importorskip("jinja2")
+    template = "Hello {{ name }}, compiled once!"
+    assert jinja2_formatter(template, name="a") == "Hello a, compiled once!"
+    misses = _compile_jinja2_template.cache_info().misses
+    assert jinja2_formatter(template, name="b") == "Hello b, compiled once!"
+    assert _compile_jinja2_template.cache_info().misses == misses
+
+
+def test_jinja2_sandbox_is_kept_for_cached_templates() -> None:
+    jinja2 = pytest.importorskip("jinja2")
+    template = "{{ obj.__class__.__mro__ }}"
+    for _ in range(2):
+        with pytest.raises(jinja2.exceptions.SecurityError):
+            jinja2_formatter(template, obj=object())
+
+
+@pytest.mark.parametrize(
+    ("template", "template_format", "expected"),
+    [
+        ("{a} {b} {a}", "f-string", ["a", "b"]),
+        ("{{ b }} {{ a }}", "jinja2", ["a", "b"]),
+    ],
+)
+def test_get_template_variables_is_stable_across_calls(
+    template: str, template_format: str, expected: list[str]
+) -> None:
+    if template_format == "jinja2":
+        pytest.importorskip("jinja2")
+    first = get_template_variables(template, template_format)
+    first.append("mutated")
+    assert get_template_variables(template, template_format) == expected
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from langchain_core.rate_limiters import InMemoryConcurrencyLimiter
+
+
+def test_acquire_and_release() -> None:
+    limiter = InMemoryConcurrencyLimiter(max_concurrency=2)
+    assert limiter.acquire(blocking=False)
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+    limiter.release()
+    assert limiter.acquire(blocking=False)
+    limiter.release()
+    limiter.release()
+    assert limiter.in_flight == 0
+    with pytest.raises(ValueError, match="without a matching acquire"):
+        limiter.release()
+
+
+def test_invalid_max_concurrency() -> None:
+    with pytest.raises(ValueError, match="max_concurrency must be greater than 0"):
+        InMemoryConcurrencyLimiter(max_concurrency=0)
+
+
+def test_caps_concurrency_across_threads() -> None:
+    limiter = InMemoryConcurrencyLimiter(max_concurrency=3)
+    lock = threading.Lock()
+    current = 0
+    peak = 0
+
+    def worker() -> None:
+        nonlocal current, peak
+        limiter.acquire()
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        time.sleep(0.01)
+        with lock:
+            current -= 1
+        limiter.release()
+
+    threads = [threading.Thread(target=worker) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+async def test_async_waiters_in_order() -> None:
+    limiter = InMemoryConcurrencyLimiter(max_concurrency=1)
+    order: list[int] = []
+
+    async def worker(i: int) -> None:
+        await limiter.aacquire()
+        order.append(i)
+        await asyncio.sleep(0.001)
+        limiter.release()
+
+    assert await limiter.aacquire()
+    tasks = []
+    for i in range(4):
+        tasks.append(asyncio.create_task(worker(i)))
+        await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2, 3]
+    assert limiter.in_flight == 0
+
+
+async def test_cancelled_waiter_does_not_leak_slot() -> None:
+    limiter = InMemoryConcurrencyLimiter(max_concurrency=1)
+    assert await limiter.aacquire()
+    waiter = asyncio.create_task(limiter.aacquire())
+    await asyncio.sleep(0)
+    # The slot is handed over to the waiter, which is cancelled before it runs.
+    limiter.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.in_flight == 0
+    assert limiter.acquire(blocking=False)
@@ -1,8 +1,11 @@
 """Test rate limiter."""
 
+import asyncio
+import threading
 import time
 
 import pytest
+from blockbuster import BlockBuster
 from freezegun import freeze_time
 
 from langchain_core.rate_limiters import InMemoryRateLimiter
@@ -108,3 +111,112 @@ async def test_async_wait_max_bucket_size() -> None:
         # Assert that sync wait can proceed without blocking
         # since we have enough tokens
         await rate_limiter.aacquire(blocking=True)
+
+
+def test_weighted_acquire() -> None:
+    with freeze_time("2023-01-01 00:00:00") as frozen_time:
+        rate_limiter = InMemoryRateLimiter(requests_per_second=10, max_bucket_size=100)
+        rate_limiter.last = time.time()
+        frozen_time.tick(5)
+        assert rate_limiter.acquire(blocking=False, tokens=30)
+        assert rate_limiter.available_tokens == 20
+        assert not rate_limiter.acquire(blocking=False, tokens=30)
+        assert rate_limiter.acquire(blocking=False, tokens=20)
+
+
+def test_invalid_tokens() -> None:
+    rate_limiter = InMemoryRateLimiter(max_bucket_size=10)
+    with pytest.raises(ValueError, match="tokens must be greater than 0"):
+        rate_limiter.acquire(tokens=0)
+    with pytest.raises(ValueError, match="at most max_bucket_size"):
+        rate_limiter.acquire(tokens=11)
+
+
+def test_wait_time_is_exact() -> None:
+    with freeze_time("2023-01-01 00:00:00") as frozen_time:
+        rate_limiter = InMemoryRateLimiter(requests_per_second=4, max_bucket_size=10)
+        rate_limiter.last = time.time()
+        with rate_limiter._consume_lock:
+            assert rate_limiter._consume(3) == pytest.approx(0.75)
+        frozen_time.tick(0.1)
+        with rate_limiter._consume_lock:
+            assert rate_limiter._consume(3) == pytest.approx(0.65)
+            # At least one whole token must accrue before the bucket is refilled.
+            assert rate_limiter._consume(0.5) == pytest.approx(0.15)
+
+
+def test_blocking_acquire_does_not_poll() -> None:
+    rate_limiter = InMemoryRateLimiter(
+        requests_per_second=50, check_every_n_seconds=1, max_bucket_size=1
+    )
+    tic = time.monotonic()
+    assert rate_limiter.acquire()
+    assert time.monotonic() - tic < 0.5
+
+
+def test_waiters_are_served_in_order() -> None:
+    rate_limiter = InMemoryRateLimiter(requests_per_second=100, max_bucket_size=1)
+    order: list[int] = []
+
+    def worker(i: int) -> None:
+        rate_limiter.acquire()
+        order.append(i)
+
+    threads = []
+    for i in range(5):
+        thread = threading.Thread(target=worker, args=(i,))
+        thread.start()
+        threads.append(thread)
+        # Make sure that each thread is queued before the next one starts.
+        while len(rate_limiter._waiters) + len(order) < i + 1:
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2, 3, 4]
+
+
+async def test_shared_between_threads_and_event_loop() -> None:
+    rate_limiter = InMemoryRateLimiter(requests_per_second=100, max_bucket_size=1)
+    acquired: list[str] = []
+
+    def worker() -> None:
+        rate_limiter.acquire()
+        acquired.append("thread")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    while not rate_limiter._waiters:  # noqa: ASYNC110
+        await asyncio.sleep(0.001)
+    await asyncio.gather(*(rate_limiter.aacquire() for _ in range(3)))
+    acquired.append("loop")
+    await asyncio.to_thread(thread.join)
+    assert acquired == ["thread", "loop"]
+    assert not rate_limiter._waiters
+
+
+async def test_cancelled_waiter_leaves_queue() -> None:
+    rate_limiter = InMemoryRateLimiter(requests_per_second=1, max_bucket_size=1)
+    first = asyncio.create_task(rate_limiter.aacquire())
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(rate_limiter.aacquire())
+    await asyncio.sleep(0.01)
+    assert len(rate_limiter._waiters) == 2
+    first.cancel()
+    second.cancel()
+    await asyncio.gather(first, second, return_exceptions=True)
+    assert not rate_limiter._waiters
+
+
+async def test_sync_acquire_in_event_loop_behind_async_waiter(
+    blockbuster: BlockBuster,
+) -> None:
+    # The sync call below blocks the event loop on purpose.
+    blockbuster.deactivate()
+    rate_limiter = InMemoryRateLimiter(requests_per_second=100, max_bucket_size=1)
+    waiting = asyncio.create_task(rate_limiter.aacquire())
+    while not rate_limiter._waiters:  # noqa: ASYNC110
+        await asyncio.sleep(0.001)
+    # Blocks the event loop, so the waiter ahead in line cannot be served first.
+    assert rate_limiter.acquire()
+    assert await waiting
+    assert not rate_limiter._waiters
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+from freezegun import freeze_time
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.rate_limiters import InMemoryTokenRateLimiter
+
+
+def count_words(messages: list[BaseMessage]) -> int:
+    return sum(len(message.text.split()) for message in messages)
+
+
+def usage(total_tokens: int) -> AIMessage:
+    return AIMessage(
+        content="",
+        usage_metadata={
+            "input_tokens": total_tokens,
+            "output_tokens": 0,
+            "total_tokens": total_tokens,
+        },
+    )
+
+
+@pytest.fixture
+def rate_limiter() -> InMemoryTokenRateLimiter:
+    return InMemoryTokenRateLimiter(tokens_per_minute=600, token_counter=count_words)
+
+
+def test_starts_full(rate_limiter: InMemoryTokenRateLimiter) -> None:
+    assert rate_limiter.available_tokens == 600
+    assert rate_limiter.requests_per_second == 10
+    assert rate_limiter.acquire(blocking=False, tokens=600)
+    assert not rate_limiter.acquire(blocking=False)
+
+
+def test_charges_estimate_and_reconciles(
+    rate_limiter: InMemoryTokenRateLimiter,
+) -> None:
+    with freeze_time("2023-01-01 00:00:00"):
+        reservation = rate_limiter.acquire_request([HumanMessage("one two three four")])
+        assert reservation == 4
+        assert rate_limiter.available_tokens == 596
+
+        # The request used more tokens than estimated.
+        rate_limiter.release_request(reservation, usage(100))
+        assert rate_limiter.available_tokens == 500
+
+        # Unused tokens are refunded.
+        reservation = rate_limiter.acquire_request([HumanMessage("a b c d e")])
+        rate_limiter.release_request(reservation, usage(1))
+        assert rate_limiter.available_tokens == 499
+
+
+def test_no_usage_keeps_estimate(rate_limiter: InMemoryTokenRateLimiter) -> None:
+    reservation = rate_limiter.acquire_request([HumanMessage("one two")])
+    rate_limiter.release_request(reservation, None)
+    rate_limiter.release_request(reservation, AIMessage(content="no usage"))
+    assert rate_limiter.available_tokens == 598
+
+
+def test_debt_delays_next_request(rate_limiter: InMemoryTokenRateLimiter) -> None:
+    with freeze_time("2023-01-01 00:00:00") as frozen_time:
+        reservation = rate_limiter.acquire_request([HumanMessage("hi")])
+        rate_limiter.release_request(reservation, usage(700))
+        assert rate_limiter.available_tokens == -100
+        assert not rate_limiter.acquire(blocking=False, tokens=10)
+        with rate_limiter._consume_lock:
+            assert rate_limiter._consume(10) == pytest.approx(11)
+        frozen_time.tick(11)
+        assert rate_limiter.acquire(blocking=False, tokens=10)
+
+
+def test_estimate_is_capped_by_bucket_size() -> None:
+    rate_limiter = InMemoryTokenRateLimiter(
+        tokens_per_minute=600, max_bucket_size=3, token_counter=count_words
+    )
+    assert rate_limiter.acquire_request([HumanMessage("a b c d e")]) == 3
+
+
+async def test_async_requests(rate_limiter: InMemoryTokenRateLimiter) -> None:
+    tic = time.monotonic()
+    reservation = await rate_limiter.aacquire_request([HumanMessage("a b")])
+    await rate_limiter.arelease_request(reservation, usage(10))
+    assert time.monotonic() - tic < 0.5
+    assert rate_limiter.available_tokens == pytest.approx(590, abs=1)
@@ -1,6 +1,7 @@
 import json
+import threading
 import uuid
-from contextvars import copy_context
+from contextvars import ContextVar, copy_context
 from typing import Any, cast
 
 import pytest
@@ -13,13 +14,23 @@ from langchain_core.callbacks.manager import (
 )
 from langchain_core.callbacks.stdout import StdOutCallbackHandler
 from langchain_core.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-from langchain_core.runnables import RunnableBinding, RunnablePassthrough
+from langchain_core.runnables import (
+    RunnableBinding,
+    RunnableLambda,
+    RunnableParallel,
+    RunnablePassthrough,
+)
 from langchain_core.runnables.config import (
+    ContextThreadPoolExecutor,
+    ExecutorPool,
     RunnableConfig,
     _set_config_context,
     ensure_config,
+    get_executor_for_config,
+    get_executor_pool,
     merge_configs,
     run_in_executor,
+    set_executor_pool,
 )
 from langchain_core.tracers.stdout import ConsoleCallbackHandler
 
@@ -161,3 +172,95 @@ async def test_run_in_executor() -> None:
 
     with pytest.raises(RuntimeError):
         await run_in_executor(None, raises_stop_iter)
+
+
+def test_executor_pool_is_reused() -> None:
+    pool = ExecutorPool(max_workers=4)
+    previous = get_executor_pool()
+    set_executor_pool(pool)
+    try:
+        thread_names: set[str] = set()
+
+        def record(x: int) -> int:
+            thread_names.add(threading.current_thread().name)
+            return x
+
+        runnable = RunnableLambda(record)
+        for _ in range(5):
+            assert runnable.batch(list(range(10))) == list(range(10))
+    finally:
+        set_executor_pool(previous)
+        pool.shutdown()
+
+    assert len(thread_names) <= 4
+    assert all(name.startswith("langchain-executor") for name in thread_names)
+    stats = pool.stats()
+    assert stats["submitted"] == stats["completed"] == 50
+    assert stats["active"] == stats["queued"] == stats["throttled"] == 0
+
+
+def test_executor_pool_respects_max_concurrency() -> None:
+    pool = ExecutorPool(max_workers=8)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    release = threading.Event()
+
+    def work(_: int) -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        release.wait(0.01)
+        with lock:
+            running -= 1
+
+    with pool.executor(max_concurrency=2) as executor:
+        list(executor.map(work, range(20)))
+
+    assert max_running == 2
+    assert pool.stats()["throttled"] == 0
+    pool.shutdown()
+
+
+def test_executor_pool_copies_context() -> None:
+    var: ContextVar[str] = ContextVar("var", default="unset")
+    var.set("parent")
+    pool = ExecutorPool(max_workers=2)
+    with pool.executor() as executor:
+        assert executor.submit(var.get).result() == "parent"
+    pool.shutdown()
+
+
+def test_executor_pool_nested_calls_do_not_deadlock() -> None:
+    pool = ExecutorPool(max_workers=2)
+    previous = get_executor_pool()
+    set_executor_pool(pool)
+    try:
+        inner = RunnableParallel(a=lambda x: x, b=lambda x: x + 1)
+
+        def call_inner(x: int) -> dict[str, int]:
+            return inner.invoke(x)
+
+        outer = RunnableLambda(call_inner)
+        assert outer.batch([1, 2, 3, 4]) == [{"a": i, "b": i + 1} for i in (1, 2, 3, 4)]
+    finally:
+        set_executor_pool(previous)
+        pool.shutdown()
+
+
+def test_executor_pool_large_max_concurrency_uses_dedicated_executor() -> None:
+    pool = ExecutorPool(max_workers=2)
+    with pool.executor(max_concurrency=10) as executor:
+        assert isinstance(executor, ContextThreadPoolExecutor)
+    assert pool.stats()["workers"] == 0
+
+
+def test_get_executor_for_config_without_pool() -> None:
+    previous = get_executor_pool()
+    set_executor_pool(None)
+    try:
+        with get_executor_for_config({"max_concurrency": 3}) as executor:
+            assert isinstance(executor, ContextThreadPoolExecutor)
+    finally:
+        set_executor_pool(previous)
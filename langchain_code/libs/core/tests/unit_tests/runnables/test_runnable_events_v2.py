@@ -48,7 +48,7 @@ from langchain_core.runnables.config import (
 )
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from langchain_core.runnables.schema import StreamEvent
-from langchain_core.runnables.utils import Addable
+from langchain_core.runnables.utils import Addable, _RootEventFilter
 from langchain_core.tools import tool
 from langchain_core.utils.aiter import aclosing
 from tests.unit_tests.runnables.test_runnable_events_v1 import (
@@ -462,6 +462,62 @@ async def test_event_stream_with_triple_lambda_test_filtering() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"include_types": ["chat_model"]},
+        {"include_names": ["my_model", "lookup"]},
+        {"include_tags": ["my_model"], "exclude_types": ["chain"]},
+        {"exclude_types": ["chat_model"]},
+        {"include_types": ["tool", "prompt"], "exclude_tags": ["my_model"]},
+    ],
+)
+async def test_event_stream_filters_match_filtering_all_events(
+    filters: dict[str, list[str]],
+) -> None:
+    @tool
+    def lookup(query: str) -> str:
+        """Look something up."""
+        return query.upper()
+
+    def use_tool(message: BaseMessage) -> str:
+        return str(lookup.invoke(str(message.content)))
+
+    template = ChatPromptTemplate.from_messages([("human", "{question}")]).with_config(
+        {"run_name": "my_template", "tags": ["my_template"]}
+    )
+    model = GenericFakeChatModel(
+        messages=cycle([AIMessage(content="hello big world")])
+    ).with_config({"run_name": "my_model", "tags": ["my_model"]})
+    chain = template | model | RunnableLambda(use_tool).with_config({"tags": ["skip"]})
+
+    def _summary(events: list[StreamEvent]) -> list[tuple[str, str, list[str], Any]]:
+        return [
+            (e["event"], e["name"], e["tags"], e["data"].get("chunk"))
+            for e in events
+            if e["run_id"] != events[0]["run_id"]
+        ]
+
+    everything = await _collect_events(
+        chain.astream_events({"question": "hi"}, version="v2")
+    )
+    event_filter = _RootEventFilter(**filters)
+    expected = [
+        e
+        for e in everything
+        if event_filter.include_event(e, e["event"][3:].rsplit("_", 1)[0])
+    ]
+    filtered = await _collect_events(
+        chain.astream_events({"question": "hi"}, None, version="v2", **filters)
+    )
+
+    assert expected
+    assert [(e["event"], e["name"]) for e in filtered] == [
+        (e["event"], e["name"]) for e in expected
+    ]
+    assert _summary(filtered) == _summary(expected)
+
+
 async def test_event_stream_with_lambdas_from_lambda() -> None:
     as_lambdas = RunnableLambda[Any, dict[str, str]](
         lambda _: {"answer": "goodbye"}
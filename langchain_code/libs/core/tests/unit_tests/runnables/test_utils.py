@@ -3,8 +3,10 @@ from typing import Any
 
 import pytest
 
+from langchain_core.messages import AIMessageChunk
 from langchain_core.runnables.base import RunnableLambda
 from langchain_core.runnables.utils import (
+    _ChunkAccumulator,
     get_function_nonlocals,
     get_lambda_source,
     indent_lines_after_first,
@@ -73,3 +75,62 @@ def test_nonlocals() -> None:
     assert RunnableLambda(my_func3).deps == [agent]
     assert RunnableLambda(my_func4).deps == [global_agent]
     assert RunnableLambda(func).deps == [nl]
+
+
+def _fold_pairwise(chunks: list[Any], *, stop_on_error: bool) -> Any:
+    final = None
+    supported = True
+    for chunk in chunks:
+        if not supported or final is None:
+            final = chunk
+            continue
+        try:
+            final = final + chunk
+        except TypeError:
+            final = chunk
+            supported = not stop_on_error
+    return final
+
+
+@pytest.mark.parametrize("stop_on_error", [False, True])
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [AIMessageChunk(content=str(i)) for i in range(5)],
+        ["a", "b", AIMessageChunk(content="c"), AIMessageChunk(content="d"), "e"],
+        [
+            AIMessageChunk(content="a", additional_kwargs={"x": 1}),
+            AIMessageChunk(content="b"),
+            AIMessageChunk(content="c", additional_kwargs={"x": "one"}),
+            AIMessageChunk(content="d"),
+        ],
+        [None, AIMessageChunk(content="a"), AIMessageChunk(content="b"), None],
+        [{"a": 1}, AIMessageChunk(content="a"), AIMessageChunk(content="b")],
+    ],
+)
+def test_chunk_accumulator_matches_pairwise_fold(
+    chunks: list[Any], *, stop_on_error: bool
+) -> None:
+    accumulator = _ChunkAccumulator(stop_on_error=stop_on_error)
+    for i, chunk in enumerate(chunks):
+        accumulator.add(chunk)
+        assert accumulator.value == _fold_pairwise(
+            chunks[: i + 1], stop_on_error=stop_on_error
+        )
+
+
+def test_chunk_accumulator_merges_messages_once() -> None:
+    calls = 0
+
+    class CountingChunk(AIMessageChunk):
+        def __add__(self, other: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            return super().__add__(other)
+
+    accumulator = _ChunkAccumulator()
+    for i in range(100):
+        accumulator.add(CountingChunk(content=str(i)))
+    assert calls == 0
+    assert accumulator.value.content == "".join(str(i) for i in range(100))
+    assert calls == 1
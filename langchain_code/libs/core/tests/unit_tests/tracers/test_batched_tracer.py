@@ -0,0 +1,127 @@
+"""Test the batched tracers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tracers.batched import (
+    AsyncBatchedTracer,
+    BatchedTracer,
+    DropPolicy,
+    RunEvent,
+)
+
+
+class FakeBatchedTracer(BatchedTracer):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[list[RunEvent]] = []
+        self.persisted = threading.Event()
+
+    def _persist_batch(self, events: list[RunEvent]) -> None:
+        self.batches.append(events)
+        self.persisted.set()
+
+    @property
+    def events(self) -> list[tuple[str, str | None]]:
+        return [(e.kind, e.run.name) for batch in self.batches for e in batch]
+
+
+class FakeAsyncBatchedTracer(AsyncBatchedTracer):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[list[RunEvent]] = []
+
+    def _persist_batch(self, events: list[RunEvent]) -> None:
+        self.batches.append(events)
+
+
+def _nested() -> RunnableLambda[int, int]:
+    inner: RunnableLambda[int, int] = RunnableLambda(lambda x: x + 1, name="inner")
+    return RunnableLambda(lambda x: inner.invoke(x) * 2, name="outer")
+
+
+def test_batched_tracer_records_starts_and_ends() -> None:
+    tracer = FakeBatchedTracer(flush_interval=60)
+
+    assert _nested().invoke(1, {"callbacks": [tracer]}) == 4
+    tracer.flush()
+
+    assert tracer.events == [
+        ("start", "outer"),
+        ("start", "inner"),
+        ("end", "inner"),
+        ("end", "outer"),
+    ]
+    start, *_, end = [e.run for batch in tracer.batches for e in batch]
+    assert start.inputs == {"input": 1}
+    assert not start.outputs
+    assert end.outputs == {"output": 4}
+    assert end.child_runs == []
+    assert [event["name"] for event in start.events] == ["start"]
+    assert [event["name"] for event in end.events] == ["start", "end"]
+
+
+def test_batched_tracer_persists_in_background() -> None:
+    tracer = FakeBatchedTracer(batch_size=2, flush_interval=60)
+
+    _nested().invoke(1, {"callbacks": [tracer]})
+
+    assert tracer.persisted.wait(5)
+    tracer.close()
+    assert all(len(batch) <= 2 for batch in tracer.batches)
+    assert len(tracer.events) == 4
+
+
+@pytest.mark.parametrize(
+    ("drop_policy", "expected"),
+    [
+        ("oldest", [("end", "inner"), ("end", "outer")]),
+        ("newest", [("start", "outer"), ("start", "inner")]),
+    ],
+)
+def test_batched_tracer_drop_policy(
+    drop_policy: DropPolicy, expected: list[tuple[str, str]]
+) -> None:
+    tracer = FakeBatchedTracer(
+        max_buffer_size=2, batch_size=10, flush_interval=60, drop_policy=drop_policy
+    )
+
+    _nested().invoke(1, {"callbacks": [tracer]})
+    tracer.flush()
+
+    assert tracer.events == expected
+    assert tracer.dropped_events == 2
+
+
+def test_batched_tracer_logs_persist_errors(caplog: pytest.LogCaptureFixture) -> None:
+    class FailingTracer(FakeBatchedTracer):
+        def _persist_batch(self, events: list[RunEvent]) -> None:
+            msg = f"boom ({len(events)})"
+            raise ValueError(msg)
+
+    tracer = FailingTracer(flush_interval=60)
+
+    _nested().invoke(1, {"callbacks": [tracer]})
+    tracer.flush()
+
+    assert "Error persisting a batch of 4 runs" in caplog.text
+
+
+async def test_async_batched_tracer() -> None:
+    tracer = FakeAsyncBatchedTracer(flush_interval=60)
+
+    assert await _nested().ainvoke(1, {"callbacks": [tracer]}) == 4
+    await asyncio.to_thread(tracer.close)
+
+    assert [(e.kind, e.run.name) for batch in tracer.batches for e in batch] == [
+        ("start", "outer"),
+        ("start", "inner"),
+        ("end", "inner"),
+        ("end", "outer"),
+    ]
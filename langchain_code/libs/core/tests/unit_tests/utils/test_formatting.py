@@ -1,8 +1,16 @@
 """Tests for langchain_core.utils.formatting."""
 
+from string import Formatter
+from typing import Any
+
 import pytest
 
-from langchain_core.utils.formatting import StrictFormatter, formatter
+from langchain_core.utils.formatting import (
+    StrictFormatter,
+    _compile_format_string,
+    _parse_format_string,
+    formatter,
+)
 
 
 class TestStrictFormatter:
@@ -109,6 +117,69 @@ class TestStrictFormatter:
         fmt.validate_input_variables("Hello, World!", [])
 
 
+class TestCompiledTemplates:
+    """Tests for the cached parsing of format strings."""
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "plain text",
+            "{a} and {b}",
+            "{a}{a}{{b}}",
+            "{a-b} {a b}",
+            "{a!r}",
+            "{a:>8}",
+            "{a:{width}}",
+            "{c.real}",
+            "{a[0]}",
+        ],
+    )
+    def test_matches_string_formatter(self, template: str) -> None:
+        """Test that cached formatting matches `string.Formatter`."""
+        kwargs = {"a": "xy", "b": 2, "c": 1.5, "a-b": 3, "a b": 4, "width": 6}
+        expected = Formatter().vformat(template, (), kwargs)
+        assert formatter.format(template, **kwargs) == expected
+        assert formatter.format(template, **kwargs) == expected
+
+    def test_plain_fields_are_compiled(self) -> None:
+        """Test that only templates with plain named fields take the fast path."""
+        assert _compile_format_string("Hi {name}!") == (("Hi ", "name"), ("!", None))
+        assert _compile_format_string("{name!r}") is None
+        assert _compile_format_string("{name:>4}") is None
+        assert _compile_format_string("{0}") is None
+        assert _compile_format_string("{}") is None
+
+    def test_parse_is_cached(self) -> None:
+        """Test that a template is parsed once across format calls."""
+        template = "{x} cached parse test"
+        for _ in range(3):
+            formatter.format(template, x=1)
+        assert _parse_format_string.cache_info().currsize > 0
+        misses = _parse_format_string.cache_info().misses
+        formatter.format(template, x=2)
+        assert _parse_format_string.cache_info().misses == misses
+
+    def test_missing_variable_raises_key_error(self) -> None:
+        """Test that the fast path raises the same error as `string.Formatter`."""
+        with pytest.raises(KeyError, match="missing"):
+            formatter.format("{missing}")
+
+    def test_invalid_template_raises_value_error(self) -> None:
+        """Test that malformed templates are rejected and not cached."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Single '}'"):
+                formatter.format("oops }")
+
+    def test_subclass_hooks_are_used(self) -> None:
+        """Test that `get_value` and `format_field` overrides still apply."""
+
+        class UpperFormatter(StrictFormatter):
+            def format_field(self, value: Any, format_spec: str) -> str:
+                return str(super().format_field(value, format_spec)).upper()
+
+        assert UpperFormatter().format("{a} {b}", a="x", b="y") == "X Y"
+
+
 class TestFormatterSingleton:
     """Tests for the formatter singleton instance."""
 
@@ -1209,3 +1209,55 @@ def test_convert_to_openai_function_json_schema_missing_title_includes_schema()
     }
     with pytest.raises(ValueError, match="my_field"):
         convert_to_openai_function(schema_without_title)
+
+
+def test_convert_to_openai_function_tool_memo() -> None:
+    """Test that memoized tool conversions are copied and invalidated."""
+
+    @tool
+    def search(query: str, limit: int = 10) -> str:
+        """Search for something."""
+        return query * limit
+
+    first = convert_to_openai_function(search)
+    strict = convert_to_openai_function(search, strict=True)
+    assert strict["parameters"]["additionalProperties"] is False
+    assert convert_to_openai_function(search) == first
+    assert "additionalProperties" not in first["parameters"]
+
+    first["parameters"]["properties"].clear()
+    assert convert_to_openai_function(search)["parameters"]["properties"]
+
+    search.description = "Search the web."
+    assert convert_to_openai_function(search)["description"] == "Search the web."
+
+    class Other(BaseModel):
+        other: int
+
+    search.args_schema = Other
+    assert list(convert_to_openai_function(search)["parameters"]["properties"]) == [
+        "other"
+    ]
+
+
+def test_convert_to_openai_function_tool_memo_dict_schema() -> None:
+    """Test that a dict args schema edited in place is converted again."""
+    schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+    }
+    search = StructuredTool(
+        name="search",
+        description="Search for something.",
+        args_schema=schema,
+        func=lambda query: query,
+    )
+
+    assert list(convert_to_openai_function(search)["parameters"]["properties"]) == [
+        "query"
+    ]
+    schema["properties"]["limit"] = {"type": "integer"}
+    assert list(convert_to_openai_function(search)["parameters"]["properties"]) == [
+        "query",
+        "limit",
+    ]
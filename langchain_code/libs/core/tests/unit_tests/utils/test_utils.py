@@ -447,6 +447,43 @@ def test_merge_lists_all_none() -> None:
     assert result is None
 
 
+def test_merge_dicts_many_matches_pairwise() -> None:
+    """Test that merging many dicts at once matches merging them one by one."""
+    dicts: list[dict[str, Any]] = [
+        {"function_call": {"name": "f", "arguments": ""}, "id": "a", "n": 1},
+        {"function_call": {"arguments": '{"q'}, "id": "a", "n": 1},
+        {"function_call": {"arguments": None}, "model_provider": "p", "x": None},
+        {"function_call": {"arguments": '": 1}'}, "x": "late", "l": ["s"]},
+        {"id": "a", "index": "lc_1", "l": [{"index": 0, "text": "a"}]},
+        {"index": "lc_2", "l": [{"index": 0, "text": "b", "type": "text"}]},
+    ]
+    expected = dicts[0]
+    for right in dicts[1:]:
+        expected = merge_dicts(expected, right)
+    assert merge_dicts(*dicts) == expected
+    assert expected["function_call"] == {"name": "f", "arguments": '{"q": 1}'}
+    assert expected["l"] == ["s", {"index": 0, "text": "ab"}]
+
+
+def test_merge_lists_many_matches_pairwise() -> None:
+    """Test that merging many lists at once matches merging them one by one."""
+    lists: list[list | None] = [
+        [{"index": 0, "type": "text", "text": "a"}],
+        [{"index": 1, "type": "tool_call_chunk", "args": "{", "name": "f"}],
+        [{"index": 0, "type": "text", "text": "b"}],
+        None,
+        [{"index": 1, "type": "tool_call_chunk", "args": "}"}],
+        [{"index": 0, "type": "non_standard", "value": {"type": "x", "y": 1}}],
+        ["plain"],
+    ]
+    expected = lists[0]
+    for other in lists[1:]:
+        expected = merge_lists(expected, other)
+    assert merge_lists(*lists) == expected
+    assert expected is not None
+    assert expected[1]["args"] == "{}"
+
+
 @pytest.mark.parametrize(
     ("left", "right", "expected"),
     [
@@ -1,4 +1,9 @@
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -6,7 +11,14 @@ from langchain_tests.integration_tests.vectorstores import VectorStoreIntegratio
 
 from langchain_core.documents import Document
 from langchain_core.embeddings.fake import DeterministicFakeEmbedding
-from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.structured_query import (
+    Comparator,
+    Comparison,
+    FilterDirective,
+    Operation,
+    Operator,
+)
+from langchain_core.vectorstores import InMemoryVectorStore, in_memory
 from tests.unit_tests.stubs import _any_id_document
 
 
@@ -98,6 +110,130 @@ def test_inmemory_dump_load(tmp_path: Path) -> None:
     assert output == loaded_output
 
 
+def _dump_files(path: Path) -> list[str]:
+    """Return the files of a binary dump, without their generation id."""
+    generation = json.loads((path / "manifest.json").read_text())["generation"]
+    return sorted(p.name.replace(f".{generation}", "") for p in path.iterdir())
+
+
+def test_inmemory_dump_load_binary(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore.from_texts(
+        ["foo", "bar", "baz"],
+        embedding,
+        metadatas=[{"a": 1}, {"doc": Document(page_content="nested")}, {"lc": 2}],
+    )
+    output = store.similarity_search_with_score("foo", k=3)
+
+    store.dump(str(tmp_path / "store"), binary=True)
+    assert _dump_files(tmp_path / "store") == [
+        "documents.jsonl",
+        "ids.json",
+        "manifest.json",
+        "vectors.npy",
+    ]
+
+    loaded_store = InMemoryVectorStore.load(str(tmp_path / "store"), embedding)
+    loaded_output = loaded_store.similarity_search_with_score("foo", k=3)
+    assert [doc for doc, _ in loaded_output] == [doc for doc, _ in output]
+    assert [score for _, score in loaded_output] == pytest.approx(
+        [score for _, score in output], abs=1e-6
+    )
+    assert isinstance(next(iter(loaded_store.store.values()))["vector"], np.memmap)
+
+    # The memory-mapped vectors are copied before the first modification
+    loaded_store.add_texts(["qux"], ids=["qux"])
+    loaded_store.delete([output[0][0].id or ""])
+    assert loaded_store.similarity_search("qux", k=1)[0].id == "qux"
+    assert len(loaded_store.similarity_search("foo", k=10)) == 3
+
+    # A binary dump of a loaded store can be written as JSON too
+    loaded_store.dump(str(tmp_path / "store.json"))
+    reloaded = InMemoryVectorStore.load(str(tmp_path / "store.json"), embedding)
+    assert sorted(reloaded.store) == sorted(loaded_store.store)
+
+
+def test_inmemory_dump_binary_over_loaded_dump(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=16)
+    path = str(tmp_path / "store")
+    texts = ["foo", *(str(i) for i in range(2_000))]
+    InMemoryVectorStore.from_texts(texts, embedding).dump(path, binary=True)
+
+    # The loaded vectors are memory-mapped from the files being replaced
+    loaded_store = InMemoryVectorStore.load(path, embedding)
+    loaded_store.dump(path, binary=True)
+    assert _dump_files(tmp_path / "store") == [
+        "documents.jsonl",
+        "ids.json",
+        "manifest.json",
+        "vectors.npy",
+    ]
+    assert loaded_store.similarity_search("foo", k=1)[0].page_content == "foo"
+
+    reloaded = InMemoryVectorStore.load(path, embedding)
+    assert reloaded.similarity_search("foo", k=1)[0].page_content == "foo"
+    assert sorted(reloaded.store) == sorted(loaded_store.store)
+
+
+def test_inmemory_dump_binary_interrupted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=6)
+    path = str(tmp_path / "store")
+    InMemoryVectorStore.from_texts(["foo", "bar"], embedding, ids=["1", "2"]).dump(
+        path, binary=True
+    )
+    replace_file = in_memory._replace_file
+
+    def fail_on_manifest(target: Path, *args: Any, **kwargs: Any) -> None:
+        if target.name == "manifest.json":
+            msg = "disk full"
+            raise OSError(msg)
+        replace_file(target, *args, **kwargs)
+
+    monkeypatch.setattr(in_memory, "_replace_file", fail_on_manifest)
+    with pytest.raises(OSError, match="disk full"):
+        InMemoryVectorStore.from_texts(
+            ["baz", "qux", "quux"], embedding, ids=["3", "4", "5"]
+        ).dump(path, binary=True)
+
+    # The data files of the interrupted dump are not used.
+    loaded_store = InMemoryVectorStore.load(path, embedding)
+    assert {id_: entry["text"] for id_, entry in loaded_store.store.items()} == {
+        "1": "foo",
+        "2": "bar",
+    }
+    assert loaded_store.similarity_search("bar", k=1)[0].id == "2"
+
+
+def test_inmemory_assigned_store_is_copied() -> None:
+    embedding = DeterministicFakeEmbedding(size=6)
+    entries = InMemoryVectorStore.from_texts(["foo"], embedding, ids=["1"]).store
+    store = InMemoryVectorStore(embedding)
+    plain = dict(entries)
+    store.store = plain
+    plain["2"] = {**entries["1"], "id": "2"}
+    assert list(store.store) == ["1"]
+    store.store["2"] = plain["2"]
+    assert {doc.id for doc in store.similarity_search("foo", k=2)} == {"1", "2"}
+
+
+def test_inmemory_dump_load_binary_empty(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=6)
+    InMemoryVectorStore(embedding).dump(str(tmp_path / "store"), binary=True)
+
+    loaded_store = InMemoryVectorStore.load(
+        str(tmp_path / "store"), embedding, mmap=False
+    )
+    assert loaded_store.store == {}
+    loaded_store.add_texts(["foo"])
+    assert loaded_store.similarity_search("foo", k=1)[0].page_content == "foo"
+
+
 async def test_inmemory_filter() -> None:
     """Test end to end construction and search with filter."""
     store = await InMemoryVectorStore.afrom_texts(
@@ -220,3 +356,287 @@ async def test_inmemory_call_embeddings_async() -> None:
     # Ensure the async embedding function is called
     assert embeddings_mock.aembed_documents.await_count == 1
     assert embeddings_mock.aembed_query.await_count == 1
+
+
+def test_inmemory_batch_search_matches_single_search() -> None:
+    embedding = DeterministicFakeEmbedding(size=8)
+    store = InMemoryVectorStore.from_texts([f"text {i}" for i in range(20)], embedding)
+    queries = [embedding.embed_query(f"text {i}") for i in (0, 5, 7)]
+
+    batched = store.similarity_search_with_score_by_vectors(queries, k=3)
+
+    for hits, query in zip(batched, queries, strict=True):
+        expected = store.similarity_search_with_score_by_vector(query, k=3)
+        assert [doc for doc, _ in hits] == [doc for doc, _ in expected]
+        assert [score for _, score in hits] == pytest.approx(
+            [score for _, score in expected]
+        )
+    assert [hits[0][0].page_content for hits in batched] == [
+        "text 0",
+        "text 5",
+        "text 7",
+    ]
+
+
+def test_inmemory_search_after_mutations() -> None:
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore(embedding=embedding)
+    store.add_texts(["foo", "bar", "baz"], ids=["1", "2", "3"])
+    # Build the vector matrix, then mutate the store through every entry point.
+    assert store.similarity_search("foo", k=1)[0].id == "1"
+
+    store.delete(["1"])
+    assert [doc.id for doc in store.similarity_search("foo", k=3)] != []
+    assert "1" not in {doc.id for doc in store.similarity_search("foo", k=3)}
+
+    store.add_texts(["foo"], ids=["2"])
+    assert store.similarity_search("foo", k=1)[0].id == "2"
+
+    store.store["4"] = {
+        "id": "4",
+        "vector": embedding.embed_query("qux"),
+        "text": "qux",
+        "metadata": {},
+    }
+    assert store.similarity_search("qux", k=1)[0].id == "4"
+
+    del store.store["4"]
+    store.store.update(
+        {"5": {"id": "5", "vector": [1.0] * 6, "text": "ones", "metadata": {}}}
+    )
+    assert {doc.id for doc in store.similarity_search("qux", k=10)} == {"2", "3", "5"}
+
+    store.store = {}
+    assert store.similarity_search("foo") == []
+
+
+def test_inmemory_add_from_threads() -> None:
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore(embedding=embedding)
+    store.add_texts(["foo"], ids=["0"])
+    # Build the vector matrix, so that every add also updates it.
+    assert store.similarity_search("foo", k=1)[0].id == "0"
+    vectors = {
+        f"{worker}-{i}": embedding.embed_query(f"text {worker} {i}")
+        for worker in range(8)
+        for i in range(250)
+    }
+
+    def add(worker: int) -> None:
+        for i in range(250):
+            id_ = f"{worker}-{i}"
+            store.store[id_] = {
+                "id": id_,
+                "vector": vectors[id_],
+                "text": id_,
+                "metadata": {},
+            }
+
+    # Switch threads as often as possible to surface races.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(add, range(8)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    for id_, vector in vectors.items():
+        assert store.similarity_search_by_vector(vector, k=1)[0].id == id_
+
+
+def test_inmemory_ivf_first_searches_from_threads() -> None:
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    store = InMemoryVectorStore(DeterministicFakeEmbedding(size=8), index="ivf")
+    store.store = {
+        str(i): {"id": str(i), "vector": vector, "text": str(i), "metadata": {}}
+        for i, vector in enumerate(rng.normal(size=(20_000, 8)).tolist())
+    }
+    barrier = threading.Barrier(8)
+
+    def search(i: int) -> str | None:
+        barrier.wait()
+        return store.similarity_search_by_vector(store.store[str(i)]["vector"])[0].id
+
+    # The index is trained by the first search, which all threads run at once.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(search, range(8))) == [str(i) for i in range(8)]
+
+
+def test_inmemory_filter_k_larger_than_matches() -> None:
+    store = InMemoryVectorStore.from_texts(
+        ["foo", "bar", "baz"],
+        DeterministicFakeEmbedding(size=6),
+        metadatas=[{"keep": True}, {"keep": False}, {"keep": True}],
+    )
+
+    output = store.similarity_search("foo", k=10, filter=lambda d: d.metadata["keep"])
+
+    assert sorted(doc.page_content for doc in output) == ["baz", "foo"]
+    assert store.similarity_search("foo", filter=lambda _: False) == []
+
+
+@pytest.fixture
+def metadata_store() -> InMemoryVectorStore:
+    return InMemoryVectorStore.from_texts(
+        ["apple", "banana", "cherry", "date", "elderberry"],
+        DeterministicFakeEmbedding(size=6),
+        metadatas=[
+            {"color": "red", "price": 1.5, "tags": ["fruit", "tree"]},
+            {"color": "yellow", "price": 0.5, "tags": ["fruit"]},
+            {"color": "red", "price": 3},
+            {"color": "brown", "price": "n/a"},
+            {"price": 10},
+        ],
+        ids=["a", "b", "c", "d", "e"],
+    )
+
+
+@pytest.mark.parametrize(
+    ("directive", "expected"),
+    [
+        (Comparison(comparator=Comparator.EQ, attribute="color", value="red"), "ac"),
+        (Comparison(comparator=Comparator.NE, attribute="color", value="red"), "bd"),
+        (Comparison(comparator=Comparator.EQ, attribute="price", value=3), "c"),
+        (Comparison(comparator=Comparator.GT, attribute="price", value=1), "ace"),
+        (Comparison(comparator=Comparator.LTE, attribute="price", value=1.5), "ab"),
+        (Comparison(comparator=Comparator.GTE, attribute="color", value="r"), "abc"),
+        (
+            Comparison(comparator=Comparator.IN, attribute="color", value=["red"]),
+            "ac",
+        ),
+        (
+            Comparison(comparator=Comparator.NIN, attribute="color", value=["red"]),
+            "bd",
+        ),
+        (
+            Comparison(comparator=Comparator.CONTAIN, attribute="tags", value="tree"),
+            "a",
+        ),
+        (Comparison(comparator=Comparator.LIKE, attribute="color", value="%e%"), "abc"),
+        (
+            Operation(
+                operator=Operator.AND,
+                arguments=[
+                    Comparison(
+                        comparator=Comparator.EQ, attribute="color", value="red"
+                    ),
+                    Comparison(comparator=Comparator.LT, attribute="price", value=2),
+                ],
+            ),
+            "a",
+        ),
+        (
+            Operation(
+                operator=Operator.OR,
+                arguments=[
+                    Comparison(
+                        comparator=Comparator.EQ, attribute="color", value="red"
+                    ),
+                    Comparison(comparator=Comparator.GT, attribute="price", value=5),
+                ],
+            ),
+            "ace",
+        ),
+        (
+            Operation(
+                operator=Operator.NOT,
+                arguments=[
+                    Comparison(comparator=Comparator.EQ, attribute="color", value="red")
+                ],
+            ),
+            "bde",
+        ),
+    ],
+)
+def test_inmemory_filter_directive(
+    metadata_store: InMemoryVectorStore, directive: FilterDirective, expected: str
+) -> None:
+    output = metadata_store.similarity_search("apple", k=10, filter=directive)
+    assert sorted(doc.id or "" for doc in output) == list(expected)
+
+
+def test_inmemory_filter_directive_cache(metadata_store: InMemoryVectorStore) -> None:
+    directive = Comparison(comparator=Comparator.EQ, attribute="color", value="red")
+    first = metadata_store.similarity_search("apple", k=10, filter=directive)
+    # An equal expression built separately hits the cached mask.
+    same = Comparison(comparator=Comparator.EQ, attribute="color", value="red")
+    assert metadata_store.similarity_search("apple", k=10, filter=same) == first
+
+    metadata_store.add_texts(["fig"], metadatas=[{"color": "red"}], ids=["f"])
+    output = metadata_store.similarity_search("apple", k=10, filter=directive)
+    assert sorted(doc.id or "" for doc in output) == ["a", "c", "f"]
+
+    metadata_store.delete(["a"])
+    output = metadata_store.similarity_search("apple", k=10, filter=directive)
+    assert sorted(doc.id or "" for doc in output) == ["c", "f"]
+
+
+def _random_ivf_store(n: int = 2000) -> InMemoryVectorStore:
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    store = InMemoryVectorStore(
+        DeterministicFakeEmbedding(size=8), index="ivf", n_lists=10, n_probe=3
+    )
+    store.store = {
+        str(i): {"id": str(i), "vector": vector, "text": str(i), "metadata": {"i": i}}
+        for i, vector in enumerate(rng.normal(size=(n, 8)).tolist())
+    }
+    return store
+
+
+def test_inmemory_ivf_search() -> None:
+    store = _random_ivf_store()
+    exact = InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+    exact.store = dict(store.store)
+    query = store.store["42"]["vector"]
+
+    output = store.similarity_search_by_vector(query, k=5)
+    assert output[0].id == "42"
+    # Probing every list is exact
+    assert store.similarity_search_by_vector(
+        query, k=5, n_probe=10
+    ) == exact.similarity_search_by_vector(query, k=5)
+
+
+def test_inmemory_ivf_incremental_updates() -> None:
+    store = _random_ivf_store()
+    # Train the index
+    store.similarity_search_by_vector(store.store["0"]["vector"], k=1)
+
+    store.store["new"] = {
+        "id": "new",
+        "vector": [1.0, -2.0, 3.0, -4.0, 5.0, -6.0, 7.0, -8.0],
+        "text": "new",
+        "metadata": {},
+    }
+    output = store.similarity_search_by_vector(store.store["new"]["vector"], k=1)
+    assert output[0].id == "new"
+
+    store.delete(["new", "7"])
+    output = store.similarity_search_by_vector(store.store["8"]["vector"], k=1)
+    assert output[0].id == "8"
+    assert "7" not in {
+        doc.id for doc in store.similarity_search_by_vector([1.0] * 8, k=100)
+    }
+
+
+def test_inmemory_ivf_filter() -> None:
+    store = _random_ivf_store()
+    query = store.store["42"]["vector"]
+
+    # Too few matches in the probed lists falls back to an exact search
+    output = store.similarity_search_by_vector(
+        query,
+        k=3,
+        filter=Comparison(comparator=Comparator.IN, attribute="i", value=[1, 2, 3]),
+    )
+    assert sorted(doc.id or "" for doc in output) == ["1", "2", "3"]
+
+
+def test_inmemory_invalid_index() -> None:
+    with pytest.raises(ValueError, match="index must be"):
+        InMemoryVectorStore(DeterministicFakeEmbedding(size=8), index="hnsw")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="n_probe"):
+        InMemoryVectorStore(DeterministicFakeEmbedding(size=8), index="ivf", n_probe=0)
@@ -7,7 +7,12 @@ import pytest
 pytest.importorskip("numpy")
 import numpy as np
 
-from langchain_core.vectorstores.utils import _cosine_similarity
+from langchain_core.vectorstores.utils import (
+    _cosine_similarity,
+    _IVFIndex,
+    _top_k_indices,
+    _VectorMatrix,
+)
 
 
 class TestCosineSimilarity:
@@ -162,3 +167,87 @@ class TestCosineSimilarity:
             ]
         )
         np.testing.assert_array_almost_equal(result, expected)
+
+
+class TestVectorMatrix:
+    """Tests for the _VectorMatrix and _top_k_indices helpers."""
+
+    def test_top_k_indices(self) -> None:
+        scores = np.array([[0.1, 0.9, 0.5, 0.7], [0.4, 0.3, 0.2, 0.1]])
+        np.testing.assert_array_equal(
+            _top_k_indices(scores, 2), np.array([[1, 3], [0, 1]])
+        )
+        np.testing.assert_array_equal(
+            _top_k_indices(scores[0], 10), np.array([1, 3, 2, 0])
+        )
+        assert _top_k_indices(scores, 0).shape == (2, 0)
+
+    def test_upsert_and_remove(self) -> None:
+        matrix = _VectorMatrix(dim=2)
+        for i in range(20):
+            matrix.upsert(str(i), [float(i), 1.0])
+        matrix.upsert("3", [0.0, 2.0])
+        matrix.remove("0")
+        matrix.remove("missing")
+
+        assert len(matrix) == 19
+        assert sorted(matrix.ids, key=int) == [str(i) for i in range(1, 20)]
+        for id_, position in matrix.positions.items():
+            assert matrix.ids[position] == id_
+        np.testing.assert_array_equal(
+            matrix.vectors[matrix.positions["3"]], np.array([0.0, 2.0])
+        )
+        np.testing.assert_allclose(
+            matrix.norms, np.linalg.norm(matrix.vectors, axis=1), rtol=1e-6
+        )
+
+    def test_cosine_similarity_matches_reference(self) -> None:
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(50, 8))
+        vectors[3] = 0.0
+        queries = rng.normal(size=(4, 8))
+        matrix = _VectorMatrix.from_vectors([str(i) for i in range(50)], vectors)
+
+        np.testing.assert_allclose(
+            matrix.cosine_similarity(queries),
+            _cosine_similarity(queries, vectors),
+            atol=1e-6,
+        )
+
+    def test_rejects_wrong_dimension(self) -> None:
+        matrix = _VectorMatrix(dim=3)
+        with pytest.raises(ValueError, match="dimension 3"):
+            matrix.upsert("a", [1.0, 2.0])
+        with pytest.raises(ValueError, match="Number of columns"):
+            matrix.cosine_similarity([[1.0, 2.0]])
+
+
+class TestIVFIndex:
+    """Tests for the _IVFIndex helper."""
+
+    def test_train_and_candidates(self) -> None:
+        rng = np.random.default_rng(0)
+        centers = np.eye(4) * 10
+        vectors = np.repeat(centers, 100, axis=0) + rng.normal(size=(400, 4))
+        matrix = _VectorMatrix.from_vectors([str(i) for i in range(400)], vectors)
+        matrix.ivf = _IVFIndex(n_lists=4, n_probe=1)
+
+        # Not enough vectors per list to train yet
+        matrix.ivf.maybe_train(_VectorMatrix.from_vectors(["a"], vectors[:1]))
+        assert matrix.ivf.centroids is None
+
+        matrix.ivf.maybe_train(matrix)
+        assert matrix.ivf.centroids is not None
+        rows = matrix.ivf.candidate_rows(matrix, centers[2])
+        assert rows is not None
+        assert set(rows.tolist()) == set(range(200, 300))
+        assert matrix.ivf.candidate_rows(matrix, centers[2], n_probe=4) is None
+
+        matrix.upsert("new", centers[3])
+        rows = matrix.ivf.candidate_rows(matrix, centers[3])
+        assert rows is not None
+        assert matrix.positions["new"] in rows.tolist()
+        matrix.remove("0")
+        rows = matrix.ivf.candidate_rows(matrix, centers[3])
+        assert rows is not None
+        assert matrix.positions["new"] in rows.tolist()
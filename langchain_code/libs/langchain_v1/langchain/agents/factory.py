@@ -47,6 +47,7 @@ from langchain.agents.structured_output import (
     ToolStrategy,
 )
 from langchain.chat_models import init_chat_model
+from langchain.chat_models.base import _freeze, _ModelCache
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable, Sequence
@@ -1014,8 +1015,40 @@ def create_agent(
 
         return {"messages": [output]}
 
+    # Bound models, reused across model calls with the same model, tools, tool choice,
+    # response format and settings, since binding converts every tool to a schema.
+    bound_models: _ModelCache[tuple[Runnable[Any, Any], ResponseFormat[Any] | None]] = _ModelCache()
+
     def _get_bound_model(
         request: ModelRequest,
+    ) -> tuple[Runnable[Any, Any], ResponseFormat[Any] | None]:
+        """Get the model with appropriate tool bindings, reusing cached bindings.
+
+        Args:
+            request: The model request containing model, tools, and response format.
+
+        Returns:
+            Tuple of `(bound_model, effective_response_format)`.
+        """
+        # Tools are compared by identity, plus the fields their schema is built from
+        # so that a tool modified in place is bound again.
+        tools = [
+            (t, t.name, t.description, t.args_schema) if isinstance(t, BaseTool) else t
+            for t in request.tools
+        ]
+        key = _freeze(
+            (
+                request.model,
+                tools,
+                request.tool_choice,
+                request.response_format,
+                request.model_settings,
+            )
+        )
+        return bound_models.get_or_create(key, lambda: _bind_model(request))
+
+    def _bind_model(
+        request: ModelRequest,
     ) -> tuple[Runnable[Any, Any], ResponseFormat[Any] | None]:
         """Get the model with appropriate tool bindings.
 
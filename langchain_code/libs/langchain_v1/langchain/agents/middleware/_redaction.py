@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import ipaddress
+import itertools
 import operator
 import re
-from collections.abc import Callable, Sequence
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import Literal
 from urllib.parse import urlparse
@@ -47,6 +51,105 @@ Detector = Callable[[str], list[PIIMatch]]
 """Callable signature for detectors that locate sensitive values."""
 
 
+@dataclass(frozen=True)
+class _PatternSpec:
+    """Regex patterns for a built-in PII type and how their matches are validated."""
+
+    patterns: tuple[re.Pattern[str], ...]
+    collect: Callable[[Sequence[Iterable[re.Match[str]]]], list[PIIMatch]]
+    """Builds the detected matches from the regex matches of each pattern, in order."""
+
+    def detect(self, content: str) -> list[PIIMatch]:
+        return self.collect([pattern.finditer(content) for pattern in self.patterns])
+
+
+def _collect_matches(
+    pii_type: str, found: Iterable[re.Match[str]], validate: Callable[[str], bool] | None = None
+) -> list[PIIMatch]:
+    return [
+        PIIMatch(type=pii_type, value=match.group(), start=match.start(), end=match.end())
+        for match in found
+        if validate is None or validate(match.group())
+    ]
+
+
+def _is_ip_address(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _collect_urls(found: Sequence[Iterable[re.Match[str]]]) -> list[PIIMatch]:
+    scheme_found, bare_found = found
+    matches: list[PIIMatch] = []
+
+    # Pattern 1: URLs with scheme (http:// or https://)
+    for match in scheme_found:
+        url = match.group()
+        result = urlparse(url)
+        if result.scheme in {"http", "https"} and result.netloc:
+            matches.append(PIIMatch(type="url", value=url, start=match.start(), end=match.end()))
+
+    # Pattern 2: URLs without scheme (www.example.com or example.com/path).
+    # Bare matches never overlap each other, so only URLs with a scheme, which are
+    # sorted and disjoint, need to be checked.
+    scheme_starts = [m["start"] for m in matches]
+    scheme_ends = [m["end"] for m in matches]
+    for match in bare_found:
+        start, end = match.start(), match.end()
+        # Skip if already matched with scheme
+        before = bisect.bisect_right(scheme_starts, start) - 1
+        if before >= 0 and start < scheme_ends[before]:
+            continue
+        before = bisect.bisect_left(scheme_starts, end) - 1
+        if before >= 0 and end <= scheme_ends[before]:
+            continue
+
+        url = match.group()
+        # Only accept if it has a path or starts with www
+        # This reduces false positives like "example.com" in prose
+        if "/" in url or url.startswith("www."):
+            # Add scheme for validation (required for urlparse to work correctly)
+            test_url = f"http://{url}"
+            result = urlparse(test_url)
+            if result.netloc and "." in result.netloc:
+                matches.append(PIIMatch(type="url", value=url, start=start, end=end))
+
+    return matches
+
+
+# URLs without scheme. More conservative to avoid false positives
+_BARE_URL_PATTERN = re.compile(
+    r"\b(?:www\.)?[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+(?:/[^\s]*)?"
+)
+
+_BUILTIN_PATTERNS: dict[str, _PatternSpec] = {
+    "email": _PatternSpec(
+        (re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),),
+        lambda found: _collect_matches("email", found[0]),
+    ),
+    "credit_card": _PatternSpec(
+        (re.compile(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"),),
+        lambda found: _collect_matches("credit_card", found[0], _passes_luhn),
+    ),
+    "ip": _PatternSpec(
+        (re.compile(r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b"),),
+        lambda found: _collect_matches("ip", found[0], _is_ip_address),
+    ),
+    "mac_address": _PatternSpec(
+        (re.compile(r"\b([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}\b"),),
+        lambda found: _collect_matches("mac_address", found[0]),
+    ),
+    "url": _PatternSpec(
+        (re.compile(r"https?://[^\s<>\"{}|\\^`\[\]]+"), _BARE_URL_PATTERN),
+        _collect_urls,
+    ),
+}
+
+
 def detect_email(content: str) -> list[PIIMatch]:
     """Detect email addresses in content.
 
@@ -56,16 +159,7 @@ def detect_email(content: str) -> list[PIIMatch]:
     Returns:
         A list of detected email matches.
     """
-    pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    return [
-        PIIMatch(
-            type="email",
-            value=match.group(),
-            start=match.start(),
-            end=match.end(),
-        )
-        for match in re.finditer(pattern, content)
-    ]
+    return _BUILTIN_PATTERNS["email"].detect(content)
 
 
 def detect_credit_card(content: str) -> list[PIIMatch]:
@@ -77,22 +171,7 @@ def detect_credit_card(content: str) -> list[PIIMatch]:
     Returns:
         A list of detected credit card matches.
     """
-    pattern = r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"
-    matches = []
-
-    for match in re.finditer(pattern, content):
-        card_number = match.group()
-        if _passes_luhn(card_number):
-            matches.append(
-                PIIMatch(
-                    type="credit_card",
-                    value=card_number,
-                    start=match.start(),
-                    end=match.end(),
-                )
-            )
-
-    return matches
+    return _BUILTIN_PATTERNS["credit_card"].detect(content)
 
 
 def detect_ip(content: str) -> list[PIIMatch]:
@@ -104,25 +183,7 @@ def detect_ip(content: str) -> list[PIIMatch]:
     Returns:
         A list of detected IP address matches.
     """
-    matches: list[PIIMatch] = []
-    ipv4_pattern = r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b"
-
-    for match in re.finditer(ipv4_pattern, content):
-        ip_candidate = match.group()
-        try:
-            ipaddress.ip_address(ip_candidate)
-        except ValueError:
-            continue
-        matches.append(
-            PIIMatch(
-                type="ip",
-                value=ip_candidate,
-                start=match.start(),
-                end=match.end(),
-            )
-        )
-
-    return matches
+    return _BUILTIN_PATTERNS["ip"].detect(content)
 
 
 def detect_mac_address(content: str) -> list[PIIMatch]:
@@ -134,16 +195,7 @@ def detect_mac_address(content: str) -> list[PIIMatch]:
     Returns:
         A list of detected MAC address matches.
     """
-    pattern = r"\b([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}\b"
-    return [
-        PIIMatch(
-            type="mac_address",
-            value=match.group(),
-            start=match.start(),
-            end=match.end(),
-        )
-        for match in re.finditer(pattern, content)
-    ]
+    return _BUILTIN_PATTERNS["mac_address"].detect(content)
 
 
 def detect_url(content: str) -> list[PIIMatch]:
@@ -155,55 +207,7 @@ def detect_url(content: str) -> list[PIIMatch]:
     Returns:
         A list of detected URL matches.
     """
-    matches: list[PIIMatch] = []
-
-    # Pattern 1: URLs with scheme (http:// or https://)
-    scheme_pattern = r"https?://[^\s<>\"{}|\\^`\[\]]+"
-
-    for match in re.finditer(scheme_pattern, content):
-        url = match.group()
-        result = urlparse(url)
-        if result.scheme in {"http", "https"} and result.netloc:
-            matches.append(
-                PIIMatch(
-                    type="url",
-                    value=url,
-                    start=match.start(),
-                    end=match.end(),
-                )
-            )
-
-    # Pattern 2: URLs without scheme (www.example.com or example.com/path)
-    # More conservative to avoid false positives
-    bare_pattern = (
-        r"\b(?:www\.)?[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
-        r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+(?:/[^\s]*)?"
-    )
-
-    for match in re.finditer(bare_pattern, content):
-        start, end = match.start(), match.end()
-        # Skip if already matched with scheme
-        if any(m["start"] <= start < m["end"] or m["start"] < end <= m["end"] for m in matches):
-            continue
-
-        url = match.group()
-        # Only accept if it has a path or starts with www
-        # This reduces false positives like "example.com" in prose
-        if "/" in url or url.startswith("www."):
-            # Add scheme for validation (required for urlparse to work correctly)
-            test_url = f"http://{url}"
-            result = urlparse(test_url)
-            if result.netloc and "." in result.netloc:
-                matches.append(
-                    PIIMatch(
-                        type="url",
-                        value=url,
-                        start=start,
-                        end=end,
-                    )
-                )
-
-    return matches
+    return _BUILTIN_PATTERNS["url"].detect(content)
 
 
 BUILTIN_DETECTORS: dict[str, Detector] = {
@@ -236,71 +240,112 @@ def _passes_luhn(card_number: str) -> bool:
     return checksum % 10 == 0
 
 
-def _apply_redact_strategy(content: str, matches: list[PIIMatch]) -> str:
+class _ScanCache:
+    """LRU of detector results keyed by a digest of the scanned content."""
+
+    def __init__(self, detector: Detector, maxsize: int) -> None:
+        self._detector = detector
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, list[PIIMatch]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def detect(self, content: str) -> list[PIIMatch]:
+        """Return the matches in content, scanning it only on a miss.
+
+        Args:
+            content: The text content to scan.
+
+        Returns:
+            The detected matches.
+        """
+        key = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            matches = self._entries.get(key)
+            if matches is not None:
+                self._entries.move_to_end(key)
+                return list(matches)
+        matches = self._detector(content)
+        with self._lock:
+            self._entries[key] = matches
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return list(matches)
+
+
+def _replace_matches(
+    content: str, matches: list[PIIMatch], replacement: Callable[[PIIMatch], str]
+) -> str:
+    ordered = sorted(matches, key=operator.itemgetter("start"))
+    if all(
+        previous["start"] < match["start"] and previous["end"] <= match["start"]
+        for previous, match in itertools.pairwise(ordered)
+    ):
+        parts: list[str] = []
+        end = 0
+        for match in ordered:
+            parts.extend((content[end : match["start"]], replacement(match)))
+            end = match["end"]
+        parts.append(content[end:])
+        return "".join(parts)
+    # Overlapping matches are replaced one at a time, starting from the last one.
     result = content
     for match in sorted(matches, key=operator.itemgetter("start"), reverse=True):
-        replacement = f"[REDACTED_{match['type'].upper()}]"
-        result = result[: match["start"]] + replacement + result[match["end"] :]
+        result = result[: match["start"]] + replacement(match) + result[match["end"] :]
     return result
 
 
+def _apply_redact_strategy(content: str, matches: list[PIIMatch]) -> str:
+    return _replace_matches(content, matches, lambda match: f"[REDACTED_{match['type'].upper()}]")
+
+
 _UNMASKED_CHAR_NUMBER = 4
 _IPV4_PARTS_NUMBER = 4
 
 
-def _apply_mask_strategy(content: str, matches: list[PIIMatch]) -> str:
-    result = content
-    for match in sorted(matches, key=operator.itemgetter("start"), reverse=True):
-        value = match["value"]
-        pii_type = match["type"]
-        if pii_type == "email":
-            parts = value.split("@")
-            if len(parts) == 2:  # noqa: PLR2004
-                domain_parts = parts[1].split(".")
-                masked = (
-                    f"{parts[0]}@****.{domain_parts[-1]}"
-                    if len(domain_parts) > 1
-                    else f"{parts[0]}@****"
-                )
-            else:
-                masked = "****"
-        elif pii_type == "credit_card":
-            digits_only = "".join(c for c in value if c.isdigit())
-            separator = "-" if "-" in value else " " if " " in value else ""
-            if separator:
-                masked = (
-                    f"****{separator}****{separator}****{separator}"
-                    f"{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
-                )
-            else:
-                masked = f"************{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
-        elif pii_type == "ip":
-            octets = value.split(".")
-            masked = f"*.*.*.{octets[-1]}" if len(octets) == _IPV4_PARTS_NUMBER else "****"
-        elif pii_type == "mac_address":
-            separator = ":" if ":" in value else "-"
-            masked = (
-                f"**{separator}**{separator}**{separator}**{separator}**{separator}{value[-2:]}"
+def _mask_value(match: PIIMatch) -> str:
+    value = match["value"]
+    pii_type = match["type"]
+    if pii_type == "email":
+        parts = value.split("@")
+        if len(parts) == 2:  # noqa: PLR2004
+            domain_parts = parts[1].split(".")
+            return (
+                f"{parts[0]}@****.{domain_parts[-1]}"
+                if len(domain_parts) > 1
+                else f"{parts[0]}@****"
             )
-        elif pii_type == "url":
-            masked = "[MASKED_URL]"
-        else:
-            masked = (
-                f"****{value[-_UNMASKED_CHAR_NUMBER:]}"
-                if len(value) > _UNMASKED_CHAR_NUMBER
-                else "****"
+        return "****"
+    if pii_type == "credit_card":
+        digits_only = "".join(c for c in value if c.isdigit())
+        separator = "-" if "-" in value else " " if " " in value else ""
+        if separator:
+            return (
+                f"****{separator}****{separator}****{separator}"
+                f"{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
             )
-        result = result[: match["start"]] + masked + result[match["end"] :]
-    return result
+        return f"************{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
+    if pii_type == "ip":
+        octets = value.split(".")
+        return f"*.*.*.{octets[-1]}" if len(octets) == _IPV4_PARTS_NUMBER else "****"
+    if pii_type == "mac_address":
+        separator = ":" if ":" in value else "-"
+        return f"**{separator}**{separator}**{separator}**{separator}**{separator}{value[-2:]}"
+    if pii_type == "url":
+        return "[MASKED_URL]"
+    return f"****{value[-_UNMASKED_CHAR_NUMBER:]}" if len(value) > _UNMASKED_CHAR_NUMBER else "****"
+
+
+def _apply_mask_strategy(content: str, matches: list[PIIMatch]) -> str:
+    return _replace_matches(content, matches, _mask_value)
 
 
 def _apply_hash_strategy(content: str, matches: list[PIIMatch]) -> str:
-    result = content
-    for match in sorted(matches, key=operator.itemgetter("start"), reverse=True):
+    def replacement(match: PIIMatch) -> str:
         digest = hashlib.sha256(match["value"].encode()).hexdigest()[:8]
-        replacement = f"<{match['type']}_hash:{digest}>"
-        result = result[: match["start"]] + replacement + result[match["end"] :]
-    return result
+        return f"<{match['type']}_hash:{digest}>"
+
+    return _replace_matches(content, matches, replacement)
 
 
 def apply_strategy(
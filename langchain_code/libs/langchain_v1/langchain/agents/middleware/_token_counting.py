@@ -0,0 +1,117 @@
+"""Shared token counting utilities for agent middleware.
+
+This module contains a token counter used by the summarization and context editing
+middleware to avoid recounting the whole conversation on every model call.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.messages import BaseMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from langchain_core.messages import MessageLikeRepresentation
+
+_DEFAULT_MAX_CACHED_MESSAGES = 4_096
+_VERSIONS_PER_MESSAGE = 2
+
+
+def _snapshot(value: Any) -> Any:
+    """Return an immutable copy of a list of content blocks or tool calls.
+
+    Dicts in the list are copied one level deep, so values nested inside them are
+    still shared with the original.
+    """
+    if not isinstance(value, list):
+        return value
+    return tuple(tuple(item.items()) if isinstance(item, dict) else item for item in value)
+
+
+class CachedTokenCounter:
+    """Token counter that counts each message once and sums the cached counts.
+
+    Only valid for counters where the count of several messages is the sum of the
+    counts of each message, such as `count_tokens_approximately` with its default
+    `extra_tokens_per_message`.
+
+    Counts are cached by message ID, along with the type, content, name, tool calls and
+    tool call ID of the message they were computed for, so a message that changed
+    since it was counted is counted again. Content and tool call lists are compared
+    by value, so blocks and tool calls that are added, removed, replaced or have a
+    field reassigned in place are noticed. Edits made in place deeper down, such as
+    to the `args` of a tool call, are not: copy the value being edited instead.
+
+    The two most recent versions of each message are kept, which covers a message
+    from the agent state and the edited copy a middleware sends to the model
+    instead. Messages without an ID are always counted.
+    """
+
+    def __init__(
+        self,
+        token_counter: Callable[[Iterable[MessageLikeRepresentation]], int],
+        *,
+        maxsize: int = _DEFAULT_MAX_CACHED_MESSAGES,
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            token_counter: Function to count tokens in messages.
+            maxsize: Maximum number of messages to cache counts for. The least
+                recently counted messages are dropped first.
+        """
+        self.token_counter = token_counter
+        self._maxsize = maxsize
+        self._counts: OrderedDict[str, list[tuple[tuple[Any, ...], int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, messages: Iterable[MessageLikeRepresentation]) -> int:
+        """Count tokens in messages.
+
+        Args:
+            messages: The messages to count tokens for.
+
+        Returns:
+            The number of tokens in the messages.
+        """
+        total = 0
+        uncached: list[MessageLikeRepresentation] = []
+        with self._lock:
+            for message in messages:
+                # Fields are read from `__dict__`, which is much faster than
+                # attribute access on messages.
+                fields = message.__dict__ if isinstance(message, BaseMessage) else {}
+                message_id = fields.get("id")
+                if message_id is None:
+                    uncached.append(message)
+                    continue
+                key = (
+                    type(message),
+                    _snapshot(fields["content"]),
+                    fields["name"],
+                    _snapshot(fields.get("tool_calls")),
+                    fields.get("tool_call_id"),
+                )
+                versions = self._counts.get(message_id)
+                if versions is None:
+                    versions = self._counts[message_id] = []
+                    if len(self._counts) > self._maxsize:
+                        self._counts.popitem(last=False)
+                else:
+                    self._counts.move_to_end(message_id)
+                for version_key, count in versions:
+                    if version_key == key:
+                        num_tokens = count
+                        break
+                else:
+                    num_tokens = self.token_counter([message])
+                    versions.insert(0, (key, num_tokens))
+                    del versions[_VERSIONS_PER_MESSAGE:]
+                total += num_tokens
+        if uncached:
+            total += self.token_counter(uncached)
+        return total
@@ -23,6 +23,7 @@ from langchain_core.messages import (
 from langchain_core.messages.utils import count_tokens_approximately
 from typing_extensions import Protocol
 
+from langchain.agents.middleware._token_counting import CachedTokenCounter
 from langchain.agents.middleware.types import (
     AgentMiddleware,
     ModelCallResult,
@@ -214,6 +215,29 @@ class ContextEditingMiddleware(AgentMiddleware):
         super().__init__()
         self.edits = list(edits or (ClearToolUsesEdit(),))
         self.token_count_method = token_count_method
+        # Reused across model calls so that each message is only counted once.
+        self._count_tokens_approximately = CachedTokenCounter(count_tokens_approximately)
+
+    def _edit_messages(self, request: ModelRequest) -> list[AnyMessage]:
+        if self.token_count_method == "approximate":  # noqa: S105
+            count_tokens: TokenCounter = self._count_tokens_approximately
+        else:
+            system_msg = [request.system_message] if request.system_message else []
+
+            def count_tokens(messages: Sequence[BaseMessage]) -> int:
+                return request.model.get_num_tokens_from_messages(
+                    system_msg + list(messages), request.tools
+                )
+
+        # `ClearToolUsesEdit` replaces messages instead of changing them in place, so
+        # other edits are the only ones that need a copy of each message.
+        if all(type(edit) is ClearToolUsesEdit for edit in self.edits):
+            edited_messages = list(request.messages)
+        else:
+            edited_messages = deepcopy(list(request.messages))
+        for edit in self.edits:
+            edit.apply(edited_messages, count_tokens=count_tokens)
+        return edited_messages
 
     def wrap_model_call(
         self,
@@ -233,23 +257,7 @@ class ContextEditingMiddleware(AgentMiddleware):
         if not request.messages:
             return handler(request)
 
-        if self.token_count_method == "approximate":  # noqa: S105
-
-            def count_tokens(messages: Sequence[BaseMessage]) -> int:
-                return count_tokens_approximately(messages)
-
-        else:
-            system_msg = [request.system_message] if request.system_message else []
-
-            def count_tokens(messages: Sequence[BaseMessage]) -> int:
-                return request.model.get_num_tokens_from_messages(
-                    system_msg + list(messages), request.tools
-                )
-
-        edited_messages = deepcopy(list(request.messages))
-        for edit in self.edits:
-            edit.apply(edited_messages, count_tokens=count_tokens)
-
+        edited_messages = self._edit_messages(request)
         return handler(request.override(messages=edited_messages))
 
     async def awrap_model_call(
@@ -270,23 +278,7 @@ class ContextEditingMiddleware(AgentMiddleware):
         if not request.messages:
             return await handler(request)
 
-        if self.token_count_method == "approximate":  # noqa: S105
-
-            def count_tokens(messages: Sequence[BaseMessage]) -> int:
-                return count_tokens_approximately(messages)
-
-        else:
-            system_msg = [request.system_message] if request.system_message else []
-
-            def count_tokens(messages: Sequence[BaseMessage]) -> int:
-                return request.model.get_num_tokens_from_messages(
-                    system_msg + list(messages), request.tools
-                )
-
-        edited_messages = deepcopy(list(request.messages))
-        for edit in self.edits:
-            edit.apply(edited_messages, count_tokens=count_tokens)
-
+        edited_messages = self._edit_messages(request)
         return await handler(request.override(messages=edited_messages))
 
 
@@ -8,12 +8,17 @@ from __future__ import annotations
 
 import fnmatch
 import json
+import os
 import re
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Literal, TypeAlias
 
 from langchain_core.tools import tool
 
@@ -84,6 +89,333 @@ def _match_include_pattern(basename: str, pattern: str) -> bool:
     return any(fnmatch.fnmatch(basename, candidate) for candidate in expanded)
 
 
+def _skip_quantifier(pattern: str, i: int) -> tuple[int, bool] | None:
+    """Skip a quantifier starting at `i`.
+
+    Returns:
+        The index after the quantifier and whether it allows zero repetitions, or
+            `None` if there is no quantifier at `i`.
+    """
+    if i >= len(pattern):
+        return None
+    char = pattern[i]
+    if char in "*?+":
+        end, optional = i + 1, char != "+"
+    elif char == "{":
+        match = re.match(r"\{(\d*)(,\d*)?\}", pattern[i:])
+        if match is None or match.group(0) == "{}":
+            return None
+        end, optional = i + match.end(), not match.group(1) or int(match.group(1)) == 0
+    else:
+        return None
+    # Lazy and possessive modifiers.
+    if end < len(pattern) and pattern[end] in "?+":
+        end += 1
+    return end, optional
+
+
+def _required_literals(pattern: str) -> list[str]:
+    """Return literal strings that every match of the regex must contain.
+
+    The analysis is conservative: constructs it does not understand, such as
+    alternations, inline flags, lookarounds and backreferences, make it return an
+    empty list, which means that no file can be ruled out.
+    """
+    literals: list[str] = []
+    current: list[str] = []
+    group_starts: list[int] = []
+
+    def flush() -> None:
+        if current:
+            literals.append("".join(current))
+            current.clear()
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        atom: str | None = None
+        if char == "|":
+            return []
+        if char == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1] in "NuUx0123456789":
+                return []
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped.isalnum():
+                # Character classes, anchors and escapes such as `\n` end a literal.
+                flush()
+            else:
+                atom = escaped
+        elif char == "[":
+            j = i + 1
+            if j < len(pattern) and pattern[j] == "^":
+                j += 1
+            if j < len(pattern) and pattern[j] == "]":
+                j += 1
+            while j < len(pattern) and pattern[j] != "]":
+                j += 2 if pattern[j] == "\\" else 1
+            if j >= len(pattern):
+                return []
+            flush()
+            i = j + 1
+        elif char == "(":
+            flush()
+            if pattern.startswith("(?:", i):
+                i += 3
+            elif pattern.startswith("(?P<", i):
+                i = pattern.find(">", i) + 1
+                if i == 0:
+                    return []
+            elif pattern.startswith("(?", i):
+                return []
+            else:
+                i += 1
+            group_starts.append(len(literals))
+            continue
+        elif char == ")":
+            flush()
+            if not group_starts:
+                return []
+            start = group_starts.pop()
+            quantifier = _skip_quantifier(pattern, i + 1)
+            i += 1
+            if quantifier is not None:
+                i, optional = quantifier
+                if optional:
+                    del literals[start:]
+            continue
+        elif char in ".^$*+?":
+            flush()
+            i += 1
+        elif char == "{" and (quantifier := _skip_quantifier(pattern, i)) is not None:
+            flush()
+            i = quantifier[0]
+        else:
+            atom = char
+            i += 1
+
+        if atom is None:
+            continue
+        quantifier = _skip_quantifier(pattern, i)
+        if quantifier is None:
+            current.append(atom)
+            continue
+        i, optional = quantifier
+        if not optional:
+            current.append(atom)
+        flush()
+    flush()
+    return literals
+
+
+def _quadgrams(text: str) -> set[int]:
+    """Return the 4-byte substrings of the UTF-8 encoded text, as integers."""
+    data = memoryview(text.encode(errors="surrogatepass"))
+    grams: set[int] = set()
+    for offset in range(4):
+        end = offset + (len(data) - offset) // 4 * 4
+        if end > offset:
+            grams.update(data[offset:end].cast("I"))
+    return grams
+
+
+_MASK_SIZES = (61, 127, 251, 509, 1021, 2039, 4093, 8191, 16381, 32749, 65521)
+_MASK_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _gram_mask(grams: set[int], size: int) -> int:
+    """Return a `size`-bit Bloom filter of the grams, as an integer."""
+    bits = bytearray(size)
+    for gram in grams:
+        bits[gram % size] = 1
+    return int(bits.translate(_MASK_DIGITS), 2)
+
+
+def _content_mask(content: str) -> tuple[int, int]:
+    """Return the size and value of the Bloom filter of a file's content."""
+    grams = _quadgrams(content)
+    size = next((size for size in _MASK_SIZES if size >= 2 * len(grams)), _MASK_SIZES[-1])
+    return size, _gram_mask(grams, size)
+
+
+def _find_class_end(part: str, start: int) -> int:
+    """Return the index of the `]` closing a character class that starts at `start`."""
+    if part[start : start + 1] == "!":
+        start += 1
+    if part[start : start + 1] == "]":
+        start += 1
+    return part.find("]", start)
+
+
+def _translate_glob(pattern_parts: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile `Path.glob` style pattern components into a regex over relative paths."""
+    regex = []
+    for i, part in enumerate(pattern_parts):
+        if part == "**":
+            regex.append("(?:[^/]+/)*")
+            continue
+        j = 0
+        while j < len(part):
+            char = part[j]
+            j += 1
+            if char == "*":
+                regex.append("[^/]*")
+            elif char == "?":
+                regex.append("[^/]")
+            elif char == "[" and (end := _find_class_end(part, j)) != -1:
+                inner = re.sub(r"([&~|\[\]])", r"\\\1", part[j:end].replace("\\", "\\\\"))
+                if inner.startswith("!"):
+                    # Negated classes must not match across path components.
+                    inner = "^/" + inner[1:]
+                elif inner.startswith("^"):
+                    inner = "\\" + inner
+                regex.append(f"[{inner}]")
+                j = end + 1
+            else:
+                regex.append(re.escape(char))
+        if i < len(pattern_parts) - 1:
+            regex.append("/")
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("".join(regex), flags)
+
+
+_SCAN_CHUNK_SIZE = 64
+"""Number of files read by each task of an indexed grep search."""
+
+_RACY_WINDOW_NS = 2_000_000_000
+"""Entries whose mtime is this recent are checked again on the next search.
+
+A change made within the filesystem's timestamp granularity of the last listing or
+read would otherwise go unnoticed.
+"""
+
+# A searched file, its matching lines and, if not indexed yet, its content mask.
+_ScannedFile: TypeAlias = tuple["_IndexedFile", list[tuple[int, str]], tuple[int, int] | None]
+
+
+@dataclass(slots=True)
+class _IndexedFile:
+    path: str
+    parts: tuple[str, ...]
+    mtime_ns: int = -1
+    size: int = 0
+    mask: tuple[int, int] | None = None
+    """Size and value of the Bloom filter of the file's content, once searched."""
+
+
+@dataclass(slots=True)
+class _IndexedDir:
+    mtime_ns: int
+    files: dict[str, _IndexedFile]
+    dirs: tuple[str, ...]
+
+
+class _FileIndex:
+    """Index of the files under a root directory, kept between searches.
+
+    Directories are only listed again when their mtime changes, so glob searches do
+    not walk the tree. For grep searches, files are also checked for modifications by
+    mtime and size. The first time a file is searched, a Bloom filter of the 4-byte
+    substrings of its content is recorded; later searches skip the files whose filter
+    rules out the literal parts of the regex.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._dirs: dict[tuple[str, ...], _IndexedDir] = {}
+        self._lock = threading.Lock()
+
+    def files(self, base: Path, *, check_files: bool) -> list[_IndexedFile]:
+        """Update the index under `base` and return the files it contains.
+
+        Args:
+            base: The directory to list, within the root.
+            check_files: Whether to also check the files for modifications.
+
+        Returns:
+            The indexed files under `base`.
+        """
+        prefix = base.relative_to(self.root).parts
+        files: list[_IndexedFile] = []
+        with self._lock:
+            self._refresh_dir(prefix, str(base), files)
+            if check_files:
+                now = time.time_ns()
+                for indexed in files:
+                    try:
+                        stat = os.stat(indexed.path)  # noqa: PTH116
+                    except OSError:
+                        continue
+                    if stat.st_mtime_ns != indexed.mtime_ns or stat.st_size != indexed.size:
+                        indexed.mask = None
+                        indexed.size = stat.st_size
+                        indexed.mtime_ns = (
+                            -1 if now - stat.st_mtime_ns < _RACY_WINDOW_NS else stat.st_mtime_ns
+                        )
+        return files
+
+    def _refresh_dir(self, parts: tuple[str, ...], path: str, files: list[_IndexedFile]) -> None:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns  # noqa: PTH116
+        except OSError:
+            self._discard_dir(parts)
+            return
+        indexed = self._dirs.get(parts)
+        if indexed is None or indexed.mtime_ns != mtime_ns:
+            previous = indexed.files if indexed is not None else {}
+            dir_files: dict[str, _IndexedFile] = {}
+            dir_names: list[str] = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        # Do not follow symlinked directories, which may point outside
+                        # the root or form cycles.
+                        if entry.is_dir(follow_symlinks=False):
+                            dir_names.append(entry.name)
+                        elif entry.is_file():
+                            dir_files[entry.name] = previous.get(entry.name) or _IndexedFile(
+                                entry.path, (*parts, entry.name)
+                            )
+            except OSError:
+                self._discard_dir(parts)
+                return
+            if indexed is not None:
+                for name in set(indexed.dirs).difference(dir_names):
+                    self._discard_dir((*parts, name))
+            if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+                mtime_ns = -1
+            indexed = _IndexedDir(mtime_ns, dir_files, tuple(dir_names))
+            self._dirs[parts] = indexed
+        files.extend(indexed.files.values())
+        for name in indexed.dirs:
+            self._refresh_dir((*parts, name), os.path.join(path, name), files)  # noqa: PTH118
+
+    def _discard_dir(self, parts: tuple[str, ...]) -> None:
+        indexed = self._dirs.pop(parts, None)
+        if indexed is not None:
+            for name in indexed.dirs:
+                self._discard_dir((*parts, name))
+
+    def candidates(self, base: Path, pattern: str) -> list[_IndexedFile]:
+        """Update the index under `base` and return the files that may match."""
+        files = self.files(base, check_files=True)
+        required = {gram for literal in _required_literals(pattern) for gram in _quadgrams(literal)}
+        if not required:
+            return files
+        queries: dict[int, int] = {}
+        candidates = []
+        for indexed in files:
+            if indexed.mask is not None:
+                size, mask = indexed.mask
+                query = queries.get(size)
+                if query is None:
+                    query = queries[size] = _gram_mask(required, size)
+                if mask & query != query:
+                    continue
+            candidates.append(indexed)
+        return candidates
+
+
 class FilesystemFileSearchMiddleware(AgentMiddleware):
     """Provides Glob and Grep search over filesystem files.
 
@@ -115,6 +447,7 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
         root_path: str,
         use_ripgrep: bool = True,
         max_file_size_mb: int = 10,
+        use_index: bool = False,
     ) -> None:
         """Initialize the search middleware.
 
@@ -124,10 +457,19 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
 
                 Falls back to Python if `ripgrep` unavailable.
             max_file_size_mb: Maximum file size to search in MB.
+            use_index: Whether to keep an index of the files under `root_path`
+                between searches.
+
+                The index is updated from file mtimes on every search, serves glob
+                searches without walking the tree again, and lets the Python grep
+                fallback skip files that cannot match and scan the others in
+                parallel. For every searched file, it holds in memory a Bloom filter
+                of the 4-byte substrings of its content, of at most 8 KB.
         """
         self.root_path = Path(root_path).resolve()
         self.use_ripgrep = use_ripgrep
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self._index = _FileIndex(self.root_path) if use_index else None
 
         # Create tool instances as closures that capture self
         @tool
@@ -157,6 +499,14 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
             if not base_full.exists() or not base_full.is_dir():
                 return "No files found"
 
+            indexed = (
+                self._indexed_glob(self._index, base_full, pattern)
+                if self._index is not None
+                else None
+            )
+            if indexed is not None:
+                return "\n".join(indexed) or "No files found"
+
             # Use pathlib glob
             matching: list[tuple[str, str]] = []
             for match in base_full.glob(pattern):
@@ -322,6 +672,9 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
             return {}
 
         regex = re.compile(pattern)
+        if self._index is not None:
+            return self._indexed_search(self._index, regex, base_full, include)
+
         results: dict[str, list[tuple[int, str]]] = {}
 
         # Walk directory tree
@@ -352,6 +705,72 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
 
         return results
 
+    def _indexed_glob(self, index: _FileIndex, base_full: Path, pattern: str) -> list[str] | None:
+        """Glob search over the file index.
+
+        Returns `None` for patterns that are left to `Path.glob`.
+        """
+        pattern_parts = tuple(part for part in pattern.split("/") if part)
+        if (
+            not pattern_parts
+            or pattern.startswith("/")
+            or pattern_parts[-1] == "**"
+            or any("**" in part and part != "**" for part in pattern_parts)
+            or any(part in {".", ".."} for part in pattern_parts)
+        ):
+            return None
+        regex = _translate_glob(pattern_parts)
+        prefix_length = len(base_full.relative_to(self.root_path).parts)
+        return [
+            "/" + "/".join(indexed.parts)
+            for indexed in index.files(base_full, check_files=False)
+            if regex.fullmatch("/".join(indexed.parts[prefix_length:]))
+        ]
+
+    def _indexed_search(
+        self, index: _FileIndex, regex: re.Pattern[str], base_full: Path, include: str | None
+    ) -> dict[str, list[tuple[int, str]]]:
+        """Search the indexed files that may match, in parallel."""
+        candidates = [
+            indexed
+            for indexed in index.candidates(base_full, regex.pattern)
+            if indexed.size <= self.max_file_size_bytes
+            and (not include or _match_include_pattern(indexed.parts[-1], include))
+        ]
+
+        def scan(chunk: list[_IndexedFile]) -> list[_ScannedFile]:
+            scanned: list[_ScannedFile] = []
+            for indexed in chunk:
+                try:
+                    content = Path(indexed.path).read_text()
+                except (UnicodeDecodeError, OSError):
+                    # Only searched again by patterns without literals, or once the
+                    # file changes.
+                    scanned.append((indexed, [], (_MASK_SIZES[0], 0)))
+                    continue
+                matches = [
+                    (line_num, line)
+                    for line_num, line in enumerate(content.splitlines(), 1)
+                    if regex.search(line)
+                ]
+                mask = _content_mask(content) if indexed.mask is None else None
+                scanned.append((indexed, matches, mask))
+            return scanned
+
+        chunks = [
+            candidates[i : i + _SCAN_CHUNK_SIZE]
+            for i in range(0, len(candidates), _SCAN_CHUNK_SIZE)
+        ]
+        results: dict[str, list[tuple[int, str]]] = {}
+        with ThreadPoolExecutor() as executor:
+            for scanned in executor.map(scan, chunks):
+                for indexed, matches, mask in scanned:
+                    if mask is not None:
+                        indexed.mask = mask
+                    if matches:
+                        results["/" + "/".join(indexed.parts)] = matches
+        return results
+
     @staticmethod
     def _format_grep_results(
         results: dict[str, list[tuple[int, str]]],
@@ -12,6 +12,7 @@ from langchain.agents.middleware._redaction import (
     PIIMatch,
     RedactionRule,
     ResolvedRedactionRule,
+    _ScanCache,
     apply_strategy,
     detect_credit_card,
     detect_email,
@@ -26,6 +27,10 @@ if TYPE_CHECKING:
 
     from langgraph.runtime import Runtime
 
+# Number of message contents whose built-in detector results each middleware keeps,
+# so that unchanged messages are not scanned again on later turns.
+_SCAN_CACHE_SIZE = 256
+
 
 class PIIMiddleware(AgentMiddleware):
     """Detect and handle Personally Identifiable Information (PII) in conversations.
@@ -49,6 +54,9 @@ class PIIMiddleware(AgentMiddleware):
     - `mask`: Partially mask PII (e.g., `****-****-****-1234` for credit card)
     - `hash`: Replace PII with deterministic hash (e.g., `<email_hash:a1b2c3d4>`)
 
+    The results of built-in detectors are cached by content in each middleware, so
+    messages that are unchanged from one turn to the next are not scanned again.
+
     Strategy Selection Guide:
 
     | Strategy | Preserves Identity? | Best For                                |
@@ -146,6 +154,9 @@ class PIIMiddleware(AgentMiddleware):
         self.pii_type = self._resolved_rule.pii_type
         self.strategy = self._resolved_rule.strategy
         self.detector = self._resolved_rule.detector
+        self._scan_cache = (
+            _ScanCache(self.detector, maxsize=_SCAN_CACHE_SIZE) if detector is None else None
+        )
 
     @property
     def name(self) -> str:
@@ -154,7 +165,10 @@ class PIIMiddleware(AgentMiddleware):
 
     def _process_content(self, content: str) -> tuple[str, list[PIIMatch]]:
         """Apply the configured redaction rule to the provided content."""
-        matches = self.detector(content)
+        if self._scan_cache is not None:
+            matches = self._scan_cache.detect(content)
+        else:
+            matches = self.detector(content)
         if not matches:
             return content, []
         sanitized = apply_strategy(content, matches, self.strategy)
@@ -25,6 +25,7 @@ from langgraph.graph.message import (
 from langgraph.runtime import Runtime
 from typing_extensions import override
 
+from langchain.agents.middleware._token_counting import CachedTokenCounter
 from langchain.agents.middleware.types import AgentMiddleware, AgentState
 from langchain.chat_models import BaseChatModel, init_chat_model
 
@@ -264,7 +265,11 @@ class SummarizationMiddleware(AgentMiddleware):
 
         self.keep = self._validate_context_size(keep, "keep")
         if token_counter is count_tokens_approximately:
-            self.token_counter = _get_approximate_token_counter(self.model)
+            # Approximate counts add up per message, so only new or changed messages
+            # are counted on each turn.
+            self.token_counter: TokenCounter = CachedTokenCounter(
+                _get_approximate_token_counter(self.model)
+            )
         else:
             self.token_counter = token_counter
         self.summary_prompt = summary_prompt
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import functools
 import importlib
+import threading
 import warnings
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
+    Generic,
     Literal,
+    NamedTuple,
     TypeAlias,
+    TypeVar,
     cast,
     overload,
 )
@@ -21,7 +26,7 @@ from langchain_core.runnables import Runnable, RunnableConfig, ensure_config
 from typing_extensions import override
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+    from collections.abc import AsyncIterator, Callable, Hashable, Iterator, Sequence
     from types import ModuleType
 
     from langchain_core.runnables.schema import StreamEvent
@@ -580,6 +585,99 @@ def _remove_prefix(s: str, prefix: str) -> str:
 
 _DECLARATIVE_METHODS = ("bind_tools", "with_structured_output")
 
+_MODEL_CACHE_SIZE = 32
+"""Maximum number of built models kept by a configurable model and its derivatives."""
+
+
+class _ModelCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_ModelT = TypeVar("_ModelT")
+
+
+class _ModelCache(Generic[_ModelT]):
+    """Thread-safe LRU cache of built models.
+
+    A `_ConfigurableModel` keys the models it builds by their resolved init params and
+    queued declarative operations, so it reuses the same provider client (and its
+    connection pool) across calls with the same configuration.
+    """
+
+    def __init__(self, maxsize: int = _MODEL_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._models: OrderedDict[Hashable, _ModelT] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, create: Callable[[], _ModelT]) -> _ModelT:
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return model
+            self.misses += 1
+        # Built outside the lock: a concurrent miss on the same key builds the model
+        # twice, which is cheaper than serializing every model construction.
+        model = create()
+        if self.maxsize > 0:
+            with self._lock:
+                self._models[key] = model
+                self._models.move_to_end(key)
+                while len(self._models) > self.maxsize:
+                    self._models.popitem(last=False)
+        return model
+
+    def info(self) -> _ModelCacheInfo:
+        with self._lock:
+            return _ModelCacheInfo(self.hits, self.misses, self.maxsize, len(self._models))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self.hits = self.misses = 0
+
+
+class _Identity:
+    """Hashable wrapper comparing an unhashable object by identity."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert model params and declarative operations into a cache key.
+
+    Containers are compared by value. Other unhashable objects, such as tool
+    instances, are compared by identity; the key keeps a reference to them so that
+    their ids cannot be reused while the model is cached.
+    """
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+    # Include the type so that e.g. `1`, `1.0` and `True` are different keys.
+    return (type(value), value)
+
 
 class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
     def __init__(
@@ -589,6 +687,7 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
         configurable_fields: Literal["any"] | list[str] | tuple[str, ...] = "any",
         config_prefix: str = "",
         queued_declarative_operations: Sequence[tuple[str, tuple[Any, ...], dict[str, Any]]] = (),
+        model_cache: _ModelCache[Runnable[Any, Any]] | None = None,
     ) -> None:
         self._default_config: dict[str, Any] = default_config or {}
         self._configurable_fields: Literal["any"] | list[str] = (
@@ -604,6 +703,11 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
                 queued_declarative_operations,
             )
         )
+        # Shared with the models derived through declarative operations and
+        # `with_config`, since their keys include the operations and params.
+        self._model_cache: _ModelCache[Runnable[Any, Any]] = (
+            model_cache if model_cache is not None else _ModelCache()
+        )
 
     def __getattr__(self, name: str) -> Any:
         if name in _DECLARATIVE_METHODS:
@@ -624,6 +728,7 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
                     else self._configurable_fields,
                     config_prefix=self._config_prefix,
                     queued_declarative_operations=queued_declarative_operations,
+                    model_cache=self._model_cache,
                 )
 
             return queue
@@ -637,11 +742,19 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
 
     def _model(self, config: RunnableConfig | None = None) -> Runnable[Any, Any]:
         params = {**self._default_config, **self._model_params(config)}
-        model = _init_chat_model_helper(**params)
+        key = _freeze((params, self._queued_declarative_operations))
+        return self._model_cache.get_or_create(key, lambda: self._build_model(params))
+
+    def _build_model(self, params: dict[str, Any]) -> Runnable[Any, Any]:
+        model: Runnable[Any, Any] = _init_chat_model_helper(**params)
         for name, args, kwargs in self._queued_declarative_operations:
             model = getattr(model, name)(*args, **kwargs)
         return model
 
+    def model_cache_info(self) -> _ModelCacheInfo:
+        """Return hit/miss statistics for the cache of built models."""
+        return self._model_cache.info()
+
     def _model_params(self, config: RunnableConfig | None) -> dict[str, Any]:
         config = ensure_config(config)
         model_params = {
@@ -684,6 +797,7 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
             else self._configurable_fields,
             config_prefix=self._config_prefix,
             queued_declarative_operations=queued_declarative_operations,
+            model_cache=self._model_cache,
         )
 
     @property
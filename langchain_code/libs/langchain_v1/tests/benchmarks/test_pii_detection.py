@@ -0,0 +1,75 @@
+import itertools
+import random
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.runtime import Runtime
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain.agents import AgentState
+from langchain.agents.middleware import PIIMiddleware
+from langchain.agents.middleware._redaction import BUILTIN_DETECTORS
+
+# A multi-megabyte tool output: JSON log lines with occasional PII.
+N_LINES = 40_000
+WORDS = [
+    *("the", "request", "failed", "with", "status", "error", "warning", "retry"),
+    *("path", "config.yaml", "v1.2.3", "handler.py", "took", "ms", "user", "token"),
+]
+PII = (
+    "jane.doe@example.com",
+    "https://api.example.com/v1/users?id=42",
+    "192.168.10.24",
+    "4111 1111 1111 1111",
+    "00:1A:2B:3C:4D:5E",
+    "www.example.org/docs",
+)
+
+
+def _tool_output() -> str:
+    rng = random.Random(0)
+    lines = []
+    for i in range(N_LINES):
+        words = rng.choices(WORDS, k=10)
+        if rng.random() < 0.05:
+            words.append(rng.choice(PII))
+        lines.append(f'{{"line": {i}, "message": "{" ".join(words)}"}}')
+    return "\n".join(lines)
+
+
+@pytest.mark.benchmark
+def test_separate_detectors(benchmark: BenchmarkFixture) -> None:
+    content = _tool_output()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def detect() -> None:
+        for detector in BUILTIN_DETECTORS.values():
+            detector(content)
+
+
+@pytest.mark.benchmark
+def test_stacked_middleware_turns(benchmark: BenchmarkFixture) -> None:
+    middlewares = [
+        PIIMiddleware(pii_type, strategy="mask", apply_to_tool_results=True)
+        for pii_type in ("email", "ip", "url")
+    ]
+    output = _tool_output()
+    rounds = itertools.count()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run_turns() -> None:
+        # A fresh output per round, then unchanged history on the following turns.
+        content = output.replace("line", f"line{next(rounds)}")
+        state = AgentState[Any](
+            messages=[
+                HumanMessage("Summarize the logs."),
+                AIMessage("", tool_calls=[{"name": "logs", "args": {}, "id": "1"}]),
+                ToolMessage(content, tool_call_id="1"),
+            ]
+        )
+        for _ in range(5):
+            for middleware in middlewares:
+                result = middleware.before_model(state, Runtime())
+                if result is not None:
+                    state = AgentState[Any](messages=result["messages"])
@@ -376,3 +376,51 @@ def test_tool_node_not_accepted() -> None:
             tools=tool_node,  # type: ignore[arg-type]
             system_prompt="You are a helpful assistant.",
         )
+
+
+def test_bound_model_reused_across_model_calls() -> None:
+    """Test that tools are only bound again when the request's tools change."""
+    bound_tools: list[list[str]] = []
+
+    class CountingModel(FakeToolCallingModel):
+        def bind_tools(self, tools: Any, **kwargs: Any) -> Any:
+            bound_tools.append([t.name for t in tools])
+            return super().bind_tools(tools, **kwargs)
+
+    @tool
+    def tool_a(value: str) -> str:
+        """Tool A."""
+        return "A"
+
+    @tool
+    def tool_b(value: str) -> str:
+        """Tool B."""
+        return "B"
+
+    class ToolFilteringMiddleware(AgentMiddleware):
+        def wrap_model_call(
+            self,
+            request: ModelRequest,
+            handler: Callable[[ModelRequest], ModelResponse],
+        ) -> ModelCallResult:
+            # Drop tool_b once it has been called.
+            if any(isinstance(m, ToolMessage) and m.name == "tool_b" for m in request.messages):
+                return handler(request.override(tools=[tool_a]))
+            return handler(request)
+
+    model = CountingModel(
+        tool_calls=[
+            [{"args": {"value": "x"}, "id": "1", "name": "tool_a"}],
+            [{"args": {"value": "x"}, "id": "2", "name": "tool_b"}],
+            [{"args": {"value": "x"}, "id": "3", "name": "tool_a"}],
+            [],
+        ]
+    )
+    agent = create_agent(
+        model=model, tools=[tool_a, tool_b], middleware=[ToolFilteringMiddleware()]
+    )
+
+    agent.invoke({"messages": [HumanMessage("Use the tools")]})
+
+    assert model.index == 4
+    assert bound_tools == [["tool_a", "tool_b"], ["tool_a"]]
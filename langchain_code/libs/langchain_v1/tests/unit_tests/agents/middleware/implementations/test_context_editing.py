@@ -12,6 +12,7 @@ from langchain_core.messages import (
     MessageLikeRepresentation,
     ToolMessage,
 )
+from langchain_core.messages.utils import count_tokens_approximately
 from typing_extensions import override
 
 from langchain.agents.middleware.context_editing import (
@@ -25,7 +26,7 @@ from langchain.agents.middleware.types import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
     from langgraph.runtime import Runtime
 
@@ -272,6 +273,88 @@ def test_exclude_tools_prevents_clearing() -> None:
     assert calc_tool.content == "[cleared]"
 
 
+def test_approximate_counts_reused_across_calls() -> None:
+    conversation: list[AIMessage | ToolMessage] = []
+    for i in range(3):
+        call_id = f"call-{i}"
+        conversation.extend(
+            (
+                AIMessage(
+                    content="",
+                    tool_calls=[{"id": call_id, "name": "search", "args": {}}],
+                    id=f"ai-{i}",
+                ),
+                ToolMessage(content="x" * 200, tool_call_id=call_id, id=f"tool-{i}"),
+            )
+        )
+    _state, request = _make_state_and_request(conversation)
+    middleware = ContextEditingMiddleware(
+        edits=[ClearToolUsesEdit(trigger=100, clear_at_least=10, keep=1)],
+    )
+
+    counted: list[BaseMessage] = []
+
+    def spy(messages: Iterable[MessageLikeRepresentation]) -> int:
+        batch = cast("list[BaseMessage]", list(messages))
+        counted.extend(batch)
+        return count_tokens_approximately(batch)
+
+    middleware._count_tokens_approximately.token_counter = spy
+
+    responses: list[ModelRequest] = []
+
+    def mock_handler(req: ModelRequest) -> ModelResponse:
+        responses.append(req)
+        return ModelResponse(result=[AIMessage(content="mock response")])
+
+    middleware.wrap_model_call(request, mock_handler)
+    cleared = [
+        m
+        for m in responses[0].messages
+        if isinstance(m, ToolMessage) and m.response_metadata.get("context_editing")
+    ]
+    assert cleared
+    # Every original message and each cleared tool message is counted exactly once.
+    assert len(counted) == len(conversation) + len(cleared)
+
+    counted.clear()
+    middleware.wrap_model_call(request, mock_handler)
+    assert len(counted) == 0
+    assert [m.content for m in responses[0].messages] == [m.content for m in responses[1].messages]
+    # The original messages are left untouched.
+    assert all(m.content == "x" * 200 for m in conversation if isinstance(m, ToolMessage))
+
+
+def test_custom_edits_receive_copies() -> None:
+    class UppercaseEdit:
+        def apply(
+            self,
+            messages: list[AnyMessage],
+            *,
+            count_tokens: Callable[[Sequence[BaseMessage]], int],
+        ) -> None:
+            for message in messages:
+                if isinstance(message.content, str):
+                    message.content = message.content.upper()
+
+    tool_message = ToolMessage(content="result", tool_call_id="call-1")
+    _state, request = _make_state_and_request([tool_message])
+    middleware = ContextEditingMiddleware(edits=[UppercaseEdit()])
+
+    modified_request = None
+
+    def mock_handler(req: ModelRequest) -> ModelResponse:
+        nonlocal modified_request
+        modified_request = req
+        return ModelResponse(result=[AIMessage(content="mock response")])
+
+    middleware.wrap_model_call(request, mock_handler)
+
+    assert modified_request is not None
+    assert modified_request.messages[0].content == "RESULT"
+    assert tool_message.content == "result"
+
+
 def _fake_runtime() -> Runtime:
     return cast("Runtime", object())
 
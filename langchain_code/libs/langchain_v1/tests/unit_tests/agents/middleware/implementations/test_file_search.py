@@ -1,5 +1,6 @@
 """Unit tests for file search middleware."""
 
+import os
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,7 @@ from langchain.agents.middleware.file_search import (
     _expand_include_patterns,
     _is_valid_include_pattern,
     _match_include_pattern,
+    _required_literals,
 )
 
 
@@ -403,3 +405,114 @@ class TestGrepEdgeCases:
 
         # Large file should be skipped
         assert "/small.txt" in result
+
+
+class TestFileIndex:
+    """Tests for the optional in-memory file index."""
+
+    @staticmethod
+    def _make_tree(root: Path) -> None:
+        (root / "src" / "pkg").mkdir(parents=True)
+        (root / "docs").mkdir()
+        (root / "src" / "app.py").write_text("def main():\n    return 'needle'\n")
+        (root / "src" / "pkg" / "util.py").write_text("NEEDLE = 1\nhaystack = 2\n")
+        (root / "docs" / "guide.md").write_text("A needle in a haystack.\n")
+        (root / "docs" / "notes.txt").write_text("nothing here\n")
+        (root / "blob.bin").write_bytes(b"\xff\xfe needle")
+
+    @staticmethod
+    def _age(path: Path) -> None:
+        # Index entries for files modified within the last seconds are not trusted.
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    @pytest.mark.parametrize(
+        ("pattern", "include", "output_mode"),
+        [
+            ("needle", None, "files_with_matches"),
+            ("needle", "*.py", "content"),
+            ("(?i)needle", None, "count"),
+            ("hay(stack)?", None, "content"),
+            ("needle|nothing", "*.{md,txt}", "files_with_matches"),
+            ("^def \\w+", None, "content"),
+            ("missing", None, "files_with_matches"),
+        ],
+    )
+    def test_indexed_grep_matches_scan(
+        self, tmp_path: Path, pattern: str, include: str | None, output_mode: str
+    ) -> None:
+        """Test that indexed grep returns the same results as a full scan."""
+        self._make_tree(tmp_path)
+        scan = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_ripgrep=False)
+        indexed = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, use_index=True
+        )
+
+        assert isinstance(indexed.grep_search, StructuredTool)
+        assert indexed.grep_search.func is not None
+        assert isinstance(scan.grep_search, StructuredTool)
+        assert scan.grep_search.func is not None
+        for path in ("/", "/src", "/docs"):
+            expected = scan.grep_search.func(
+                pattern=pattern, path=path, include=include, output_mode=output_mode
+            )
+            # Twice, to compare both the index build and the cached search.
+            for _ in range(2):
+                result = indexed.grep_search.func(
+                    pattern=pattern, path=path, include=include, output_mode=output_mode
+                )
+                assert result == expected
+
+    def test_indexed_grep_sees_file_changes(self, tmp_path: Path) -> None:
+        """Test that the index picks up modified, new and deleted files."""
+        self._make_tree(tmp_path)
+        for path in tmp_path.rglob("*"):
+            self._age(path)
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, use_index=True
+        )
+        assert isinstance(middleware.grep_search, StructuredTool)
+        assert middleware.grep_search.func is not None
+        assert middleware.grep_search.func(pattern="marker") == "No matches found"
+
+        (tmp_path / "docs" / "notes.txt").write_text("a marker\n")
+        (tmp_path / "src" / "pkg" / "new.py").write_text("marker = True\n")
+        (tmp_path / "docs" / "guide.md").unlink()
+
+        result = middleware.grep_search.func(pattern="marker")
+        assert result.splitlines() == ["/docs/notes.txt", "/src/pkg/new.py"]
+        assert "/docs/guide.md" not in middleware.grep_search.func(pattern="needle")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["*.py", "**/*.py", "src/**/*.py", "*/*.md", "**/[!a]*", "docs/?????.txt", "**/pkg"],
+    )
+    def test_indexed_glob_matches_pathlib(self, tmp_path: Path, pattern: str) -> None:
+        """Test that indexed glob returns the same results as `Path.glob`."""
+        self._make_tree(tmp_path)
+        scan = FilesystemFileSearchMiddleware(root_path=str(tmp_path))
+        indexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_index=True)
+
+        assert isinstance(indexed.glob_search, StructuredTool)
+        assert indexed.glob_search.func is not None
+        assert isinstance(scan.glob_search, StructuredTool)
+        assert scan.glob_search.func is not None
+        for path in ("/", "/src"):
+            expected = scan.glob_search.func(pattern=pattern, path=path)
+            assert indexed.glob_search.func(pattern=pattern, path=path) == expected
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("needle", ["needle"]),
+            ("foo.*bar", ["foo", "bar"]),
+            ("a\\.b", ["a.b"]),
+            ("colou?r", ["colo", "r"]),
+            ("(?:abc)+def", ["abc", "def"]),
+            ("foo|bar", []),
+            ("(?i)needle", []),
+            ("[ab]cd", ["cd"]),
+        ],
+    )
+    def test_required_literals(self, pattern: str, expected: list[str]) -> None:
+        """Test extraction of literals every match must contain."""
+        assert _required_literals(pattern) == expected
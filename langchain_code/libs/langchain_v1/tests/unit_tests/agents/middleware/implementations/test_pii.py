@@ -8,6 +8,7 @@ from langgraph.runtime import Runtime
 
 from langchain.agents import AgentState
 from langchain.agents.factory import create_agent
+from langchain.agents.middleware._redaction import _ScanCache
 from langchain.agents.middleware.pii import (
     PIIDetectionError,
     PIIMatch,
@@ -644,3 +645,32 @@ class TestMultipleMiddleware:
         content = result["messages"][0].content
         assert "test@example.com" not in content
         assert "10.0.0.1" not in content
+
+
+class TestScanCache:
+    """Test caching scan results across turns."""
+
+    def test_unchanged_content_scanned_once(self) -> None:
+        scanned: list[str] = []
+
+        def counting_detector(content: str) -> list[PIIMatch]:
+            scanned.append(content)
+            return detect_email(content)
+
+        middleware = PIIMiddleware("email", strategy="redact")
+        middleware._scan_cache = _ScanCache(counting_detector, maxsize=2)
+        state = AgentState[Any](messages=[HumanMessage("Scan test: no personal data here.")])
+
+        for _ in range(3):
+            assert middleware.before_model(state, Runtime()) is None
+
+        assert scanned == ["Scan test: no personal data here."]
+
+    def test_scan_cache_per_middleware(self) -> None:
+        email = PIIMiddleware("email")
+        other_email = PIIMiddleware("email")
+        custom = PIIMiddleware("api_key", detector=r"sk-[a-z]+")
+
+        assert email._scan_cache is not None
+        assert email._scan_cache is not other_email._scan_cache
+        assert custom._scan_cache is None
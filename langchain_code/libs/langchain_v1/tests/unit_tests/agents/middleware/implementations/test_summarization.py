@@ -1002,6 +1002,63 @@ def test_summarization_adjust_token_counts() -> None:
     assert count_1 != count_2
 
 
+def test_summarization_approximate_counts_are_cached_per_message() -> None:
+    messages: list[AnyMessage] = [
+        HumanMessage(content="question " * 20, id="h1"),
+        AIMessage(
+            content="",
+            tool_calls=[{"id": "call-1", "name": "search", "args": {"q": "x"}}],
+            id="a1",
+        ),
+        ToolMessage(content="result " * 50, tool_call_id="call-1", id="t1"),
+        HumanMessage(content="no id"),
+    ]
+    middleware = SummarizationMiddleware(model=MockChatModel(), trigger=("messages", 50))
+
+    assert middleware.token_counter(messages) == count_tokens_approximately(messages)
+
+    counted: list[list[Any]] = []
+    cached_counter = middleware.token_counter
+
+    def spy(batch: Iterable[MessageLikeRepresentation]) -> int:
+        counted.append(list(batch))
+        return count_tokens_approximately(counted[-1])
+
+    cached_counter.token_counter = spy  # type: ignore[attr-defined]
+    assert middleware.token_counter(messages) == count_tokens_approximately(messages)
+    # Only the message without an ID is counted again.
+    assert counted == [[messages[3]]]
+
+    counted.clear()
+    edited = [*messages[:2], messages[2].model_copy(update={"content": "short"})]
+    assert middleware.token_counter(edited) == count_tokens_approximately(edited)
+    assert counted == [[edited[2]]]
+
+
+def test_summarization_approximate_counts_see_in_place_edits() -> None:
+    message = HumanMessage(content=[{"type": "text", "text": "question"}], id="h1")
+    ai_message = AIMessage(
+        content="",
+        tool_calls=[{"id": "call-1", "name": "search", "args": {"q": "x"}}],
+        id="a1",
+    )
+    messages: list[AnyMessage] = [message, ai_message]
+    middleware = SummarizationMiddleware(model=MockChatModel(), trigger=("messages", 50))
+    assert middleware.token_counter(messages) == count_tokens_approximately(messages)
+
+    assert isinstance(message.content, list)
+    message.content.append({"type": "text", "text": "more " * 50})
+    assert middleware.token_counter(messages) == count_tokens_approximately(messages)
+
+    block = message.content[0]
+    assert isinstance(block, dict)
+    block["text"] = "question " * 50
+    assert middleware.token_counter(messages) == count_tokens_approximately(messages)
+
+    ai_message.tool_calls[0]["args"] = {"q": "x" * 200}
+    assert middleware.token_counter(messages) == count_tokens_approximately(messages)
+
+
 def test_summarization_middleware_many_parallel_tool_calls_safety() -> None:
     """Test cutoff safety preserves AI message with many parallel tool calls."""
     middleware = SummarizationMiddleware(
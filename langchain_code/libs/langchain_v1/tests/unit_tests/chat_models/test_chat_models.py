@@ -1,5 +1,5 @@
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pytest
@@ -8,7 +8,13 @@ from langchain_core.runnables import RunnableConfig, RunnableSequence
 from pydantic import SecretStr
 
 from langchain.chat_models import __all__, init_chat_model
-from langchain.chat_models.base import _SUPPORTED_PROVIDERS, _attempt_infer_model_provider
+from langchain.chat_models.base import (
+    _SUPPORTED_PROVIDERS,
+    _attempt_infer_model_provider,
+    _ConfigurableModel,
+    _ModelCache,
+)
+from tests.unit_tests.agents.model import FakeToolCallingModel
 
 if TYPE_CHECKING:
     from langchain_core.language_models import BaseChatModel
@@ -334,3 +340,37 @@ def test_configurable_with_default() -> None:
     prompt = ChatPromptTemplate.from_messages([("system", "foo")])
     chain = prompt | model_with_config
     assert isinstance(chain, RunnableSequence)
+
+
+def test_configurable_model_cache() -> None:
+    """Test that a configurable model reuses the models it builds."""
+    built: list[dict[str, Any]] = []
+
+    def init_helper(model: str, **kwargs: Any) -> FakeToolCallingModel:
+        built.append({"model": model, **kwargs})
+        return FakeToolCallingModel()
+
+    with mock.patch("langchain.chat_models.base._init_chat_model_helper", init_helper):
+        model = _ConfigurableModel(
+            default_config={"model": "foo", "temperature": 0},
+            model_cache=_ModelCache(maxsize=2),
+        )
+        tools = [{"type": "function", "function": {"name": "foo"}}]
+        model_with_tools = model.bind_tools(tools)
+
+        assert model_with_tools.invoke("hi").content == "hi"
+        model_with_tools.invoke("hi")
+        model.bind_tools([dict(tool) for tool in tools]).invoke("hi")
+        assert len(built) == 1
+        assert model.model_cache_info() == (2, 1, 2, 1)
+
+        # Different params or operations build a new model.
+        model_with_tools.invoke("hi", {"configurable": {"temperature": 1}})
+        model_with_tools.invoke("hi", {"configurable": {"temperature": 1.0}})
+        model.invoke("hi")
+        assert [params.get("temperature") for params in built] == [0, 1, 1.0, 0]
+        assert model.model_cache_info() == (2, 4, 2, 2)
+
+        # The least recently used model was evicted.
+        model_with_tools.invoke("hi")
+        assert len(built) == 5